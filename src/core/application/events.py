@@ -0,0 +1,66 @@
+"""Barramento de eventos de domínio em processo."""
+
+import logging
+import threading
+from typing import Callable, Iterable
+
+from src.core.domain.entities.base import DomainEvent, Entity
+
+logger = logging.getLogger(__name__)
+
+EventHandler = Callable[[DomainEvent], None]
+
+ALL_EVENTS = "*"
+
+
+class EventBus:
+    """
+    Entrega eventos de domínio aos handlers inscritos.
+
+    A entrega é síncrona e na ordem de inscrição. Handlers devem ser
+    rápidos (enfileirar trabalho, não executá-lo); a falha de um handler
+    é registrada em log e não impede a entrega aos demais.
+    """
+
+    def __init__(self):
+        self._handlers: dict[str, list[EventHandler]] = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, event_type: str, handler: EventHandler) -> None:
+        """
+        Inscreve um handler em um tipo de evento.
+
+        Args:
+            event_type (str): `DomainEvent.event_type`, ou `*` para todos.
+            handler (EventHandler): Função chamada com o evento.
+        """
+        with self._lock:
+            handlers = list(self._handlers.get(event_type, ()))
+            handlers.append(handler)
+            self._handlers[event_type] = handlers
+
+    def publish(self, event: DomainEvent) -> None:
+        """Entrega um evento aos handlers do tipo e aos de `*`."""
+        handlers = self._handlers.get(event.event_type, []) + (
+            self._handlers.get(ALL_EVENTS, [])
+        )
+        for handler in handlers:
+            try:
+                handler(event)
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.exception(
+                    "Falha no handler %r do evento %s",
+                    handler,
+                    event.event_type,
+                )
+
+    def publish_all(self, events: Iterable[DomainEvent]) -> None:
+        """Entrega vários eventos, em ordem."""
+        for event in events:
+            self.publish(event)
+
+    def dispatch(self, entity: Entity) -> None:
+        """Publica e limpa os eventos acumulados em uma entidade."""
+        events = entity.get_domain_events()
+        entity.clear_domain_events()
+        self.publish_all(events)
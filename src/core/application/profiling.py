@@ -0,0 +1,427 @@
+"""Ganchos de profiling sob demanda para casos de uso e repositórios.
+
+Os ganchos ficam desligados por padrão. Quando habilitados (via variáveis
+de ambiente ou pela API do `Profiler`), amostram chamadas de `execute`
+filtrando pelo nome do caso de uso ou pelo `tenant_id` e gravam arquivos
+`.pstats` (cProfile) e snapshots de alocação (tracemalloc) em um
+diretório. A amostragem é limitada por um token bucket para que os
+ganchos possam ficar ativos em produção.
+
+Variáveis de ambiente:
+    DOCUMENT_MANAGER_PROFILING: "1"/"true" habilita os ganchos.
+    DOCUMENT_MANAGER_PROFILING_USE_CASES: nomes separados por vírgula.
+    DOCUMENT_MANAGER_PROFILING_TENANTS: UUIDs separados por vírgula.
+    DOCUMENT_MANAGER_PROFILING_DIR: diretório de saída.
+    DOCUMENT_MANAGER_PROFILING_MODES: "cprofile", "tracemalloc" ou ambos.
+    DOCUMENT_MANAGER_PROFILING_RATE: máximo de amostras por minuto.
+"""
+
+import cProfile
+import functools
+import itertools
+import logging
+import os
+import tempfile
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any, Callable, Iterator, Mapping, Optional
+from uuid import UUID
+
+from src.core.application.services.rate_limit import TokenBucket
+from src.core.domain.entities.tenant import Tenant
+
+logger = logging.getLogger(__name__)
+
+ENV_ENABLED = "DOCUMENT_MANAGER_PROFILING"
+ENV_USE_CASES = "DOCUMENT_MANAGER_PROFILING_USE_CASES"
+ENV_TENANTS = "DOCUMENT_MANAGER_PROFILING_TENANTS"
+ENV_OUTPUT_DIR = "DOCUMENT_MANAGER_PROFILING_DIR"
+ENV_MODES = "DOCUMENT_MANAGER_PROFILING_MODES"
+ENV_RATE = "DOCUMENT_MANAGER_PROFILING_RATE"
+
+_TRUTHY = {"1", "true", "yes", "on"}
+# Só um `cProfile.Profile` pode estar ativo por processo (no Python 3.12+,
+# `enable` falha com ValueError se houver outro), em qualquer `Profiler`.
+_CPROFILE_LOCK = threading.Lock()
+
+
+def _split(value: str) -> list[str]:
+    """Separa uma lista de valores separados por vírgula."""
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+@dataclass(frozen=True)
+class ProfilingConfig:
+    """
+    Configuração dos ganchos de profiling.
+
+    Attributes:
+        enabled (bool): Se os ganchos estão ativos.
+        use_cases (frozenset[str]): Nomes de casos de uso amostrados.
+        tenant_ids (frozenset[UUID]): Tenants amostrados.
+        output_dir (Path): Diretório onde os perfis são gravados.
+        cprofile (bool): Grava arquivos `.pstats` com cProfile.
+        tracemalloc (bool): Grava snapshots de alocação com tracemalloc.
+        max_per_minute (float): Máximo de amostras por minuto.
+        burst (int): Quantidade de amostras permitidas em rajada.
+
+    Sem filtros de caso de uso ou tenant, todas as chamadas são
+    candidatas à amostragem (ainda sujeitas ao limite de taxa).
+    """
+
+    enabled: bool = False
+    use_cases: frozenset[str] = field(default_factory=frozenset)
+    tenant_ids: frozenset[UUID] = field(default_factory=frozenset)
+    output_dir: Path = field(
+        default_factory=lambda: Path(tempfile.gettempdir()) / "profiles"
+    )
+    cprofile: bool = True
+    tracemalloc: bool = False
+    max_per_minute: float = 6.0
+    burst: int = 1
+
+    @classmethod
+    def from_env(
+        cls, environ: Optional[Mapping[str, str]] = None
+    ) -> "ProfilingConfig":
+        """
+        Cria a configuração a partir das variáveis de ambiente.
+
+        Args:
+            environ (Mapping[str, str], optional): Ambiente a ser lido.
+                Usa `os.environ` quando omitido.
+
+        Returns:
+            ProfilingConfig: Configuração resultante.
+        """
+        env = os.environ if environ is None else environ
+        config = cls()
+        modes = set(_split(env.get(ENV_MODES, "cprofile").lower()))
+        return replace(
+            config,
+            enabled=env.get(ENV_ENABLED, "").strip().lower() in _TRUTHY,
+            use_cases=frozenset(_split(env.get(ENV_USE_CASES, ""))),
+            tenant_ids=frozenset(
+                UUID(value) for value in _split(env.get(ENV_TENANTS, ""))
+            ),
+            output_dir=Path(env.get(ENV_OUTPUT_DIR, config.output_dir)),
+            cprofile="cprofile" in modes,
+            tracemalloc="tracemalloc" in modes,
+            max_per_minute=float(env.get(ENV_RATE, config.max_per_minute)),
+        )
+
+
+def extract_tenant_id(args: tuple, kwargs: dict) -> Optional[UUID]:
+    """
+    Descobre o tenant de uma chamada a partir de seus argumentos.
+
+    Procura um argumento nomeado `tenant_id`, uma entidade `Tenant` ou
+    qualquer objeto com atributo `tenant_id` (como `Document`).
+
+    Returns:
+        UUID | None: ID do tenant, se encontrado.
+    """
+    tenant_id = kwargs.get("tenant_id")
+    if isinstance(tenant_id, UUID):
+        return tenant_id
+    for value in itertools.chain(args, kwargs.values()):
+        if isinstance(value, Tenant):
+            return value.entity_id
+        tenant_id = getattr(value, "tenant_id", None)
+        if isinstance(tenant_id, UUID):
+            return tenant_id
+    return None
+
+
+class Profiler:
+    """
+    Controla a amostragem e a gravação dos perfis.
+
+    Pode ser reconfigurado em tempo de execução por `enable`, `disable`,
+    `configure` e `reload_from_env`.
+    """
+
+    def __init__(
+        self,
+        config: Optional[ProfilingConfig] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._clock = clock
+        self._local = threading.local()
+        self._tracemalloc_lock = threading.Lock()
+        self._sequence = itertools.count(1)
+        self._apply(config or ProfilingConfig())
+
+    @classmethod
+    def from_env(
+        cls, environ: Optional[Mapping[str, str]] = None
+    ) -> "Profiler":
+        """Cria um profiler configurado pelas variáveis de ambiente."""
+        return cls(ProfilingConfig.from_env(environ))
+
+    @property
+    def config(self) -> ProfilingConfig:
+        """Retorna a configuração atual."""
+        return self._config
+
+    def _apply(self, config: ProfilingConfig) -> None:
+        """Troca a configuração e recria o limitador de amostragem."""
+        if config.max_per_minute <= 0:
+            raise ValueError("A taxa de amostragem deve ser positiva.")
+        self._bucket = TokenBucket(
+            rate=config.max_per_minute / 60.0,
+            capacity=max(1, config.burst),
+            clock=self._clock,
+        )
+        self._config = config
+
+    def configure(self, **changes: Any) -> ProfilingConfig:
+        """
+        Altera campos da configuração em tempo de execução.
+
+        Args:
+            **changes: Campos de `ProfilingConfig` a serem alterados.
+
+        Returns:
+            ProfilingConfig: Nova configuração.
+        """
+        for key in ("use_cases", "tenant_ids"):
+            if key in changes:
+                changes[key] = frozenset(changes[key])
+        if "output_dir" in changes:
+            changes["output_dir"] = Path(changes["output_dir"])
+        self._apply(replace(self._config, **changes))
+        return self._config
+
+    def enable(self, **changes: Any) -> ProfilingConfig:
+        """Habilita os ganchos, opcionalmente alterando filtros."""
+        return self.configure(enabled=True, **changes)
+
+    def disable(self) -> ProfilingConfig:
+        """Desabilita os ganchos."""
+        return self.configure(enabled=False)
+
+    def reload_from_env(
+        self, environ: Optional[Mapping[str, str]] = None
+    ) -> ProfilingConfig:
+        """Relê a configuração das variáveis de ambiente."""
+        self._apply(ProfilingConfig.from_env(environ))
+        return self._config
+
+    def matches(self, name: str, tenant_id: Optional[UUID]) -> bool:
+        """
+        Verifica se a chamada passa pelos filtros configurados.
+
+        Args:
+            name (str): Nome do caso de uso ou método.
+            tenant_id (UUID | None): Tenant da chamada.
+
+        Returns:
+            bool: True se a chamada é candidata à amostragem.
+        """
+        config = self._config
+        if not config.enabled:
+            return False
+        if not config.use_cases and not config.tenant_ids:
+            return True
+        return name in config.use_cases or tenant_id in config.tenant_ids
+
+    def should_sample(self, name: str, tenant_id: Optional[UUID]) -> bool:
+        """Aplica os filtros e o limite de taxa a uma chamada."""
+        if getattr(self._local, "active", False):
+            return False
+        return self.matches(name, tenant_id) and self._bucket.try_acquire()
+
+    def _output_stem(self, name: str, tenant_id: Optional[UUID]) -> Path:
+        """Monta o caminho base dos arquivos de uma amostra."""
+        directory = self._config.output_dir
+        directory.mkdir(parents=True, exist_ok=True)
+        stamp = time.strftime("%Y%m%dT%H%M%S")
+        tenant = str(tenant_id) if tenant_id else "sem-tenant"
+        safe_name = name.replace("/", "_").replace(os.sep, "_")
+        return directory / (
+            f"{stamp}-{safe_name}-{tenant}-{next(self._sequence)}"
+        )
+
+    @contextmanager
+    def profile(
+        self, name: str, tenant_id: Optional[UUID] = None
+    ) -> Iterator[Optional[Path]]:
+        """
+        Perfila o bloco se a chamada for amostrada.
+
+        Chamadas aninhadas na mesma thread ficam dentro do perfil externo
+        e não são amostradas novamente. Como `cProfile` e `tracemalloc` são
+        globais do processo, uma amostra simultânea em outra thread não
+        grava o perfil que já está em andamento.
+
+        Args:
+            name (str): Nome do caso de uso ou método.
+            tenant_id (UUID | None): Tenant da chamada.
+
+        Yields:
+            Path | None: Caminho base dos arquivos gravados, ou None se a
+            chamada não foi amostrada.
+        """
+        if not self.should_sample(name, tenant_id):
+            yield None
+            return
+
+        config = self._config
+        try:
+            stem = self._output_stem(name, tenant_id)
+        except OSError:
+            logger.exception(
+                "Falha ao preparar o diretório de perfis %s.",
+                config.output_dir,
+            )
+            stem = None
+        if stem is None:
+            yield None
+            return
+
+        profiler = (
+            cProfile.Profile()
+            if config.cprofile and _CPROFILE_LOCK.acquire(blocking=False)
+            else None
+        )
+        tracing = (
+            config.tracemalloc
+            and not tracemalloc.is_tracing()
+            and self._tracemalloc_lock.acquire(blocking=False)
+        )
+        self._local.active = True
+        try:
+            if tracing:
+                tracemalloc.start()
+            if profiler is not None:
+                try:
+                    profiler.enable()
+                except ValueError:  # outra ferramenta de profiling ativa
+                    logger.warning("cProfile indisponível para %s.", stem)
+                    _CPROFILE_LOCK.release()
+                    profiler = None
+            yield stem
+        finally:
+            # Falhas do profiling são registradas e não chegam a quem
+            # chamou; a limpeza sempre roda.
+            self._local.active = False
+            if profiler is not None:
+                try:
+                    profiler.disable()
+                    profiler.dump_stats(f"{stem}.pstats")
+                except Exception:  # pylint: disable=broad-exception-caught
+                    logger.exception("Falha ao gravar %s.pstats.", stem)
+                finally:
+                    _CPROFILE_LOCK.release()
+            if tracing:
+                try:
+                    tracemalloc.take_snapshot().dump(f"{stem}.tracemalloc")
+                except Exception:  # pylint: disable=broad-exception-caught
+                    logger.exception("Falha ao gravar %s.tracemalloc.", stem)
+                finally:
+                    tracemalloc.stop()
+                    self._tracemalloc_lock.release()
+
+    def wrap(self, func: Callable, name: Optional[str] = None) -> Callable:
+        """
+        Envolve uma função com o gancho de profiling.
+
+        Args:
+            func (Callable): Função a ser envolvida.
+            name (str, optional): Nome usado nos filtros e nos arquivos.
+
+        Returns:
+            Callable: Função envolvida.
+        """
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not self._config.enabled:
+                return func(*args, **kwargs)
+            tenant_id = extract_tenant_id(args, kwargs)
+            with self.profile(label, tenant_id):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+
+class ProfiledUseCase:
+    """Proxy que perfila o `execute` de um caso de uso."""
+
+    def __init__(
+        self,
+        use_case: Any,
+        profiler: Profiler,
+        name: Optional[str] = None,
+    ):
+        self._use_case = use_case
+        self.name = name or type(use_case).__name__
+        self.execute = profiler.wrap(use_case.execute, self.name)
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._use_case, attr)
+
+
+class ProfiledRepository:
+    """Proxy que perfila os métodos públicos de um repositório.
+
+    Cada método é identificado como `NomeDaClasse.metodo` nos filtros.
+    """
+
+    def __init__(self, repository: Any, profiler: Profiler):
+        self._repository = repository
+        self._profiler = profiler
+        self._prefix = type(repository).__name__
+
+    def __getattr__(self, attr: str) -> Any:
+        value = getattr(self._repository, attr)
+        if attr.startswith("_") or not callable(value):
+            return value
+        wrapped = self._profiler.wrap(value, f"{self._prefix}.{attr}")
+        setattr(self, attr, wrapped)
+        return wrapped
+
+
+_default_profiler: Optional[Profiler] = None
+_default_lock = threading.Lock()
+
+
+def get_profiler() -> Profiler:
+    """Retorna o profiler global, configurado pelo ambiente."""
+    global _default_profiler  # pylint: disable=global-statement
+    if _default_profiler is None:
+        with _default_lock:
+            if _default_profiler is None:
+                _default_profiler = Profiler.from_env()
+    return _default_profiler
+
+
+def profiled(name: Optional[str] = None) -> Callable[[Callable], Callable]:
+    """
+    Decorador que perfila uma função com o profiler global.
+
+    Args:
+        name (str, optional): Nome usado nos filtros e nos arquivos.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            profiler = get_profiler()
+            if not profiler.config.enabled:
+                return func(*args, **kwargs)
+            tenant_id = extract_tenant_id(args, kwargs)
+            with profiler.profile(label, tenant_id):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
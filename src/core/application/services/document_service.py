@@ -0,0 +1,16 @@
+"""Serviço para gerenciar documentos."""
+
+from src.core.application.services.base import IDocumentService
+from src.core.domain.entities.document import Document
+from src.core.domain.exceptions import BusinessRuleViolationError
+
+
+class DocumentService(IDocumentService):
+    """Serviço para gerenciar documentos."""
+
+    def validate(self, document: Document) -> None:
+        """Valida um novo documento."""
+        if document.is_deleted():
+            raise BusinessRuleViolationError(
+                "Não é possível criar um documento já deletado."
+            )
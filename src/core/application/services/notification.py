@@ -0,0 +1,267 @@
+"""Fila e despacho de notificações por e-mail."""
+
+import heapq
+import itertools
+import random
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+from uuid import UUID
+
+from src.core.application.services.rate_limit import TokenBucket
+
+
+class DeliveryError(Exception):
+    """Falha na entrega de uma notificação."""
+
+
+class TransientDeliveryError(DeliveryError):
+    """Falha temporária; a notificação deve ser reenviada mais tarde."""
+
+
+class PermanentDeliveryError(DeliveryError):
+    """Falha definitiva; reenviar não adianta."""
+
+
+@dataclass
+class Notification:
+    """
+    Mensagem a ser enviada.
+
+    Attributes:
+        tenant_id (UUID): Empresa dona da notificação (limite de envio).
+        recipients (tuple[str, ...]): Destinatários.
+        subject (str): Assunto.
+        body (str): Corpo em texto simples.
+        attempts (int): Tentativas de envio já feitas.
+        not_before (float): Instante (relógio do despachante) a partir do
+            qual a notificação pode ser enviada.
+        last_error (str, optional): Última falha de envio.
+    """
+
+    tenant_id: UUID
+    recipients: tuple[str, ...]
+    subject: str
+    body: str
+    attempts: int = 0
+    not_before: float = 0.0
+    last_error: Optional[str] = field(default=None, compare=False)
+
+
+class IMailer(ABC):
+    """Interface para o envio de notificações."""
+
+    @abstractmethod
+    def send_batch(
+        self, notifications: list[Notification]
+    ) -> list[Optional[DeliveryError]]:
+        """
+        Envia um lote, reaproveitando a conexão.
+
+        Returns:
+            list[DeliveryError | None]: Resultado de cada notificação, na
+            ordem do lote; None indica sucesso.
+        """
+
+    @abstractmethod
+    def close(self) -> None:
+        """Fecha a conexão, se houver."""
+
+
+class NotificationQueue:
+    """Fila thread-safe ordenada pelo instante liberado para envio."""
+
+    def __init__(self):
+        self._heap: list[tuple[float, int, Notification]] = []
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def put(self, notification: Notification) -> None:
+        """Enfileira uma notificação."""
+        with self._lock:
+            heapq.heappush(
+                self._heap,
+                (notification.not_before, next(self._sequence), notification),
+            )
+
+    def pop_ready(self, now: float, limit: int) -> list[Notification]:
+        """Retira até `limit` notificações liberadas até `now`."""
+        ready = []
+        with self._lock:
+            while self._heap and len(ready) < limit:
+                if self._heap[0][0] > now:
+                    break
+                ready.append(heapq.heappop(self._heap)[2])
+        return ready
+
+    def next_ready_at(self) -> Optional[float]:
+        """Instante da próxima notificação liberada, se houver."""
+        with self._lock:
+            return self._heap[0][0] if self._heap else None
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Reenvio com backoff exponencial e jitter.
+
+    Attributes:
+        max_attempts (int): Tentativas antes de desistir.
+        base_delay (float): Espera após a primeira falha, em segundos.
+        factor (float): Multiplicador a cada nova falha.
+        max_delay (float): Espera máxima.
+        jitter (float): Fração aleatória somada à espera.
+    """
+
+    max_attempts: int = 5
+    base_delay: float = 1.0
+    factor: float = 2.0
+    max_delay: float = 300.0
+    jitter: float = 0.1
+
+    def delay(self, attempts: int, rng: random.Random) -> float:
+        """Espera antes da próxima tentativa após `attempts` falhas."""
+        delay = min(
+            self.max_delay, self.base_delay * self.factor ** (attempts - 1)
+        )
+        return delay * (1 + self.jitter * rng.random())
+
+
+@dataclass(frozen=True)
+class DispatchReport:
+    """Resultado de uma rodada de despacho."""
+
+    sent: int = 0
+    retried: int = 0
+    failed: int = 0
+    deferred: int = 0
+
+
+class NotificationDispatcher:
+    """
+    Despacha a fila em lotes, com limite por tenant e reenvio.
+
+    Cada rodada retira até `batch_size` notificações liberadas. As de
+    tenants sem saldo no token bucket voltam para a fila para o instante
+    em que houver saldo; as demais são enviadas juntas por `IMailer`,
+    sobre uma única conexão. Falhas temporárias são reagendadas com
+    backoff; falhas definitivas, ou que esgotaram as tentativas, vão para
+    `failed`.
+
+    Args:
+        queue (NotificationQueue): Fila de notificações.
+        mailer (IMailer): Envio dos lotes.
+        rate (float): Envios por segundo por tenant.
+        burst (float): Rajada máxima por tenant.
+        tenant_limits (dict[UUID, tuple[float, float]], optional): Taxa e
+            rajada de tenants específicos.
+        batch_size (int): Notificações por lote.
+        retry (RetryPolicy): Política de reenvio.
+        clock (Callable[[], float]): Relógio monotônico em segundos.
+        seed (int, optional): Semente do jitter.
+    """
+
+    def __init__(
+        self,
+        queue: NotificationQueue,
+        mailer: IMailer,
+        rate: float = 5.0,
+        burst: float = 50.0,
+        tenant_limits: Optional[dict[UUID, tuple[float, float]]] = None,
+        batch_size: int = 100,
+        retry: RetryPolicy = RetryPolicy(),
+        clock: Callable[[], float] = time.monotonic,
+        seed: Optional[int] = None,
+    ):
+        self.queue = queue
+        self.mailer = mailer
+        self.rate = rate
+        self.burst = burst
+        self.tenant_limits = dict(tenant_limits or {})
+        self.batch_size = batch_size
+        self.retry = retry
+        self.failed: list[Notification] = []
+        self._clock = clock
+        self._rng = random.Random(seed)
+        self._buckets: dict[UUID, TokenBucket] = {}
+
+    def _bucket(self, tenant_id: UUID) -> TokenBucket:
+        bucket = self._buckets.get(tenant_id)
+        if bucket is None:
+            rate, burst = self.tenant_limits.get(
+                tenant_id, (self.rate, self.burst)
+            )
+            bucket = self._buckets[tenant_id] = TokenBucket(
+                rate, burst, clock=self._clock
+            )
+        return bucket
+
+    def _take_batch(self, now: float) -> tuple[list[Notification], int]:
+        """Monta um lote respeitando o limite de cada tenant."""
+        batch: list[Notification] = []
+        deferred = 0
+        while len(batch) < self.batch_size:
+            ready = self.queue.pop_ready(now, self.batch_size - len(batch))
+            if not ready:
+                break
+            for notification in ready:
+                bucket = self._bucket(notification.tenant_id)
+                if bucket.try_acquire():
+                    batch.append(notification)
+                else:
+                    notification.not_before = now + bucket.retry_after()
+                    self.queue.put(notification)
+                    deferred += 1
+        return batch, deferred
+
+    def dispatch_once(self) -> DispatchReport:
+        """Executa uma rodada de despacho."""
+        now = self._clock()
+        batch, deferred = self._take_batch(now)
+        if not batch:
+            return DispatchReport(deferred=deferred)
+
+        sent = retried = failed = 0
+        for notification, error in zip(batch, self.mailer.send_batch(batch)):
+            if error is None:
+                sent += 1
+                continue
+            notification.attempts += 1
+            notification.last_error = str(error)
+            if isinstance(error, PermanentDeliveryError) or (
+                notification.attempts >= self.retry.max_attempts
+            ):
+                self.failed.append(notification)
+                failed += 1
+            else:
+                notification.not_before = now + self.retry.delay(
+                    notification.attempts, self._rng
+                )
+                self.queue.put(notification)
+                retried += 1
+        return DispatchReport(sent, retried, failed, deferred)
+
+    def run(self, stop: threading.Event, idle: float = 0.5) -> None:
+        """
+        Despacha continuamente até `stop` ser sinalizado.
+
+        Entre rodadas sem envio, espera até a próxima notificação
+        liberada, limitado a `idle` segundos.
+        """
+        try:
+            while not stop.is_set():
+                report = self.dispatch_once()
+                if report.sent or report.retried or report.failed:
+                    continue
+                next_ready = self.queue.next_ready_at()
+                wait = idle
+                if next_ready is not None:
+                    wait = min(idle, max(0.0, next_ready - self._clock()))
+                stop.wait(wait)
+        finally:
+            self.mailer.close()
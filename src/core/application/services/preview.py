@@ -0,0 +1,215 @@
+"""Geração de prévias e miniaturas dos arquivos em segundo plano."""
+
+import logging
+import re
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from functools import partial
+from typing import Callable, Iterable, Optional, Protocol
+from uuid import UUID
+
+from src.core.application.events import EventBus
+from src.core.domain.entities.base import DomainEvent
+from src.core.domain.exceptions import (
+    BlobNotFoundException,
+    DocumentNotFoundException,
+)
+from src.core.domain.repositorys.blob import FileSegment, IBlobStore
+from src.core.domain.repositorys.document import IDocumentRepository
+
+logger = logging.getLogger(__name__)
+
+Renderer = Callable[[list[FileSegment], str, dict[str, int]], dict]
+"""Recebe os trechos do arquivo, o tipo de mídia e as variantes (nome e
+lado máximo em pixels); retorna os bytes de cada variante."""
+
+DEFAULT_VARIANTS = {"thumbnail": 256, "preview": 1024}
+_VARIANT = re.compile(r"^[a-z0-9_]+$")
+
+
+class PreviewCache(Protocol):
+    """Onde as variantes geradas ficam guardadas (ex.: `DiskLRUCache`)."""
+
+    def __contains__(self, key: str) -> bool: ...
+
+    def get(self, key: str) -> Optional[bytes]: ...
+
+    def put(self, key: str, data: bytes) -> bool: ...
+
+
+def preview_key(digest: str, variant: str) -> str:
+    """Chave de uma variante no cache: o conteúdo define a prévia."""
+    return f"{digest}.{variant}"
+
+
+class PreviewPipeline:
+    """
+    Gera a prévia da primeira página e miniaturas de cada anexo.
+
+    Os handlers dos eventos de criação e alteração de documentos só
+    enfileiram trabalho: a renderização, que usa muita CPU, roda em um
+    `ProcessPoolExecutor` (fora do GIL e do fluxo da requisição) e o
+    resultado é gravado no cache pelo callback do futuro.
+
+    Os trabalhos são identificados pelo hash do conteúdo: um arquivo já
+    renderizado, em renderização ou que falhou não é enviado de novo,
+    mesmo que apareça em vários documentos ou versões. Uma variante que
+    não cabe no cache conta como falha.
+
+    Args:
+        document_repository (IDocumentRepository): Fonte dos documentos.
+        blob_store (IBlobStore): Conteúdo dos arquivos.
+        cache (PreviewCache): Destino das variantes geradas.
+        renderer (Renderer): Função de renderização; roda em outro
+            processo, então deve ser definida no nível de um módulo.
+        executor (Executor, optional): Executor dos trabalhos; por padrão,
+            um `ProcessPoolExecutor` com `max_workers` processos.
+        variants (dict[str, int]): Variantes geradas e o lado máximo de
+            cada uma, em pixels.
+        media_types (Iterable[str], optional): Tipos de mídia aceitos pelo
+            renderizador; os demais são ignorados. Todos por padrão.
+        max_workers (int, optional): Processos do executor padrão.
+    """
+
+    def __init__(
+        self,
+        document_repository: IDocumentRepository,
+        blob_store: IBlobStore,
+        cache: PreviewCache,
+        renderer: Renderer,
+        executor: Optional[Executor] = None,
+        variants: Optional[dict[str, int]] = None,
+        media_types: Optional[Iterable[str]] = None,
+        max_workers: Optional[int] = None,
+    ):
+        self.document_repository = document_repository
+        self.blob_store = blob_store
+        self.cache = cache
+        self.renderer = renderer
+        self.variants = dict(variants or DEFAULT_VARIANTS)
+        for variant in self.variants:
+            if not _VARIANT.match(variant):
+                raise ValueError(f"Variante inválida: '{variant}'.")
+        self.media_types = (
+            frozenset(media_types) if media_types is not None else None
+        )
+        self._executor = executor or ProcessPoolExecutor(max_workers)
+        self._pending: dict[str, Future] = {}
+        self._failed: set[str] = set()
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self.rendered = 0
+
+    def subscribe(self, bus: EventBus) -> None:
+        """Inscreve o pipeline na criação e alteração de documentos."""
+        bus.subscribe("document_created", self.handle)
+        bus.subscribe("document_updated", self.handle)
+
+    def handle(self, event: DomainEvent) -> None:
+        """Enfileira a renderização dos arquivos afetados pelo evento."""
+        if "digest" in event.data:
+            # Anexo novo: o evento já traz o conteúdo e o tipo.
+            self.submit(event.data["digest"], event.data["media_type"])
+            return
+        try:
+            document = self.document_repository.get(
+                UUID(event.data["document_id"])
+            )
+        except DocumentNotFoundException:
+            return
+        for attachment in document.attachments_at().values():
+            self.submit(attachment.digest, attachment.media_type)
+
+    def _known(self, digest: str) -> Optional[Future]:
+        """Futuro em andamento, ou None; levanta KeyError se já tratado."""
+        future = self._pending.get(digest)
+        if future is None and (
+            digest in self._failed
+            or all(
+                preview_key(digest, variant) in self.cache
+                for variant in self.variants
+            )
+        ):
+            raise KeyError(digest)
+        return future
+
+    def submit(self, digest: str, media_type: str) -> Optional[Future]:
+        """
+        Enfileira a renderização de um conteúdo, se ainda for preciso.
+
+        Returns:
+            Future | None: O trabalho (novo ou já em andamento), ou None
+            se o conteúdo já foi renderizado, falhou antes ou tem um tipo
+            de mídia não aceito.
+        """
+        if self.media_types is not None and media_type not in self.media_types:
+            return None
+        with self._lock:
+            try:
+                future = self._known(digest)
+            except KeyError:
+                return None
+            if future is not None:
+                return future
+        try:
+            segments = self.blob_store.segments(digest)
+        except BlobNotFoundException:
+            return None
+        with self._lock:
+            try:
+                future = self._known(digest)
+            except KeyError:
+                return None
+            if future is not None:
+                return future
+            future = self._executor.submit(
+                self.renderer, segments, media_type, self.variants
+            )
+            self._pending[digest] = future
+        future.add_done_callback(partial(self._store, digest))
+        return future
+
+    def _store(self, digest: str, future: Future) -> None:
+        """Grava as variantes geradas; roda fora do fluxo da requisição."""
+        try:
+            for variant, data in future.result().items():
+                if not self.cache.put(preview_key(digest, variant), data):
+                    # Maior que o cache: reenviar geraria o mesmo resultado.
+                    raise ValueError(f"A variante '{variant}' não coube.")
+        except Exception:  # pylint: disable=broad-exception-caught
+            logger.exception("Falha ao gerar a prévia de %s.", digest)
+            with self._lock:
+                self._failed.add(digest)
+        else:
+            with self._lock:
+                self.rendered += 1
+        finally:
+            with self._lock:
+                self._pending.pop(digest, None)
+                self._idle.notify_all()
+
+    def preview(
+        self, digest: str, variant: str = "thumbnail"
+    ) -> Optional[bytes]:
+        """Bytes de uma variante já gerada, ou None."""
+        return self.cache.get(preview_key(digest, variant))
+
+    @property
+    def pending(self) -> int:
+        """Trabalhos ainda em andamento."""
+        with self._lock:
+            return len(self._pending)
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """
+        Espera os trabalhos em andamento terminarem.
+
+        Returns:
+            bool: False se o tempo acabou antes.
+        """
+        with self._idle:
+            return self._idle.wait_for(lambda: not self._pending, timeout)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Encerra o executor."""
+        self._executor.shutdown(wait=wait)
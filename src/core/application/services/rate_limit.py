@@ -0,0 +1,335 @@
+"""Limitadores de taxa baseados em token bucket."""
+
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Iterator, Optional
+from uuid import UUID
+
+
+class TokenBucket:
+    """Token bucket thread-safe.
+
+    Os tokens são repostos continuamente a uma taxa fixa até o limite
+    da capacidade. Cada operação consome um ou mais tokens.
+
+    Attributes:
+        rate (float): Tokens repostos por segundo.
+        capacity (float): Quantidade máxima de tokens acumulados.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Inicializa o token bucket cheio.
+
+        Args:
+            rate (float): Tokens repostos por segundo.
+            capacity (float): Quantidade máxima de tokens.
+            clock (Callable[[], float]): Relógio monotônico em segundos.
+        """
+        if rate <= 0:
+            raise ValueError("A taxa do token bucket deve ser positiva.")
+        if capacity < 1:
+            raise ValueError(
+                "A capacidade do token bucket deve ser de pelo menos 1."
+            )
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self._clock = clock
+        self._tokens = float(capacity)
+        self._last = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        """Repõe os tokens acumulados desde a última leitura."""
+        elapsed = now - self._last
+        if elapsed > 0:
+            self._tokens = min(
+                self.capacity, self._tokens + elapsed * self.rate
+            )
+            self._last = now
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """
+        Tenta consumir tokens sem bloquear.
+
+        Args:
+            tokens (float): Quantidade de tokens a consumir.
+
+        Returns:
+            bool: True se os tokens foram consumidos.
+        """
+        with self._lock:
+            self._refill(self._clock())
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+
+    def retry_after(self, tokens: float = 1.0) -> float:
+        """
+        Calcula quanto tempo falta para haver tokens suficientes.
+
+        Args:
+            tokens (float): Quantidade de tokens desejada.
+
+        Returns:
+            float: Segundos até a próxima aquisição possível.
+        """
+        with self._lock:
+            self._refill(self._clock())
+            missing = tokens - self._tokens
+            return max(0.0, missing / self.rate)
+
+
+@dataclass(frozen=True)
+class TenantQuota:
+    """
+    Limites de uso de um tenant.
+
+    Attributes:
+        rate (float): Requisições por segundo, em média.
+        burst (float): Rajada máxima (capacidade do token bucket).
+        max_concurrent (int): Requisições simultâneas.
+        max_wait (float): Tempo máximo, em segundos, que uma requisição
+            acima do limite pode esperar na fila antes de ser rejeitada;
+            0 rejeita imediatamente.
+    """
+
+    rate: float = 50.0
+    burst: float = 100.0
+    max_concurrent: int = 16
+    max_wait: float = 0.0
+
+    def __post_init__(self):
+        if self.rate <= 0:
+            raise ValueError("A taxa da cota deve ser positiva.")
+        if self.burst < 1 or self.max_concurrent < 1:
+            raise ValueError(
+                "A rajada e a concorrência devem ser de pelo menos 1."
+            )
+        if self.max_wait < 0:
+            raise ValueError("A espera máxima não pode ser negativa.")
+
+
+RATE = "rate"
+CONCURRENCY = "concurrency"
+# Fragmentos com mais tenants que isso são varridos em busca de estados
+# ociosos a cada vez que dobram de tamanho.
+_SWEEP_MIN = 1024
+
+
+@dataclass(frozen=True)
+class Admission:
+    """
+    Resultado de uma tentativa de admissão.
+
+    Attributes:
+        admitted (bool): Se a requisição foi admitida (e ocupa uma vaga
+            de concorrência até `release`).
+        reason (str, optional): `rate` ou `concurrency`, se recusada.
+        retry_after (float): Segundos até haver token, quando recusada
+            pela taxa; 0 quando recusada pela concorrência (depende de
+            outra requisição terminar).
+    """
+
+    admitted: bool
+    reason: Optional[str] = None
+    retry_after: float = 0.0
+
+
+class QuotaExceededError(Exception):
+    """
+    Exceção lançada quando um tenant excede a sua cota.
+
+    Args:
+        tenant_id (UUID): Tenant limitado.
+        admission (Admission): Motivo e tempo sugerido de espera.
+    """
+
+    def __init__(self, tenant_id: UUID, admission: Admission):
+        super().__init__(
+            f"Cota do tenant '{tenant_id}' excedida ({admission.reason})."
+        )
+        self.tenant_id = tenant_id
+        self.reason = admission.reason
+        self.retry_after = admission.retry_after
+
+
+class _TenantState:
+    """Token bucket e contador de concorrência de um tenant."""
+
+    __slots__ = ("quota", "tokens", "last", "in_flight")
+
+    def __init__(self, quota: TenantQuota, now: float):
+        self.quota = quota
+        self.tokens = quota.burst
+        self.last = now
+        self.in_flight = 0
+
+
+class TenantRateLimiter:
+    """
+    Limita taxa e concorrência por tenant.
+
+    O estado de cada tenant fica em um de `shards` fragmentos, escolhido
+    pelo hash do ID; cada fragmento tem o próprio lock. Uma admissão
+    custa O(1) e só disputa o lock com tenants do mesmo fragmento, de
+    modo que um tenant com carga alta não atrasa os demais.
+
+    A admissão não bloqueia: quem chama decide entre esperar
+    (`Admission.retry_after`, ou o próximo `release`) e rejeitar.
+
+    O estado de um tenant sem requisições em andamento e com o bucket
+    cheio é igual ao de um tenant novo; esses estados são descartados
+    quando o fragmento cresce, de modo que IDs usados uma única vez não
+    acumulam memória.
+
+    Args:
+        default (TenantQuota): Cota dos tenants sem configuração própria.
+        quotas (dict[UUID, TenantQuota], optional): Cotas por tenant.
+        shards (int): Quantidade de fragmentos (potência de 2).
+        clock (Callable[[], float]): Relógio monotônico em segundos.
+    """
+
+    def __init__(
+        self,
+        default: TenantQuota = TenantQuota(),
+        quotas: Optional[dict[UUID, TenantQuota]] = None,
+        shards: int = 64,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if shards < 1 or shards & (shards - 1):
+            raise ValueError("A quantidade de fragmentos deve ser 2^n.")
+        self.default = default
+        self._quotas = dict(quotas or {})
+        self._mask = shards - 1
+        self._locks = [threading.Lock() for _ in range(shards)]
+        self._states: list[dict[UUID, _TenantState]] = [
+            {} for _ in range(shards)
+        ]
+        self._sweep_at = [_SWEEP_MIN] * shards
+        self._clock = clock
+
+    def _shard(self, tenant_id: UUID) -> int:
+        return hash(tenant_id) & self._mask
+
+    def quota_for(self, tenant_id: UUID) -> TenantQuota:
+        """Cota em vigor para um tenant."""
+        return self._quotas.get(tenant_id, self.default)
+
+    def configure(self, tenant_id: UUID, quota: TenantQuota) -> None:
+        """
+        Define a cota de um tenant.
+
+        O saldo de tokens é limitado à nova rajada; as requisições em
+        andamento continuam contando para a concorrência.
+        """
+        shard = self._shard(tenant_id)
+        with self._locks[shard]:
+            self._quotas[tenant_id] = quota
+            state = self._states[shard].get(tenant_id)
+            if state is not None:
+                state.quota = quota
+                state.tokens = min(state.tokens, quota.burst)
+
+    def try_acquire(self, tenant_id: UUID) -> Admission:
+        """Tenta admitir uma requisição do tenant, sem bloquear."""
+        return self._acquire(tenant_id, 1.0, occupy=True)
+
+    def charge(self, tenant_id: UUID, cost: float) -> Admission:
+        """
+        Cobra `cost` tokens do tenant sem ocupar vaga de concorrência.
+
+        Usado para o trabalho extra de uma requisição já admitida (ex.:
+        cada operação de um lote). Um custo maior que a rajada é aceito
+        com o bucket cheio e deixa o saldo negativo: as próximas
+        requisições do tenant esperam até ele ser reposto.
+
+        Returns:
+            Admission: Recusada por `rate` se faltarem tokens.
+        """
+        return self._acquire(tenant_id, cost, occupy=False)
+
+    def _acquire(
+        self, tenant_id: UUID, cost: float, occupy: bool
+    ) -> Admission:
+        shard = self._shard(tenant_id)
+        now = self._clock()
+        with self._locks[shard]:
+            states = self._states[shard]
+            state = states.get(tenant_id)
+            if state is None:
+                if len(states) >= self._sweep_at[shard]:
+                    self._sweep(shard, now)
+                state = states[tenant_id] = _TenantState(
+                    self.quota_for(tenant_id), now
+                )
+            quota = state.quota
+            if occupy and state.in_flight >= quota.max_concurrent:
+                return Admission(False, CONCURRENCY)
+            elapsed = now - state.last
+            if elapsed > 0:
+                state.tokens = min(
+                    quota.burst, state.tokens + elapsed * quota.rate
+                )
+                state.last = now
+            required = min(cost, quota.burst)
+            if state.tokens < required:
+                return Admission(
+                    False, RATE, (required - state.tokens) / quota.rate
+                )
+            state.tokens -= cost
+            if occupy:
+                state.in_flight += 1
+            return Admission(True)
+
+    def _sweep(self, shard: int, now: float) -> None:
+        """Descarta os estados ociosos de um fragmento (com o lock)."""
+        states = self._states[shard]
+        for tenant_id, state in list(states.items()):
+            quota = state.quota
+            if state.in_flight == 0 and (
+                state.tokens + (now - state.last) * quota.rate >= quota.burst
+            ):
+                del states[tenant_id]
+        self._sweep_at[shard] = max(_SWEEP_MIN, 2 * len(states))
+
+    def tenants(self) -> int:
+        """Tenants com estado mantido em memória."""
+        return sum(len(states) for states in self._states)
+
+    def release(self, tenant_id: UUID) -> None:
+        """Libera a vaga de concorrência de uma requisição admitida."""
+        shard = self._shard(tenant_id)
+        with self._locks[shard]:
+            state = self._states[shard].get(tenant_id)
+            if state is not None and state.in_flight > 0:
+                state.in_flight -= 1
+
+    def in_flight(self, tenant_id: UUID) -> int:
+        """Requisições do tenant em andamento."""
+        state = self._states[self._shard(tenant_id)].get(tenant_id)
+        return 0 if state is None else state.in_flight
+
+    @contextmanager
+    def admit(self, tenant_id: UUID) -> Iterator[None]:
+        """
+        Executa um bloco dentro da cota do tenant, sem esperar.
+
+        Raises:
+            QuotaExceededError: Se o tenant estiver acima da cota.
+        """
+        admission = self.try_acquire(tenant_id)
+        if not admission.admitted:
+            raise QuotaExceededError(tenant_id, admission)
+        try:
+            yield
+        finally:
+            self.release(tenant_id)
@@ -0,0 +1,39 @@
+"""Alocação de números sequenciais por blocos (hi/lo)."""
+
+import threading
+
+from src.core.domain.repositorys.sequence import ISequenceRepository
+
+
+class BlockSequenceAllocator:
+    """
+    Entrega números sequenciais a partir de blocos reservados.
+
+    Cada worker reserva um bloco de `block_size` números com uma única
+    escrita no armazenamento e passa a entregá-los da memória. Números
+    nunca se repetem entre workers, mas podem sobrar lacunas: o restante
+    de um bloco é perdido quando o processo termina, e workers diferentes
+    intercalam blocos. Os números são únicos, não contíguos.
+
+    Args:
+        repository (ISequenceRepository): Armazenamento das sequências.
+        block_size (int): Números reservados por escrita.
+    """
+
+    def __init__(self, repository: ISequenceRepository, block_size: int = 100):
+        if block_size < 1:
+            raise ValueError("O tamanho do bloco deve ser de pelo menos 1.")
+        self.repository = repository
+        self.block_size = block_size
+        self._blocks: dict[str, tuple[int, int]] = {}
+        self._lock = threading.Lock()
+
+    def next(self, key: str) -> int:
+        """Retorna o próximo número da sequência `key`."""
+        with self._lock:
+            current, end = self._blocks.get(key, (0, 0))
+            if current >= end:
+                current = self.repository.reserve_block(key, self.block_size)
+                end = current + self.block_size
+            self._blocks[key] = (current + 1, end)
+        return current
@@ -0,0 +1,82 @@
+"""Geração de slugs únicos por tenant."""
+
+from typing import Iterable
+
+from src.core.domain.entities.document import Document
+from src.core.domain.repositorys.document import IDocumentRepository
+from src.core.domain.text import slugify, with_suffix
+
+
+class SlugService:
+    """
+    Gera slugs para documentos a partir de um campo de texto.
+
+    As colisões de um lote inteiro são resolvidas com uma única consulta
+    ao repositório (`get_taken_slugs`); colisões dentro do próprio lote
+    também recebem sufixos (`contrato`, `contrato-2`, `contrato-3`).
+
+    Como outro processo pode gravar o mesmo slug entre a geração e o
+    `save`, o índice único do repositório continua sendo a garantia
+    final (`SlugAlreadyExistsException`).
+
+    Args:
+        repository (IDocumentRepository): Repositório com índice de slugs.
+    """
+
+    def __init__(self, repository: IDocumentRepository):
+        self.repository = repository
+
+    @staticmethod
+    def base_slug(document: Document, source: str = "title") -> str:
+        """Slug base de um documento, sem sufixo de colisão."""
+        return slugify(getattr(document, source) or "") or slugify(
+            document.document_type.value
+        )
+
+    def assign(
+        self,
+        documents: Iterable[Document],
+        source: str = "title",
+        overwrite: bool = False,
+    ) -> list[Document]:
+        """
+        Define o slug dos documentos que ainda não têm um.
+
+        Args:
+            documents (Iterable[Document]): Documentos do lote.
+            source (str): Atributo de origem (`title`, ou `subject` em
+                contratos).
+            overwrite (bool): Se True, regera slugs já definidos.
+
+        Returns:
+            list[Document]: Os documentos que receberam um slug.
+        """
+        pending = [
+            (document, self.base_slug(document, source))
+            for document in documents
+            if overwrite or not document.slug
+        ]
+        if not pending:
+            return []
+        taken = self.repository.get_taken_slugs(
+            {(document.tenant_id, base) for document, base in pending}
+        )
+        claimed: set[tuple] = set()
+        for document, base in pending:
+            candidate, number = base, 2
+            while self._collides(document, candidate, taken, claimed):
+                candidate = with_suffix(base, number)
+                number += 1
+            claimed.add((document.tenant_id, candidate))
+            document.slug = candidate
+        return [document for document, _ in pending]
+
+    @staticmethod
+    def _collides(
+        document: Document, candidate: str, taken: set, claimed: set
+    ) -> bool:
+        """O slug já do documento (ao regerar) não conta como colisão."""
+        key = (document.tenant_id, candidate)
+        if key in claimed:
+            return True
+        return key in taken and document.slug != candidate
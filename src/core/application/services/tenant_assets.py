@@ -0,0 +1,217 @@
+"""Variantes do logo das empresas, geradas uma vez em segundo plano."""
+
+import hashlib
+import logging
+import re
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from functools import partial
+from typing import Callable, Optional
+from uuid import UUID
+
+from src.core.application.events import EventBus
+from src.core.application.services.preview import PreviewCache
+from src.core.domain.entities.base import DomainEvent
+from src.core.domain.entities.tenant import Tenant
+from src.core.domain.exceptions import TenantNotFoundException
+from src.core.domain.repositorys.tenant import ITenantRepository
+
+logger = logging.getLogger(__name__)
+
+LogoRenderer = Callable[[str, dict[str, int]], dict]
+"""Recebe o logo (caminho ou URL) e as variantes (nome e lado máximo em
+pixels); retorna os bytes PNG de cada variante."""
+
+DEFAULT_LOGO_VARIANTS = {"small": 64, "medium": 128, "large": 256}
+_VARIANT = re.compile(r"^[a-z0-9_]+$")
+_ASSET = re.compile(r"^[0-9a-f]{64}\.png$")
+
+
+def asset_name(data: bytes) -> str:
+    """Nome de um arquivo gerado: o hash do conteúdo (`<sha256>.png`)."""
+    return f"{hashlib.sha256(data).hexdigest()}.png"
+
+
+class TenantAssetService:
+    """
+    Busca e redimensiona o logo de cada empresa fora das requisições.
+
+    `Tenant.logo` é um caminho ou URL. Na criação da empresa, e a cada
+    `TenantUpdatedEvent`, o logo é lido e as variantes são geradas em um
+    `ProcessPoolExecutor`, como no `PreviewPipeline`; o callback do
+    futuro grava cada variante no cache pelo hash do conteúdo. As páginas
+    só consultam o nome da variante (`logo`) e servem os bytes do cache
+    (`asset`): como o nome muda junto com o conteúdo, a resposta pode ser
+    guardada pelo navegador indefinidamente.
+
+    A alteração de uma empresa gera as variantes de novo (o arquivo no
+    mesmo caminho pode ter mudado). Se o próprio logo mudou, as variantes
+    antigas deixam de ser oferecidas na hora; senão, continuam até as
+    novas ficarem prontas. Os arquivos antigos não são apagados, pois
+    outra empresa pode ter o mesmo logo: saem do cache pelo uso (LRU), e
+    `logo` gera de novo as variantes de um arquivo que já saiu.
+
+    Args:
+        tenant_repository (ITenantRepository): Fonte das empresas.
+        cache (PreviewCache): Destino das variantes (ex.: `DiskLRUCache`).
+        renderer (LogoRenderer): Função de leitura e redimensionamento;
+            roda em outro processo, então deve ser definida no nível de
+            um módulo.
+        executor (Executor, optional): Executor dos trabalhos; por padrão,
+            um `ProcessPoolExecutor` com `max_workers` processos.
+        variants (dict[str, int]): Variantes geradas e o lado máximo de
+            cada uma, em pixels.
+        max_workers (int, optional): Processos do executor padrão.
+    """
+
+    def __init__(
+        self,
+        tenant_repository: ITenantRepository,
+        cache: PreviewCache,
+        renderer: LogoRenderer,
+        executor: Optional[Executor] = None,
+        variants: Optional[dict[str, int]] = None,
+        max_workers: Optional[int] = None,
+    ):
+        self.tenant_repository = tenant_repository
+        self.cache = cache
+        self.renderer = renderer
+        self.variants = dict(variants or DEFAULT_LOGO_VARIANTS)
+        for variant in self.variants:
+            if not _VARIANT.match(variant):
+                raise ValueError(f"Variante inválida: '{variant}'.")
+        self._executor = executor or ProcessPoolExecutor(max_workers)
+        self._assets: dict[UUID, dict[str, str]] = {}
+        self._sources: dict[UUID, str] = {}
+        self._generations: dict[UUID, int] = {}
+        self._generation = 0
+        self._pending: dict[UUID, Future] = {}
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self.rendered = 0
+
+    def subscribe(self, bus: EventBus) -> None:
+        """Inscreve o serviço nos eventos de empresas."""
+        bus.subscribe("tenant_created", self.handle)
+        bus.subscribe("tenant_updated", self.handle)
+        bus.subscribe("tenant_deleted", self.handle)
+
+    def handle(self, event: DomainEvent) -> None:
+        """Gera as variantes da empresa do evento (ou as esquece)."""
+        tenant_id = UUID(event.data["tenant_id"])
+        try:
+            tenant = self.tenant_repository.get(tenant_id)
+        except TenantNotFoundException:
+            self.forget(tenant_id)
+            return
+        self.submit(tenant, refresh=event.event_type == "tenant_updated")
+
+    def submit(
+        self, tenant: Tenant, refresh: bool = False
+    ) -> Optional[Future]:
+        """
+        Enfileira a geração das variantes do logo, se ainda for preciso.
+
+        Args:
+            tenant (Tenant): Empresa.
+            refresh (bool): Gera de novo mesmo que o logo não tenha mudado.
+
+        Returns:
+            Future | None: O trabalho (novo ou já em andamento), ou None
+            se as variantes desse logo já existem.
+        """
+        tenant_id = tenant.entity_id
+        with self._lock:
+            if self._sources.get(tenant_id) == tenant.logo:
+                if not refresh and tenant_id in self._pending:
+                    return self._pending[tenant_id]
+                if not refresh and tenant_id in self._assets:
+                    return None
+            else:
+                self._assets.pop(tenant_id, None)
+            future, generation = self._enqueue(tenant_id, tenant.logo)
+        future.add_done_callback(partial(self._store, tenant_id, generation))
+        return future
+
+    def _enqueue(self, tenant_id: UUID, source: str) -> tuple[Future, int]:
+        """Enfileira a geração; chamado com `_lock` adquirido."""
+        self._generation += 1
+        generation = self._generations[tenant_id] = self._generation
+        self._sources[tenant_id] = source
+        future = self._executor.submit(self.renderer, source, self.variants)
+        self._pending[tenant_id] = future
+        return future, generation
+
+    def _store(self, tenant_id: UUID, generation: int, future: Future):
+        """Grava as variantes geradas; roda fora do fluxo da requisição."""
+        try:
+            names = {}
+            for variant, data in future.result().items():
+                names[variant] = name = asset_name(data)
+                if not self.cache.put(name, data):
+                    raise ValueError(f"A variante '{variant}' não coube.")
+        except Exception:  # pylint: disable=broad-exception-caught
+            logger.exception("Falha ao gerar o logo da empresa %s.", tenant_id)
+            names = None
+        with self._lock:
+            if self._generations.get(tenant_id) != generation:
+                return  # um trabalho mais novo já foi enfileirado
+            if names is not None:
+                self._assets[tenant_id] = names
+                self.rendered += 1
+            self._pending.pop(tenant_id, None)
+            self._idle.notify_all()
+
+    def forget(self, tenant_id: UUID) -> None:
+        """Deixa de oferecer as variantes de uma empresa."""
+        with self._lock:
+            self._assets.pop(tenant_id, None)
+            self._sources.pop(tenant_id, None)
+            if self._generations.pop(tenant_id, None) is not None:
+                self._pending.pop(tenant_id, None)
+                self._idle.notify_all()
+
+    def logo(self, tenant_id: UUID, variant: str = "medium") -> Optional[str]:
+        """
+        Nome do arquivo de uma variante já gerada, ou None.
+
+        Se o arquivo já saiu do cache, as variantes são geradas de novo e
+        o resultado é None até ficarem prontas.
+        """
+        with self._lock:
+            name = self._assets.get(tenant_id, {}).get(variant)
+        if name is None or name in self.cache:
+            return name
+        with self._lock:
+            source = self._sources.get(tenant_id)
+            if source is None or tenant_id in self._pending:
+                return None
+            future, generation = self._enqueue(tenant_id, source)
+        future.add_done_callback(partial(self._store, tenant_id, generation))
+        return None
+
+    def asset(self, name: str) -> Optional[bytes]:
+        """Bytes de um arquivo gerado, pelo nome, ou None."""
+        if not _ASSET.match(name):
+            return None
+        return self.cache.get(name)
+
+    @property
+    def pending(self) -> int:
+        """Trabalhos ainda em andamento."""
+        with self._lock:
+            return len(self._pending)
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """
+        Espera os trabalhos em andamento terminarem.
+
+        Returns:
+            bool: False se o tempo acabou antes.
+        """
+        with self._idle:
+            return self._idle.wait_for(lambda: not self._pending, timeout)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Encerra o executor."""
+        self._executor.shutdown(wait=wait)
@@ -0,0 +1,107 @@
+"""Unidade de trabalho sobre o repositório de documentos."""
+
+import copy
+import threading
+from typing import Iterable
+from uuid import UUID
+
+from src.core.domain.entities.document import Document
+from src.core.domain.exceptions import DocumentAlreadyExistsException
+from src.core.domain.repositorys.document import (
+    DocumentMetadata,
+    IDocumentRepository,
+)
+
+
+class DocumentUnitOfWork:
+    """
+    Acumula as alterações de várias operações e as grava de uma vez.
+
+    Tem a mesma interface de leitura e escrita usada pelos casos de uso
+    (`get`, `save`, `update`), de modo que eles rodam sem alterações
+    sobre a unidade de trabalho. `get` devolve uma cópia de trabalho do
+    documento; `save` e `update` apenas registram a mudança. Nada chega
+    ao repositório antes de `commit`, que grava tudo em uma única
+    transação e falha se algum documento lido foi alterado por outra
+    operação nesse meio tempo.
+
+    É thread-safe para operações sobre documentos diferentes.
+
+    Args:
+        repository (IDocumentRepository): Repositório de documentos.
+    """
+
+    def __init__(self, repository: IDocumentRepository):
+        self.repository = repository
+        self._loaded: dict[UUID, Document] = {}
+        self._expected: dict[UUID, DocumentMetadata] = {}
+        self._created: dict[UUID, Document] = {}
+        self._dirty: dict[UUID, None] = {}
+        self._lock = threading.Lock()
+
+    def get(self, document_id: UUID) -> Document:
+        """
+        Obtém a cópia de trabalho de um documento.
+
+        Raises:
+            DocumentNotFoundException: Se o documento não existir.
+        """
+        with self._lock:
+            document = self._created.get(document_id) or self._loaded.get(
+                document_id
+            )
+        if document is not None:
+            return document
+        # Metadados antes da entidade: se o documento mudar entre as duas
+        # leituras, o commit acusa o conflito em vez de gravar por cima.
+        metadata = self.repository.get_metadata(document_id)
+        document = copy.copy(self.repository.get(document_id))
+        with self._lock:
+            self._expected.setdefault(document_id, metadata)
+            return self._loaded.setdefault(document_id, document)
+
+    def save(self, document: Document) -> Document:
+        """Registra a inclusão de um documento."""
+        with self._lock:
+            if document.entity_id in self._created or (
+                document.entity_id in self._loaded
+            ):
+                raise DocumentAlreadyExistsException(
+                    f"Document '{document.entity_id}' já existe."
+                )
+            self._created[document.entity_id] = document
+        return document
+
+    def update(self, document: Document) -> Document:
+        """Registra a alteração de um documento (a cópia passa a valer)."""
+        with self._lock:
+            if document.entity_id in self._created:
+                self._created[document.entity_id] = document
+            else:
+                self._loaded[document.entity_id] = document
+                self._dirty[document.entity_id] = None
+        return document
+
+    @property
+    def entities(self) -> Iterable[Document]:
+        """Documentos incluídos ou alterados, na ordem de registro."""
+        return [*self._created.values()] + [
+            self._loaded[document_id] for document_id in self._dirty
+        ]
+
+    def commit(self) -> None:
+        """
+        Grava todas as alterações em uma única transação.
+
+        Raises:
+            DocumentVersionConflictException: Se um documento alterado
+                mudou no repositório depois de lido.
+        """
+        self.repository.commit(
+            self._created.values(),
+            [self._loaded[document_id] for document_id in self._dirty],
+            {
+                document_id: self._expected[document_id]
+                for document_id in self._dirty
+            },
+        )
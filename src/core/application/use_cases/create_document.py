@@ -1,5 +1,6 @@
 """Use case para criar um documento."""
 
+from src.core.application.profiling import profiled
 from src.core.application.services.base import IDocumentService
 from src.core.application.use_cases.base import UseCase
 from src.core.domain.entities.document import Document
@@ -10,6 +11,7 @@ from src.core.domain.repositorys.document import IDocumentRepository
 class CreateDocumentUseCase(UseCase):
     """Caso de uso para criar um documento."""
 
+    @profiled("CreateDocumentUseCase")
     def execute(
         self,
         repository: IDocumentRepository,
@@ -0,0 +1,46 @@
+"""Use Case para anexar um arquivo a um documento."""
+
+import copy
+from uuid import UUID
+
+from src.core.application.profiling import profiled
+from src.core.domain.repositorys.blob import BlobSource, IBlobStore
+from src.core.domain.repositorys.document import IDocumentRepository
+from src.core.domain.value_objects.attachment import Attachment
+
+
+class AttachFileUseCase:
+    """
+    Caso de uso para anexar um arquivo a um documento.
+
+    O conteúdo é gravado no armazenamento antes de o documento ser lido,
+    de modo que o upload não segura nenhum lock do repositório. Se a
+    atualização do documento falhar, o objeto gravado fica sem
+    referência, mas é reaproveitado no próximo envio do mesmo arquivo.
+    """
+
+    def __init__(
+        self,
+        document_repository: IDocumentRepository,
+        blob_store: IBlobStore,
+    ):
+        self._document_repository = document_repository
+        self._blob_store = blob_store
+
+    @profiled("AttachFileUseCase")
+    def execute(
+        self,
+        document_id: UUID,
+        filename: str,
+        source: BlobSource,
+        media_type: str,
+        user_id: UUID,
+    ) -> Attachment:
+        """Grava o conteúdo e cria uma nova versão do documento com ele."""
+        blob = self._blob_store.put(source)
+        document = copy.copy(self._document_repository.get(document_id))
+        attachment = document.attach(
+            filename, blob.digest, blob.size, media_type, user_id
+        )
+        self._document_repository.update(document)
+        return attachment
@@ -0,0 +1,190 @@
+"""Use Case para executar um lote de operações sobre documentos."""
+
+import copy
+import threading
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from typing import Any, Optional
+from uuid import UUID
+
+from src.core.application.profiling import profiled
+from src.core.application.services.base import IDocumentService
+from src.core.application.services.unit_of_work import DocumentUnitOfWork
+from src.core.application.use_cases.create_document import (
+    CreateDocumentUseCase,
+)
+from src.core.application.use_cases.document.change_status import (
+    ChangeDocumentStatusUseCase,
+)
+from src.core.application.use_cases.document.update import (
+    UpdateDocumentAttributeUseCase,
+)
+from src.core.domain.entities.document import Document
+from src.core.domain.repositorys.document import IDocumentRepository
+from src.core.domain.value_objects.doc_status import DocumentStatus
+
+CREATE = "create"
+UPDATE_ATTRIBUTE = "update_attribute"
+STATUS_OPERATIONS = {
+    "publish": DocumentStatus.PUBLISHED,
+    "archive": DocumentStatus.ARCHIVED,
+    "delete": DocumentStatus.DELETED,
+}
+OPERATIONS = (CREATE, UPDATE_ATTRIBUTE, *STATUS_OPERATIONS)
+
+
+@dataclass(frozen=True)
+class BatchOperation:
+    """
+    Uma operação do lote.
+
+    Attributes:
+        op (str): Um de `OPERATIONS`.
+        user_id (UUID): Usuário que executa a operação.
+        document_id (UUID, optional): Documento alvo; nas inclusões, é o
+            ID do documento novo, que operações seguintes podem usar.
+        document (Document, optional): Documento a incluir (`create`).
+        attr (str, optional): Atributo a alterar (`update_attribute`).
+        value (Any, optional): Novo valor (`update_attribute`).
+    """
+
+    op: str
+    user_id: UUID
+    document_id: Optional[UUID] = None
+    document: Optional[Document] = None
+    attr: Optional[str] = None
+    value: Any = None
+
+    @property
+    def target(self) -> UUID:
+        """Documento afetado pela operação."""
+        if self.document is not None:
+            return self.document.entity_id
+        return self.document_id
+
+
+@dataclass
+class OperationResult:
+    """
+    Resultado de uma operação.
+
+    Attributes:
+        document (Document, optional): Estado do documento após a
+            operação, se ela foi executada.
+        error (Exception, optional): Falha da operação.
+    """
+
+    document: Optional[Document] = None
+    error: Optional[Exception] = None
+
+    @property
+    def executed(self) -> bool:
+        """Se a operação chegou a ser executada com sucesso."""
+        return self.document is not None
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """
+    Resultado de um lote.
+
+    Attributes:
+        committed (bool): Se as alterações foram gravadas. Um lote é tudo
+            ou nada: com uma falha, nenhuma operação é gravada.
+        results (list[OperationResult]): Resultado de cada operação, na
+            ordem do lote.
+        entities (list[Document]): Documentos gravados (para publicar os
+            eventos de domínio).
+    """
+
+    committed: bool
+    results: list[OperationResult]
+    entities: list[Document]
+
+
+class ExecuteDocumentBatchUseCase:
+    """
+    Executa um lote de operações em uma única unidade de trabalho.
+
+    As operações são aplicadas com os casos de uso de documento sobre
+    uma `DocumentUnitOfWork` e gravadas com um único `commit`. Operações
+    sobre o mesmo documento formam um grupo que roda em ordem; com
+    `parallel`, grupos diferentes rodam ao mesmo tempo no `executor`, o
+    que compensa quando o repositório faz E/S a cada leitura.
+
+    Args:
+        document_repository (IDocumentRepository): Repositório de
+            documentos.
+        document_service (IDocumentService): Validação de inclusões.
+        executor (Executor, optional): Pool para os grupos em paralelo;
+            sem ele, os grupos rodam em sequência.
+    """
+
+    def __init__(
+        self,
+        document_repository: IDocumentRepository,
+        document_service: IDocumentService,
+        executor: Optional[Executor] = None,
+    ):
+        self._document_repository = document_repository
+        self._document_service = document_service
+        self._executor = executor
+
+    @profiled("ExecuteDocumentBatchUseCase")
+    def execute(
+        self, operations: list[BatchOperation], parallel: bool = False
+    ) -> BatchResult:
+        """Executa o lote; grava tudo ou nada."""
+        for operation in operations:
+            if operation.op not in OPERATIONS:
+                raise ValueError(f"Operação inválida: '{operation.op}'.")
+
+        unit = DocumentUnitOfWork(self._document_repository)
+        results = [OperationResult() for _ in operations]
+        groups: dict[UUID, list[int]] = {}
+        for index, operation in enumerate(operations):
+            groups.setdefault(operation.target, []).append(index)
+        failed = threading.Event()
+
+        def run_group(indexes: list[int]) -> None:
+            for index in indexes:
+                if failed.is_set():
+                    return
+                try:
+                    document = self._apply(unit, operations[index])
+                    results[index].document = copy.copy(document)
+                except Exception as error:  # pylint: disable=W0718
+                    results[index].error = error
+                    failed.set()
+                    return
+
+        if parallel and self._executor is not None and len(groups) > 1:
+            list(self._executor.map(run_group, groups.values()))
+        else:
+            for indexes in groups.values():
+                run_group(indexes)
+
+        if failed.is_set():
+            return BatchResult(False, results, [])
+        unit.commit()
+        return BatchResult(True, results, list(unit.entities))
+
+    def _apply(
+        self, unit: DocumentUnitOfWork, operation: BatchOperation
+    ) -> Document:
+        if operation.op == CREATE:
+            return CreateDocumentUseCase().execute(
+                unit, self._document_service, operation.document
+            )
+        if operation.op == UPDATE_ATTRIBUTE:
+            return UpdateDocumentAttributeUseCase(unit).execute(
+                operation.document_id,
+                operation.attr,
+                operation.value,
+                operation.user_id,
+            )
+        return ChangeDocumentStatusUseCase(unit).execute(
+            operation.document_id,
+            STATUS_OPERATIONS[operation.op],
+            operation.user_id,
+        )
@@ -0,0 +1,62 @@
+"""Use Case para alterar o status de um documento."""
+
+import copy
+from uuid import UUID
+
+from src.core.application.profiling import profiled
+from src.core.domain.entities.document import Document
+from src.core.domain.events.document import (
+    DocumentDeletedEvent,
+    DocumentUpdatedEvent,
+)
+from src.core.domain.exceptions import BusinessRuleViolationError
+from src.core.domain.repositorys.document import IDocumentRepository
+from src.core.domain.value_objects.doc_status import DocumentStatus
+
+
+class ChangeDocumentStatusUseCase:
+    """Caso de uso para publicar, arquivar ou deletar um documento."""
+
+    def __init__(self, document_repository: IDocumentRepository):
+        self._document_repository = document_repository
+
+    @profiled("ChangeDocumentStatusUseCase")
+    def execute(
+        self, document_id: UUID, status: DocumentStatus, user_id: UUID
+    ) -> Document:
+        """Executa o caso de uso para alterar o status do documento."""
+
+        document = copy.copy(self._document_repository.get(document_id))
+        old_status = document.status
+        if not isinstance(old_status, DocumentStatus):
+            # Tipos com ciclo próprio (ex.: `ContractStatus`) não passam
+            # pelos status de `Document`.
+            raise BusinessRuleViolationError(
+                f"O status de '{document.document_type}' não pode ser "
+                "alterado por este caso de uso."
+            )
+
+        if status == DocumentStatus.PUBLISHED:
+            document.publish()
+        elif status == DocumentStatus.ARCHIVED:
+            document.archive()
+        elif status == DocumentStatus.DELETED:
+            document.delete()
+        else:
+            raise BusinessRuleViolationError(
+                f"Não é possível alterar o status para '{status}'."
+            )
+
+        if status == DocumentStatus.DELETED:
+            event = DocumentDeletedEvent(document.entity_id, user_id)
+        else:
+            event = DocumentUpdatedEvent(
+                document_id=document.entity_id,
+                user_id=user_id,
+                old_value=old_status,
+                new_value=document.status,
+                document_type=document.document_type,
+            )
+        document.add_domain_event(event)
+
+        return self._document_repository.update(document)
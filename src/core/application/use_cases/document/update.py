@@ -0,0 +1,32 @@
+"""Use Case para atualizar um atributo de um documento."""
+
+import copy
+from typing import Any
+from uuid import UUID
+
+from src.core.application.profiling import profiled
+from src.core.domain.entities.document import Document
+from src.core.domain.repositorys.document import IDocumentRepository
+
+
+class UpdateDocumentAttributeUseCase:
+    """Caso de uso para atualizar um atributo de um documento."""
+
+    def __init__(self, document_repository: IDocumentRepository):
+        self._document_repository = document_repository
+
+    @profiled("UpdateDocumentAttributeUseCase")
+    def execute(
+        self,
+        document_id: UUID,
+        attr: str,
+        new_value: Any,
+        user_id: UUID,
+    ) -> Document:
+        """Executa o caso de uso para atualizar um atributo."""
+
+        # Cópia de trabalho: se a gravação falhar (ex.: slug em uso), a
+        # entidade guardada no repositório continua intacta.
+        document = copy.copy(self._document_repository.get(document_id))
+        document.update_attribute(attr, new_value, user_id)
+        return self._document_repository.update(document)
@@ -1,5 +1,6 @@
 """Use Case para criar uma empresa (tenant)."""
 
+from src.core.application.profiling import profiled
 from src.core.application.services.tenant_service import TenantService
 from src.core.domain.entities.tenant import Tenant
 from src.core.domain.events.tenant import TenantCreatedEvent
@@ -17,6 +18,7 @@ class CreateTenantUseCase:
         self._tenant_repository = tenant_repository
         self._tenant_service = tenant_service
 
+    @profiled("CreateTenantUseCase")
     def execute(self, tenant: Tenant) -> Tenant:
         """Executa o caso de uso para criar uma empresa (tenant)."""
 
@@ -1,7 +1,7 @@
 """Entidade base para o domínio."""
 
 from abc import ABC
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Any, Optional
 from uuid import UUID, uuid4
 
@@ -55,9 +55,10 @@ class Entity(ABC):
         created_at: Optional[datetime],
         updated_at: Optional[datetime],
     ):
+        now = datetime.now()
         self._entity_id: UUID = entity_id or uuid4()
-        self._created_at: datetime = created_at or datetime.now()
-        self._updated_at: datetime = updated_at or datetime.now()
+        self._created_at: datetime = created_at or now
+        self._updated_at: datetime = updated_at or now
         self._domain_events: list[DomainEvent] = []
 
     @property
@@ -76,8 +77,18 @@ class Entity(ABC):
         return self._updated_at
 
     def _update_timestamp(self) -> None:
-        """Atualiza o timestamp da entidade."""
-        self._updated_at = datetime.now()
+        """
+        Atualiza o timestamp da entidade.
+
+        O novo valor é sempre maior que o anterior, mesmo com duas
+        alterações no mesmo microssegundo: `updated_at` identifica o
+        estado da entidade (ETag).
+        """
+        now = datetime.now()
+        previous = self._updated_at
+        if isinstance(previous, datetime) and now <= previous:
+            now = previous + timedelta(microseconds=1)
+        self._updated_at = now
 
     def add_domain_event(self, event: DomainEvent) -> None:
         """
@@ -101,6 +112,18 @@ class Entity(ABC):
         """
         return self._domain_events.copy()
 
+    def __copy__(self) -> "Entity":
+        """
+        Cópia rasa da entidade, com a própria lista de eventos.
+
+        Usada como cópia de trabalho: alterar a cópia não altera a
+        entidade original.
+        """
+        clone = self.__class__.__new__(self.__class__)
+        clone.__dict__.update(self.__dict__)
+        clone._domain_events = list(self._domain_events)
+        return clone
+
     def __eq__(self, other: Any) -> bool:
         """Compara entidades por ID."""
         return (
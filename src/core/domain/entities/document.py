@@ -5,11 +5,16 @@ from typing import Any
 from uuid import UUID
 
 from src.core.domain.entities.base import Entity
-from src.core.domain.events.document import DocumentUpdatedEvent
+from src.core.domain.events.document import (
+    DocumentAttachmentAddedEvent,
+    DocumentUpdatedEvent,
+)
 from src.core.domain.exceptions import (
     DocumentUpdateAttrException,
     DomainValidationError,
 )
+from src.core.domain.text import slugify
+from src.core.domain.value_objects.attachment import Attachment
 from src.core.domain.value_objects.doc_status import DocumentStatus
 from src.core.domain.value_objects.doc_types import DocumentType
 
@@ -31,8 +36,15 @@ class Document(Entity):
         entity_id (UUID, optional): ID da entidade.
         created_at (datetime, optional): Timestamp de criação.
         updated_at (datetime, optional): Timestamp da última modificação.
+        slug (str, optional): Identificador legível, único por tenant.
+        attachments (tuple[Attachment, ...], optional): Arquivos anexados
+            em todas as versões, em ordem de anexação.
     """
 
+    # Atributos que `update_attribute` pode alterar. Status, versão,
+    # tenant, autor e os atributos internos mudam só pelos métodos próprios.
+    updatable_attributes: frozenset[str] = frozenset({"title", "slug"})
+
     def __init__(
         self,
         title: str,
@@ -44,6 +56,8 @@ class Document(Entity):
         entity_id: UUID = None,
         created_at: datetime = None,
         updated_at: datetime = None,
+        slug: str | None = None,
+        attachments: tuple[Attachment, ...] = (),
     ):
         super().__init__(entity_id, created_at, updated_at)
         self.title = title
@@ -52,6 +66,8 @@ class Document(Entity):
         self.document_type = document_type
         self.status = status
         self.tenant_id = tenant_id
+        self.slug = slug
+        self._attachments = tuple(attachments)
 
     @property
     def title(self) -> str:
@@ -104,6 +120,31 @@ class Document(Entity):
             )
         self._version = value
 
+    @property
+    def slug(self) -> str | None:
+        """Retorna o slug do documento."""
+        return self._slug
+
+    @slug.setter
+    def slug(self, value: str | None):
+        """Define o slug do documento, normalizando textos livres.
+
+        Slugs já normalizados (inclusive com sufixo de colisão além do
+        tamanho máximo) são mantidos; os demais passam por `slugify`.
+        """
+        if value is None:
+            self._slug = None
+            return
+        if not isinstance(value, str):
+            raise DomainValidationError("O slug deve ser um texto.")
+        if value != slugify(value, max_length=len(value)):
+            value = slugify(value)
+        if not value:
+            raise DomainValidationError(
+                "O slug deve conter pelo menos uma letra ou número."
+            )
+        self._slug = value
+
     @property
     def document_type(self) -> DocumentType:
         """Retorna o tipo do documento."""
@@ -174,6 +215,7 @@ class Document(Entity):
                 "Não é possível publicar um documento deletado"
             )
         self._status = DocumentStatus.PUBLISHED
+        self._update_timestamp()
 
     def archive(self) -> None:
         """Arquiva o documento."""
@@ -182,14 +224,95 @@ class Document(Entity):
                 "Não é possível arquivar um documento deletado"
             )
         self._status = DocumentStatus.ARCHIVED
+        self._update_timestamp()
 
     def delete(self) -> None:
         """Marca o documento como deletado (soft delete)."""
         self._status = DocumentStatus.DELETED
+        self._update_timestamp()
 
     def increment_version(self) -> None:
         """Incrementa a versão do documento."""
         self._version += 1
+        self._update_timestamp()
+
+    @property
+    def attachments(self) -> tuple[Attachment, ...]:
+        """Arquivos anexados em todas as versões."""
+        return self._attachments
+
+    def attach(
+        self,
+        filename: str,
+        digest: str,
+        size: int,
+        media_type: str,
+        user_id_modifier: UUID,
+    ) -> Attachment:
+        """
+        Anexa um arquivo já gravado no armazenamento de conteúdo.
+
+        Cada anexo cria uma nova versão do documento. Um arquivo com o
+        mesmo nome substitui o anterior a partir dessa versão; as versões
+        antigas continuam acessíveis por `attachment(filename, version)`.
+
+        Args:
+            filename (str): Nome do arquivo no documento.
+            digest (str): SHA-256 do conteúdo.
+            size (int): Tamanho em bytes.
+            media_type (str): Tipo de mídia.
+            user_id_modifier (UUID): Usuário que anexou o arquivo.
+
+        Returns:
+            Attachment: O anexo registrado.
+
+        Raises:
+            DomainValidationError: Se o documento estiver deletado ou os
+                dados do arquivo forem inválidos.
+        """
+        if self._status == DocumentStatus.DELETED:
+            raise DomainValidationError(
+                "Não é possível anexar arquivos a um documento deletado"
+            )
+        attachment = Attachment(
+            filename, digest, size, media_type, self._version + 1
+        )
+        previous = self.attachment(filename)
+        self.increment_version()
+        self._attachments = self._attachments + (attachment,)
+        self.add_domain_event(
+            DocumentAttachmentAddedEvent(
+                self.entity_id,
+                user_id_modifier,
+                self.document_type,
+                attachment,
+                previous.digest if previous else None,
+            )
+        )
+        return attachment
+
+    def attachment(
+        self, filename: str, version: int | None = None
+    ) -> Attachment | None:
+        """Arquivo com o nome dado, como estava na versão informada."""
+        return self.attachments_at(version).get(filename)
+
+    def attachments_at(
+        self, version: int | None = None
+    ) -> dict[str, Attachment]:
+        """
+        Arquivos do documento em uma versão, por nome.
+
+        Args:
+            version (int, optional): Versão desejada; a atual por padrão.
+        """
+        if version is None:
+            version = self._version
+        files: dict[str, Attachment] = {}
+        for attachment in self._attachments:
+            if attachment.version <= version:
+                files[attachment.filename] = attachment
+        return files
 
     def belongs_to_tenant(self, tenant_id: str) -> bool:
         """Verifica se o documento pertence ao tenant especificado."""
@@ -211,8 +334,10 @@ class Document(Entity):
     ):
         """
         Atualiza um atributo do documento e registra o evento de domínio.
+
+        Só os atributos de `updatable_attributes` podem ser alterados.
         """
-        if not hasattr(self, attr):
+        if attr not in self.updatable_attributes or not hasattr(self, attr):
             raise DocumentUpdateAttrException(
                 f"A entidade '{self.__class__.__name__}'"
                 f"não tem o atributo '{attr}'."
@@ -228,7 +353,11 @@ class Document(Entity):
         if old_value == new_value:
             return
 
-        if not isinstance(new_value, type(old_value)):
+        # Atributos opcionais ainda vazios (ex.: slug) são validados pelo
+        # próprio setter.
+        if old_value is not None and not isinstance(
+            new_value, type(old_value)
+        ):
             raise DocumentUpdateAttrException(
                 f"Não é possível atualizar '{attr}'. \n"
                 f"Os tipos não são compatíveis.\n"
@@ -249,7 +378,7 @@ class Document(Entity):
                 document_id=self.entity_id,
                 user_id=user_id_modifier,
                 old_value=old_value,
-                new_value=new_value,
+                new_value=getattr(self, attr),
                 document_type=self.document_type,
             )
         )
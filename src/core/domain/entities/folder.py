@@ -0,0 +1,99 @@
+"""Entidade de Pasta."""
+
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from src.core.domain.entities.base import Entity
+from src.core.domain.exceptions import DomainValidationError
+
+
+def folder_path(*folder_ids: UUID) -> str:
+    """
+    Monta o caminho materializado de uma sequência de pastas.
+
+    O caminho é a concatenação dos IDs da raiz até a pasta (`/a/b/c/`), de
+    modo que toda a subárvore de uma pasta compartilha o seu caminho como
+    prefixo.
+    """
+    return "/" + "".join(f"{folder_id.hex}/" for folder_id in folder_ids)
+
+
+class Folder(Entity):
+    """Entidade de Pasta.
+
+    Pastas organizam documentos em uma árvore por tenant.
+
+    Attributes:
+        name (str): Nome da pasta.
+        tenant_id (UUID): ID da empresa.
+        parent_id (UUID, optional): Pasta mãe; None para pastas raiz.
+        path (str): Caminho materializado, mantido pelo repositório.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        tenant_id: UUID,
+        parent_id: Optional[UUID] = None,
+        entity_id: Optional[UUID] = None,
+        created_at: Optional[datetime] = None,
+        updated_at: Optional[datetime] = None,
+    ):
+        super().__init__(entity_id, created_at, updated_at)
+        self.name = name
+        self.tenant_id = tenant_id
+        self.parent_id = parent_id
+        self.path = folder_path(self.entity_id)
+
+    @property
+    def name(self) -> str:
+        """Retorna o nome da pasta."""
+        return self._name
+
+    @name.setter
+    def name(self, value: str):
+        """Define o nome da pasta, garantindo que não seja vazio."""
+        if not value or not value.strip():
+            raise DomainValidationError("O nome da pasta não pode ser vazio.")
+        self._name = value
+
+    @property
+    def tenant_id(self) -> UUID:
+        """Retorna o ID da empresa da pasta."""
+        return self._tenant_id
+
+    @tenant_id.setter
+    def tenant_id(self, value: UUID):
+        """Define o ID da empresa da pasta."""
+        if not isinstance(value, UUID):
+            raise DomainValidationError(
+                "O ID da empresa deve ser um UUID válido."
+            )
+        self._tenant_id = value
+
+    @property
+    def parent_id(self) -> Optional[UUID]:
+        """Retorna o ID da pasta mãe."""
+        return self._parent_id
+
+    @parent_id.setter
+    def parent_id(self, value: Optional[UUID]):
+        """Define a pasta mãe."""
+        if value is not None and not isinstance(value, UUID):
+            raise DomainValidationError(
+                "O ID da pasta mãe deve ser um UUID válido."
+            )
+        if value is not None and value == self.entity_id:
+            raise DomainValidationError(
+                "Uma pasta não pode ser mãe de si mesma."
+            )
+        self._parent_id = value
+
+    @property
+    def depth(self) -> int:
+        """Profundidade da pasta (0 para pastas raiz)."""
+        return self.path.count("/") - 2
+
+    def __str__(self):
+        return f"Folder(id={self.entity_id}, name={self.name})"
@@ -4,6 +4,7 @@ from typing import Any
 from uuid import UUID
 
 from src.core.domain.entities.base import DomainEvent
+from src.core.domain.value_objects.attachment import Attachment
 
 
 class DocumentUpdatedEvent(DomainEvent):
@@ -72,3 +73,43 @@ class DocumentDeletedEvent(DomainEvent):
                 "user_id": str(user_id),
             },
         )
+
+
+class DocumentAttachmentAddedEvent(DocumentUpdatedEvent):
+    """Evento disparado quando um arquivo é anexado a um documento.
+
+    É um `document_updated`: o valor antigo é o digest anterior do
+    arquivo (ou None) e o novo é o digest anexado.
+
+    Args:
+        document_id (UUID): ID do documento.
+        user_id (UUID): ID do usuário que anexou o arquivo.
+        document_type (str): Tipo do documento.
+        attachment (Attachment): Arquivo anexado.
+        previous_digest (str, optional): Digest da versão anterior.
+    """
+
+    def __init__(
+        self,
+        document_id: UUID,
+        user_id: UUID,
+        document_type: str,
+        attachment: Attachment,
+        previous_digest: str | None = None,
+    ):
+        super().__init__(
+            document_id=document_id,
+            user_id=user_id,
+            old_value=previous_digest,
+            new_value=attachment.digest,
+            document_type=document_type,
+        )
+        self.data.update(
+            {
+                "filename": attachment.filename,
+                "digest": attachment.digest,
+                "size": attachment.size,
+                "media_type": attachment.media_type,
+                "version": attachment.version,
+            }
+        )
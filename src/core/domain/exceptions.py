@@ -9,6 +9,34 @@ class DocumentAlreadyExistsException(Exception):
     """Exceção lançada quando um documento já existe."""
 
 
+class SlugAlreadyExistsException(DocumentAlreadyExistsException):
+    """Exceção lançada quando um slug já está em uso no tenant."""
+
+
+class DocumentVersionConflictException(Exception):
+    """Exceção lançada quando um documento foi alterado desde a leitura."""
+
+
+class TenantNotFoundException(Exception):
+    """Exceção lançada quando uma empresa não é encontrada."""
+
+
+class TenantAlreadyExistsException(Exception):
+    """Exceção lançada quando uma empresa já existe."""
+
+
+class FolderNotFoundException(Exception):
+    """Exceção lançada quando uma pasta não é encontrada."""
+
+
+class FolderAlreadyExistsException(Exception):
+    """Exceção lançada quando uma pasta já existe."""
+
+
+class BlobNotFoundException(Exception):
+    """Exceção lançada quando um conteúdo não está no armazenamento."""
+
+
 class InvalidDocumentTypeException(Exception):
     """Exceção lançada quando o tipo de documento é inválido."""
 
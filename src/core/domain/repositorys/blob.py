@@ -0,0 +1,90 @@
+"""Repository para o conteúdo dos arquivos anexados."""
+
+from abc import abstractmethod
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator, NamedTuple, Optional
+
+from src.core.domain.repositorys.base import IRepository
+
+BlobSource = BinaryIO | Iterable[bytes]
+
+
+class BlobInfo(NamedTuple):
+    """
+    Identificação de um conteúdo armazenado.
+
+    Attributes:
+        digest (str): SHA-256 do conteúdo, em hexadecimal.
+        size (int): Tamanho em bytes.
+    """
+
+    digest: str
+    size: int
+
+
+class FileSegment(NamedTuple):
+    """
+    Trecho de um arquivo local com parte de um conteúdo.
+
+    Permite enviar os bytes direto do arquivo (`sendfile`, `mmap`), sem
+    lê-los para a memória do processo.
+
+    Attributes:
+        path (Path): Arquivo.
+        offset (int): Posição inicial no arquivo.
+        count (int): Quantidade de bytes.
+    """
+
+    path: Path
+    offset: int
+    count: int
+
+
+class IBlobStore(IRepository):
+    """
+    Interface para o armazenamento endereçado por conteúdo.
+
+    Cada objeto é identificado pelo SHA-256 dos seus bytes e é imutável.
+    Gravar um conteúdo que já existe não cria uma cópia.
+    """
+
+    @abstractmethod
+    def put(self, source: BlobSource) -> BlobInfo:
+        """
+        Grava um conteúdo lido de um arquivo binário ou de blocos de bytes.
+
+        Returns:
+            BlobInfo: Digest e tamanho do conteúdo.
+        """
+
+    @abstractmethod
+    def open(self, digest: str) -> BinaryIO:
+        """
+        Abre o conteúdo para leitura.
+
+        Raises:
+            BlobNotFoundException: Se o conteúdo não existir.
+        """
+
+    @abstractmethod
+    def read_chunks(self, digest: str) -> Iterator[bytes]:
+        """Lê o conteúdo em blocos."""
+
+    @abstractmethod
+    def exists(self, digest: str) -> bool:
+        """Verifica se o conteúdo existe."""
+
+    @abstractmethod
+    def size(self, digest: str) -> int:
+        """Tamanho do conteúdo, em bytes."""
+
+    @abstractmethod
+    def segments(
+        self, digest: str, start: int = 0, stop: Optional[int] = None
+    ) -> list[FileSegment]:
+        """
+        Trechos de arquivo que formam os bytes `[start, stop)`.
+
+        Raises:
+            BlobNotFoundException: Se o conteúdo não existir.
+        """
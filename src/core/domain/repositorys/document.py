@@ -1,6 +1,8 @@
 """Repository para a entidade Document."""
 
 from abc import abstractmethod
+from datetime import datetime
+from typing import Iterable, NamedTuple, Optional
 from uuid import UUID
 
 from src.core.domain.entities.document import Document
@@ -8,6 +10,21 @@ from src.core.domain.repositorys.base import IRepository
 from src.core.domain.value_objects.doc_types import DocumentType
 
 
+class DocumentMetadata(NamedTuple):
+    """
+    Dados de controle de um documento, sem o restante da entidade.
+
+    Attributes:
+        entity_id (UUID): ID do documento.
+        version (int): Versão do documento.
+        updated_at (datetime): Timestamp da última modificação.
+    """
+
+    entity_id: UUID
+    version: int
+    updated_at: datetime
+
+
 class IDocumentRepository(IRepository):
     """Interface para o repositório de documentos."""
 
@@ -23,6 +40,32 @@ class IDocumentRepository(IRepository):
     def update(self, document: Document) -> Document:
         """Atualiza um documento no repositório."""
 
+    @abstractmethod
+    def update_many(self, documents: Iterable[Document]) -> int:
+        """Atualiza vários documentos em uma única operação."""
+
+    @abstractmethod
+    def commit(
+        self,
+        created: Iterable[Document],
+        updated: Iterable[Document],
+        expected: Optional[dict[UUID, DocumentMetadata]] = None,
+    ) -> None:
+        """
+        Grava inclusões e alterações em uma única transação.
+
+        Args:
+            created (Iterable[Document]): Documentos novos.
+            updated (Iterable[Document]): Documentos alterados.
+            expected (dict[UUID, DocumentMetadata], optional): Metadados
+                de cada documento no momento da leitura (controle de
+                concorrência otimista).
+
+        Raises:
+            DocumentVersionConflictException: Se um documento mudou desde
+                a leitura; nada é gravado.
+        """
+
     @abstractmethod
     def delete(self, document_id: UUID) -> None:
         """Remove um documento do repositório."""
@@ -60,3 +103,65 @@ class IDocumentRepository(IRepository):
     @abstractmethod
     def get_by_tenant_id(self, tenant_id: UUID) -> list[Document]:
         """Obtém documentos associados a um tenant específico."""
+
+    @abstractmethod
+    def get_by_slug(self, tenant_id: UUID, slug: str) -> Document:
+        """Obtém um documento pelo slug, único dentro do tenant."""
+
+    @abstractmethod
+    def get_taken_slugs(
+        self, candidates: Iterable[tuple[UUID, str]]
+    ) -> set[tuple[UUID, str]]:
+        """
+        Obtém, em uma única consulta, os slugs em uso que colidem com os
+        candidatos `(tenant_id, slug)`: o próprio slug e as variações com
+        sufixo numérico (`slug-2`, `slug-3`, ...).
+        """
+
+    @abstractmethod
+    def get_page_by_tenant(
+        self, tenant_id: UUID, limit: int, after: Optional[UUID] = None
+    ) -> list[Document]:
+        """
+        Obtém uma página dos documentos de um tenant, em ordem de ID.
+
+        Args:
+            tenant_id (UUID): Empresa dona dos documentos.
+            limit (int): Tamanho máximo da página.
+            after (UUID, optional): ID do último documento da página
+                anterior (cursor).
+        """
+
+    @abstractmethod
+    def get_archived_by_tenant(self, tenant_id: UUID) -> list[Document]:
+        """
+        Obtém os arquivados de um tenant guardados no armazenamento frio.
+
+        Esses documentos não aparecem em `get_by_tenant_id` nem em
+        `get_page_by_tenant`.
+        """
+
+    @abstractmethod
+    def count_archived_by_tenant(self, tenant_id: UUID) -> int:
+        """Conta os arquivados frios de um tenant sem carregá-los."""
+
+    @abstractmethod
+    def get_metadata(self, document_id: UUID) -> DocumentMetadata:
+        """
+        Obtém a versão e a data de modificação de um documento.
+
+        Deve ser uma consulta leve, que não carrega a entidade completa;
+        é usada para validar caches (ETag).
+
+        Raises:
+            DocumentNotFoundException: Se o documento não existir.
+        """
+
+    @abstractmethod
+    def get_tenant_version(self, tenant_id: UUID) -> int:
+        """
+        Obtém a versão agregada dos documentos de um tenant.
+
+        O valor muda sempre que um documento do tenant é incluído,
+        alterado ou removido; serve de chave para caches de resumos.
+        """
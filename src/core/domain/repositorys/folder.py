@@ -0,0 +1,52 @@
+"""Repository para a entidade Folder."""
+
+from abc import abstractmethod
+from typing import Optional
+from uuid import UUID
+
+from src.core.domain.entities.folder import Folder
+from src.core.domain.repositorys.base import IRepository
+
+
+class IFolderRepository(IRepository):
+    """Interface para o repositório de pastas."""
+
+    @abstractmethod
+    def save(self, folder: Folder) -> Folder:
+        """Adiciona uma pasta ao repositório."""
+
+    @abstractmethod
+    def get(self, folder_id: UUID) -> Folder:
+        """Obtém uma pasta do repositório."""
+
+    @abstractmethod
+    def update(self, folder: Folder) -> Folder:
+        """Atualiza uma pasta no repositório."""
+
+    @abstractmethod
+    def delete(self, folder_id: UUID) -> None:
+        """Remove uma pasta sem subpastas do repositório."""
+
+    @abstractmethod
+    def exists(self, folder_id: UUID) -> bool:
+        """Verifica se uma pasta existe no repositório."""
+
+    @abstractmethod
+    def get_children(self, folder_id: UUID) -> list[Folder]:
+        """Obtém as subpastas diretas de uma pasta."""
+
+    @abstractmethod
+    def get_subtree(self, folder_id: UUID) -> list[Folder]:
+        """Obtém a pasta e todas as suas descendentes."""
+
+    @abstractmethod
+    def is_in_subtree(self, folder_id: UUID, ancestor_id: UUID) -> bool:
+        """Verifica se uma pasta está na subárvore de outra."""
+
+    @abstractmethod
+    def move(self, folder_id: UUID, new_parent_id: Optional[UUID]) -> Folder:
+        """Move uma pasta, com toda a sua subárvore, para outra mãe."""
+
+    @abstractmethod
+    def path_of(self, folder_id: UUID) -> str:
+        """Obtém o caminho materializado de uma pasta."""
@@ -0,0 +1,24 @@
+"""Repository para sequências numéricas."""
+
+from abc import abstractmethod
+
+from src.core.domain.repositorys.base import IRepository
+
+
+class ISequenceRepository(IRepository):
+    """
+    Interface para o armazenamento de sequências.
+
+    Cada chamada a `reserve_block` reserva atomicamente um bloco de
+    números consecutivos, mesmo com vários processos usando o mesmo
+    armazenamento.
+    """
+
+    @abstractmethod
+    def reserve_block(self, key: str, size: int) -> int:
+        """
+        Reserva o bloco `[início, início + size)` da sequência `key`.
+
+        Returns:
+            int: Primeiro número do bloco. Sequências começam em 1.
+        """
@@ -1,6 +1,7 @@
 """Repository para a entidade Tenant."""
 
 from abc import abstractmethod
+from typing import Optional
 from uuid import UUID
 
 from src.core.domain.entities.tenant import Tenant
@@ -57,3 +58,12 @@ class ITenantRepository(IRepository):
     @abstractmethod
     def exists_by_name(self, name: str) -> bool:
         """Verifica se uma empresa existe pelo nome."""
+
+    @abstractmethod
+    def get_page(
+        self,
+        limit: int,
+        after: Optional[UUID] = None,
+        is_active: bool = True,
+    ) -> list[Tenant]:
+        """Obtém uma página de empresas, em ordem de ID (cursor `after`)."""
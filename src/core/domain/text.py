@@ -0,0 +1,52 @@
+"""Normalização de textos do domínio."""
+
+import re
+import unicodedata
+
+SLUG_MAX_LENGTH = 80
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+_SUFFIX = re.compile(r"-(\d+)$")
+
+
+def fold_accents(text: str) -> str:
+    """
+    Remove acentos e cedilhas, preservando as letras base.
+
+    Example:
+        fold_accents("Locação de Imóveis") == "Locacao de Imoveis"
+    """
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(
+        char for char in decomposed if not unicodedata.combining(char)
+    )
+
+
+def slugify(text: str, max_length: int = SLUG_MAX_LENGTH) -> str:
+    """
+    Gera um slug ASCII em minúsculas, com palavras separadas por hífen.
+
+    Example:
+        slugify("Locação de Imóveis 2") == "locacao-de-imoveis-2"
+
+    Returns:
+        str: O slug, que pode ser vazio se o texto não tiver letras nem
+        números.
+    """
+    slug = _NON_ALNUM.sub("-", fold_accents(text).casefold()).strip("-")
+    return slug[:max_length].rstrip("-")
+
+
+def with_suffix(slug: str, number: int) -> str:
+    """
+    Adiciona o sufixo de colisão `-N`.
+
+    O slug base não é encurtado, de modo que `slug_family` do resultado
+    é sempre o próprio slug base.
+    """
+    return f"{slug}-{number}"
+
+
+def slug_family(slug: str) -> str:
+    """Retorna o slug sem o último sufixo numérico (`a-b-2` → `a-b`)."""
+    return _SUFFIX.sub("", slug)
@@ -0,0 +1,51 @@
+"""Arquivo anexado a um documento."""
+
+import re
+from dataclasses import dataclass
+
+from src.core.domain.exceptions import DomainValidationError
+
+_SHA256 = re.compile(r"^[0-9a-f]{64}$")
+
+
+def is_sha256(digest: str) -> bool:
+    """Verifica se o texto é um SHA-256 em hexadecimal minúsculo."""
+    return isinstance(digest, str) and _SHA256.match(digest) is not None
+
+
+@dataclass(frozen=True)
+class Attachment:
+    """
+    Referência a um arquivo do armazenamento de conteúdo.
+
+    O conteúdo fica no `IBlobStore`, endereçado pelo SHA-256; o documento
+    guarda apenas esta referência. Arquivos iguais em documentos ou
+    tenants diferentes apontam para o mesmo objeto.
+
+    Attributes:
+        filename (str): Nome do arquivo no documento.
+        digest (str): SHA-256 do conteúdo, em hexadecimal.
+        size (int): Tamanho em bytes.
+        media_type (str): Tipo de mídia, por exemplo `application/pdf`.
+        version (int): Versão do documento que trouxe o arquivo.
+    """
+
+    filename: str
+    digest: str
+    size: int
+    media_type: str
+    version: int
+
+    def __post_init__(self):
+        if not isinstance(self.filename, str) or not self.filename.strip():
+            raise DomainValidationError(
+                "O nome do arquivo não pode ser vazio."
+            )
+        if not is_sha256(self.digest):
+            raise DomainValidationError(
+                "O digest deve ser um SHA-256 em hexadecimal."
+            )
+        if not isinstance(self.size, int) or self.size < 0:
+            raise DomainValidationError(
+                "O tamanho do arquivo deve ser um inteiro não negativo."
+            )
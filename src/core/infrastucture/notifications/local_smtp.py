@@ -0,0 +1,180 @@
+"""Servidor SMTP local mínimo para desenvolvimento e testes offline.
+
+Aceita o subconjunto do protocolo usado pelo `smtplib` (EHLO/HELO, MAIL,
+RCPT, DATA, RSET, NOOP e QUIT), guarda as mensagens em memória e conta
+as conexões. Não faz entrega nem autenticação.
+
+Uso:
+    with LocalSmtpServer() as server:
+        mailer = SmtpMailer(server.host, server.port)
+"""
+
+import socketserver
+import threading
+from dataclasses import dataclass
+from email import message_from_bytes
+from email.message import Message
+
+
+@dataclass(frozen=True)
+class ReceivedMessage:
+    """Mensagem recebida pelo servidor local."""
+
+    mail_from: str
+    recipients: tuple[str, ...]
+    data: bytes
+
+    @property
+    def message(self) -> Message:
+        """Mensagem de e-mail decodificada."""
+        return message_from_bytes(self.data)
+
+
+class _SmtpHandler(socketserver.StreamRequestHandler):
+    server: "_Server"
+
+    def _reply(self, line: str) -> None:
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def _read_data(self) -> bytes:
+        lines = []
+        while True:
+            line = self.rfile.readline()
+            if not line or line in (b".\r\n", b".\n"):
+                break
+            if line.startswith(b".."):
+                line = line[1:]
+            lines.append(line)
+        return b"".join(lines)
+
+    def handle(self) -> None:
+        owner = self.server.owner
+        owner.register_connection()
+        self._reply("220 localhost ESMTP local")
+        mail_from, recipients = "", []
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command, _, argument = line.decode().strip().partition(" ")
+            command = command.upper()
+            if command == "EHLO":
+                self._reply("250-localhost")
+                self._reply("250 8BITMIME")
+            elif command in ("HELO", "NOOP", "RSET"):
+                if command == "RSET":
+                    mail_from, recipients = "", []
+                self._reply("250 OK")
+            elif command == "MAIL":
+                mail_from, recipients = argument.partition(":")[2], []
+                self._reply("250 OK")
+            elif command == "RCPT":
+                recipient = argument.partition(":")[2].strip("<> ")
+                refusal = owner.refusal(recipient)
+                if refusal:
+                    self._reply(refusal)
+                    continue
+                recipients.append(recipient)
+                self._reply("250 OK")
+            elif command == "DATA":
+                self._reply("354 Fim com <CRLF>.<CRLF>")
+                data = self._read_data()
+                failure = owner.take_failure()
+                if failure:
+                    self._reply(failure)
+                    continue
+                owner.store(
+                    ReceivedMessage(
+                        mail_from.strip("<> "), tuple(recipients), data
+                    )
+                )
+                self._reply("250 OK")
+            elif command == "QUIT":
+                self._reply("221 Tchau")
+                return
+            else:
+                self._reply("502 Comando não implementado")
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+    owner: "LocalSmtpServer"
+
+
+class LocalSmtpServer:
+    """
+    Servidor SMTP em uma thread, escutando em uma porta local.
+
+    Args:
+        host (str): Endereço de escuta.
+        port (int): Porta; 0 escolhe uma porta livre.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self._server = _Server((host, port), _SmtpHandler)
+        self._server.owner = self
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, daemon=True
+        )
+        self._lock = threading.Lock()
+        self._failures: list[str] = []
+        self._refusals: dict[str, str] = {}
+        self.messages: list[ReceivedMessage] = []
+        self.connections = 0
+
+    @property
+    def host(self) -> str:
+        """Endereço de escuta."""
+        return self._server.server_address[0]
+
+    @property
+    def port(self) -> int:
+        """Porta de escuta."""
+        return self._server.server_address[1]
+
+    def register_connection(self) -> None:
+        """Conta uma nova conexão."""
+        with self._lock:
+            self.connections += 1
+
+    def store(self, message: ReceivedMessage) -> None:
+        """Guarda uma mensagem recebida."""
+        with self._lock:
+            self.messages.append(message)
+
+    def fail_next(self, reply: str = "451 Tente mais tarde", count=1):
+        """Responde `reply` aos próximos `count` comandos DATA."""
+        with self._lock:
+            self._failures.extend([reply] * count)
+
+    def take_failure(self) -> str:
+        """Retira a próxima falha programada, se houver."""
+        with self._lock:
+            return self._failures.pop(0) if self._failures else ""
+
+    def refuse(self, recipient: str, reply: str = "550 Caixa inexistente"):
+        """Responde `reply` ao RCPT de `recipient` a partir de agora."""
+        with self._lock:
+            self._refusals[recipient] = reply
+
+    def refusal(self, recipient: str) -> str:
+        """Resposta programada para o RCPT de `recipient`, se houver."""
+        with self._lock:
+            return self._refusals.get(recipient, "")
+
+    def start(self) -> "LocalSmtpServer":
+        """Inicia o servidor em segundo plano."""
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Para o servidor."""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "LocalSmtpServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
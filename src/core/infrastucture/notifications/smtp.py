@@ -0,0 +1,142 @@
+"""Envio de notificações por SMTP com conexão reaproveitada."""
+
+import smtplib
+from email.message import EmailMessage
+from typing import Callable, Optional
+
+from src.core.application.services.notification import (
+    DeliveryError,
+    IMailer,
+    Notification,
+    PermanentDeliveryError,
+    TransientDeliveryError,
+)
+
+
+def _classify(code: int, message: str) -> DeliveryError:
+    """Códigos 5xx são definitivos; os demais, temporários."""
+    if 500 <= code < 600:
+        return PermanentDeliveryError(f"{code} {message}")
+    return TransientDeliveryError(f"{code} {message}")
+
+
+def _classify_refused(refused: dict) -> DeliveryError:
+    """Falha definitiva só se todos os destinatários recusados forem 5xx."""
+    if all(500 <= code < 600 for code, _ in refused.values()):
+        return PermanentDeliveryError(str(refused))
+    return TransientDeliveryError(str(refused))
+
+
+class SmtpMailer(IMailer):
+    """
+    Envia lotes de notificações sobre uma única conexão SMTP.
+
+    A conexão é aberta no primeiro envio e mantida entre lotes; se o
+    servidor a encerrar, ela é reaberta no envio seguinte. Use `close` ao
+    desligar o despachante.
+
+    Args:
+        host (str): Servidor SMTP.
+        port (int): Porta do servidor.
+        sender (str): Remetente das mensagens.
+        username (str, optional): Usuário para autenticação.
+        password (str, optional): Senha para autenticação.
+        starttls (bool): Negocia TLS antes de autenticar.
+        timeout (float): Timeout de rede, em segundos.
+        smtp_factory (Callable[..., smtplib.SMTP]): Cria a conexão.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int = 25,
+        sender: str = "nao-responda@localhost",
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        starttls: bool = False,
+        timeout: float = 10.0,
+        smtp_factory: Callable[..., smtplib.SMTP] = smtplib.SMTP,
+    ):
+        self.host = host
+        self.port = port
+        self.sender = sender
+        self.username = username
+        self.password = password
+        self.starttls = starttls
+        self.timeout = timeout
+        self.connections_opened = 0
+        self._smtp_factory = smtp_factory
+        self._smtp: Optional[smtplib.SMTP] = None
+
+    def _connection(self) -> smtplib.SMTP:
+        if self._smtp is None:
+            smtp = self._smtp_factory(
+                self.host, self.port, timeout=self.timeout
+            )
+            if self.starttls:
+                smtp.starttls()
+            if self.username:
+                smtp.login(self.username, self.password or "")
+            self._smtp = smtp
+            self.connections_opened += 1
+        return self._smtp
+
+    def _drop_connection(self) -> None:
+        smtp, self._smtp = self._smtp, None
+        if smtp is not None:
+            try:
+                smtp.close()
+            except OSError:
+                pass
+
+    def build_message(self, notification: Notification) -> EmailMessage:
+        """Monta a mensagem de e-mail de uma notificação."""
+        message = EmailMessage()
+        message["From"] = self.sender
+        message["To"] = ", ".join(notification.recipients)
+        message["Subject"] = notification.subject
+        message.set_content(notification.body)
+        return message
+
+    def _send(self, notification: Notification) -> Optional[DeliveryError]:
+        """
+        Envia uma notificação.
+
+        Se só parte dos destinatários for recusada, a mensagem já foi
+        entregue aos demais: `notification.recipients` passa a conter só
+        os recusados, para que um reenvio não duplique a entrega.
+        """
+        try:
+            refused = self._connection().send_message(
+                self.build_message(notification),
+                to_addrs=list(notification.recipients),
+            )
+        except smtplib.SMTPRecipientsRefused as error:
+            return _classify_refused(error.recipients)
+        except smtplib.SMTPResponseException as error:
+            if error.smtp_code == 421:
+                self._drop_connection()
+            return _classify(error.smtp_code, str(error.smtp_error))
+        except (smtplib.SMTPException, OSError) as error:
+            self._drop_connection()
+            return TransientDeliveryError(str(error))
+        if refused:
+            notification.recipients = tuple(refused)
+            return _classify_refused(refused)
+        return None
+
+    def send_batch(
+        self, notifications: list[Notification]
+    ) -> list[Optional[DeliveryError]]:
+        """Envia um lote pela conexão atual."""
+        return [self._send(notification) for notification in notifications]
+
+    def close(self) -> None:
+        """Encerra a conexão com QUIT."""
+        smtp, self._smtp = self._smtp, None
+        if smtp is None:
+            return
+        try:
+            smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            smtp.close()
@@ -0,0 +1,203 @@
+"""Segmentos compactados, só de acréscimo, para dados frios."""
+
+import lzma
+import os
+import re
+import struct
+import threading
+import zlib
+from pathlib import Path
+from typing import NamedTuple
+
+SEGMENT_BYTES = 64 << 20
+# Cabeçalho de cada registro: tamanho, CRC-32 e compressor.
+_HEADER = struct.Struct(">IIB")
+_SEGMENT = re.compile(r"^segment-(\d{8})\.arc$")
+CODECS = {
+    "zlib": (1, lambda data: zlib.compress(data, 6), zlib.decompress),
+    "lzma": (2, lzma.compress, lzma.decompress),
+}
+_DECOMPRESS = {code: decompress for code, _, decompress in CODECS.values()}
+
+
+class ArchiveLocation(NamedTuple):
+    """
+    Posição de um registro nos segmentos.
+
+    Attributes:
+        segment (int): Número do segmento.
+        offset (int): Início do registro (cabeçalho) no segmento.
+        length (int): Tamanho do registro, com o cabeçalho.
+    """
+
+    segment: int
+    offset: int
+    length: int
+
+
+class ArchiveStore:
+    """
+    Registros compactados gravados em segmentos só de acréscimo.
+
+    Cada registro é compactado individualmente (`zlib` ou `lzma`, da
+    biblioteca padrão) e escrito no fim do segmento ativo,
+    `segment-00000001.arc`; ao passar de `segment_bytes`, um novo segmento
+    é aberto. A leitura de um registro é um `pread` na posição devolvida
+    pela gravação e a descompressão só dele, sem índice em disco: quem
+    grava guarda o `ArchiveLocation`.
+
+    Um registro nunca é reescrito. Ao descartá-lo, seus bytes passam a
+    contar como lixo do segmento, e o arquivo é apagado quando todos os
+    registros de um segmento fechado foram descartados.
+
+    Args:
+        root (str | Path): Diretório dos segmentos.
+        codec (str): `zlib` (mais rápido) ou `lzma` (menor).
+        segment_bytes (int): Tamanho a partir do qual o segmento é fechado.
+        durable (bool): Executa `fsync` após cada gravação.
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        codec: str = "zlib",
+        segment_bytes: int = SEGMENT_BYTES,
+        durable: bool = False,
+    ):
+        if codec not in CODECS:
+            raise ValueError(
+                f"Compressor inválido: '{codec}'. Use um de {tuple(CODECS)}."
+            )
+        if segment_bytes < 1:
+            raise ValueError("O tamanho do segmento deve ser positivo.")
+        self.root = Path(root)
+        self.codec = codec
+        self.segment_bytes = segment_bytes
+        self.durable = durable
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._code, self._compress, _ = CODECS[codec]
+        self._readers: dict[int, int] = {}
+        self._sizes: dict[int, int] = {}
+        self._garbage: dict[int, int] = {}
+        for path in self.root.iterdir():
+            match = _SEGMENT.match(path.name)
+            if match:
+                self._sizes[int(match.group(1))] = path.stat().st_size
+        self._active = max(self._sizes, default=1)
+        self._sizes.setdefault(self._active, 0)
+        self._writer = self._open_writer()
+        self._lock = threading.Lock()
+
+    def _path(self, segment: int) -> Path:
+        return self.root / f"segment-{segment:08d}.arc"
+
+    def _open_writer(self) -> int:
+        return os.open(
+            self._path(self._active),
+            os.O_WRONLY | os.O_CREAT | os.O_APPEND,
+            0o644,
+        )
+
+    @property
+    def segments(self) -> int:
+        """Quantidade de segmentos em disco."""
+        return len(self._sizes)
+
+    @property
+    def size(self) -> int:
+        """Bytes ocupados pelos segmentos."""
+        return sum(self._sizes.values())
+
+    @property
+    def garbage(self) -> int:
+        """Bytes de registros descartados ainda nos segmentos."""
+        return sum(self._garbage.values())
+
+    def append(self, data: bytes) -> ArchiveLocation:
+        """
+        Compacta e grava um registro no fim do segmento ativo.
+
+        Returns:
+            ArchiveLocation: Posição para ler o registro.
+        """
+        payload = self._compress(data)
+        record = (
+            _HEADER.pack(len(payload), zlib.crc32(payload), self._code)
+            + payload
+        )
+        with self._lock:
+            size = self._sizes[self._active]
+            if size and size + len(record) > self.segment_bytes:
+                os.close(self._writer)
+                self._active += 1
+                self._sizes[self._active] = size = 0
+                self._writer = self._open_writer()
+            os.write(self._writer, record)
+            if self.durable:
+                os.fsync(self._writer)
+            self._sizes[self._active] = size + len(record)
+            return ArchiveLocation(self._active, size, len(record))
+
+    def read(self, location: ArchiveLocation) -> bytes:
+        """
+        Lê e descompacta um registro.
+
+        Raises:
+            ValueError: Se o registro estiver corrompido.
+        """
+        with self._lock:
+            record = os.pread(
+                self._reader(location.segment),
+                location.length,
+                location.offset,
+            )
+        length, checksum, code = _HEADER.unpack_from(record)
+        payload = record[_HEADER.size :]
+        if (
+            len(payload) != length
+            or zlib.crc32(payload) != checksum
+            or code not in _DECOMPRESS
+        ):
+            raise ValueError(f"Registro corrompido em {location}.")
+        return _DECOMPRESS[code](payload)
+
+    def _reader(self, segment: int) -> int:
+        """Descritor de leitura do segmento; chamado com `_lock`."""
+        descriptor = self._readers.get(segment)
+        if descriptor is None:
+            descriptor = os.open(self._path(segment), os.O_RDONLY)
+            self._readers[segment] = descriptor
+        return descriptor
+
+    def discard(self, location: ArchiveLocation) -> None:
+        """
+        Marca um registro como descartado.
+
+        O segmento é apagado quando fica só com registros descartados,
+        exceto o ativo, que ainda recebe gravações, e o seu descritor de
+        leitura é fechado. Cada registro deve ser descartado uma única vez
+        e não pode mais ser lido depois disso: quem grava deve impedir
+        que uma leitura use uma posição já descartada.
+        """
+        with self._lock:
+            segment = location.segment
+            if segment not in self._sizes:
+                return
+            garbage = self._garbage.get(segment, 0) + location.length
+            if segment == self._active or garbage < self._sizes[segment]:
+                self._garbage[segment] = garbage
+                return
+            self._garbage.pop(segment, None)
+            del self._sizes[segment]
+            descriptor = self._readers.pop(segment, None)
+            if descriptor is not None:
+                os.close(descriptor)
+            self._path(segment).unlink(missing_ok=True)
+
+    def close(self) -> None:
+        """Fecha os arquivos abertos."""
+        with self._lock:
+            os.close(self._writer)
+            for descriptor in self._readers.values():
+                os.close(descriptor)
+            self._readers.clear()
@@ -0,0 +1,48 @@
+"""Acesso assíncrono aos repositórios síncronos."""
+
+import asyncio
+import functools
+from typing import Any, Awaitable, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+class AsyncRepository:
+    """
+    Expõe os métodos de um repositório como corrotinas.
+
+    Repositórios em memória respondem em microssegundos e são chamados
+    diretamente no event loop (`offload=False`), sem o custo de trocar de
+    thread. Repositórios que bloqueiam em E/S (SQLite, rede) devem usar
+    `offload=True`, que executa cada chamada em uma thread do pool padrão
+    e mantém o loop livre.
+
+    Example:
+        documents = AsyncRepository(InMemoryDocumentRepository())
+        document = await documents.get(document_id)
+
+    Args:
+        repository: Repositório síncrono.
+        offload (bool): Executa as chamadas fora do event loop.
+    """
+
+    def __init__(self, repository: Any, offload: bool = False):
+        self.repository = repository
+        self.offload = offload
+
+    async def run(self, func: Callable[..., T], *args, **kwargs) -> T:
+        """Executa uma função síncrona conforme a política de `offload`."""
+        if self.offload:
+            return await asyncio.to_thread(func, *args, **kwargs)
+        return func(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Callable[..., Awaitable[Any]]:
+        method = getattr(self.repository, name)
+        if not callable(method):
+            return method
+
+        @functools.wraps(method)
+        async def call(*args, **kwargs):
+            return await self.run(method, *args, **kwargs)
+
+        return call
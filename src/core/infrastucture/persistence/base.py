@@ -0,0 +1,273 @@
+"""Base para repositórios em memória com índices secundários."""
+
+import bisect
+import threading
+from typing import Any, Hashable, Iterable, Optional, TypeVar
+from uuid import UUID
+
+from src.core.domain.entities.base import Entity
+
+E = TypeVar("E", bound=Entity)
+
+
+class InMemoryRepository:
+    """
+    Armazena entidades em memória indexadas por ID.
+
+    Subclasses declaram índices de igualdade em `_index_keys`; cada índice
+    mapeia um valor para o conjunto ordenado (por inserção) de IDs que o
+    possuem, de modo que consultas por esses campos custam O(k) no número
+    de resultados. Na atualização, apenas os índices cujas chaves mudaram
+    são alterados.
+
+    Índices listados em `_ordered_indexes` mantêm também, para cada valor,
+    a lista ordenada dos IDs, usada na paginação por cursor (`_page`).
+
+    Attributes:
+        not_found_exception (type[Exception]): Exceção para IDs ausentes.
+        already_exists_exception (type[Exception]): Exceção para IDs
+            duplicados.
+    """
+
+    not_found_exception: type[Exception] = KeyError
+    already_exists_exception: type[Exception] = KeyError
+    _ordered_indexes: tuple[str, ...] = ()
+
+    def __init__(self):
+        self._entities: dict[UUID, Any] = {}
+        self._indexes: dict[str, dict[Hashable, dict[UUID, None]]] = {}
+        self._ordered: dict[str, dict[Hashable, list[UUID]]] = {}
+        self._indexed_keys: dict[UUID, dict[str, Hashable]] = {}
+        self._lock = threading.RLock()
+
+    def _index_keys(self, entity: Any) -> dict[str, Hashable]:
+        """
+        Retorna os valores indexados de uma entidade.
+
+        Args:
+            entity: Entidade a ser indexada.
+
+        Returns:
+            dict[str, Hashable]: Nome do índice para o valor indexado.
+        """
+        return {}
+
+    def _index(self, entity: Any) -> None:
+        """Adiciona a entidade aos índices secundários."""
+        keys = self._index_keys(entity)
+        entity_id = entity.entity_id
+        for name, key in keys.items():
+            self._add(name, key, entity_id)
+        self._indexed_keys[entity_id] = keys
+
+    def _add(self, name: str, key: Hashable, entity_id: UUID) -> None:
+        """Adiciona um ID a uma entrada de índice."""
+        self._indexes.setdefault(name, {}).setdefault(key, {})[
+            entity_id
+        ] = None
+        if name in self._ordered_indexes:
+            bisect.insort(
+                self._ordered.setdefault(name, {}).setdefault(key, []),
+                entity_id,
+            )
+
+    def _unindex(self, entity_id: UUID) -> None:
+        """Remove a entidade dos índices secundários."""
+        for name, key in self._indexed_keys.pop(entity_id, {}).items():
+            self._discard(name, key, entity_id)
+
+    def _reindex(self, entity: Any) -> None:
+        """Atualiza apenas os índices cujas chaves mudaram."""
+        entity_id = entity.entity_id
+        old_keys = self._indexed_keys.get(entity_id, {})
+        new_keys = self._index_keys(entity)
+        for name in old_keys.keys() - new_keys.keys():
+            self._discard(name, old_keys[name], entity_id)
+        for name, key in new_keys.items():
+            old_key = old_keys.get(name)
+            if name in old_keys and old_key == key:
+                continue
+            if name in old_keys:
+                self._discard(name, old_key, entity_id)
+            self._add(name, key, entity_id)
+        self._indexed_keys[entity_id] = new_keys
+
+    def _discard(self, name: str, key: Hashable, entity_id: UUID) -> None:
+        """Remove um ID de uma entrada de índice."""
+        bucket = self._indexes.get(name, {}).get(key)
+        if bucket is None:
+            return
+        bucket.pop(entity_id, None)
+        if not bucket:
+            del self._indexes[name][key]
+        ordered = self._ordered.get(name, {}).get(key)
+        if ordered is not None:
+            index = bisect.bisect_left(ordered, entity_id)
+            if index < len(ordered) and ordered[index] == entity_id:
+                del ordered[index]
+            if not ordered:
+                del self._ordered[name][key]
+
+    def _lookup(self, name: str, key: Hashable) -> list:
+        """Retorna as entidades de uma entrada de índice."""
+        with self._lock:
+            bucket = self._indexes.get(name, {}).get(key, {})
+            return [self._load(entity_id) for entity_id in bucket]
+
+    def _lookup_ids(self, name: str, key: Hashable) -> Iterable[UUID]:
+        """Retorna uma cópia dos IDs de uma entrada de índice."""
+        with self._lock:
+            return list(self._indexes.get(name, {}).get(key, {}))
+
+    def _page(
+        self,
+        name: str,
+        key: Hashable,
+        limit: int,
+        after: Optional[UUID] = None,
+    ) -> list:
+        """
+        Retorna uma página de um índice ordenado, em ordem de ID.
+
+        O cursor `after` é o ID do último item da página anterior; cada
+        página custa O(log m + k).
+        """
+        with self._lock:
+            ids = self._ordered.get(name, {}).get(key, [])
+            start = bisect.bisect_right(ids, after) if after else 0
+            return [
+                self._load(entity_id)
+                for entity_id in ids[start : start + limit]
+            ]
+
+    def _store(self, entity: Any) -> None:
+        """Grava a entidade no mapa por ID."""
+        self._entities[entity.entity_id] = entity
+
+    def _load(self, entity_id: UUID) -> Any:
+        """
+        Lê a entidade do mapa por ID.
+
+        Subclasses que guardam no mapa outra representação (ex.: a posição
+        no arquivo frio) reconstroem a entidade aqui.
+
+        Raises:
+            KeyError: Se o ID não existir.
+        """
+        return self._entities[entity_id]
+
+    def save(self, entity: E) -> E:
+        """Adiciona uma entidade ao repositório."""
+        with self._lock:
+            if entity.entity_id in self._entities:
+                raise self.already_exists_exception(
+                    f"{type(entity).__name__} '{entity.entity_id}' "
+                    "já existe."
+                )
+            self._store(entity)
+            self._index(entity)
+        return entity
+
+    def get(self, entity_id: UUID) -> Any:
+        """Obtém uma entidade pelo ID."""
+        try:
+            return self._load(entity_id)
+        except KeyError:
+            raise self.not_found_exception(
+                f"Entidade '{entity_id}' não encontrada."
+            ) from None
+
+    def get_by_id(self, entity_id: UUID) -> Any:
+        """Obtém uma entidade pelo ID."""
+        return self.get(entity_id)
+
+    def update(self, entity: E) -> E:
+        """Atualiza uma entidade e os seus índices."""
+        with self._lock:
+            if entity.entity_id not in self._entities:
+                raise self.not_found_exception(
+                    f"Entidade '{entity.entity_id}' não encontrada."
+                )
+            self._store(entity)
+            self._reindex(entity)
+        return entity
+
+    def update_many(self, entities: Iterable[E]) -> int:
+        """
+        Atualiza várias entidades com uma única aquisição do lock.
+
+        A operação é tudo ou nada: se alguma entidade não existir, nenhuma
+        é atualizada.
+
+        Returns:
+            int: Quantidade de entidades atualizadas.
+        """
+        entities = list(entities)
+        with self._lock:
+            for entity in entities:
+                if entity.entity_id not in self._entities:
+                    raise self.not_found_exception(
+                        f"Entidade '{entity.entity_id}' não encontrada."
+                    )
+            for entity in entities:
+                self._store(entity)
+                self._reindex(entity)
+        return len(entities)
+
+    def commit(self, created: Iterable[E], updated: Iterable[E]) -> None:
+        """
+        Grava inclusões e alterações com uma única aquisição do lock.
+
+        A operação é tudo ou nada: todas as entidades são validadas antes
+        da primeira gravação.
+
+        Raises:
+            already_exists_exception: Se uma inclusão já existir.
+            not_found_exception: Se uma alteração não existir.
+        """
+        created, updated = list(created), list(updated)
+        with self._lock:
+            new_ids = set()
+            for entity in created:
+                if entity.entity_id in self._entities or (
+                    entity.entity_id in new_ids
+                ):
+                    raise self.already_exists_exception(
+                        f"{type(entity).__name__} '{entity.entity_id}' "
+                        "já existe."
+                    )
+                new_ids.add(entity.entity_id)
+            for entity in updated:
+                if entity.entity_id not in self._entities:
+                    raise self.not_found_exception(
+                        f"Entidade '{entity.entity_id}' não encontrada."
+                    )
+            for entity in created:
+                self._store(entity)
+                self._index(entity)
+            for entity in updated:
+                self._store(entity)
+                self._reindex(entity)
+
+    def delete(self, entity_id: UUID) -> None:
+        """Remove uma entidade do repositório."""
+        with self._lock:
+            if entity_id not in self._entities:
+                raise self.not_found_exception(
+                    f"Entidade '{entity_id}' não encontrada."
+                )
+            self._unindex(entity_id)
+            del self._entities[entity_id]
+
+    def all(self) -> list:
+        """Obtém todas as entidades do repositório."""
+        with self._lock:
+            return [self._load(entity_id) for entity_id in self._entities]
+
+    def count(self) -> int:
+        """Conta o número de entidades no repositório."""
+        return len(self._entities)
+
+    def exists(self, entity_id: UUID) -> bool:
+        """Verifica se uma entidade existe no repositório."""
+        return entity_id in self._entities
@@ -0,0 +1,392 @@
+"""Armazenamento de conteúdo endereçado por SHA-256 em disco."""
+
+import contextlib
+import hashlib
+import io
+import os
+import struct
+import tempfile
+from bisect import bisect_right
+from itertools import accumulate
+from pathlib import Path
+from typing import BinaryIO, Iterator, Optional
+
+from src.core.domain.exceptions import BlobNotFoundException
+from src.core.domain.repositorys.blob import (
+    BlobInfo,
+    BlobSource,
+    FileSegment,
+    IBlobStore,
+)
+from src.core.domain.value_objects.attachment import is_sha256
+from src.core.infrastucture.persistence.chunking import Chunker
+
+CHUNK_SIZE = 1 << 20
+MANIFEST_MAGIC = b"CDCM\x01"
+_ENTRY = struct.Struct(">32sQ")
+
+
+def _sharded(directory: Path, digest: str) -> Path:
+    """Caminho `ab/cdef...` do digest dentro do diretório."""
+    if not is_sha256(digest):
+        raise ValueError(f"Digest inválido: '{digest}'.")
+    return directory / digest[:2] / digest[2:]
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Persiste a entrada de diretório criada pelo rename."""
+    try:
+        descriptor = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(descriptor)
+    except OSError:
+        pass
+    finally:
+        os.close(descriptor)
+
+
+class FileSystemBlobStore(IBlobStore):
+    """
+    Implementação de `IBlobStore` em um diretório local.
+
+    Cada objeto fica em `objects/ab/cdef...`, pelo SHA-256 do conteúdo. A
+    gravação é feita em streaming, em blocos de `chunk_size`: cada bloco
+    atualiza o hash e é escrito em um arquivo temporário no mesmo
+    diretório raiz, sem manter o conteúdo inteiro em memória. No fim, o
+    arquivo é renomeado atomicamente para o caminho do digest; se o
+    objeto já existir, o temporário é descartado e nada é duplicado.
+
+    Leitores nunca veem um objeto parcial, e uma gravação interrompida
+    deixa, no máximo, um temporário em `tmp/`.
+
+    Args:
+        root (str | Path): Diretório do armazenamento.
+        chunk_size (int): Tamanho dos blocos de leitura e escrita.
+        durable (bool): Executa `fsync` no arquivo e no diretório antes
+            de confirmar a gravação.
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        chunk_size: int = CHUNK_SIZE,
+        durable: bool = True,
+    ):
+        if chunk_size < 1:
+            raise ValueError("O tamanho do bloco deve ser positivo.")
+        self.root = Path(root)
+        self.chunk_size = chunk_size
+        self.durable = durable
+        self._objects = self.root / "objects"
+        self._tmp = self.root / "tmp"
+        self._objects.mkdir(parents=True, exist_ok=True)
+        self._tmp.mkdir(parents=True, exist_ok=True)
+
+    def _location(self, digest: str) -> Path:
+        return _sharded(self._objects, digest)
+
+    def path(self, digest: str) -> Path:
+        """
+        Caminho do arquivo do objeto, para leituras diretas.
+
+        Raises:
+            BlobNotFoundException: Se o conteúdo não existir.
+        """
+        location = self._location(digest)
+        if not location.is_file():
+            raise BlobNotFoundException(f"Conteúdo '{digest}' não encontrado.")
+        return location
+
+    def put(self, source: BlobSource) -> BlobInfo:
+        """Grava o conteúdo, calculando o SHA-256 na mesma passagem."""
+        hasher = hashlib.sha256()
+        size = 0
+        descriptor, temporary = tempfile.mkstemp(dir=self._tmp, prefix="put-")
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                for chunk in self._chunks(source):
+                    hasher.update(chunk)
+                    file.write(chunk)
+                    size += len(chunk)
+                if self.durable:
+                    file.flush()
+                    os.fsync(file.fileno())
+            digest = hasher.hexdigest()
+            location = self._location(digest)
+            if location.is_file():
+                os.unlink(temporary)
+            else:
+                location.parent.mkdir(exist_ok=True)
+                os.chmod(temporary, 0o444)
+                os.replace(temporary, location)
+                if self.durable:
+                    _fsync_directory(location.parent)
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(temporary)
+            raise
+        return BlobInfo(digest, size)
+
+    def _chunks(self, source: BlobSource) -> Iterator[bytes]:
+        """Blocos da origem; arquivos são lidos em um buffer reutilizado."""
+        readinto = getattr(source, "readinto", None)
+        if readinto is None:
+            if hasattr(source, "read"):
+                yield from iter(lambda: source.read(self.chunk_size), b"")
+                return
+            for chunk in source:
+                if chunk:
+                    yield chunk
+            return
+        buffer = bytearray(self.chunk_size)
+        view = memoryview(buffer)
+        while True:
+            count = readinto(view)
+            if not count:
+                return
+            yield view[:count]
+
+    def open(self, digest: str) -> BinaryIO:
+        """Abre o conteúdo para leitura binária."""
+        return open(self.path(digest), "rb")
+
+    def read_chunks(
+        self, digest: str, chunk_size: Optional[int] = None
+    ) -> Iterator[bytes]:
+        """Lê o conteúdo em blocos de `chunk_size`."""
+        with self.open(digest) as file:
+            yield from iter(
+                lambda: file.read(chunk_size or self.chunk_size), b""
+            )
+
+    def exists(self, digest: str) -> bool:
+        """Verifica se o conteúdo existe."""
+        return self._location(digest).is_file()
+
+    def size(self, digest: str) -> int:
+        """Tamanho do conteúdo, em bytes."""
+        return self.path(digest).stat().st_size
+
+    def segments(
+        self, digest: str, start: int = 0, stop: Optional[int] = None
+    ) -> list[FileSegment]:
+        """O próprio arquivo do objeto, de `start` a `stop`."""
+        path = self.path(digest)
+        if stop is None:
+            stop = path.stat().st_size
+        if stop <= start:
+            return []
+        return [FileSegment(path, start, stop - start)]
+
+
+class ChunkedBlobStore(IBlobStore):
+    """
+    Implementação de `IBlobStore` com deduplicação por blocos.
+
+    O conteúdo é dividido em blocos definidos pelo conteúdo (`Chunker`,
+    FastCDC), e cada bloco é gravado uma única vez em um
+    `FileSystemBlobStore` (`chunks/`). Cada arquivo é descrito por um
+    manifesto (`manifests/ab/cdef...`, pelo SHA-256 do arquivo inteiro)
+    com a lista ordenada de `(digest, tamanho)` dos seus blocos. Versões
+    de um arquivo editado compartilham todos os blocos que não mudaram.
+
+    O manifesto é gravado por último, com rename atômico: se ele existe,
+    todos os blocos existem. O digest devolvido é o do arquivo inteiro,
+    calculado na mesma passagem da divisão em blocos, de modo que os
+    anexos continuam endereçados como em `FileSystemBlobStore`.
+
+    Args:
+        root (str | Path): Diretório do armazenamento.
+        chunker (Chunker, optional): Parâmetros de corte.
+        durable (bool): Executa `fsync` antes de confirmar as gravações.
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        chunker: Optional[Chunker] = None,
+        durable: bool = True,
+    ):
+        self.root = Path(root)
+        self.chunker = chunker or Chunker()
+        self.durable = durable
+        self.chunks = FileSystemBlobStore(
+            self.root / "chunks", durable=durable
+        )
+        self._manifests = self.root / "manifests"
+        self._manifests.mkdir(parents=True, exist_ok=True)
+
+    def put(self, source: BlobSource) -> BlobInfo:
+        """Grava os blocos novos do conteúdo e o seu manifesto."""
+        hasher = hashlib.sha256()
+        entries: list[BlobInfo] = []
+        for chunk in self.chunker.chunks(source):
+            hasher.update(chunk)
+            digest = hashlib.sha256(chunk).hexdigest()
+            if not self.chunks.exists(digest):
+                self.chunks.put((chunk,))
+            entries.append(BlobInfo(digest, len(chunk)))
+        info = BlobInfo(hasher.hexdigest(), sum(size for _, size in entries))
+        location = _sharded(self._manifests, info.digest)
+        if not location.is_file():
+            self._write_manifest(location, entries)
+        return info
+
+    def _write_manifest(self, location: Path, entries: list[BlobInfo]):
+        location.parent.mkdir(exist_ok=True)
+        descriptor, temporary = tempfile.mkstemp(
+            dir=location.parent, prefix=".manifest-"
+        )
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                file.write(MANIFEST_MAGIC)
+                for digest, size in entries:
+                    file.write(_ENTRY.pack(bytes.fromhex(digest), size))
+                if self.durable:
+                    file.flush()
+                    os.fsync(file.fileno())
+            os.replace(temporary, location)
+            if self.durable:
+                _fsync_directory(location.parent)
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(temporary)
+            raise
+
+    def manifest(self, digest: str) -> list[BlobInfo]:
+        """
+        Blocos do arquivo, em ordem.
+
+        Raises:
+            BlobNotFoundException: Se o conteúdo não existir.
+        """
+        location = _sharded(self._manifests, digest)
+        try:
+            data = location.read_bytes()
+        except FileNotFoundError:
+            raise BlobNotFoundException(
+                f"Conteúdo '{digest}' não encontrado."
+            ) from None
+        if not data.startswith(MANIFEST_MAGIC):
+            raise ValueError(f"Manifesto inválido: '{digest}'.")
+        return [
+            BlobInfo(chunk.hex(), size)
+            for chunk, size in _ENTRY.iter_unpack(data[len(MANIFEST_MAGIC) :])
+        ]
+
+    def open(self, digest: str) -> BinaryIO:
+        """Abre o conteúdo como um stream que remonta os blocos."""
+        reader = ManifestReader(self.chunks, self.manifest(digest))
+        return io.BufferedReader(reader, self.chunker.max_size)
+
+    def read_chunks(self, digest: str) -> Iterator[bytes]:
+        """Lê o conteúdo bloco a bloco, na ordem do manifesto."""
+        for chunk, _ in self.manifest(digest):
+            with self.chunks.open(chunk) as file:
+                yield file.read()
+
+    def exists(self, digest: str) -> bool:
+        """Verifica se o conteúdo existe."""
+        return _sharded(self._manifests, digest).is_file()
+
+    def size(self, digest: str) -> int:
+        """Tamanho do conteúdo, em bytes."""
+        return sum(size for _, size in self.manifest(digest))
+
+    def segments(
+        self, digest: str, start: int = 0, stop: Optional[int] = None
+    ) -> list[FileSegment]:
+        """Trechos dos arquivos dos blocos que cobrem `[start, stop)`."""
+        segments = []
+        offset = 0
+        for chunk, size in self.manifest(digest):
+            end = offset + size
+            if stop is not None and offset >= stop:
+                break
+            if end > start:
+                first = max(start, offset)
+                last = end if stop is None else min(stop, end)
+                segments.append(
+                    FileSegment(
+                        self.chunks.path(chunk), first - offset, last - first
+                    )
+                )
+            offset = end
+        return segments
+
+
+class ManifestReader(io.RawIOBase):
+    """
+    Leitura sequencial ou com `seek` de um arquivo descrito por blocos.
+
+    Mantém aberto apenas o bloco corrente; `seek` localiza o bloco por
+    busca binária nos deslocamentos acumulados.
+
+    Args:
+        chunks (FileSystemBlobStore): Armazenamento dos blocos.
+        entries (list[BlobInfo]): Blocos do arquivo, em ordem.
+    """
+
+    def __init__(self, chunks: FileSystemBlobStore, entries: list[BlobInfo]):
+        super().__init__()
+        self._chunks = chunks
+        self._entries = entries
+        self._offsets = list(
+            accumulate((size for _, size in entries), initial=0)
+        )
+        self._position = 0
+        self._current = -1
+        self._file: Optional[BinaryIO] = None
+
+    @property
+    def size(self) -> int:
+        """Tamanho total do arquivo."""
+        return self._offsets[-1]
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += self.size
+        elif whence != io.SEEK_SET:
+            raise ValueError(f"whence inválido: {whence}")
+        if offset < 0:
+            raise ValueError("Posição negativa.")
+        self._position = offset
+        return offset
+
+    def readinto(self, buffer) -> int:
+        if self._position >= self.size:
+            return 0
+        index = bisect_right(self._offsets, self._position) - 1
+        if index != self._current:
+            self._close_chunk()
+            self._file = self._chunks.open(self._entries[index].digest)
+            self._current = index
+        self._file.seek(self._position - self._offsets[index])
+        available = self._offsets[index + 1] - self._position
+        view = memoryview(buffer)[:available]
+        count = self._file.readinto(view)
+        self._position += count
+        return count
+
+    def _close_chunk(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._current = -1
+
+    def close(self) -> None:
+        self._close_chunk()
+        super().close()
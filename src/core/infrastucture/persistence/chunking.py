@@ -0,0 +1,230 @@
+"""Divisão de conteúdo em blocos definidos pelo conteúdo (FastCDC).
+
+Os pontos de corte são escolhidos por um hash rolante (gear hash) sobre
+os próprios bytes, não por posição. Inserir ou remover bytes no meio de
+um arquivo muda apenas os blocos em volta da edição; os demais voltam a
+ter os mesmos limites e o mesmo SHA-256, e podem ser reaproveitados
+entre versões do arquivo.
+
+Segue o FastCDC com "normalized chunking": até o tamanho médio, a
+máscara exige mais bits zerados (corte mais difícil); depois dele, menos
+bits (corte mais fácil). Isso concentra os tamanhos perto da média. Os
+primeiros `min_size` bytes de cada bloco não são examinados.
+
+O hash de 32 bits desloca um bit por byte, então só depende dos últimos
+32 bytes (a janela). Com o extra `analytics` (NumPy) instalado, o hash de
+todas as posições do buffer é calculado de forma vetorizada, somando a
+janela por duplicação em cinco passos; sem ele, um laço em Python faz o
+mesmo cálculo. Os dois caminhos produzem exatamente os mesmos cortes.
+"""
+
+import hashlib
+from bisect import bisect_left
+from typing import BinaryIO, Iterable, Iterator, Optional
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depende do ambiente
+    np = None
+
+MIN_SIZE = 16 * 1024
+AVG_SIZE = 64 * 1024
+MAX_SIZE = 256 * 1024
+READ_SIZE = 1 << 20
+
+_WIDTH = 32
+_WORD = (1 << _WIDTH) - 1
+
+# Tabela fixa: mudar os valores muda todos os pontos de corte e, com
+# eles, a deduplicação contra o que já está armazenado.
+GEAR = tuple(
+    int.from_bytes(hashlib.sha256(bytes([value])).digest()[:4], "big")
+    for value in range(256)
+)
+_GEAR_ARRAY = np.array(GEAR, dtype=np.uint32) if np is not None else None
+
+
+def _mask(bits: int) -> int:
+    """Máscara com os `bits` mais altos da palavra."""
+    return ((1 << bits) - 1) << (_WIDTH - bits)
+
+
+class Chunker:
+    """
+    Parâmetros de corte do FastCDC.
+
+    Args:
+        min_size (int): Tamanho mínimo de um bloco; pelo menos 64.
+        avg_size (int): Tamanho médio desejado; deve ser potência de 2.
+        max_size (int): Tamanho máximo de um bloco.
+        normalization (int): Bits somados (antes da média) e subtraídos
+            (depois dela) da máscara.
+        vectorized (bool, optional): Usa NumPy; por padrão, quando
+            estiver instalado.
+
+    Raises:
+        ValueError: Se os tamanhos forem incoerentes.
+    """
+
+    def __init__(
+        self,
+        min_size: int = MIN_SIZE,
+        avg_size: int = AVG_SIZE,
+        max_size: int = MAX_SIZE,
+        normalization: int = 2,
+        vectorized: Optional[bool] = None,
+    ):
+        if not 2 * _WIDTH <= min_size <= avg_size <= max_size:
+            raise ValueError(
+                "Os tamanhos devem satisfazer 64 <= mínimo <= médio <= "
+                "máximo."
+            )
+        if avg_size & (avg_size - 1):
+            raise ValueError("O tamanho médio deve ser potência de 2.")
+        bits = avg_size.bit_length() - 1
+        if not 0 < bits - normalization < bits + normalization <= _WIDTH:
+            raise ValueError("Normalização incompatível com o tamanho médio.")
+        if vectorized is None:
+            vectorized = np is not None
+        elif vectorized and np is None:
+            raise ValueError("O modo vetorizado requer o NumPy.")
+        self.min_size = min_size
+        self.avg_size = avg_size
+        self.max_size = max_size
+        self.vectorized = vectorized
+        self._mask_small = _mask(bits + normalization)
+        self._mask_large = _mask(bits - normalization)
+
+    def cut(self, data: bytes | bytearray, start: int, end: int) -> int:
+        """
+        Posição do fim do bloco que começa em `start`.
+
+        Args:
+            data: Buffer com os dados.
+            start (int): Início do bloco.
+            end (int): Fim dos dados disponíveis.
+
+        Returns:
+            int: Posição de corte, entre `start + 1` e `end`.
+        """
+        size = end - start
+        if size <= self.min_size:
+            return end
+        limit = start + min(size, self.max_size)
+        normal = start + min(self.avg_size, limit - start)
+        gear = GEAR
+        word = _WORD
+        value = 0
+        # Aquece a janela com os bytes anteriores ao primeiro candidato,
+        # sem testar a máscara.
+        position = start + self.min_size
+        for byte in data[position - _WIDTH : position]:
+            value = ((value << 1) + gear[byte]) & word
+        mask = self._mask_small
+        for byte in data[position:normal]:
+            value = ((value << 1) + gear[byte]) & word
+            position += 1
+            if not value & mask:
+                return position
+        mask = self._mask_large
+        for byte in data[normal:limit]:
+            value = ((value << 1) + gear[byte]) & word
+            position += 1
+            if not value & mask:
+                return position
+        return limit
+
+    def _candidates(self, data: bytearray) -> tuple[list[int], list[int]]:
+        """
+        Posições de corte possíveis do buffer, para as duas máscaras.
+
+        O hash da janela em `p` é a soma de `GEAR[b[p - k]] << k` para
+        `k < 32`; cada passo soma a janela de tamanho `m` com a anterior
+        deslocada, dobrando `m`.
+        """
+        window = np.take(_GEAR_ARRAY, np.frombuffer(data, dtype=np.uint8))
+        span = 1
+        while span < _WIDTH:
+            window[span:] += window[:-span] << np.uint32(span)
+            span *= 2
+        # A máscara pequena tem os mesmos bits da grande e mais alguns:
+        # seus candidatos são um subconjunto dos da grande. O corte fica
+        # logo depois do byte cujo hash zera a máscara.
+        large = np.flatnonzero((window & np.uint32(self._mask_large)) == 0)
+        small = large[(window[large] & np.uint32(self._mask_small)) == 0]
+        return (small + 1).tolist(), (large + 1).tolist()
+
+    def _cut_candidates(
+        self,
+        candidates: tuple[list[int], list[int]],
+        start: int,
+        end: int,
+    ) -> int:
+        """Equivalente a `cut`, usando as posições já calculadas."""
+        size = end - start
+        if size <= self.min_size:
+            return end
+        limit = start + min(size, self.max_size)
+        normal = start + min(self.avg_size, limit - start)
+        small, large = candidates
+        first = start + self.min_size + 1
+        index = bisect_left(small, first)
+        if index < len(small) and small[index] <= normal:
+            return small[index]
+        index = bisect_left(large, normal + 1)
+        if index < len(large) and large[index] <= limit:
+            return large[index]
+        return limit
+
+    def split(self, data: bytes) -> list[bytes]:
+        """Divide um conteúdo em memória."""
+        return list(self.chunks([data]))
+
+    def chunks(self, source: BinaryIO | Iterable[bytes]) -> Iterator[bytes]:
+        """
+        Divide um conteúdo lido em streaming.
+
+        Mantém em memória no máximo um bloco máximo além do último
+        pedaço lido: só lê mais dados quando o buffer não contém um
+        bloco máximo inteiro.
+
+        Args:
+            source: Arquivo binário ou blocos de bytes de qualquer
+                tamanho.
+        """
+        buffer = bytearray()
+        start = 0
+        exhausted = False
+        candidates = None
+        pieces = _pieces(source, max(READ_SIZE, self.max_size))
+        while True:
+            while not exhausted and len(buffer) - start < self.max_size:
+                piece = next(pieces, None)
+                if piece is None:
+                    exhausted = True
+                    continue
+                del buffer[:start]
+                start = 0
+                buffer += piece
+                candidates = None
+            if start >= len(buffer):
+                return
+            if not self.vectorized:
+                end = self.cut(buffer, start, len(buffer))
+            else:
+                if candidates is None:
+                    candidates = self._candidates(buffer)
+                end = self._cut_candidates(candidates, start, len(buffer))
+            yield bytes(buffer[start:end])
+            start = end
+
+
+def _pieces(source: BinaryIO | Iterable[bytes], size: int) -> Iterator[bytes]:
+    """Lê a origem em pedaços de até `size` bytes."""
+    read = getattr(source, "read", None)
+    if read is not None:
+        yield from iter(lambda: read(size), b"")
+        return
+    for piece in source:
+        if piece:
+            yield piece
@@ -0,0 +1,144 @@
+"""Cache de arquivos em disco com limite de tamanho e remoção LRU."""
+
+import contextlib
+import os
+import re
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+_KEY = re.compile(r"^[0-9A-Za-z_][0-9A-Za-z_.-]*$")
+
+
+class DiskLRUCache:
+    """
+    Conteúdos em arquivos de um diretório, até `max_bytes` no total.
+
+    A ordem de uso fica em memória; cada leitura também atualiza o
+    `mtime` do arquivo, de modo que, ao reabrir o cache, a ordem é
+    reconstruída a partir do disco. Quando uma gravação ultrapassa o
+    limite, os arquivos menos usados recentemente são removidos.
+
+    As gravações são atômicas (arquivo temporário e rename): um leitor
+    nunca vê um conteúdo parcial.
+
+    Args:
+        root (str | Path): Diretório do cache.
+        max_bytes (int): Tamanho máximo somado dos conteúdos.
+    """
+
+    def __init__(self, root: str | Path, max_bytes: int):
+        if max_bytes < 1:
+            raise ValueError("O cache deve ter pelo menos um byte.")
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self._tmp = self.root / "tmp"
+        self._tmp.mkdir(parents=True, exist_ok=True)
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        """Reconstrói a ordem de uso pelos `mtime` dos arquivos."""
+        files = []
+        for path in self.root.glob("*/*"):
+            if path.parent != self._tmp and path.is_file():
+                files.append((path.stat().st_mtime_ns, path))
+        for _, path in sorted(files):
+            size = path.stat().st_size
+            self._entries[path.name] = size
+            self._size += size
+        self._evict()
+
+    def _path(self, key: str) -> Path:
+        if not _KEY.match(key) or ".." in key:
+            raise ValueError(f"Chave inválida: '{key}'.")
+        return self.root / key[:2] / key
+
+    @property
+    def size(self) -> int:
+        """Tamanho somado dos conteúdos, em bytes."""
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Lê um conteúdo e o marca como usado; None se não existir."""
+        path = self._path(key)
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+        except FileNotFoundError:
+            # Removido por uma gravação concorrente.
+            return None
+        return data
+
+    def path(self, key: str) -> Optional[Path]:
+        """Caminho do conteúdo, marcado como usado; None se não existir."""
+        path = self._path(key)
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+        with contextlib.suppress(FileNotFoundError):
+            os.utime(path)
+        return path
+
+    def put(self, key: str, data: bytes) -> bool:
+        """
+        Grava um conteúdo, removendo os menos usados se preciso.
+
+        Returns:
+            bool: False se o conteúdo sozinho excede o limite do cache.
+        """
+        path = self._path(key)
+        if len(data) > self.max_bytes:
+            return False
+        descriptor, temporary = tempfile.mkstemp(dir=self._tmp)
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                file.write(data)
+            path.parent.mkdir(exist_ok=True)
+            os.replace(temporary, path)
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(temporary)
+            raise
+        with self._lock:
+            self._size += len(data) - self._entries.pop(key, 0)
+            self._entries[key] = len(data)
+            self._evict(keep=key)
+        return True
+
+    def discard(self, key: str) -> None:
+        """Remove um conteúdo, se existir."""
+        path = self._path(key)
+        with self._lock:
+            size = self._entries.pop(key, None)
+            if size is None:
+                return
+            self._size -= size
+            with contextlib.suppress(FileNotFoundError):
+                path.unlink()
+
+    def _evict(self, keep: Optional[str] = None) -> None:
+        """Remove os menos usados até caber no limite (com o lock)."""
+        while self._size > self.max_bytes and self._entries:
+            key, size = next(iter(self._entries.items()))
+            if key == keep:
+                break
+            del self._entries[key]
+            self._size -= size
+            with contextlib.suppress(FileNotFoundError):
+                self._path(key).unlink()
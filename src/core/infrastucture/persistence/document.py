@@ -0,0 +1,343 @@
+"""Repositório de documentos em memória."""
+
+import copy
+import pickle
+from typing import Hashable, Iterable, Optional
+from uuid import UUID
+
+from src.core.domain.entities.document import Document
+from src.core.domain.exceptions import (
+    DocumentAlreadyExistsException,
+    DocumentNotFoundException,
+    DocumentVersionConflictException,
+    SlugAlreadyExistsException,
+)
+from src.core.domain.repositorys.document import (
+    DocumentMetadata,
+    IDocumentRepository,
+)
+from src.core.domain.text import slug_family
+from src.core.domain.value_objects.doc_status import DocumentStatus
+from src.core.domain.value_objects.doc_types import DocumentType
+from src.core.infrastucture.persistence.archive import (
+    ArchiveLocation,
+    ArchiveStore,
+)
+from src.core.infrastucture.persistence.base import InMemoryRepository
+
+
+class InMemoryDocumentRepository(InMemoryRepository, IDocumentRepository):
+    """
+    Implementação em memória de `IDocumentRepository`.
+
+    Mantém índices por tenant, tipo, usuário e status, de modo que as
+    consultas `get_by_*` não percorrem todos os documentos.
+
+    O slug é único por tenant: `(tenant_id, slug)` é indexado e também
+    `(tenant_id, slug sem o sufixo numérico)`, o que permite encontrar
+    todas as colisões de um slug base sem percorrer o tenant.
+
+    A versão e a data de modificação gravadas ficam também em uma tabela
+    à parte, lida por `get_metadata` sem tocar na entidade. Cada tenant
+    tem ainda um contador de gravações (`get_tenant_version`), que muda
+    sempre que algum documento dele é incluído, alterado ou removido.
+
+    Com um `ArchiveStore`, os documentos arquivados vão para o armazenamento
+    frio: a entidade é serializada e compactada em um segmento, e no mapa
+    por ID fica só a posição do registro (`ArchiveLocation`). A entidade é
+    descompactada a cada leitura, como uma cópia nova (alterá-la sem
+    `update` não altera o repositório). Desarquivar ou excluir descarta o
+    registro frio.
+
+    Os arquivados frios saem do índice por tenant, de modo que as listagens
+    quentes (`get_by_tenant_id`, `get_page_by_tenant`) nunca descompactam
+    registros; eles ficam em um índice à parte, lido por
+    `get_archived_by_tenant` e contado sem leitura por
+    `count_archived_by_tenant`. Os demais índices continuam com o ID.
+
+    Args:
+        archive (ArchiveStore, optional): Armazenamento dos arquivados; sem
+            ele, todos os documentos ficam em memória.
+    """
+
+    not_found_exception = DocumentNotFoundException
+    already_exists_exception = DocumentAlreadyExistsException
+    _ordered_indexes = ("tenant_id", "archived_tenant_id")
+
+    def __init__(self, archive: Optional[ArchiveStore] = None):
+        super().__init__()
+        self.archive = archive
+        self._metadata: dict[UUID, DocumentMetadata] = {}
+        self._tenant_versions: dict[UUID, int] = {}
+
+    def _store(self, entity: Document) -> None:
+        previous = self._entities.get(entity.entity_id)
+        if self._is_cold(entity):
+            frozen = copy.copy(entity)
+            frozen.clear_domain_events()
+            self._entities[entity.entity_id] = self.archive.append(
+                pickle.dumps(frozen, pickle.HIGHEST_PROTOCOL)
+            )
+        else:
+            super()._store(entity)
+        if isinstance(previous, ArchiveLocation):
+            self.archive.discard(previous)
+
+    def _load(self, entity_id: UUID) -> Document:
+        stored = self._entities[entity_id]
+        if not isinstance(stored, ArchiveLocation):
+            return stored
+        # Uma gravação concorrente pode descartar o registro e apagar o
+        # segmento: a posição é lida e usada com o lock adquirido.
+        with self._lock:
+            stored = self._entities[entity_id]
+            if not isinstance(stored, ArchiveLocation):
+                return stored
+            data = self.archive.read(stored)
+        return pickle.loads(data)
+
+    @property
+    def archived(self) -> int:
+        """Documentos no armazenamento frio."""
+        with self._lock:
+            return sum(
+                len(bucket)
+                for bucket in self._indexes.get(
+                    "archived_tenant_id", {}
+                ).values()
+            )
+
+    def _is_cold(self, entity: Document) -> bool:
+        """Indica se a entidade vai para o armazenamento frio."""
+        return self.archive is not None and (
+            entity.status == DocumentStatus.ARCHIVED
+        )
+
+    def _index(self, entity: Document) -> None:
+        super()._index(entity)
+        self._store_metadata(entity)
+        self._touch_tenant(entity.tenant_id)
+
+    def _reindex(self, entity: Document) -> None:
+        old_tenant = self._indexed_tenant(entity.entity_id)
+        super()._reindex(entity)
+        self._store_metadata(entity)
+        self._touch_tenant(entity.tenant_id)
+        if old_tenant is not None and old_tenant != entity.tenant_id:
+            self._touch_tenant(old_tenant)
+
+    def _unindex(self, entity_id: UUID) -> None:
+        tenant_id = self._indexed_tenant(entity_id)
+        super()._unindex(entity_id)
+        self._metadata.pop(entity_id, None)
+        if tenant_id is not None:
+            self._touch_tenant(tenant_id)
+
+    def _indexed_tenant(self, entity_id: UUID) -> Optional[UUID]:
+        keys = self._indexed_keys.get(entity_id, {})
+        return keys.get("tenant_id", keys.get("archived_tenant_id"))
+
+    def _touch_tenant(self, tenant_id: UUID) -> None:
+        self._tenant_versions[tenant_id] = (
+            self._tenant_versions.get(tenant_id, 0) + 1
+        )
+
+    def _store_metadata(self, entity: Document) -> None:
+        self._metadata[entity.entity_id] = DocumentMetadata(
+            entity.entity_id, entity.version, entity.updated_at
+        )
+
+    def _index_keys(self, entity: Document) -> dict[str, Hashable]:
+        tenant_index = (
+            "archived_tenant_id" if self._is_cold(entity) else "tenant_id"
+        )
+        keys = {
+            tenant_index: entity.tenant_id,
+            "document_type": entity.document_type,
+            "user_id": entity.user_id,
+            "status": entity.status,
+        }
+        if entity.slug:
+            keys["slug"] = (entity.tenant_id, entity.slug)
+            keys["slug_family"] = (entity.tenant_id, slug_family(entity.slug))
+        return keys
+
+    def _check_slug(
+        self, entity: Document, rewritten: frozenset[UUID] = frozenset()
+    ) -> None:
+        """
+        Garante que o slug não pertence a outro documento do tenant.
+
+        Documentos em `rewritten` estão sendo regravados na mesma operação
+        e não contam como donos dos slugs atuais.
+        """
+        if not entity.slug:
+            return
+        owners = self._indexes.get("slug", {}).get(
+            (entity.tenant_id, entity.slug), {}
+        )
+        if any(
+            owner != entity.entity_id and owner not in rewritten
+            for owner in owners
+        ):
+            raise SlugAlreadyExistsException(
+                f"O slug '{entity.slug}' já está em uso no tenant "
+                f"'{entity.tenant_id}'."
+            )
+
+    def save(self, entity: Document) -> Document:
+        """Adiciona um documento ao repositório."""
+        with self._lock:
+            self._check_slug(entity)
+            return super().save(entity)
+
+    def update(self, entity: Document) -> Document:
+        """Atualiza um documento e os seus índices."""
+        with self._lock:
+            self._check_slug(entity)
+            return super().update(entity)
+
+    def commit(
+        self,
+        created: Iterable[Document],
+        updated: Iterable[Document],
+        expected: Optional[dict[UUID, DocumentMetadata]] = None,
+    ) -> None:
+        """
+        Grava inclusões e alterações em uma única operação.
+
+        Args:
+            created (Iterable[Document]): Documentos novos.
+            updated (Iterable[Document]): Documentos alterados.
+            expected (dict[UUID, DocumentMetadata], optional): Metadados
+                lidos antes das alterações; se algum documento foi gravado
+                depois disso, nada é gravado.
+
+        Raises:
+            DocumentVersionConflictException: Se um documento mudou desde
+                a leitura.
+            SlugAlreadyExistsException: Se um slug colidir.
+        """
+        created, updated = list(created), list(updated)
+        with self._lock:
+            for document_id, metadata in (expected or {}).items():
+                if self._metadata.get(document_id) != metadata:
+                    raise DocumentVersionConflictException(
+                        f"O documento '{document_id}' foi alterado por "
+                        "outra operação."
+                    )
+            rewritten = frozenset(
+                document.entity_id for document in created + updated
+            )
+            claimed: dict[tuple[UUID, str], UUID] = {}
+            for document in created + updated:
+                if not document.slug:
+                    continue
+                key = (document.tenant_id, document.slug)
+                if claimed.setdefault(key, document.entity_id) != (
+                    document.entity_id
+                ):
+                    raise SlugAlreadyExistsException(
+                        f"O slug '{document.slug}' aparece mais de uma vez."
+                    )
+                self._check_slug(document, rewritten)
+            super().commit(created, updated)
+
+    def delete(self, entity_id: UUID) -> None:
+        """Remove um documento e o seu registro frio, se houver."""
+        with self._lock:
+            stored = self._entities.get(entity_id)
+            super().delete(entity_id)
+            if isinstance(stored, ArchiveLocation):
+                self.archive.discard(stored)
+
+    def get_by_slug(self, tenant_id: UUID, slug: str) -> Document:
+        """Obtém um documento pelo slug, único dentro do tenant."""
+        documents = self._lookup("slug", (tenant_id, slug))
+        if not documents:
+            raise DocumentNotFoundException(
+                f"Documento com slug '{slug}' não encontrado."
+            )
+        return documents[0]
+
+    def get_taken_slugs(
+        self, candidates: Iterable[tuple[UUID, str]]
+    ) -> set[tuple[UUID, str]]:
+        """Obtém os slugs em uso que colidem com os candidatos."""
+        taken = set()
+        with self._lock:
+            exact = self._indexes.get("slug", {})
+            family = self._indexes.get("slug_family", {})
+            for key in set(candidates):
+                if key in exact:
+                    taken.add(key)
+                for entity_id in family.get(key, ()):
+                    taken.add(self._indexed_keys[entity_id]["slug"])
+        return taken
+
+    def get_by_document_type(
+        self, document_type: DocumentType
+    ) -> list[Document]:
+        """Obtém documentos pelo tipo."""
+        return self._lookup("document_type", document_type)
+
+    def get_by_user_id(self, user_id: UUID) -> list[Document]:
+        """Obtém documentos associados a um usuário específico."""
+        return self._lookup("user_id", user_id)
+
+    def get_by_status(self, status: str) -> list[Document]:
+        """Obtém documentos pelo status.
+
+        Aceita o enum do status ou o seu valor textual.
+        """
+        with self._lock:
+            keys = [
+                key
+                for key in self._indexes.get("status", {})
+                if key == status or str(key) == str(status)
+            ]
+            return [
+                document
+                for key in keys
+                for document in self._lookup("status", key)
+            ]
+
+    def get_by_tenant_id(self, tenant_id: UUID) -> list[Document]:
+        """Obtém documentos associados a um tenant específico.
+
+        Não inclui os arquivados do armazenamento frio.
+        """
+        return self._lookup("tenant_id", tenant_id)
+
+    def get_page_by_tenant(
+        self, tenant_id: UUID, limit: int, after: Optional[UUID] = None
+    ) -> list[Document]:
+        """Obtém uma página dos documentos de um tenant, em ordem de ID.
+
+        Não inclui os arquivados do armazenamento frio.
+        """
+        return self._page("tenant_id", tenant_id, limit, after)
+
+    def get_archived_by_tenant(self, tenant_id: UUID) -> list[Document]:
+        """Obtém os arquivados de um tenant no armazenamento frio."""
+        return self._lookup("archived_tenant_id", tenant_id)
+
+    def count_archived_by_tenant(self, tenant_id: UUID) -> int:
+        """Conta os arquivados de um tenant sem descompactá-los."""
+        with self._lock:
+            return len(
+                self._indexes.get("archived_tenant_id", {}).get(tenant_id, {})
+            )
+
+    def get_metadata(self, document_id: UUID) -> DocumentMetadata:
+        """Obtém a versão e a data de modificação gravadas."""
+        metadata = self._metadata.get(document_id)
+        if metadata is None:
+            raise DocumentNotFoundException(
+                f"Entidade '{document_id}' não encontrada."
+            )
+        return metadata
+
+    def get_tenant_version(self, tenant_id: UUID) -> int:
+        """Obtém o contador de gravações dos documentos de um tenant."""
+        return self._tenant_versions.get(tenant_id, 0)
@@ -0,0 +1,149 @@
+"""Repositório de pastas em memória."""
+
+from typing import Callable, Hashable, Optional
+from uuid import UUID
+
+from src.core.domain.entities.folder import Folder, folder_path
+from src.core.domain.exceptions import (
+    BusinessRuleViolationError,
+    FolderAlreadyExistsException,
+    FolderNotFoundException,
+)
+from src.core.domain.repositorys.folder import IFolderRepository
+from src.core.infrastucture.persistence.base import InMemoryRepository
+from src.core.infrastucture.persistence.path_index import PathIndex
+
+PathListener = Callable[[str, str], None]
+
+
+class InMemoryFolderRepository(InMemoryRepository, IFolderRepository):
+    """
+    Implementação em memória de `IFolderRepository` com caminhos
+    materializados.
+
+    Cada pasta guarda o caminho da raiz até ela (`Folder.path`), e os
+    caminhos ficam em um `PathIndex`: a subárvore é uma faixa contígua e
+    a pertinência é uma comparação de prefixo. Mover uma pasta reescreve
+    o prefixo da faixa inteira de uma vez.
+
+    Outros índices (como o de contratos por pasta) podem acompanhar as
+    mudanças de caminho com `subscribe`; os ouvintes recebem o prefixo
+    antigo e o novo, fora do lock do repositório.
+    """
+
+    not_found_exception = FolderNotFoundException
+    already_exists_exception = FolderAlreadyExistsException
+
+    def __init__(self):
+        super().__init__()
+        self._paths = PathIndex()
+        self._listeners: list[PathListener] = []
+
+    def _index_keys(self, entity: Folder) -> dict[str, Hashable]:
+        return {"parent_id": entity.parent_id, "tenant_id": entity.tenant_id}
+
+    def subscribe(self, listener: PathListener) -> None:
+        """Registra um ouvinte de mudanças de caminho."""
+        self._listeners.append(listener)
+
+    def _notify(self, old_path: str, new_path: str) -> None:
+        if old_path == new_path:
+            return
+        for listener in self._listeners:
+            listener(old_path, new_path)
+
+    def _resolve_path(self, folder: Folder, parent_id: Optional[UUID]) -> str:
+        """Calcula o caminho da pasta sob a mãe informada."""
+        if parent_id is None:
+            return folder_path(folder.entity_id)
+        parent = self.get(parent_id)
+        if parent.tenant_id != folder.tenant_id:
+            raise BusinessRuleViolationError(
+                "A pasta mãe pertence a outra empresa."
+            )
+        if parent.path.startswith(folder.path):
+            raise BusinessRuleViolationError(
+                "Não é possível mover uma pasta para dentro de si mesma."
+            )
+        return f"{parent.path}{folder.entity_id.hex}/"
+
+    def save(self, entity: Folder) -> Folder:
+        """Adiciona uma pasta sob a sua mãe."""
+        provisional = folder_path(entity.entity_id)
+        with self._lock:
+            if entity.entity_id in self._entities:
+                raise self.already_exists_exception(
+                    f"Pasta '{entity.entity_id}' já existe."
+                )
+            entity.path = self._resolve_path(entity, entity.parent_id)
+            super().save(entity)
+            self._paths.add(entity.path, entity.entity_id)
+        self._notify(provisional, entity.path)
+        return entity
+
+    def update(self, entity: Folder) -> Folder:
+        """Atualiza uma pasta; uma nova mãe move a subárvore."""
+        with self._lock:
+            stored_parent = self._indexed_keys.get(entity.entity_id, {}).get(
+                "parent_id"
+            )
+            if entity.parent_id != stored_parent:
+                return self.move(entity.entity_id, entity.parent_id)
+            return super().update(entity)
+
+    def delete(self, entity_id: UUID) -> None:
+        """Remove uma pasta sem subpastas."""
+        with self._lock:
+            folder = self.get(entity_id)
+            if self._paths.count(folder.path) > 1:
+                raise BusinessRuleViolationError(
+                    "Não é possível remover uma pasta com subpastas."
+                )
+            self._paths.remove(folder.path, entity_id)
+            super().delete(entity_id)
+
+    def move(self, folder_id: UUID, new_parent_id: Optional[UUID]) -> Folder:
+        """
+        Move uma pasta, com toda a sua subárvore, para outra mãe.
+
+        Raises:
+            BusinessRuleViolationError: Se a nova mãe estiver na própria
+                subárvore ou pertencer a outra empresa.
+        """
+        with self._lock:
+            folder = self.get(folder_id)
+            old_path = folder.path
+            new_path = self._resolve_path(folder, new_parent_id)
+            for path, entity_id in self._paths.rebase(old_path, new_path):
+                self._entities[entity_id].path = path
+            folder.parent_id = new_parent_id
+            super().update(folder)
+        self._notify(old_path, new_path)
+        return folder
+
+    def get_children(self, folder_id: UUID) -> list[Folder]:
+        """Obtém as subpastas diretas de uma pasta."""
+        return self._lookup("parent_id", folder_id)
+
+    def get_subtree(self, folder_id: UUID) -> list[Folder]:
+        """Obtém a pasta e todas as suas descendentes."""
+        with self._lock:
+            path = self.get(folder_id).path
+            return [
+                self._entities[entity_id]
+                for entity_id in self._paths.subtree(path)
+            ]
+
+    def is_in_subtree(self, folder_id: UUID, ancestor_id: UUID) -> bool:
+        """Verifica se uma pasta está na subárvore de outra."""
+        return self.get(folder_id).path.startswith(self.get(ancestor_id).path)
+
+    def path_of(self, folder_id: UUID) -> str:
+        """
+        Obtém o caminho materializado de uma pasta.
+
+        Pastas ainda não cadastradas são tratadas como raiz; quando forem
+        salvas, os ouvintes recebem a mudança de caminho.
+        """
+        folder = self._entities.get(folder_id)
+        return folder.path if folder else folder_path(folder_id)
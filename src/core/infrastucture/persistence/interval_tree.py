@@ -0,0 +1,179 @@
+"""Árvore de intervalos para consultas por faixa e por ponto."""
+
+import random
+from typing import Any, Hashable, Iterator, Optional
+
+
+class _Node:
+    """Nó da árvore: treap ordenada por `key` e aumentada por `max_end`."""
+
+    __slots__ = (
+        "key",
+        "end",
+        "max_end",
+        "priority",
+        "value",
+        "left",
+        "right",
+    )
+
+    def __init__(self, key: tuple, end: Any, priority: float, value: Any):
+        self.key = key
+        self.end = end
+        self.max_end = end
+        self.priority = priority
+        self.value = value
+        self.left: Optional["_Node"] = None
+        self.right: Optional["_Node"] = None
+
+    def refresh(self) -> None:
+        """Recalcula o maior fim da subárvore."""
+        max_end = self.end
+        if self.left is not None and self.left.max_end > max_end:
+            max_end = self.left.max_end
+        if self.right is not None and self.right.max_end > max_end:
+            max_end = self.right.max_end
+        self.max_end = max_end
+
+
+def _split(node: Optional[_Node], key: tuple) -> tuple:
+    """Divide a árvore em (chaves < key, chaves >= key)."""
+    if node is None:
+        return None, None
+    if node.key < key:
+        left, right = _split(node.right, key)
+        node.right = left
+        node.refresh()
+        return node, right
+    left, right = _split(node.left, key)
+    node.left = right
+    node.refresh()
+    return left, node
+
+
+def _merge(left: Optional[_Node], right: Optional[_Node]) -> Optional[_Node]:
+    """Une duas árvores em que todas as chaves de `left` < `right`."""
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if left.priority > right.priority:
+        left.right = _merge(left.right, right)
+        left.refresh()
+        return left
+    right.left = _merge(left, right.left)
+    right.refresh()
+    return right
+
+
+def _remove(node: Optional[_Node], key: tuple) -> tuple:
+    """Remove a chave; retorna (nova raiz, removido)."""
+    if node is None:
+        return None, False
+    if key == node.key:
+        return _merge(node.left, node.right), True
+    if key < node.key:
+        node.left, removed = _remove(node.left, key)
+    else:
+        node.right, removed = _remove(node.right, key)
+    if removed:
+        node.refresh()
+    return node, removed
+
+
+class IntervalTree:
+    """
+    Índice de intervalos fechados `[start, end]` com atualização O(log n).
+
+    É uma treap ordenada por `(start, id)` em que cada nó guarda o maior
+    `end` da sua subárvore. Uma consulta de sobreposição descarta
+    subárvores inteiras cujo maior fim é anterior ao início da faixa ou
+    cujo início é posterior ao fim da faixa, visitando O(log n + k) nós
+    na prática para `k` resultados.
+
+    Intervalos abertos (sem fim) devem usar um sentinela como `date.max`.
+    Intervalos degenerados (`start == end`) transformam a árvore em um
+    índice ordenado comum, útil para faixas sobre uma única data.
+    """
+
+    def __init__(self, seed: Optional[int] = None):
+        self._root: Optional[_Node] = None
+        self._size = 0
+        self._random = random.Random(seed)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def insert(self, start: Any, end: Any, item_id: Hashable, value=None):
+        """
+        Adiciona um intervalo.
+
+        Args:
+            start: Início do intervalo.
+            end: Fim do intervalo (inclusivo).
+            item_id (Hashable): Identificador único (desempata `start`).
+            value: Valor associado, retornado nas consultas.
+        """
+        if end < start:
+            raise ValueError("O fim do intervalo é anterior ao início.")
+        node = _Node(
+            (start, item_id),
+            end,
+            self._random.random(),
+            item_id if value is None else value,
+        )
+        left, right = _split(self._root, node.key)
+        self._root = _merge(_merge(left, node), right)
+        self._size += 1
+
+    def remove(self, start: Any, item_id: Hashable) -> bool:
+        """
+        Remove um intervalo pelo início e pelo identificador.
+
+        Returns:
+            bool: True se o intervalo existia.
+        """
+        self._root, removed = _remove(self._root, (start, item_id))
+        if removed:
+            self._size -= 1
+        return removed
+
+    def overlapping(self, low: Any, high: Any) -> Iterator[Any]:
+        """
+        Retorna os valores cujos intervalos intersectam `[low, high]`.
+
+        Os resultados saem em ordem crescente de início.
+        """
+        stack: list[_Node] = []
+        node = self._root
+        while stack or node is not None:
+            while node is not None:
+                if node.max_end < low:
+                    node = None
+                    break
+                stack.append(node)
+                node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+            if node.key[0] > high:
+                return
+            if node.end >= low:
+                yield node.value
+            node = node.right
+
+    def stabbing(self, point: Any) -> Iterator[Any]:
+        """Retorna os valores cujos intervalos contêm `point`."""
+        return self.overlapping(point, point)
+
+    def __iter__(self) -> Iterator[Any]:
+        """Percorre todos os valores em ordem de início."""
+        stack: list[_Node] = []
+        node = self._root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.value
+            node = node.right
@@ -0,0 +1,77 @@
+"""Índice ordenado por caminho materializado."""
+
+import bisect
+from typing import Hashable, Iterator
+
+# Maior que qualquer caractere de um caminho (`/` e dígitos hexadecimais).
+_PATH_END = "~"
+
+
+class PathIndex:
+    """
+    Lista ordenada de `(caminho, id)` para consultas por subárvore.
+
+    Como todos os caminhos de uma subárvore começam pelo caminho da sua
+    raiz, eles ocupam uma faixa contígua da lista: a consulta é uma busca
+    binária seguida da leitura da faixa, O(log n + k). Mover uma
+    subárvore troca o prefixo da faixa inteira de uma vez (`rebase`).
+    """
+
+    def __init__(self):
+        self._keys: list[tuple[str, Hashable]] = []
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, path: str, item_id: Hashable) -> None:
+        """Adiciona um item sob o caminho."""
+        bisect.insort(self._keys, (path, item_id))
+
+    def remove(self, path: str, item_id: Hashable) -> None:
+        """Remove um item do caminho, se existir."""
+        index = bisect.bisect_left(self._keys, (path, item_id))
+        if index < len(self._keys) and self._keys[index] == (path, item_id):
+            del self._keys[index]
+
+    def _bounds(self, prefix: str) -> tuple[int, int]:
+        low = bisect.bisect_left(self._keys, (prefix,))
+        high = bisect.bisect_left(self._keys, (prefix + _PATH_END,), low)
+        return low, high
+
+    def subtree(self, prefix: str) -> Iterator[Hashable]:
+        """Itera os IDs cujo caminho começa por `prefix`."""
+        low, high = self._bounds(prefix)
+        return (item_id for _, item_id in self._keys[low:high])
+
+    def count(self, prefix: str) -> int:
+        """Conta os itens da subárvore."""
+        low, high = self._bounds(prefix)
+        return high - low
+
+    def rebase(
+        self, old_prefix: str, new_prefix: str
+    ) -> list[tuple[str, Hashable]]:
+        """
+        Troca o prefixo de todos os itens da subárvore.
+
+        A faixa é recortada, reescrita e reinserida em bloco na posição do
+        novo prefixo; a ordem relativa dos itens não muda.
+
+        Returns:
+            list[tuple[str, Hashable]]: Novos `(caminho, id)` dos itens.
+        """
+        if old_prefix == new_prefix:
+            return []
+        low, high = self._bounds(old_prefix)
+        size = len(old_prefix)
+        moved = [
+            (new_prefix + path[size:], item_id)
+            for path, item_id in self._keys[low:high]
+        ]
+        del self._keys[low:high]
+        low, high = self._bounds(new_prefix)
+        if low == high:
+            self._keys[low:low] = moved
+        else:
+            self._keys[low:high] = sorted(self._keys[low:high] + moved)
+        return moved
@@ -0,0 +1,82 @@
+"""Armazenamentos de sequências numéricas."""
+
+import sqlite3
+import threading
+from pathlib import Path
+
+from src.core.domain.repositorys.sequence import ISequenceRepository
+
+
+def _check_size(size: int) -> None:
+    if size < 1:
+        raise ValueError("O tamanho do bloco deve ser de pelo menos 1.")
+
+
+class InMemorySequenceRepository(ISequenceRepository):
+    """Sequências em memória, seguras entre threads de um processo."""
+
+    def __init__(self):
+        self._next: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def reserve_block(self, key: str, size: int) -> int:
+        """Reserva um bloco de números da sequência."""
+        _check_size(size)
+        with self._lock:
+            start = self._next.get(key, 1)
+            self._next[key] = start + size
+        return start
+
+
+class SqliteSequenceRepository(ISequenceRepository):
+    """
+    Sequências persistidas em um arquivo SQLite.
+
+    Cada reserva é uma única transação de escrita (`BEGIN IMMEDIATE`), o
+    que a torna atômica entre processos que compartilham o arquivo.
+
+    Args:
+        path (str | Path): Caminho do banco de dados.
+        timeout (float): Espera máxima, em segundos, pelo lock de escrita.
+    """
+
+    def __init__(self, path: str | Path, timeout: float = 30.0):
+        self.path = Path(path)
+        self.timeout = timeout
+        with self._connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS sequences ("
+                "key TEXT PRIMARY KEY, next INTEGER NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(
+            self.path, timeout=self.timeout, isolation_level=None
+        )
+
+    def reserve_block(self, key: str, size: int) -> int:
+        """Reserva um bloco de números da sequência."""
+        _check_size(size)
+        connection = self._connect()
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+            connection.execute(
+                "INSERT INTO sequences (key, next) VALUES (?, 1) "
+                "ON CONFLICT (key) DO NOTHING",
+                (key,),
+            )
+            (start,) = connection.execute(
+                "SELECT next FROM sequences WHERE key = ?", (key,)
+            ).fetchone()
+            connection.execute(
+                "UPDATE sequences SET next = ? WHERE key = ?",
+                (start + size, key),
+            )
+            connection.execute("COMMIT")
+        except BaseException:
+            if connection.in_transaction:
+                connection.execute("ROLLBACK")
+            raise
+        finally:
+            connection.close()
+        return start
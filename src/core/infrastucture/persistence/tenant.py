@@ -0,0 +1,57 @@
+"""Repositório de empresas em memória."""
+
+from typing import Hashable, Optional
+from uuid import UUID
+
+from src.core.domain.entities.tenant import Tenant
+from src.core.domain.exceptions import (
+    TenantAlreadyExistsException,
+    TenantNotFoundException,
+)
+from src.core.domain.repositorys.tenant import ITenantRepository
+from src.core.infrastucture.persistence.base import InMemoryRepository
+
+
+class InMemoryTenantRepository(InMemoryRepository, ITenantRepository):
+    """
+    Implementação em memória de `ITenantRepository`.
+
+    O nome é indexado sem diferenciar maiúsculas de minúsculas, de modo
+    que `exists_by_name` custa O(1).
+    """
+
+    not_found_exception = TenantNotFoundException
+    already_exists_exception = TenantAlreadyExistsException
+    _ordered_indexes = ("is_active",)
+
+    def _index_keys(self, entity: Tenant) -> dict[str, Hashable]:
+        return {
+            "user_id": entity.user_id,
+            "is_active": entity.is_active,
+            "name": entity.name.strip().casefold(),
+        }
+
+    def get_by_user_id(self, user_id: UUID) -> list[Tenant]:
+        """Obtém empresas associadas a um usuário específico."""
+        return self._lookup("user_id", user_id)
+
+    def get_actives(self) -> list[Tenant]:
+        """Obtém empresas ativas."""
+        return self._lookup("is_active", True)
+
+    def get_inactives(self) -> list[Tenant]:
+        """Obtém empresas inativas."""
+        return self._lookup("is_active", False)
+
+    def exists_by_name(self, name: str) -> bool:
+        """Verifica se uma empresa existe pelo nome."""
+        return bool(self._lookup_ids("name", name.strip().casefold()))
+
+    def get_page(
+        self,
+        limit: int,
+        after: Optional[UUID] = None,
+        is_active: bool = True,
+    ) -> list[Tenant]:
+        """Obtém uma página de empresas (ativas ou não), em ordem de ID."""
+        return self._page("is_active", is_active, limit, after)
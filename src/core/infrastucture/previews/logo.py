@@ -0,0 +1,125 @@
+"""Leitura e redimensionamento do logo das empresas.
+
+O logo (`Tenant.logo`) é um caminho local, dentro de um diretório
+permitido, ou uma URL `http(s)` de um endereço público. Cada variante é
+reduzida mantendo a proporção e a transparência e gravada em PNG. As
+funções rodam nos processos do `TenantAssetService`.
+
+Requer o extra opcional `preview` (`Pillow`).
+"""
+
+import io
+import ipaddress
+import socket
+import urllib.request
+from pathlib import Path
+from urllib.parse import urlparse
+
+from PIL import Image
+
+MAX_LOGO_BYTES = 10 << 20
+TIMEOUT = 10.0
+
+
+def _check_host(url: str) -> None:
+    """
+    Recusa URLs cujo host resolve para um endereço não público.
+
+    Raises:
+        ValueError: Se o host for privado, de loopback, link-local,
+            reservado, multicast ou não resolver.
+    """
+    host = urlparse(url).hostname
+    try:
+        addresses = socket.getaddrinfo(host, None) if host else []
+    except (OSError, UnicodeError) as error:
+        raise ValueError(f"Host do logo não resolvido: '{url}'.") from error
+    if not addresses:
+        raise ValueError(f"Host do logo não resolvido: '{url}'.")
+    for *_, sockaddr in addresses:
+        address = ipaddress.ip_address(sockaddr[0].split("%", 1)[0])
+        if not address.is_global or address.is_multicast:
+            raise ValueError(f"Host do logo não permitido: '{url}'.")
+
+
+class _CheckedRedirectHandler(urllib.request.HTTPRedirectHandler):
+    """Aplica a `_check_host` ao destino de cada redirecionamento."""
+
+    def redirect_request(  # pylint: disable=too-many-arguments
+        self, req, fp, code, msg, headers, newurl
+    ):
+        if urlparse(newurl).scheme not in ("http", "https"):
+            raise ValueError(f"Origem de logo não aceita: '{newurl}'.")
+        _check_host(newurl)
+        return super().redirect_request(req, fp, code, msg, headers, newurl)
+
+
+_OPENER = urllib.request.build_opener(_CheckedRedirectHandler)
+
+
+def read_logo(
+    source: str,
+    root: str,
+    max_bytes: int = MAX_LOGO_BYTES,
+    timeout: float = TIMEOUT,
+) -> bytes:
+    """
+    Lê o conteúdo original do logo.
+
+    Args:
+        source (str): Caminho local ou URL `http`/`https`.
+        root (str): Diretório dos logos locais; caminhos fora dele são
+            recusados.
+        max_bytes (int): Tamanho máximo aceito.
+        timeout (float): Tempo máximo de cada leitura da URL, em segundos.
+
+    Raises:
+        ValueError: Se a origem não for aceita, apontar para um endereço
+            privado ou de loopback ou passar de `max_bytes`.
+    """
+    scheme = urlparse(source).scheme
+    if scheme in ("http", "https"):
+        _check_host(source)
+        with _OPENER.open(source, timeout=timeout) as response:
+            data = response.read(max_bytes + 1)
+    elif scheme and len(scheme) > 1:  # `C:\` é um caminho do Windows
+        raise ValueError(f"Origem de logo não aceita: '{source}'.")
+    else:
+        path = Path(source).resolve()
+        if not path.is_relative_to(Path(root).resolve()):
+            raise ValueError(f"Logo fora do diretório permitido: '{source}'.")
+        with open(path, "rb") as file:
+            data = file.read(max_bytes + 1)
+    if len(data) > max_bytes:
+        raise ValueError(f"Logo maior que {max_bytes} bytes: '{source}'.")
+    return data
+
+
+def render_logo(
+    source: str, variants: dict[str, int], root: str
+) -> dict[str, bytes]:
+    """
+    Gera as variantes do logo, em PNG.
+
+    O serviço só informa a origem e as variantes: passe
+    `functools.partial(render_logo, root=...)` como renderizador.
+
+    Args:
+        source (str): Caminho local ou URL do logo.
+        variants (dict[str, int]): Nome e lado máximo de cada variante.
+        root (str): Diretório dos logos locais, repassado a `read_logo`.
+
+    Returns:
+        dict[str, bytes]: PNG de cada variante.
+    """
+    image = Image.open(io.BytesIO(read_logo(source, root)))
+    image.seek(0)
+    image = image.convert("RGBA")
+    results = {}
+    for name, size in variants.items():
+        variant = image.copy()
+        variant.thumbnail((size, size))
+        output = io.BytesIO()
+        variant.save(output, "PNG", optimize=True)
+        results[name] = output.getvalue()
+    return results
@@ -0,0 +1,96 @@
+"""Renderização da primeira página e de miniaturas de arquivos.
+
+Imagens são abertas pelo Pillow; PDFs têm a primeira página rasterizada
+pelo PDFium (`pypdfium2`). Cada variante é reduzida mantendo a proporção
+e gravada em PNG.
+
+As funções rodam nos processos do `PreviewPipeline`, então recebem os
+trechos do arquivo (`FileSegment`) em vez do conteúdo: só os caminhos
+atravessam o limite entre processos.
+
+Requer o extra opcional `preview` (`Pillow` e `pypdfium2`).
+"""
+
+import io
+
+import pypdfium2 as pdfium
+from PIL import Image
+
+from src.core.domain.repositorys.blob import FileSegment
+
+PDF = "application/pdf"
+IMAGE_TYPES = frozenset(
+    {
+        "image/bmp",
+        "image/gif",
+        "image/jpeg",
+        "image/png",
+        "image/tiff",
+        "image/webp",
+    }
+)
+MEDIA_TYPES = IMAGE_TYPES | {PDF}
+
+
+def read_segments(segments: list[FileSegment]) -> bytes:
+    """Junta os trechos de arquivo em um conteúdo."""
+    content = bytearray()
+    for segment in segments:
+        with open(segment.path, "rb") as file:
+            file.seek(segment.offset)
+            content += file.read(segment.count)
+    return bytes(content)
+
+
+def first_page(content: bytes, media_type: str, size: int) -> Image.Image:
+    """
+    Primeira página (ou quadro) do arquivo como imagem RGB.
+
+    Args:
+        size (int): Lado maior desejado, em pixels; PDFs são rasterizados
+            já nessa escala.
+    """
+    if media_type == PDF:
+        document = pdfium.PdfDocument(content)
+        try:
+            page = document[0]
+            scale = size / max(page.get_size())
+            image = page.render(scale=scale).to_pil()
+        finally:
+            document.close()
+    else:
+        image = Image.open(io.BytesIO(content))
+        image.seek(0)
+    return image.convert("RGB")
+
+
+def render_previews(
+    segments: list[FileSegment], media_type: str, variants: dict[str, int]
+) -> dict[str, bytes]:
+    """
+    Gera as variantes de um arquivo, em PNG.
+
+    Args:
+        segments (list[FileSegment]): Trechos que formam o arquivo.
+        media_type (str): Tipo de mídia (um de `MEDIA_TYPES`).
+        variants (dict[str, int]): Nome e lado máximo de cada variante.
+
+    Returns:
+        dict[str, bytes]: PNG de cada variante.
+
+    Raises:
+        ValueError: Se o tipo de mídia não for aceito.
+    """
+    if media_type not in MEDIA_TYPES:
+        raise ValueError(f"Tipo de mídia sem prévia: '{media_type}'.")
+    image = first_page(
+        read_segments(segments), media_type, max(variants.values())
+    )
+    results = {}
+    for name, size in variants.items():
+        variant = image.copy()
+        variant.thumbnail((size, size))
+        output = io.BytesIO()
+        variant.save(output, "PNG", optimize=True)
+        results[name] = output.getvalue()
+    return results
@@ -0,0 +1,123 @@
+"""Indexação incremental de documentos para a busca textual."""
+
+from typing import Hashable, Iterable, Optional
+from uuid import UUID
+
+from src.core.application.events import EventBus
+from src.core.domain.entities.base import DomainEvent
+from src.core.domain.entities.document import Document
+from src.core.domain.exceptions import DocumentNotFoundException
+from src.core.domain.repositorys.document import IDocumentRepository
+from src.core.domain.value_objects.doc_status import DocumentStatus
+from src.core.infrastucture.search.inverted_index import InvertedIndex
+
+# Campos indexados e seus pesos; os ausentes no tipo são ignorados
+# (`subject`, `description` e `notes` são de contratos).
+SEARCH_FIELDS = (
+    ("title", 3),
+    ("subject", 2),
+    ("description", 1),
+    ("notes", 1),
+)
+
+
+class SearchIndexer:
+    """
+    Mantém um índice invertido por tenant, atualizado por eventos.
+
+    Cada evento de criação, alteração ou exclusão reindexa apenas o
+    documento afetado; se os campos indexados não mudaram (ex.: só o
+    status), o índice não é tocado. Documentos excluídos saem do índice.
+
+    Args:
+        document_repository (IDocumentRepository): Fonte dos documentos.
+        fields (Iterable[tuple[str, int]]): Atributos indexados e pesos.
+        vectorized (bool, optional): Repassado a cada `InvertedIndex`.
+    """
+
+    def __init__(
+        self,
+        document_repository: IDocumentRepository,
+        fields: Iterable[tuple[str, int]] = SEARCH_FIELDS,
+        vectorized: Optional[bool] = None,
+    ):
+        self.document_repository = document_repository
+        self.fields = tuple(fields)
+        self.vectorized = vectorized
+        self._indexes: dict[Hashable, InvertedIndex] = {}
+        self._tenants: dict[UUID, Hashable] = {}
+
+    def subscribe(self, bus: EventBus) -> None:
+        """
+        Inscreve o indexador nos eventos de documentos.
+
+        Inclui `contract_anonymized`: os dados pessoais removidos de um
+        contrato não podem continuar sendo encontrados pela busca.
+        """
+        for event_type in (
+            "document_created",
+            "document_updated",
+            "document_deleted",
+            "contract_anonymized",
+        ):
+            bus.subscribe(event_type, self.handle)
+
+    def handle(self, event: DomainEvent) -> None:
+        """Reindexa o documento do evento."""
+        document_id = UUID(event.data["document_id"])
+        try:
+            document = self.document_repository.get(document_id)
+        except DocumentNotFoundException:
+            self.remove(document_id)
+            return
+        self.index(document)
+
+    def _fields(self, document: Document) -> list[tuple[str, int]]:
+        fields = []
+        for name, weight in self.fields:
+            value = getattr(document, name, None)
+            if value:
+                fields.append((str(value), weight))
+        return fields
+
+    def index(self, document: Document) -> bool:
+        """
+        Indexa um documento (ou o remove, se estiver excluído).
+
+        Returns:
+            bool: True se o índice foi alterado.
+        """
+        if document.status == DocumentStatus.DELETED:
+            return self.remove(document.entity_id)
+        tenant_id = document.tenant_id
+        index = self._indexes.get(tenant_id)
+        if index is None:
+            index = self._indexes[tenant_id] = InvertedIndex(self.vectorized)
+        self._tenants[document.entity_id] = tenant_id
+        return index.add(document.entity_id, self._fields(document))
+
+    def index_many(self, documents: Iterable[Document]) -> int:
+        """Indexa vários documentos; retorna quantos alteraram o índice."""
+        return sum(self.index(document) for document in documents)
+
+    def remove(self, document_id: UUID) -> bool:
+        """Remove um documento do índice; False se ele não estava lá."""
+        tenant_id = self._tenants.pop(document_id, None)
+        if tenant_id is None:
+            return False
+        return self._indexes[tenant_id].remove(document_id)
+
+    def search(
+        self, tenant_id: UUID, query: str, limit: int = 10
+    ) -> list[tuple[UUID, float]]:
+        """
+        Busca nos documentos de um tenant.
+
+        Returns:
+            list[tuple[UUID, float]]: IDs e pontuações BM25, da maior
+            para a menor.
+        """
+        index = self._indexes.get(tenant_id)
+        if index is None:
+            return []
+        return index.search(query, limit)
@@ -0,0 +1,349 @@
+"""Índice invertido com ranqueamento BM25."""
+
+import heapq
+import math
+import threading
+from array import array
+from collections import OrderedDict
+from typing import Hashable, Iterable, Optional
+
+from src.core.infrastucture.search.postings import PostingList, np
+from src.core.infrastucture.search.tokenizer import tokenize
+
+K1 = 1.2
+B = 0.75
+# Fração de documentos removidos que dispara a compactação.
+COMPACT_RATIO = 0.25
+_COMPACT_MIN = 1024
+# Ocorrências decodificadas mantidas em cache (8 bytes cada).
+CACHE_POSTINGS = 1 << 22
+# Variação do tamanho médio dos documentos que invalida o cache.
+AVERAGE_DRIFT = 0.05
+# Termos com menos ocorrências são decodificados a cada consulta.
+_CACHE_MIN = 1024
+# Abaixo de 1/_DENSE_FACTOR ocorrências por documento, a soma das
+# pontuações ordena as ocorrências em vez de usar um vetor denso.
+_DENSE_FACTOR = 4
+
+
+class InvertedIndex:
+    """
+    Índice de busca textual de um conjunto de documentos.
+
+    Cada documento indexado recebe um número sequencial, e as listas de
+    ocorrências só crescem no fim (ver `postings`). Reindexar um documento
+    marca o número antigo como removido e atribui um novo; os removidos
+    são descartados das listas na compactação, feita automaticamente
+    quando passam de `COMPACT_RATIO` do total.
+
+    Como no Lucene, a frequência dos termos e o tamanho médio usados pelo
+    BM25 incluem os documentos removidos até a compactação seguinte: as
+    estatísticas ficam ligeiramente desatualizadas, mas remover não exige
+    saber os termos antigos do documento.
+
+    Os campos de um documento têm pesos: a frequência de um termo é a
+    soma dos pesos dos campos em que ele aparece.
+
+    No modo vetorizado, as listas dos termos frequentes ficam também
+    decodificadas, com o impacto BM25 de cada ocorrência já calculado,
+    em um cache LRU: a consulta só multiplica pelo IDF e soma.
+
+    Args:
+        vectorized (bool, optional): Usa NumPy para decodificar e pontuar;
+            por padrão, quando estiver instalado.
+        cache_postings (int): Ocorrências mantidas decodificadas.
+    """
+
+    def __init__(
+        self,
+        vectorized: Optional[bool] = None,
+        cache_postings: int = CACHE_POSTINGS,
+    ):
+        if vectorized is None:
+            vectorized = np is not None
+        elif vectorized and np is None:
+            raise ValueError("O modo vetorizado requer o NumPy.")
+        self.vectorized = vectorized
+        self._terms: dict[str, PostingList] = {}
+        self._keys: list[Optional[Hashable]] = []
+        self._numbers: dict[Hashable, tuple[int, int]] = {}
+        self._lengths = array("I")
+        self._alive = bytearray()
+        self._total_length = 0
+        self.cache_postings = cache_postings
+        self._cache: OrderedDict[str, _Impacts] = OrderedDict()
+        self._cached = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._numbers)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._numbers
+
+    @property
+    def removed(self) -> int:
+        """Documentos removidos ainda presentes nas listas."""
+        return len(self._keys) - len(self._numbers)
+
+    @property
+    def postings(self) -> int:
+        """Ocorrências nas listas, contando as de documentos removidos."""
+        return sum(len(postings) for postings in self._terms.values())
+
+    @property
+    def posting_bytes(self) -> int:
+        """Bytes ocupados pelas listas de ocorrências."""
+        return sum(len(postings.data) for postings in self._terms.values())
+
+    def add(self, key: Hashable, fields: Iterable[tuple[str, int]]) -> bool:
+        """
+        Indexa (ou reindexa) um documento.
+
+        Args:
+            key (Hashable): Identificador do documento.
+            fields (Iterable[tuple[str, int]]): Textos e seus pesos.
+
+        Returns:
+            bool: False se o texto não mudou desde a última indexação.
+        """
+        fields = tuple(fields)
+        fingerprint = hash(fields)
+        frequencies: dict[str, int] = {}
+        for text, weight in fields:
+            for token in tokenize(text):
+                frequencies[token] = frequencies.get(token, 0) + weight
+        with self._lock:
+            current = self._numbers.get(key)
+            if current is not None and current[1] == fingerprint:
+                return False
+            if current is not None:
+                self._discard(current[0])
+            number = len(self._keys)
+            self._keys.append(key)
+            self._numbers[key] = (number, fingerprint)
+            length = sum(frequencies.values())
+            self._lengths.append(length)
+            self._alive.append(1)
+            self._total_length += length
+            for token, frequency in frequencies.items():
+                postings = self._terms.get(token)
+                if postings is None:
+                    postings = self._terms[token] = PostingList()
+                postings.append(number, frequency)
+            self._maybe_compact()
+        return True
+
+    def remove(self, key: Hashable) -> bool:
+        """Remove um documento; False se ele não estava indexado."""
+        with self._lock:
+            current = self._numbers.pop(key, None)
+            if current is None:
+                return False
+            self._discard(current[0])
+            self._maybe_compact()
+        return True
+
+    def _discard(self, number: int) -> None:
+        self._alive[number] = 0
+        self._keys[number] = None
+
+    def _maybe_compact(self) -> None:
+        removed = len(self._keys) - len(self._numbers)
+        if removed >= _COMPACT_MIN and removed > COMPACT_RATIO * len(
+            self._keys
+        ):
+            self._compact()
+
+    def compact(self) -> None:
+        """Descarta os documentos removidos e renumera os demais."""
+        with self._lock:
+            self._compact()
+
+    def _compact(self) -> None:
+        renumber = {}
+        keys: list[Optional[Hashable]] = []
+        lengths = array("I")
+        for number, key in enumerate(self._keys):
+            if self._alive[number]:
+                renumber[number] = len(keys)
+                self._numbers[key] = (len(keys), self._numbers[key][1])
+                keys.append(key)
+                lengths.append(self._lengths[number])
+        terms = {}
+        for token, postings in self._terms.items():
+            documents, frequencies = postings.decode()
+            kept = [
+                (renumber[document], frequency)
+                for document, frequency in zip(documents, frequencies)
+                if document in renumber
+            ]
+            if kept:
+                terms[token] = PostingList.build(*zip(*kept))
+        self._terms = terms
+        self._keys = keys
+        self._lengths = lengths
+        self._alive = bytearray(b"\x01" * len(keys))
+        self._total_length = sum(lengths)
+        self._cache.clear()
+        self._cached = 0
+
+    def search(
+        self, query: str, limit: int = 10
+    ) -> list[tuple[Hashable, float]]:
+        """
+        Documentos mais relevantes para a consulta, pelo BM25.
+
+        Um documento precisa conter ao menos um dos termos; os que contêm
+        mais termos, ou termos mais raros, ficam à frente.
+
+        Returns:
+            list[tuple[Hashable, float]]: Chaves e pontuações, da maior
+            para a menor.
+        """
+        query_tokens = list(dict.fromkeys(tokenize(query)))
+        with self._lock:
+            tokens = [token for token in query_tokens if token in self._terms]
+            postings = [self._terms[token] for token in tokens]
+            if not postings or limit < 1:
+                return []
+            if self.vectorized:
+                ranked = self._search_array(tokens, postings, limit)
+            else:
+                ranked = self._search_python(postings, limit)
+            return [(self._keys[number], score) for number, score in ranked]
+
+    def _statistics(self, postings: PostingList) -> tuple[float, float]:
+        """IDF do termo e tamanho médio dos documentos."""
+        total = len(self._keys)
+        idf = math.log(
+            1 + (total - postings.count + 0.5) / (postings.count + 0.5)
+        )
+        return idf, self._total_length / total
+
+    def _search_python(
+        self, postings: list[PostingList], limit: int
+    ) -> list[tuple[int, float]]:
+        scores: dict[int, float] = {}
+        for term in postings:
+            idf, average = self._statistics(term)
+            norm = K1 / average * B
+            base = K1 * (1 - B)
+            for document, frequency in zip(*term.decode()):
+                if not self._alive[document]:
+                    continue
+                score = (
+                    idf
+                    * frequency
+                    * (K1 + 1)
+                    / (frequency + base + norm * self._lengths[document])
+                )
+                scores[document] = scores.get(document, 0.0) + score
+        return heapq.nlargest(
+            limit, scores.items(), key=lambda item: (item[1], -item[0])
+        )
+
+    def _impacts(
+        self, token: str, postings: PostingList, average: float
+    ) -> tuple["np.ndarray", "np.ndarray"]:
+        """
+        Documentos e impactos BM25 (sem o IDF) de um termo.
+
+        Os termos com muitas ocorrências ficam decodificados em um cache
+        LRU limitado a `cache_postings` ocorrências. Como as listas só
+        crescem no fim, uma entrada desatualizada é completada
+        decodificando apenas os bytes novos; ela é descartada se o
+        tamanho médio dos documentos mudou mais que `AVERAGE_DRIFT`.
+        """
+        entry = self._cache.pop(token, None)
+        if entry is not None:
+            self._cached -= len(entry.documents)
+            if abs(entry.average - average) > AVERAGE_DRIFT * average:
+                entry = None
+        if entry is None:
+            entry = _Impacts(average)
+        if entry.offset < len(postings.data):
+            documents, frequencies = postings.decode_array(
+                entry.offset, entry.last
+            )
+            lengths = np.frombuffer(self._lengths, dtype=np.uint32)
+            norm = K1 * (1 - B + B * lengths[documents] / entry.average)
+            del lengths
+            impacts = (frequencies * (K1 + 1) / (frequencies + norm)).astype(
+                np.float32
+            )
+            entry.extend(documents.astype(np.uint32), impacts)
+            entry.offset, entry.last = len(postings.data), postings.last
+        if postings.count >= _CACHE_MIN:
+            self._cache[token] = entry
+            self._cached += len(entry.documents)
+            while self._cached > self.cache_postings and self._cache:
+                _, evicted = self._cache.popitem(last=False)
+                self._cached -= len(evicted.documents)
+        return entry.documents, entry.impacts
+
+    def _search_array(
+        self, tokens: list[str], postings: list[PostingList], limit: int
+    ) -> list[tuple[int, float]]:
+        total = len(self._keys)
+        average = self._total_length / total
+        all_documents, all_scores = [], []
+        for token, term in zip(tokens, postings):
+            idf, _ = self._statistics(term)
+            documents, impacts = self._impacts(token, term, average)
+            all_documents.append(documents)
+            all_scores.append(impacts * np.float32(idf))
+        alive = np.frombuffer(self._alive, dtype=np.uint8).view(bool)
+        size = sum(len(documents) for documents in all_documents)
+        if len(postings) == 1:
+            documents, scores = all_documents[0], all_scores[0]
+            keep = alive[documents]
+            documents, scores = documents[keep], scores[keep]
+        elif size * _DENSE_FACTOR < total:
+            documents, inverse = np.unique(
+                np.concatenate(all_documents), return_inverse=True
+            )
+            scores = np.bincount(inverse, weights=np.concatenate(all_scores))
+            keep = alive[documents]
+            documents, scores = documents[keep], scores[keep]
+        else:
+            # Muitas ocorrências: acumula em um vetor denso por documento.
+            scores = np.bincount(
+                np.concatenate(all_documents),
+                weights=np.concatenate(all_scores),
+                minlength=total,
+            )
+            scores *= alive
+            documents = None
+        del alive
+        if len(scores) > limit:
+            top = np.argpartition(scores, -limit)[-limit:]
+        else:
+            top = np.arange(len(scores))
+        top = top[scores[top] > 0]
+        ranked = top if documents is None else documents[top]
+        order = np.lexsort((ranked, -scores[top]))
+        return [
+            (int(document), float(score))
+            for document, score in zip(ranked[order], scores[top][order])
+        ]
+
+
+class _Impacts:
+    """Ocorrências decodificadas de um termo, no cache do índice."""
+
+    __slots__ = ("average", "offset", "last", "documents", "impacts")
+
+    def __init__(self, average: float):
+        self.average = average
+        self.offset = 0
+        self.last = -1
+        self.documents = np.empty(0, dtype=np.uint32)
+        self.impacts = np.empty(0, dtype=np.float32)
+
+    def extend(self, documents: "np.ndarray", impacts: "np.ndarray"):
+        """Acrescenta as ocorrências decodificadas depois do fim."""
+        if len(self.documents):
+            documents = np.concatenate((self.documents, documents))
+            impacts = np.concatenate((self.impacts, impacts))
+        self.documents, self.impacts = documents, impacts
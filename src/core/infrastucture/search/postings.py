@@ -0,0 +1,129 @@
+"""Listas de ocorrências (postings) comprimidas.
+
+Cada termo guarda os documentos em que aparece como pares
+`(documento, frequência)`, com o número do documento codificado como a
+diferença para o anterior. Os números são atribuídos em ordem crescente,
+então as diferenças são pequenas e cabem em um ou dois bytes de varint
+(7 bits por byte; o bit alto indica continuação), e um documento novo é
+sempre acrescentado no fim, sem reescrever a lista.
+
+Com o extra `analytics` (NumPy) instalado, a decodificação é vetorizada;
+sem ele, um laço em Python produz os mesmos valores.
+"""
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depende do ambiente
+    np = None
+
+
+def write_varint(out: bytearray, value: int) -> None:
+    """Acrescenta um inteiro não negativo codificado como varint."""
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def read_varints(data: bytes) -> list[int]:
+    """Decodifica uma sequência de varints."""
+    values = []
+    value = shift = 0
+    for byte in data:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+        else:
+            values.append(value)
+            value = shift = 0
+    return values
+
+
+def read_varints_array(data: bytes) -> "np.ndarray":
+    """
+    Decodifica uma sequência de varints com NumPy.
+
+    Cada byte sem o bit de continuação fecha um valor; os bytes de um
+    mesmo valor são deslocados pela posição dentro dele e somados com
+    `np.add.reduceat`.
+    """
+    raw = np.frombuffer(data, dtype=np.uint8)
+    ends = np.flatnonzero(raw < 0x80)
+    if len(ends) == len(raw):
+        return raw.astype(np.int64)
+    starts = np.empty_like(ends)
+    starts[0] = 0
+    starts[1:] = ends[:-1] + 1
+    position = np.arange(len(raw)) - np.repeat(starts, ends - starts + 1)
+    parts = (raw & 0x7F).astype(np.int64) << (7 * position)
+    return np.add.reduceat(parts, starts)
+
+
+class PostingList:
+    """
+    Ocorrências de um termo, em ordem crescente de documento.
+
+    Attributes:
+        data (bytearray): Pares `(diferença, frequência)` em varint.
+        last (int): Último documento acrescentado (-1 se vazia).
+        count (int): Quantidade de documentos.
+    """
+
+    __slots__ = ("data", "last", "count")
+
+    def __init__(self):
+        self.data = bytearray()
+        self.last = -1
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def append(self, document: int, frequency: int) -> None:
+        """
+        Acrescenta um documento maior que todos os já presentes.
+
+        Raises:
+            ValueError: Se o documento não for maior que `last`.
+        """
+        if document <= self.last:
+            raise ValueError("Os documentos devem ser crescentes.")
+        write_varint(self.data, document - self.last - 1)
+        write_varint(self.data, frequency)
+        self.last = document
+        self.count += 1
+
+    def decode(self) -> tuple[list[int], list[int]]:
+        """Documentos e frequências, em listas do Python."""
+        values = read_varints(self.data)
+        documents, frequencies = [], values[1::2]
+        current = -1
+        for delta in values[0::2]:
+            current += delta + 1
+            documents.append(current)
+        return documents, frequencies
+
+    def decode_array(
+        self, offset: int = 0, last: int = -1
+    ) -> tuple["np.ndarray", "np.ndarray"]:
+        """
+        Documentos e frequências, em arrays `int64` do NumPy.
+
+        Args:
+            offset (int): Byte inicial; permite decodificar só o que foi
+                acrescentado depois de uma decodificação anterior.
+            last (int): Último documento antes de `offset`.
+        """
+        values = read_varints_array(bytes(self.data[offset:]))
+        documents = np.cumsum(values[0::2] + 1) + last
+        return documents, values[1::2]
+
+    @classmethod
+    def build(
+        cls, documents: list[int], frequencies: list[int]
+    ) -> "PostingList":
+        """Cria a lista a partir de documentos já ordenados."""
+        postings = cls()
+        for document, frequency in zip(documents, frequencies):
+            postings.append(document, frequency)
+        return postings
@@ -0,0 +1,159 @@
+"""Índice ordenado para sugestões por prefixo (autocompletar)."""
+
+import bisect
+import threading
+from typing import Hashable, Iterator
+
+from src.core.infrastucture.search.tokenizer import STOPWORDS, words
+
+
+def normalize(text: str) -> str:
+    """
+    Texto em minúsculas, sem acentos e sem palavras vazias, com as
+    palavras separadas por espaço (`Locação de Imóvel` → `locacao
+    imovel`). Um texto só com palavras vazias as mantém.
+    """
+    parts = words(text)
+    return " ".join([part for part in parts if part not in STOPWORDS] or parts)
+
+
+def normalize_prefix(text: str) -> str:
+    """
+    Normaliza o texto digitado: a última palavra pode estar incompleta
+    (`de` → `despesa`), então só as anteriores perdem as palavras vazias.
+    """
+    parts = words(text)
+    return " ".join(
+        [part for part in parts[:-1] if part not in STOPWORDS] + parts[-1:]
+    )
+
+
+class _SortedEntries:
+    """
+    Textos em ordem, em uma lista de `str`, e as chaves em outra lista
+    alinhada: duas listas de referências em vez de um nó por caractere
+    (trie) ou uma tupla por entrada.
+    """
+
+    __slots__ = ("texts", "keys")
+
+    def __init__(self):
+        self.texts: list[str] = []
+        self.keys: list[Hashable] = []
+
+    def add(self, text: str, key: Hashable) -> None:
+        index = bisect.bisect_right(self.texts, text)
+        self.texts.insert(index, text)
+        self.keys.insert(index, key)
+
+    def remove(self, text: str, key: Hashable) -> None:
+        index = bisect.bisect_left(self.texts, text)
+        while index < len(self.texts) and self.texts[index] == text:
+            if self.keys[index] == key:
+                del self.texts[index]
+                del self.keys[index]
+                return
+            index += 1
+
+    def matching(self, prefix: str) -> Iterator[Hashable]:
+        """Chaves dos textos que começam por `prefix`, em ordem."""
+        texts = self.texts
+        index = bisect.bisect_left(texts, prefix)
+        while index < len(texts) and texts[index].startswith(prefix):
+            yield self.keys[index]
+            index += 1
+
+
+class PrefixIndex:
+    """
+    Sugestões de rótulos (títulos, nomes) pelo começo digitado.
+
+    Cada rótulo entra normalizado (sem acentos, pontuação nem palavras
+    vazias) em duas listas ordenadas: o rótulo inteiro e, na segunda, o
+    trecho a partir de cada palavra seguinte ("locação de imóvel" também
+    é encontrado por "imo" e por "locacao imo"). A consulta é uma busca
+    binária e a leitura das entradas seguintes, O(log n + k); os rótulos
+    que começam pelo prefixo vêm antes dos que só têm uma palavra com ele.
+
+    Incluir ou remover um rótulo desloca as listas (O(n) em memória
+    contígua), como no `PathIndex`.
+    """
+
+    def __init__(self):
+        self._starts = _SortedEntries()
+        self._inner = _SortedEntries()
+        self._labels: dict[Hashable, str] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._labels
+
+    @staticmethod
+    def _entries(label: str) -> tuple[str, list[str]]:
+        parts = normalize(label).split()
+        inner = [" ".join(parts[index:]) for index in range(1, len(parts))]
+        return " ".join(parts), inner
+
+    def set(self, key: Hashable, label: str) -> bool:
+        """
+        Inclui ou troca o rótulo de uma chave.
+
+        Returns:
+            bool: False se o rótulo não mudou.
+        """
+        start, inner = self._entries(label)
+        with self._lock:
+            current = self._labels.get(key)
+            if current == label:
+                return False
+            if current is not None:
+                self._remove(key, current)
+            self._starts.add(start, key)
+            for text in inner:
+                self._inner.add(text, key)
+            self._labels[key] = label
+        return True
+
+    def remove(self, key: Hashable) -> bool:
+        """Remove uma chave; False se ela não estava no índice."""
+        with self._lock:
+            label = self._labels.pop(key, None)
+            if label is None:
+                return False
+            self._remove(key, label)
+        return True
+
+    def _remove(self, key: Hashable, label: str) -> None:
+        start, inner = self._entries(label)
+        self._starts.remove(start, key)
+        for text in inner:
+            self._inner.remove(text, key)
+
+    def complete(
+        self, prefix: str, limit: int = 10
+    ) -> list[tuple[Hashable, str]]:
+        """
+        Rótulos que começam pelo texto digitado.
+
+        Returns:
+            list[tuple[Hashable, str]]: Chaves e rótulos originais, no
+            máximo `limit`.
+        """
+        prefix = normalize_prefix(prefix)
+        results: list[tuple[Hashable, str]] = []
+        if not prefix or limit < 1:
+            return results
+        seen = set()
+        with self._lock:
+            for entries in (self._starts, self._inner):
+                for key in entries.matching(prefix):
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    results.append((key, self._labels[key]))
+                    if len(results) == limit:
+                        return results
+        return results
@@ -0,0 +1,72 @@
+"""Tokenização de textos em português para a busca."""
+
+import re
+from typing import Iterator
+
+from src.core.domain.text import fold_accents
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+# Já sem acentos: os tokens são comparados depois de `fold_accents`.
+STOPWORDS = frozenset(
+    """
+    a ao aos as ate com como da das de dela dele do dos e ela ele em entre
+    era essa esse esta este eu foi ha isso isto ja la lhe mais mas me mesmo
+    na nao nas nem no nos o os ou para pela pelas pelo pelos por qual quando
+    que se sem ser seu seus so sua suas tambem te tem um uma umas uns
+    """.split()
+)
+
+# Plurais comuns, do sufixo mais longo para o mais curto.
+_PLURALS = (
+    ("oes", "ao"),
+    ("aes", "ao"),
+    ("ais", "al"),
+    ("eis", "el"),
+    ("ois", "ol"),
+    ("res", "r"),
+    ("zes", "z"),
+    ("ns", "m"),
+)
+_MIN_STEM = 3
+
+
+def singular(token: str) -> str:
+    """
+    Reduz plurais regulares ao singular (`locacoes` → `locacao`).
+
+    É uma redução leve, aplicada igualmente a documentos e consultas:
+    um erro ocasional (`pires` → `pir`) não impede a correspondência.
+    """
+    if len(token) <= _MIN_STEM + 1 or not token.endswith("s"):
+        return token
+    for suffix, replacement in _PLURALS:
+        if token.endswith(suffix):
+            return token[: -len(suffix)] + replacement
+    if token.endswith(("ss", "us", "is")):
+        return token
+    return token[:-1]
+
+
+def words(text: str) -> list[str]:
+    """Palavras do texto em minúsculas e sem acentos, na ordem."""
+    text = text.casefold()
+    if not text.isascii():
+        text = fold_accents(text)
+    return _WORD.findall(text)
+
+
+def tokenize(text: str) -> Iterator[str]:
+    """
+    Extrai os termos de um texto.
+
+    Os termos ficam em minúsculas, sem acentos e no singular, e as
+    palavras vazias (`de`, `para`, `com`...) são descartadas: "Locação
+    de Imóveis" e "locacao imovel" produzem os mesmos termos.
+
+    Example:
+        list(tokenize("Contratos de Locação")) == ["contrato", "locacao"]
+    """
+    for token in words(text):
+        if token not in STOPWORDS:
+            yield singular(token)
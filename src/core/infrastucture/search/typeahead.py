@@ -0,0 +1,114 @@
+"""Sugestões de títulos de documentos e nomes de empresas."""
+
+from typing import Hashable, Iterable
+from uuid import UUID
+
+from src.core.application.events import EventBus
+from src.core.domain.entities.base import DomainEvent
+from src.core.domain.entities.document import Document
+from src.core.domain.entities.tenant import Tenant
+from src.core.domain.exceptions import (
+    DocumentNotFoundException,
+    TenantNotFoundException,
+)
+from src.core.domain.repositorys.document import IDocumentRepository
+from src.core.domain.repositorys.tenant import ITenantRepository
+from src.core.domain.value_objects.doc_status import DocumentStatus
+from src.core.infrastucture.search.prefix_index import PrefixIndex
+
+
+class TypeaheadIndexer:
+    """
+    Mantém os índices de prefixo atualizados pelos eventos de domínio.
+
+    Há um `PrefixIndex` de títulos por tenant e um de nomes de empresas
+    (para a administração). Um evento de documento só altera o índice se
+    o título mudou (ex.: `update_attribute("title", ...)`); documentos
+    excluídos saem das sugestões.
+
+    Args:
+        document_repository (IDocumentRepository): Fonte dos documentos.
+        tenant_repository (ITenantRepository): Fonte das empresas.
+    """
+
+    def __init__(
+        self,
+        document_repository: IDocumentRepository,
+        tenant_repository: ITenantRepository,
+    ):
+        self.document_repository = document_repository
+        self.tenant_repository = tenant_repository
+        self.tenants = PrefixIndex()
+        self._documents: dict[Hashable, PrefixIndex] = {}
+        self._document_tenants: dict[UUID, Hashable] = {}
+
+    def subscribe(self, bus: EventBus) -> None:
+        """Inscreve o indexador nos eventos de documentos e empresas."""
+        for action in ("created", "updated", "deleted"):
+            bus.subscribe(f"document_{action}", self.handle_document)
+            bus.subscribe(f"tenant_{action}", self.handle_tenant)
+
+    def handle_document(self, event: DomainEvent) -> None:
+        """Atualiza o título do documento do evento."""
+        document_id = UUID(event.data["document_id"])
+        try:
+            document = self.document_repository.get(document_id)
+        except DocumentNotFoundException:
+            self.remove_document(document_id)
+            return
+        self.index_document(document)
+
+    def handle_tenant(self, event: DomainEvent) -> None:
+        """Atualiza o nome da empresa do evento."""
+        tenant_id = UUID(event.data["tenant_id"])
+        try:
+            tenant = self.tenant_repository.get(tenant_id)
+        except TenantNotFoundException:
+            self.tenants.remove(tenant_id)
+            return
+        self.index_tenant(tenant)
+
+    def index_document(self, document: Document) -> bool:
+        """
+        Indexa o título de um documento (ou o remove, se excluído).
+
+        Returns:
+            bool: True se o índice foi alterado.
+        """
+        if document.status == DocumentStatus.DELETED:
+            return self.remove_document(document.entity_id)
+        index = self._documents.get(document.tenant_id)
+        if index is None:
+            index = self._documents[document.tenant_id] = PrefixIndex()
+        self._document_tenants[document.entity_id] = document.tenant_id
+        return index.set(document.entity_id, document.title)
+
+    def index_documents(self, documents: Iterable[Document]) -> int:
+        """Indexa vários documentos; retorna quantos alteraram o índice."""
+        return sum(self.index_document(document) for document in documents)
+
+    def remove_document(self, document_id: UUID) -> bool:
+        """Remove um documento das sugestões."""
+        tenant_id = self._document_tenants.pop(document_id, None)
+        if tenant_id is None:
+            return False
+        return self._documents[tenant_id].remove(document_id)
+
+    def index_tenant(self, tenant: Tenant) -> bool:
+        """Indexa o nome de uma empresa."""
+        return self.tenants.set(tenant.entity_id, tenant.name)
+
+    def suggest_documents(
+        self, tenant_id: UUID, prefix: str, limit: int = 10
+    ) -> list[tuple[UUID, str]]:
+        """Documentos do tenant cujo título começa pelo texto digitado."""
+        index = self._documents.get(tenant_id)
+        if index is None:
+            return []
+        return index.complete(prefix, limit)
+
+    def suggest_tenants(
+        self, prefix: str, limit: int = 10
+    ) -> list[tuple[UUID, str]]:
+        """Empresas cujo nome começa pelo texto digitado."""
+        return self.tenants.complete(prefix, limit)
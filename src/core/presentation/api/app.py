@@ -0,0 +1,688 @@
+"""Aplicação ASGI sobre os casos de uso de documentos e empresas.
+
+As listagens são enviadas como NDJSON (uma entidade JSON por linha), em
+partes, página a página pelo cursor: a resposta nunca monta a lista
+completa em memória. Para continuar uma listagem interrompida, envie o
+`id` da última linha recebida em `?after=`.
+
+Uso com um servidor ASGI:
+    uvicorn src.core.presentation.api.app:create_app --factory
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional
+from urllib.parse import quote
+from uuid import UUID
+
+from src.core.application.events import EventBus
+from src.core.application.services.document_service import DocumentService
+from src.core.application.services.rate_limit import TenantRateLimiter
+from src.core.application.services.tenant_service import TenantService
+from src.core.application.use_cases.create_document import (
+    CreateDocumentUseCase,
+)
+from src.core.application.use_cases.document.batch import (
+    CREATE,
+    OPERATIONS,
+    UPDATE_ATTRIBUTE,
+    BatchOperation,
+    ExecuteDocumentBatchUseCase,
+)
+from src.core.application.use_cases.document.change_status import (
+    ChangeDocumentStatusUseCase,
+)
+from src.core.application.use_cases.document.update import (
+    UpdateDocumentAttributeUseCase,
+)
+from src.core.application.use_cases.tenant.create import CreateTenantUseCase
+from src.core.domain.entities.document import Document
+from src.core.domain.entities.tenant import Tenant
+from src.core.domain.exceptions import (
+    BlobNotFoundException,
+    BusinessRuleViolationError,
+    DocumentAlreadyExistsException,
+    DocumentNotFoundException,
+    DocumentTypeException,
+    DocumentUpdateAttrException,
+    DocumentVersionConflictException,
+    DomainValidationError,
+    TenantAlreadyExistsException,
+    TenantNotFoundException,
+)
+from src.core.domain.repositorys.blob import IBlobStore
+from src.core.domain.repositorys.document import IDocumentRepository
+from src.core.domain.repositorys.tenant import ITenantRepository
+from src.core.domain.value_objects.doc_status import DocumentStatus
+from src.core.domain.value_objects.doc_types import DocumentType
+from src.core.infrastucture.persistence.async_repository import (
+    AsyncRepository,
+)
+from src.core.infrastucture.persistence.document import (
+    InMemoryDocumentRepository,
+)
+from src.core.infrastucture.persistence.tenant import (
+    InMemoryTenantRepository,
+)
+from src.core.infrastucture.search.typeahead import TypeaheadIndexer
+from src.core.presentation.api.conditional import (
+    entity_tag,
+    none_match,
+    parse_range,
+    range_applies,
+)
+from src.core.presentation.api.http import (
+    FileResponse,
+    HTTPError,
+    Receive,
+    Request,
+    Response,
+    Router,
+    Send,
+    StreamingResponse,
+)
+from src.core.presentation.api.limits import (
+    SHARED_TENANT,
+    TenantLimitMiddleware,
+    quota_response,
+)
+from src.core.presentation.api.serializers import encode_lines, serialize
+
+# Ordem importa: subclasses antes das classes base.
+ERROR_STATUS: tuple[tuple[type[Exception], int], ...] = (
+    (DocumentNotFoundException, 404),
+    (TenantNotFoundException, 404),
+    (BlobNotFoundException, 404),
+    (DocumentAlreadyExistsException, 409),
+    (TenantAlreadyExistsException, 409),
+    (DocumentVersionConflictException, 409),
+    (BusinessRuleViolationError, 409),
+    (DomainValidationError, 422),
+    (DocumentUpdateAttrException, 422),
+    (DocumentTypeException, 422),
+)
+
+MAX_SUGGESTIONS = 50
+
+
+def _uuid(value: Any, name: str) -> UUID:
+    try:
+        return UUID(str(value))
+    except ValueError as error:
+        raise HTTPError(422, f"'{name}' deve ser um UUID.") from error
+
+
+def _member(enum: type, value: Any, name: str):
+    try:
+        return enum[value]
+    except KeyError as error:
+        raise HTTPError(
+            422,
+            f"'{name}' deve ser um de {[item.name for item in enum]}.",
+        ) from error
+
+
+def _required(data: dict, name: str) -> Any:
+    if name not in data:
+        raise HTTPError(422, f"Campo obrigatório: '{name}'.")
+    return data[name]
+
+
+class DocumentApi:
+    """
+    Aplicação ASGI de documentos e empresas.
+
+    Rotas:
+        GET  /health
+        POST /tenants                       cria uma empresa
+        GET  /tenants?active=&limit=&after= lista empresas (NDJSON)
+        GET  /tenants/suggestions?q=&limit= nomes de empresas
+        GET  /tenants/{id}
+        GET  /tenants/{id}/documents?limit=&after= documentos (NDJSON)
+        GET  /tenants/{id}/documents/suggestions?q=&limit= títulos
+        POST /documents                     cria um documento
+        POST /documents/batch               {operations, parallel}
+        GET  /documents/{id}                ETag; If-None-Match → 304
+        PATCH /documents/{id}               {attr, value, user_id}
+        POST /documents/{id}/status         {status, user_id}
+        GET  /documents/{id}/files/{name}?version= conteúdo; aceita Range
+
+    Args:
+        document_repository (IDocumentRepository): Repositório de
+            documentos.
+        tenant_repository (ITenantRepository): Repositório de empresas.
+        bus (EventBus, optional): Recebe os eventos de domínio das
+            escritas.
+        offload (bool): Executa as chamadas aos repositórios fora do
+            event loop (repositórios com E/S bloqueante).
+        page_size (int): Entidades lidas por página nas listagens.
+        batch_workers (int): Threads para os lotes com `parallel`.
+        blob_store (IBlobStore, optional): Conteúdo dos anexos; sem ele,
+            as rotas de arquivos não são registradas.
+        typeahead (TypeaheadIndexer, optional): Índices de sugestões; sem
+            ele, as rotas de sugestões não são registradas.
+        limiter (TenantRateLimiter, optional): Cotas por tenant; com ele,
+            cada operação de um lote é cobrada da cota (a requisição em
+            si é cobrada pelo `TenantLimitMiddleware`).
+    """
+
+    def __init__(
+        self,
+        document_repository: IDocumentRepository,
+        tenant_repository: ITenantRepository,
+        bus: Optional[EventBus] = None,
+        offload: bool = False,
+        page_size: int = 500,
+        batch_workers: int = 8,
+        blob_store: Optional[IBlobStore] = None,
+        typeahead: Optional[TypeaheadIndexer] = None,
+        limiter: Optional[TenantRateLimiter] = None,
+    ):
+        if page_size < 1:
+            raise ValueError("O tamanho da página deve ser de pelo menos 1.")
+        self.documents = AsyncRepository(document_repository, offload)
+        self.tenants = AsyncRepository(tenant_repository, offload)
+        self.bus = bus
+        self.page_size = page_size
+        self.blob_store = blob_store
+        self.typeahead = typeahead
+        self.limiter = limiter
+        self._document_service = DocumentService()
+        self._create_document = CreateDocumentUseCase()
+        self._update_document = UpdateDocumentAttributeUseCase(
+            document_repository
+        )
+        self._change_status = ChangeDocumentStatusUseCase(document_repository)
+        self._create_tenant = CreateTenantUseCase(
+            tenant_repository, TenantService()
+        )
+        self._batch_executor = ThreadPoolExecutor(
+            batch_workers, "document-batch"
+        )
+        self._batch = ExecuteDocumentBatchUseCase(
+            document_repository, self._document_service, self._batch_executor
+        )
+        self.router = Router()
+        self._register_routes()
+
+    def _register_routes(self) -> None:
+        add = self.router.add
+        add("GET", "/health", self.health)
+        add("POST", "/tenants", self.create_tenant)
+        add("GET", "/tenants", self.list_tenants)
+        if self.typeahead is not None:
+            # Antes de /tenants/{tenant_id}, que também casaria.
+            add("GET", "/tenants/suggestions", self.suggest_tenants)
+            add(
+                "GET",
+                "/tenants/{tenant_id}/documents/suggestions",
+                self.suggest_documents,
+            )
+        add("GET", "/tenants/{tenant_id}", self.get_tenant)
+        add("GET", "/tenants/{tenant_id}/documents", self.list_documents)
+        add("POST", "/documents", self.create_document)
+        # Antes de /documents/{document_id}, que também casaria com o
+        # caminho.
+        add("POST", "/documents/batch", self.batch)
+        add("GET", "/documents/{document_id}", self.get_document)
+        add("PATCH", "/documents/{document_id}", self.update_document)
+        add("POST", "/documents/{document_id}/status", self.change_status)
+        if self.blob_store is not None:
+            path = "/documents/{document_id}/files/{filename}"
+            add("GET", path, self.download)
+            add("HEAD", path, self.download)
+
+    async def __call__(self, scope: dict, receive: Receive, send: Send):
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+        request = await Request.from_asgi(scope, receive)
+        try:
+            handler, request.params = self.router.resolve(
+                request.method, request.path
+            )
+            response = await handler(request)
+        except HTTPError as error:
+            response = Response.json(
+                {"detail": error.detail}, error.status, headers=error.headers
+            )
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            response = self._error_response(error)
+        await response(send)
+
+    async def _lifespan(self, receive: Receive, send: Send) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                self._batch_executor.shutdown()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    @staticmethod
+    def _status_of(error: Exception) -> Optional[int]:
+        for error_type, status in ERROR_STATUS:
+            if isinstance(error, error_type):
+                return status
+        return None
+
+    def _error_response(self, error: Exception) -> Response:
+        status = self._status_of(error)
+        if status is None:
+            raise error
+        return Response.json({"detail": str(error)}, status)
+
+    def _publish(self, entity: Any) -> None:
+        if self.bus is not None:
+            self.bus.dispatch(entity)
+
+    def _page_query(self, request: Request) -> tuple[Optional[int], Any]:
+        limit = request.query.get("limit")
+        if limit is not None:
+            if not limit.isdigit() or int(limit) < 1:
+                raise HTTPError(422, "'limit' deve ser um inteiro positivo.")
+            limit = int(limit)
+        after = request.query.get("after")
+        if after is not None:
+            after = _uuid(after, "after")
+        return limit, after
+
+    async def _stream(
+        self,
+        fetch: Callable[[int, Optional[UUID]], Awaitable[list]],
+        limit: Optional[int],
+        after: Optional[UUID],
+    ) -> AsyncIterator[bytes]:
+        """Percorre as páginas pelo cursor, uma parte NDJSON por página."""
+        remaining = limit
+        while remaining is None or remaining > 0:
+            size = self.page_size
+            if remaining is not None:
+                size = min(size, remaining)
+                remaining -= size
+            page = await fetch(size, after)
+            if page:
+                yield encode_lines(page)
+            if len(page) < size:
+                return
+            after = page[-1].entity_id
+
+    @staticmethod
+    def _suggestion_query(request: Request) -> tuple[str, int]:
+        limit = request.query.get("limit", "10")
+        if not limit.isdigit() or not 1 <= int(limit) <= MAX_SUGGESTIONS:
+            raise HTTPError(
+                422, f"'limit' deve estar entre 1 e {MAX_SUGGESTIONS}."
+            )
+        return request.query.get("q", ""), int(limit)
+
+    async def health(self, request: Request) -> Response:
+        """Verificação de disponibilidade."""
+        return Response.json({"status": "ok"})
+
+    async def create_tenant(self, request: Request) -> Response:
+        """Cria uma empresa."""
+        data = request.json()
+        tenant = Tenant(
+            name=_required(data, "name"),
+            description=_required(data, "description"),
+            logo=_required(data, "logo"),
+            user_id=_uuid(_required(data, "user_id"), "user_id"),
+            is_active=bool(data.get("is_active", True)),
+        )
+        tenant = await self.tenants.run(self._create_tenant.execute, tenant)
+        self._publish(tenant)
+        return Response.json(
+            serialize(tenant),
+            201,
+            headers={"location": f"/tenants/{tenant.entity_id}"},
+        )
+
+    async def get_tenant(self, request: Request) -> Response:
+        """Obtém uma empresa."""
+        tenant_id = _uuid(request.params["tenant_id"], "tenant_id")
+        return Response.json(serialize(await self.tenants.get(tenant_id)))
+
+    async def list_tenants(self, request: Request) -> Response:
+        """Lista empresas ativas (ou inativas, com `?active=false`)."""
+        limit, after = self._page_query(request)
+        is_active = request.query.get("active", "true").lower() != "false"
+
+        async def fetch(size: int, cursor: Optional[UUID]) -> list:
+            return await self.tenants.get_page(size, cursor, is_active)
+
+        return StreamingResponse(self._stream(fetch, limit, after))
+
+    async def list_documents(self, request: Request) -> Response:
+        """Lista os documentos de uma empresa."""
+        tenant_id = _uuid(request.params["tenant_id"], "tenant_id")
+        limit, after = self._page_query(request)
+        await self.tenants.get(tenant_id)
+
+        async def fetch(size: int, cursor: Optional[UUID]) -> list:
+            return await self.documents.get_page_by_tenant(
+                tenant_id, size, cursor
+            )
+
+        return StreamingResponse(self._stream(fetch, limit, after))
+
+    async def suggest_documents(self, request: Request) -> Response:
+        """
+        Títulos de documentos da empresa que começam pelo texto `q`.
+
+        Responde direto dos índices em memória, sem ler o repositório.
+        """
+        tenant_id = _uuid(request.params["tenant_id"], "tenant_id")
+        prefix, limit = self._suggestion_query(request)
+        suggestions = self.typeahead.suggest_documents(
+            tenant_id, prefix, limit
+        )
+        return Response.json(
+            [
+                {"id": str(document_id), "title": title}
+                for document_id, title in suggestions
+            ]
+        )
+
+    async def suggest_tenants(self, request: Request) -> Response:
+        """Nomes de empresas que começam pelo texto `q`."""
+        prefix, limit = self._suggestion_query(request)
+        return Response.json(
+            [
+                {"id": str(tenant_id), "name": name}
+                for tenant_id, name in self.typeahead.suggest_tenants(
+                    prefix, limit
+                )
+            ]
+        )
+
+    @staticmethod
+    def _build_document(data: dict, tenant_id: UUID) -> Document:
+        entity_id = data.get("id")
+        return Document(
+            title=_required(data, "title"),
+            user_id=_uuid(_required(data, "user_id"), "user_id"),
+            document_type=_member(
+                DocumentType,
+                _required(data, "document_type"),
+                "document_type",
+            ),
+            tenant_id=tenant_id,
+            slug=data.get("slug"),
+            entity_id=None if entity_id is None else _uuid(entity_id, "id"),
+        )
+
+    async def create_document(self, request: Request) -> Response:
+        """Cria um documento em uma empresa existente."""
+        data = request.json()
+        tenant_id = _uuid(_required(data, "tenant_id"), "tenant_id")
+        try:
+            await self.tenants.get(tenant_id)
+        except TenantNotFoundException as error:
+            raise HTTPError(422, "Empresa inexistente.") from error
+        document = self._build_document(data, tenant_id)
+        document = await self.documents.run(
+            self._create_document.execute,
+            self.documents.repository,
+            self._document_service,
+            document,
+        )
+        self._publish(document)
+        return self._document_response(
+            document,
+            201,
+            headers={"location": f"/documents/{document.entity_id}"},
+        )
+
+    @staticmethod
+    def _document_response(
+        document: Document,
+        status: int = 200,
+        headers: Optional[dict[str, str]] = None,
+    ) -> Response:
+        """Resposta com o documento e a ETag do estado serializado."""
+        headers = dict(headers or {})
+        headers["etag"] = entity_tag(
+            document.entity_id, document.version, document.updated_at
+        )
+        return Response.json(serialize(document), status, headers=headers)
+
+    async def get_document(self, request: Request) -> Response:
+        """
+        Obtém um documento.
+
+        Com `If-None-Match`, a ETag atual é calculada a partir dos
+        metadados do repositório; se o cliente já tem a versão atual, a
+        resposta é 304 e o documento nem chega a ser lido.
+        """
+        document_id = _uuid(request.params["document_id"], "document_id")
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            etag = entity_tag(*await self.documents.get_metadata(document_id))
+            if not none_match(if_none_match, etag):
+                return Response.not_modified(etag)
+        return self._document_response(await self.documents.get(document_id))
+
+    async def update_document(self, request: Request) -> Response:
+        """Atualiza um atributo de um documento."""
+        document_id = _uuid(request.params["document_id"], "document_id")
+        data = request.json()
+        document = await self.documents.run(
+            self._update_document.execute,
+            document_id,
+            _required(data, "attr"),
+            _required(data, "value"),
+            _uuid(_required(data, "user_id"), "user_id"),
+        )
+        self._publish(document)
+        return self._document_response(document)
+
+    async def change_status(self, request: Request) -> Response:
+        """Publica, arquiva ou exclui um documento."""
+        document_id = _uuid(request.params["document_id"], "document_id")
+        data = request.json()
+        document = await self.documents.run(
+            self._change_status.execute,
+            document_id,
+            _member(DocumentStatus, _required(data, "status"), "status"),
+            _uuid(_required(data, "user_id"), "user_id"),
+        )
+        self._publish(document)
+        return self._document_response(document)
+
+    async def download(self, request: Request) -> Response:
+        """
+        Conteúdo de um arquivo anexado, inteiro ou por faixa (`Range`).
+
+        A ETag é o SHA-256 do conteúdo. Com `Range` (e `If-Range`, se
+        presente, igual à ETag), a resposta é 206 com a faixa pedida.
+        Os bytes saem direto dos arquivos do armazenamento (ver
+        `FileResponse`).
+        """
+        document_id = _uuid(request.params["document_id"], "document_id")
+        version = request.query.get("version")
+        if version is not None and not version.isdigit():
+            raise HTTPError(422, "'version' deve ser um inteiro positivo.")
+        document = await self.documents.get(document_id)
+        attachment = document.attachment(
+            request.params["filename"],
+            int(version) if version is not None else None,
+        )
+        if attachment is None:
+            raise HTTPError(404, "Arquivo não encontrado.")
+
+        etag = f'"{attachment.digest}"'
+        headers = {
+            "etag": etag,
+            "accept-ranges": "bytes",
+            "content-disposition": "inline; filename*=UTF-8''"
+            + quote(attachment.filename),
+        }
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None and not none_match(if_none_match, etag):
+            return Response.not_modified(etag)
+        size = attachment.size
+        byte_range = None
+        if range_applies(request.headers.get("if-range"), etag):
+            byte_range = parse_range(request.headers.get("range"), size)
+        status = 200
+        if byte_range is None:
+            byte_range = range(size)
+        else:
+            status = 206
+            headers["content-range"] = (
+                f"bytes {byte_range.start}-{byte_range.stop - 1}/{size}"
+            )
+        segments = await self.documents.run(
+            self.blob_store.segments,
+            attachment.digest,
+            byte_range.start,
+            byte_range.stop,
+        )
+        return FileResponse(
+            segments,
+            status,
+            headers,
+            media_type=attachment.media_type.encode("latin-1"),
+            send_body=request.method != "HEAD",
+            zero_copy=request.zero_copy,
+        )
+
+    async def _batch_operation(
+        self, data: Any, tenants: set[UUID]
+    ) -> BatchOperation:
+        """Converte uma operação do corpo e valida a empresa."""
+        if not isinstance(data, dict):
+            raise HTTPError(422, "A operação deve ser um objeto.")
+        op = _required(data, "op")
+        if op not in OPERATIONS:
+            raise HTTPError(422, f"'op' deve ser um de {list(OPERATIONS)}.")
+        user_id = _uuid(_required(data, "user_id"), "user_id")
+        if op == CREATE:
+            tenant_id = _uuid(_required(data, "tenant_id"), "tenant_id")
+            if tenant_id not in tenants:
+                try:
+                    await self.tenants.get(tenant_id)
+                except TenantNotFoundException as error:
+                    raise HTTPError(422, "Empresa inexistente.") from error
+                tenants.add(tenant_id)
+            return BatchOperation(
+                op, user_id, document=self._build_document(data, tenant_id)
+            )
+        document_id = _uuid(_required(data, "id"), "id")
+        if op == UPDATE_ATTRIBUTE:
+            return BatchOperation(
+                op,
+                user_id,
+                document_id,
+                attr=_required(data, "attr"),
+                value=_required(data, "value"),
+            )
+        return BatchOperation(op, user_id, document_id)
+
+    def _charge_batch(
+        self, request: Request, operations: list[BatchOperation]
+    ) -> Optional[Response]:
+        """
+        Cobra as operações do lote das cotas; a resposta 429, se faltar.
+
+        `create` é cobrada do tenant do documento novo; as demais, do
+        tenant da requisição (`X-Tenant-Id`) ou da cota compartilhada.
+        Tokens já cobrados de outro tenant do lote não são devolvidos.
+        """
+        if self.limiter is None:
+            return None
+        try:
+            requester = UUID(request.headers["x-tenant-id"])
+        except (KeyError, ValueError):
+            requester = SHARED_TENANT
+        costs: dict[UUID, int] = {}
+        for operation in operations:
+            tenant_id = (
+                operation.document.tenant_id
+                if operation.op == CREATE
+                else requester
+            )
+            costs[tenant_id] = costs.get(tenant_id, 0) + 1
+        for tenant_id, cost in costs.items():
+            admission = self.limiter.charge(tenant_id, cost)
+            if not admission.admitted:
+                return quota_response(admission)
+        return None
+
+    async def batch(self, request: Request) -> Response:
+        """
+        Executa várias operações de documento em uma única transação.
+
+        Corpo: `{"operations": [...], "parallel": false}`. Cada operação
+        tem `op` (`create`, `update_attribute`, `publish`, `archive` ou
+        `delete`) e `user_id`; `create` leva os campos de `POST
+        /documents` (com `id` opcional, para referenciar o documento
+        novo nas operações seguintes), `update_attribute` leva `id`,
+        `attr` e `value`, e as demais levam `id`.
+
+        O lote é tudo ou nada. A resposta traz o resultado de cada
+        operação, na ordem do lote: a que falhou tem o status do erro, e
+        as outras, 424 (não gravadas). Sem falhas, o status é 200. Com
+        cotas, cada operação custa um token (429 se faltar).
+        """
+        data = request.json()
+        raw = _required(data, "operations")
+        if not isinstance(raw, list) or not raw:
+            raise HTTPError(422, "'operations' deve ser uma lista não vazia.")
+        operations, tenants = [], set()
+        for index, item in enumerate(raw):
+            try:
+                operations.append(await self._batch_operation(item, tenants))
+            except HTTPError as error:
+                raise HTTPError(
+                    error.status, f"Operação {index}: {error.detail}"
+                ) from error
+            except DomainValidationError as error:
+                raise HTTPError(422, f"Operação {index}: {error}") from error
+        rejected = self._charge_batch(request, operations)
+        if rejected is not None:
+            return rejected
+
+        result = await self.documents.run(
+            self._batch.execute, operations, bool(data.get("parallel"))
+        )
+        for entity in result.entities:
+            self._publish(entity)
+
+        status = 200
+        items = []
+        for operation, outcome in zip(operations, result.results):
+            item = {"op": operation.op, "id": operation.target}
+            if outcome.error is not None:
+                item["status"] = self._status_of(outcome.error)
+                if item["status"] is None:
+                    raise outcome.error
+                item["detail"] = str(outcome.error)
+                if status == 200:
+                    status = item["status"]
+            elif not result.committed:
+                item["status"] = 424
+            else:
+                item["status"] = 201 if operation.op == CREATE else 200
+                item["document"] = serialize(outcome.document)
+            items.append(item)
+        return Response.json(
+            {"committed": result.committed, "results": items}, status
+        )
+
+
+def create_app() -> TenantLimitMiddleware:
+    """Cria a aplicação com repositórios em memória e cotas por tenant."""
+    limiter = TenantRateLimiter()
+    return TenantLimitMiddleware(
+        DocumentApi(
+            InMemoryDocumentRepository(),
+            InMemoryTenantRepository(),
+            EventBus(),
+            limiter=limiter,
+        ),
+        limiter,
+    )
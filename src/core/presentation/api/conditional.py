@@ -0,0 +1,102 @@
+"""ETags, requisições condicionais e faixas de bytes."""
+
+import hashlib
+import re
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from src.core.presentation.api.http import HTTPError
+
+_BYTE_RANGE = re.compile(r"^\s*(\d*)\s*-\s*(\d*)\s*$")
+
+
+def entity_tag(entity_id: UUID, version: int, updated_at: datetime) -> str:
+    """
+    Calcula a ETag forte de um estado de entidade.
+
+    O estado é identificado por `(entity_id, version, updated_at)`: toda
+    alteração persistida muda `updated_at` ou `version`.
+    """
+    digest = hashlib.blake2b(
+        f"{entity_id.hex}:{version}:{updated_at.isoformat()}".encode(),
+        digest_size=12,
+    )
+    return f'"{digest.hexdigest()}"'
+
+
+def none_match(if_none_match: str, etag: str) -> bool:
+    """
+    Avalia o cabeçalho `If-None-Match`.
+
+    Usa a comparação fraca da RFC 9110 (o prefixo `W/` é ignorado).
+
+    Returns:
+        bool: True se nenhuma ETag da lista corresponde (a resposta deve
+        ser enviada); False se o cliente já tem a versão atual.
+    """
+    if if_none_match.strip() == "*":
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return False
+    return True
+
+
+def range_applies(if_range: Optional[str], etag: str) -> bool:
+    """
+    Avalia o cabeçalho `If-Range` (apenas ETags, comparação forte).
+
+    Returns:
+        bool: True se a faixa pedida deve ser atendida; False se o
+        conteúdo mudou e a resposta deve ser o conteúdo inteiro.
+    """
+    return if_range is None or if_range.strip() == etag
+
+
+def parse_range(header: Optional[str], size: int) -> Optional[range]:
+    """
+    Interpreta o cabeçalho `Range` de uma requisição.
+
+    Apenas uma faixa de bytes é atendida; pedidos com várias faixas ou
+    malformados são ignorados (a resposta é o conteúdo inteiro), como a
+    RFC 9110 permite.
+
+    Args:
+        header (str, optional): Valor do cabeçalho, como `bytes=0-1023`,
+            `bytes=1024-` ou `bytes=-500`.
+        size (int): Tamanho do conteúdo.
+
+    Returns:
+        range | None: Os bytes pedidos, ou None para o conteúdo inteiro.
+
+    Raises:
+        HTTPError: 416 se a faixa estiver fora do conteúdo.
+    """
+    if header is None:
+        return None
+    unit, _, ranges = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in ranges:
+        return None
+    match = _BYTE_RANGE.match(ranges)
+    if match is None or match.groups() == ("", ""):
+        return None
+    first, last = match.groups()
+    if first == "":
+        suffix = int(last)
+        start, stop = (max(0, size - suffix) if suffix else size), size
+    else:
+        start = int(first)
+        stop = size if last == "" else min(int(last) + 1, size)
+        if last != "" and int(last) < start:
+            return None
+    if start >= stop:
+        raise HTTPError(
+            416,
+            "Faixa de bytes fora do conteúdo.",
+            {"content-range": f"bytes */{size}"},
+        )
+    return range(start, stop)
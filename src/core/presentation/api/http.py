@@ -0,0 +1,323 @@
+"""Primitivas HTTP mínimas sobre ASGI: requisição, respostas e rotas."""
+
+import mmap
+import re
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional
+from urllib.parse import parse_qsl
+
+from src.core.domain.repositorys.blob import FileSegment
+from src.core.presentation.api.serializers import decode, encode
+
+Receive = Callable[[], Awaitable[dict]]
+Send = Callable[[dict], Awaitable[None]]
+
+NDJSON = b"application/x-ndjson"
+OCTET_STREAM = b"application/octet-stream"
+ZEROCOPY_SEND = "http.response.zerocopysend"
+
+
+class HTTPError(Exception):
+    """
+    Erro que vira uma resposta HTTP com corpo JSON.
+
+    Args:
+        status (int): Código de status.
+        detail (str): Mensagem para o cliente.
+        headers (dict[str, str], optional): Cabeçalhos extras.
+    """
+
+    def __init__(
+        self,
+        status: int,
+        detail: str,
+        headers: Optional[dict[str, str]] = None,
+    ):
+        super().__init__(detail)
+        self.status = status
+        self.detail = detail
+        self.headers = headers or {}
+
+
+@dataclass
+class Request:
+    """Requisição HTTP com o corpo já lido."""
+
+    method: str
+    path: str
+    query: dict[str, str]
+    headers: dict[str, str]
+    body: bytes
+    params: dict[str, str] = field(default_factory=dict)
+    extensions: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def zero_copy(self) -> bool:
+        """Se o servidor aceita `http.response.zerocopysend`."""
+        return ZEROCOPY_SEND in self.extensions
+
+    @classmethod
+    async def from_asgi(cls, scope: dict, receive: Receive) -> "Request":
+        """Monta a requisição lendo o corpo completo do canal ASGI."""
+        chunks = []
+        while True:
+            message = await receive()
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                break
+        return cls(
+            method=scope["method"],
+            path=scope["path"],
+            query=dict(parse_qsl(scope.get("query_string", b"").decode())),
+            headers={
+                name.decode("latin-1"): value.decode("latin-1")
+                for name, value in scope.get("headers", ())
+            },
+            body=b"".join(chunks),
+            extensions=scope.get("extensions") or {},
+        )
+
+    def json(self) -> Any:
+        """
+        Decodifica o corpo JSON.
+
+        Raises:
+            HTTPError: 400 se o corpo não for um objeto JSON válido.
+        """
+        try:
+            data = decode(self.body or b"{}")
+        except ValueError as error:
+            raise HTTPError(400, "Corpo JSON inválido.") from error
+        if not isinstance(data, dict):
+            raise HTTPError(400, "O corpo deve ser um objeto JSON.")
+        return data
+
+
+class Response:
+    """Resposta com corpo completo em memória."""
+
+    def __init__(
+        self,
+        body: bytes = b"",
+        status: int = 200,
+        headers: Optional[dict[str, str]] = None,
+        media_type: Optional[bytes] = b"application/json",
+    ):
+        self.body = body
+        self.status = status
+        self.headers = headers or {}
+        self.media_type = media_type
+
+    @classmethod
+    def json(cls, data: Any, status: int = 200, **kwargs) -> "Response":
+        """Resposta JSON."""
+        return cls(encode(data), status, **kwargs)
+
+    @classmethod
+    def not_modified(cls, etag: str) -> "Response":
+        """Resposta 304, sem corpo."""
+        return cls(status=304, headers={"etag": etag}, media_type=None)
+
+    def _raw_headers(self, extra: list) -> list[tuple[bytes, bytes]]:
+        headers = list(extra)
+        if self.media_type is not None:
+            headers.insert(0, (b"content-type", self.media_type))
+        headers.extend(
+            (name.lower().encode("latin-1"), value.encode("latin-1"))
+            for name, value in self.headers.items()
+        )
+        return headers
+
+    async def __call__(self, send: Send) -> None:
+        extra = []
+        if self.status not in (204, 304):
+            extra.append((b"content-length", str(len(self.body)).encode()))
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self.status,
+                "headers": self._raw_headers(extra),
+            }
+        )
+        await send({"type": "http.response.body", "body": self.body})
+
+
+class StreamingResponse(Response):
+    """
+    Resposta enviada em partes, à medida que o iterador as produz.
+
+    Args:
+        chunks (AsyncIterator[bytes]): Partes do corpo.
+    """
+
+    def __init__(
+        self,
+        chunks: AsyncIterator[bytes],
+        status: int = 200,
+        headers: Optional[dict[str, str]] = None,
+        media_type: bytes = NDJSON,
+    ):
+        super().__init__(b"", status, headers, media_type)
+        self.chunks = chunks
+
+    async def __call__(self, send: Send) -> None:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self.status,
+                "headers": self._raw_headers([]),
+            }
+        )
+        async for chunk in self.chunks:
+            await send(
+                {
+                    "type": "http.response.body",
+                    "body": chunk,
+                    "more_body": True,
+                }
+            )
+        await send({"type": "http.response.body", "body": b""})
+
+
+class FileResponse(Response):
+    """
+    Resposta com bytes de arquivos locais, sem lê-los inteiros.
+
+    Com a extensão ASGI `http.response.zerocopysend`, cada trecho é
+    entregue ao servidor como descritor, deslocamento e tamanho, e o
+    servidor o envia com `os.sendfile`. Sem ela, o trecho é mapeado com
+    `mmap` e enviado em fatias de `bytes` de até `chunk_size`: as páginas
+    vêm do cache do sistema operacional, e só uma fatia por vez é
+    copiada para a memória do processo.
+
+    Args:
+        segments (list[FileSegment]): Trechos, na ordem do corpo.
+        send_body (bool): False para `HEAD`: só os cabeçalhos.
+        zero_copy (bool): Usa `http.response.zerocopysend`.
+        chunk_size (int): Tamanho das fatias sem a extensão.
+    """
+
+    def __init__(
+        self,
+        segments: list[FileSegment],
+        status: int = 200,
+        headers: Optional[dict[str, str]] = None,
+        media_type: bytes = OCTET_STREAM,
+        send_body: bool = True,
+        zero_copy: bool = False,
+        chunk_size: int = 1 << 20,
+    ):
+        super().__init__(b"", status, headers, media_type)
+        self.segments = segments
+        self.send_body = send_body
+        self.zero_copy = zero_copy
+        self.chunk_size = chunk_size
+
+    @property
+    def content_length(self) -> int:
+        """Soma dos tamanhos dos trechos."""
+        return sum(segment.count for segment in self.segments)
+
+    async def __call__(self, send: Send) -> None:
+        length = str(self.content_length).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self.status,
+                "headers": self._raw_headers([(b"content-length", length)]),
+            }
+        )
+        segments = self.segments if self.send_body else []
+        for index, segment in enumerate(segments):
+            more_body = index < len(segments) - 1
+            with open(segment.path, "rb") as file:
+                if self.zero_copy:
+                    await send(
+                        {
+                            "type": ZEROCOPY_SEND,
+                            "file": file,
+                            "offset": segment.offset,
+                            "count": segment.count,
+                            "more_body": more_body,
+                        }
+                    )
+                else:
+                    await self._send_mapped(send, file, segment, more_body)
+        if not segments:
+            await send({"type": "http.response.body", "body": b""})
+
+    async def _send_mapped(
+        self, send: Send, file, segment: FileSegment, more_body: bool
+    ) -> None:
+        """Envia um trecho em fatias de um mapeamento somente leitura."""
+        # O deslocamento do mmap precisa ser múltiplo da granularidade.
+        skip = segment.offset % mmap.ALLOCATIONGRANULARITY
+        mapping = mmap.mmap(
+            file.fileno(),
+            segment.count + skip,
+            access=mmap.ACCESS_READ,
+            offset=segment.offset - skip,
+        )
+        try:
+            end = skip + segment.count
+            for start in range(skip, end, self.chunk_size):
+                stop = min(start + self.chunk_size, end)
+                # O ASGI exige `bytes`, e o transporte pode guardar o
+                # corpo sem copiá-lo depois que `send` retorna: cada fatia
+                # é copiada, e o mapeamento pode ser fechado no fim.
+                await send(
+                    {
+                        "type": "http.response.body",
+                        "body": mapping[start:stop],
+                        "more_body": more_body or stop < end,
+                    }
+                )
+        finally:
+            mapping.close()
+
+
+Handler = Callable[[Request], Awaitable[Response]]
+
+
+class Router:
+    """
+    Tabela de rotas com parâmetros de caminho (`/documents/{id}`).
+
+    Os padrões são compilados uma vez, no registro da rota.
+    """
+
+    def __init__(self):
+        self._routes: list[tuple[re.Pattern, dict[str, Handler]]] = []
+
+    def add(self, method: str, path: str, handler: Handler) -> None:
+        """Registra um handler para um método e um padrão de caminho."""
+        pattern = re.compile(
+            "^" + re.sub(r"{(\w+)}", r"(?P<\1>[^/]+)", path) + "$"
+        )
+        for existing, handlers in self._routes:
+            if existing.pattern == pattern.pattern:
+                handlers[method] = handler
+                return
+        self._routes.append((pattern, {method: handler}))
+
+    def resolve(self, method: str, path: str) -> tuple[Handler, dict]:
+        """
+        Encontra o handler de uma requisição.
+
+        Raises:
+            HTTPError: 404 se o caminho não existe; 405 se o método não é
+                aceito no caminho.
+        """
+        for pattern, handlers in self._routes:
+            match = pattern.match(path)
+            if match is None:
+                continue
+            handler = handlers.get(method)
+            if handler is None:
+                raise HTTPError(
+                    405,
+                    "Método não permitido.",
+                    {"allow": ", ".join(sorted(handlers))},
+                )
+            return handler, match.groupdict()
+        raise HTTPError(404, "Recurso não encontrado.")
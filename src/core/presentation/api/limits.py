@@ -0,0 +1,171 @@
+"""Middleware ASGI de cotas por tenant."""
+
+import asyncio
+import math
+import re
+from collections import deque
+from typing import Callable, Optional
+from uuid import UUID
+
+from src.core.application.services.rate_limit import (
+    RATE,
+    Admission,
+    TenantRateLimiter,
+)
+from src.core.presentation.api.http import Receive, Response, Send
+
+TENANT_HEADER = b"x-tenant-id"
+_TENANT_PATH = re.compile(r"^/tenants/([0-9a-fA-F-]{32,36})(?:/|$)")
+SHARED_TENANT = UUID(int=0)
+"""Cota compartilhada pelas requisições de dados sem tenant identificado;
+configure-a com `TenantRateLimiter.configure(SHARED_TENANT, ...)`."""
+SHARED_PATHS = ("/documents",)
+
+
+def tenant_from_request(scope: dict) -> Optional[UUID]:
+    """
+    Identifica o tenant pelo caminho `/tenants/{id}/...` ou, fora dele,
+    pelo cabeçalho `X-Tenant-Id`.
+
+    O caminho tem precedência: um cabeçalho que aponta para outro tenant
+    não desvia a requisição para outra cota. Fora do caminho, o cabeçalho
+    só deve ser confiado quando definido por um gateway autenticado.
+
+    Raises:
+        ValueError: Se o cabeçalho não for um UUID ou divergir do caminho.
+    """
+    path_tenant = None
+    match = _TENANT_PATH.match(scope.get("path", ""))
+    if match is not None:
+        try:
+            path_tenant = UUID(match.group(1))
+        except ValueError:
+            pass
+    for name, value in scope.get("headers", ()):
+        if name == TENANT_HEADER:
+            try:
+                header_tenant = UUID(value.decode("latin-1"))
+            except ValueError:
+                raise ValueError("X-Tenant-Id deve ser um UUID.") from None
+            if path_tenant not in (None, header_tenant):
+                raise ValueError("X-Tenant-Id diverge do tenant do caminho.")
+            return header_tenant
+    return path_tenant
+
+
+def quota_response(admission: Admission) -> Response:
+    """Resposta 429 de uma admissão recusada, com `Retry-After`."""
+    retry_after = max(1, math.ceil(admission.retry_after))
+    return Response.json(
+        {"detail": "Cota do tenant excedida.", "reason": admission.reason},
+        429,
+        headers={"retry-after": str(retry_after)},
+    )
+
+
+class TenantLimitMiddleware:
+    """
+    Aplica as cotas de `TenantRateLimiter` às requisições HTTP.
+
+    Requisições acima da cota esperam na fila por até `max_wait` da cota
+    do tenant: pelo próximo token, quando o limite é de taxa, ou pela
+    próxima requisição do tenant que terminar, quando é de concorrência.
+    Passado o prazo, a resposta é 429 com `Retry-After`. Requisições sem
+    tenant identificado em `shared_paths` (as rotas de documentos) usam
+    a cota de `SHARED_TENANT`; as demais (ex.: `/health`) não são
+    limitadas. As com tenant inválido (`tenant_of` levanta `ValueError`)
+    recebem 400.
+
+    Example:
+        app = TenantLimitMiddleware(DocumentApi(...), TenantRateLimiter())
+
+    Args:
+        app: Aplicação ASGI protegida.
+        limiter (TenantRateLimiter): Cotas e contadores.
+        tenant_of (Callable[[dict], UUID | None]): Extrai o tenant do
+            escopo ASGI.
+        shared_paths (tuple[str, ...]): Prefixos limitados pela cota de
+            `SHARED_TENANT` quando o tenant não é identificado.
+    """
+
+    def __init__(
+        self,
+        app,
+        limiter: TenantRateLimiter,
+        tenant_of: Callable[[dict], Optional[UUID]] = tenant_from_request,
+        shared_paths: tuple[str, ...] = SHARED_PATHS,
+    ):
+        self.app = app
+        self.limiter = limiter
+        self.tenant_of = tenant_of
+        self.shared_paths = shared_paths
+        self._waiters: dict[UUID, deque[asyncio.Future]] = {}
+
+    async def __call__(self, scope: dict, receive: Receive, send: Send):
+        tenant_id = None
+        if scope["type"] == "http":
+            try:
+                tenant_id = self.tenant_of(scope)
+            except ValueError as error:
+                await Response.json({"detail": str(error)}, 400)(send)
+                return
+            if tenant_id is None and scope["path"].startswith(
+                self.shared_paths
+            ):
+                tenant_id = SHARED_TENANT
+        if tenant_id is None:
+            await self.app(scope, receive, send)
+            return
+
+        admission = await self._admit(tenant_id)
+        if not admission.admitted:
+            await quota_response(admission)(send)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.limiter.release(tenant_id)
+            self._wake(tenant_id)
+
+    async def _admit(self, tenant_id: UUID) -> Admission:
+        """Tenta admitir, esperando até o prazo da cota."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.limiter.quota_for(tenant_id).max_wait
+        while True:
+            admission = self.limiter.try_acquire(tenant_id)
+            if admission.admitted:
+                return admission
+            remaining = deadline - loop.time()
+            if admission.reason == RATE:
+                if admission.retry_after > remaining:
+                    return admission
+                await asyncio.sleep(admission.retry_after)
+            elif remaining <= 0 or not await self._wait_release(
+                tenant_id, remaining
+            ):
+                return admission
+
+    async def _wait_release(self, tenant_id: UUID, timeout: float) -> bool:
+        """Espera uma requisição do tenant terminar; False no timeout."""
+        waiter = asyncio.get_running_loop().create_future()
+        queue = self._waiters.setdefault(tenant_id, deque())
+        queue.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            if waiter in queue:
+                queue.remove(waiter)
+            if not queue:
+                self._waiters.pop(tenant_id, None)
+
+    def _wake(self, tenant_id: UUID) -> None:
+        """Acorda o primeiro da fila do tenant (ordem de chegada)."""
+        queue = self._waiters.get(tenant_id)
+        while queue:
+            waiter = queue.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
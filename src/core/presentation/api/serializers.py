@@ -0,0 +1,120 @@
+"""Serialização de entidades para a API.
+
+Cada tipo de entidade tem uma função que monta o dicionário de saída
+campo a campo, sem introspecção (`vars`, `dataclasses.asdict`) a cada
+chamada. A codificação usa `orjson` quando instalado (extra opcional
+`api`) e cai para `json` da biblioteca padrão.
+"""
+
+import json
+from datetime import date
+from decimal import Decimal
+from typing import Any, Callable
+from uuid import UUID
+
+from src.core.domain.entities.document import Document
+from src.core.domain.entities.tenant import Tenant
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depende do ambiente
+    orjson = None
+
+Serializer = Callable[[Any], dict[str, Any]]
+
+
+def _default(value: Any) -> Any:
+    """Converte os tipos que os codificadores não conhecem."""
+    if isinstance(value, (UUID, Decimal)):
+        return str(value)
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError(f"Tipo não serializável: {type(value).__name__}.")
+
+
+if orjson is not None:
+
+    def encode(data: Any) -> bytes:
+        """Codifica em JSON compacto (UTF-8)."""
+        return orjson.dumps(data, default=_default)
+
+    decode = orjson.loads
+
+else:  # pragma: no cover - depende do ambiente
+    _encoder = json.JSONEncoder(
+        default=_default, separators=(",", ":"), ensure_ascii=False
+    )
+
+    def encode(data: Any) -> bytes:
+        """Codifica em JSON compacto (UTF-8)."""
+        return _encoder.encode(data).encode("utf-8")
+
+    decode = json.loads
+
+
+def serialize_tenant(tenant: Tenant) -> dict[str, Any]:
+    """Representação de uma empresa."""
+    return {
+        "id": tenant.entity_id,
+        "name": tenant.name,
+        "description": tenant.description,
+        "logo": tenant.logo,
+        "is_active": tenant.is_active,
+        "user_id": tenant.user_id,
+        "created_at": tenant.created_at,
+        "updated_at": tenant.updated_at,
+    }
+
+
+def serialize_document(document: Document) -> dict[str, Any]:
+    """Representação de um documento."""
+    return {
+        "id": document.entity_id,
+        "tenant_id": document.tenant_id,
+        "title": document.title,
+        "slug": document.slug,
+        "document_type": document.document_type.name,
+        "status": document.status.name,
+        "version": document.version,
+        "user_id": document.user_id,
+        "created_at": document.created_at,
+        "updated_at": document.updated_at,
+    }
+
+
+_SERIALIZERS: dict[type, Serializer] = {
+    Tenant: serialize_tenant,
+    Document: serialize_document,
+}
+
+
+def register_serializer(entity_type: type, serializer: Serializer) -> None:
+    """Registra a função de serialização de um tipo de entidade."""
+    _SERIALIZERS[entity_type] = serializer
+
+
+def serialize(entity: Any) -> dict[str, Any]:
+    """
+    Serializa uma entidade com a função registrada para o seu tipo.
+
+    Subclasses sem função própria usam a da classe base mais próxima; a
+    resolução é feita uma vez por tipo.
+
+    Raises:
+        TypeError: Se nenhum tipo da hierarquia tiver serializador.
+    """
+    serializer = _SERIALIZERS.get(type(entity))
+    if serializer is None:
+        for base in type(entity).__mro__[1:]:
+            serializer = _SERIALIZERS.get(base)
+            if serializer is not None:
+                _SERIALIZERS[type(entity)] = serializer
+                break
+        else:
+            raise TypeError(f"Sem serializador para {type(entity).__name__}.")
+    return serializer(entity)
+
+
+def encode_lines(entities: list) -> bytes:
+    """Codifica entidades em NDJSON (uma linha JSON por entidade)."""
+    return b"".join(encode(serialize(entity)) + b"\n" for entity in entities)
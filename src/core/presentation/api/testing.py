@@ -0,0 +1,142 @@
+"""Cliente ASGI em processo, para testes sem servidor nem rede."""
+
+import asyncio
+import os
+from dataclasses import dataclass, field
+from typing import Any, Optional
+from urllib.parse import urlsplit
+
+from src.core.presentation.api.serializers import decode, encode
+
+
+@dataclass
+class ClientResponse:
+    """
+    Resposta recebida pelo cliente.
+
+    Attributes:
+        status (int): Código de status.
+        headers (dict[str, str]): Cabeçalhos, com nomes em minúsculas.
+        chunks (list[bytes]): Partes do corpo, na ordem de envio.
+    """
+
+    status: int
+    headers: dict[str, str] = field(default_factory=dict)
+    chunks: list[bytes] = field(default_factory=list)
+
+    @property
+    def body(self) -> bytes:
+        """Corpo completo."""
+        return b"".join(self.chunks)
+
+    def json(self) -> Any:
+        """Corpo decodificado como JSON."""
+        return decode(self.body)
+
+    def lines(self) -> list[Any]:
+        """Corpo decodificado como NDJSON."""
+        return [decode(line) for line in self.body.splitlines() if line]
+
+
+class ASGITestClient:
+    """
+    Envia requisições diretamente a uma aplicação ASGI.
+
+    Example:
+        client = ASGITestClient(app)
+        response = client.get("/health")
+
+    Args:
+        app: Aplicação ASGI.
+        extensions (dict, optional): Extensões ASGI anunciadas no escopo;
+            `http.response.zerocopysend` é atendida lendo o arquivo.
+    """
+
+    def __init__(self, app, extensions: Optional[dict] = None):
+        self.app = app
+        self.extensions = extensions or {}
+
+    async def arequest(
+        self,
+        method: str,
+        url: str,
+        json: Any = None,
+        headers: Optional[dict[str, str]] = None,
+        body: bytes = b"",
+    ) -> ClientResponse:
+        """Executa uma requisição no event loop corrente."""
+        parts = urlsplit(url)
+        if json is not None:
+            body = encode(json)
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": method.upper(),
+            "scheme": "http",
+            "path": parts.path,
+            "raw_path": parts.path.encode(),
+            "query_string": parts.query.encode(),
+            "headers": [
+                (name.lower().encode("latin-1"), value.encode("latin-1"))
+                for name, value in (headers or {}).items()
+            ],
+            "client": ("testclient", 50000),
+            "server": ("testserver", 80),
+            "extensions": self.extensions,
+        }
+        messages = [{"type": "http.request", "body": body}]
+        response: Optional[ClientResponse] = None
+
+        async def receive() -> dict:
+            if messages:
+                return messages.pop()
+            return {"type": "http.disconnect"}
+
+        async def send(message: dict) -> None:
+            nonlocal response
+            if message["type"] == "http.response.start":
+                response = ClientResponse(
+                    status=message["status"],
+                    headers={
+                        name.decode("latin-1"): value.decode("latin-1")
+                        for name, value in message.get("headers", ())
+                    },
+                )
+            elif message["type"] == "http.response.body":
+                if message.get("body"):
+                    # Como um servidor, copia os bytes antes de retornar.
+                    response.chunks.append(bytes(message["body"]))
+            elif message["type"] == "http.response.zerocopysend":
+                descriptor = message["file"].fileno()
+                count = message.get("count")
+                if count is None:
+                    count = os.fstat(descriptor).st_size
+                response.chunks.append(
+                    os.pread(descriptor, count, message.get("offset", 0))
+                )
+
+        await self.app(scope, receive, send)
+        if response is None:
+            raise RuntimeError("A aplicação não enviou uma resposta.")
+        return response
+
+    def request(self, method: str, url: str, **kwargs) -> ClientResponse:
+        """Executa uma requisição em um event loop novo."""
+        return asyncio.run(self.arequest(method, url, **kwargs))
+
+    def get(self, url: str, **kwargs) -> ClientResponse:
+        """Requisição GET."""
+        return self.request("GET", url, **kwargs)
+
+    def head(self, url: str, **kwargs) -> ClientResponse:
+        """Requisição HEAD."""
+        return self.request("HEAD", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> ClientResponse:
+        """Requisição POST."""
+        return self.request("POST", url, **kwargs)
+
+    def patch(self, url: str, **kwargs) -> ClientResponse:
+        """Requisição PATCH."""
+        return self.request("PATCH", url, **kwargs)
@@ -0,0 +1,210 @@
+"""Aplicação ASGI das páginas HTML renderizadas no servidor.
+
+Os templates são compilados na criação da aplicação. Cada card é
+guardado no `FragmentCache` pela chave `(listagem, entity_id, version,
+updated_at)` e cada painel de resumo por `(listagem, tenant_id, versão
+agregada do tenant)`. Ao renderizar de novo uma página, só os cards dos
+documentos alterados são refeitos, e o resumo só é recalculado se algum
+documento do tenant mudou.
+
+O logo da empresa não é lido nem redimensionado na renderização: a página
+aponta para a variante gerada pelo `TenantAssetService`, servida em
+`/assets/{nome}` com cache indefinido no navegador (o nome é o hash do
+conteúdo).
+"""
+
+from typing import Optional
+from uuid import UUID
+
+from src.core.application.services.tenant_assets import TenantAssetService
+from src.core.domain.entities.tenant import Tenant
+from src.core.domain.exceptions import TenantNotFoundException
+from src.core.domain.repositorys.tenant import ITenantRepository
+from src.core.presentation.api.http import (
+    HTTPError,
+    Receive,
+    Request,
+    Response,
+    Router,
+    Send,
+)
+from src.core.presentation.web.cache import FragmentCache
+from src.core.presentation.web.listing import TEMPLATES, Listing
+from src.core.presentation.web.templates import Markup, TemplateRegistry
+
+HTML = b"text/html; charset=utf-8"
+PNG = b"image/png"
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+
+class WebApp:
+    """
+    Páginas de listagem por tenant.
+
+    Example:
+        web = WebApp(tenant_repository)
+        web.add_listing(document_listing(document_repository))
+
+    Args:
+        tenant_repository (ITenantRepository): Repositório de empresas.
+        cache (FragmentCache, optional): Cache de fragmentos.
+        page_size (int): Cards por página.
+        assets (TenantAssetService, optional): Variantes do logo; sem ele,
+            as páginas não exibem o logo.
+        logo_variant (str): Variante do logo usada no cabeçalho.
+    """
+
+    def __init__(
+        self,
+        tenant_repository: ITenantRepository,
+        cache: Optional[FragmentCache] = None,
+        page_size: int = 200,
+        assets: Optional[TenantAssetService] = None,
+        logo_variant: str = "medium",
+    ):
+        self.tenant_repository = tenant_repository
+        self.cache = cache or FragmentCache()
+        self.page_size = page_size
+        self.assets = assets
+        self.logo_variant = logo_variant
+        self.templates = TemplateRegistry()
+        self.templates.load_directory(TEMPLATES)
+        self.router = Router()
+        self._listings: dict[str, Listing] = {}
+        if assets is not None:
+            self.router.add("GET", "/assets/{name}", self._asset)
+
+    def add_listing(self, listing: Listing) -> None:
+        """Registra uma listagem e compila os seus templates."""
+        if listing.templates is not None:
+            self.templates.load_directory(listing.templates)
+        for name in (listing.card_template, listing.summary_template):
+            if name not in self.templates:
+                raise ValueError(f"Template inexistente: '{name}'.")
+        self._listings[listing.name] = listing
+
+        async def handler(request: Request) -> Response:
+            return self._page(listing, request)
+
+        path = f"/tenants/{{tenant_id}}/{listing.name}"
+        self.router.add("GET", path, handler)
+
+    async def __call__(self, scope: dict, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            return
+        request = await Request.from_asgi(scope, receive)
+        try:
+            handler, request.params = self.router.resolve(
+                request.method, request.path
+            )
+            response = await handler(request)
+        except HTTPError as error:
+            response = self._html(
+                self.templates["error.html"].render(
+                    {"status": error.status, "detail": error.detail}
+                ),
+                error.status,
+            )
+        await response(send)
+
+    @staticmethod
+    def _html(body: str, status: int = 200) -> Response:
+        return Response(body.encode("utf-8"), status, media_type=HTML)
+
+    async def _asset(self, request: Request) -> Response:
+        data = self.assets.asset(request.params["name"])
+        if data is None:
+            raise HTTPError(404, "Arquivo não encontrado.")
+        return Response(
+            data, headers={"cache-control": IMMUTABLE}, media_type=PNG
+        )
+
+    def _logo(self, tenant: Tenant) -> Markup:
+        """Imagem do logo, se a variante já foi gerada."""
+        if self.assets is None:
+            return Markup()
+        name = self.assets.logo(tenant.entity_id, self.logo_variant)
+        if name is None:
+            return Markup()
+        return self.templates["logo.html"].render(
+            {"src": f"/assets/{name}", "alt": tenant.name}
+        )
+
+    def _page(self, listing: Listing, request: Request) -> Response:
+        try:
+            tenant_id = UUID(request.params["tenant_id"])
+            after = request.query.get("after")
+            after = UUID(after) if after else None
+        except ValueError as error:
+            raise HTTPError(404, "Página não encontrada.") from error
+        try:
+            tenant = self.tenant_repository.get(tenant_id)
+        except TenantNotFoundException as error:
+            raise HTTPError(404, "Empresa não encontrada.") from error
+        return self._html(self.render_listing(listing, tenant, after))
+
+    @staticmethod
+    def _summary(listing: Listing, tenant_id: UUID) -> dict:
+        """
+        Valores do resumo de um tenant.
+
+        Os arquivados frios entram apenas como contagem, sem serem
+        descompactados.
+        """
+        repository = listing.repository
+        values = listing.summary_values(repository.get_by_tenant_id(tenant_id))
+        cold = repository.count_archived_by_tenant(tenant_id)
+        if cold:
+            values["total"] += cold
+            if "archived" in values:
+                values["archived"] += cold
+        return values
+
+    def render_listing(
+        self, listing: Listing, tenant: Tenant, after: Optional[UUID] = None
+    ) -> Markup:
+        """Renderiza uma página da listagem de um tenant."""
+        repository = listing.repository
+        page = repository.get_page_by_tenant(
+            tenant.entity_id, self.page_size, after
+        )
+        card = self.templates[listing.card_template]
+        cards = [
+            self.cache.get_or_render(
+                (
+                    listing.name,
+                    document.entity_id,
+                    document.version,
+                    document.updated_at,
+                ),
+                lambda document=document: card.render(
+                    listing.card_values(document)
+                ),
+            )
+            for document in page
+        ]
+        summary = self.cache.get_or_render(
+            (
+                listing.name,
+                tenant.entity_id,
+                repository.get_tenant_version(tenant.entity_id),
+            ),
+            lambda: self.templates[listing.summary_template].render(
+                self._summary(listing, tenant.entity_id)
+            ),
+        )
+        pagination = Markup()
+        if len(page) == self.page_size:
+            pagination = self.templates["pagination.html"].render(
+                {"after": page[-1].entity_id}
+            )
+        return self.templates["page.html"].render(
+            {
+                "title": listing.title,
+                "tenant": tenant.name,
+                "logo": self._logo(tenant),
+                "summary": summary,
+                "cards": Markup("\n".join(cards)),
+                "pagination": pagination,
+            }
+        )
@@ -0,0 +1,52 @@
+"""Cache de fragmentos HTML renderizados."""
+
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+from src.core.presentation.web.templates import Markup
+
+
+class FragmentCache:
+    """
+    Cache LRU de fragmentos, com chaves que identificam o estado.
+
+    A chave inclui a versão do que foi renderizado (por exemplo,
+    `(entity_id, version, updated_at)` para um card), de modo que um
+    fragmento nunca precisa ser invalidado: quando a entidade muda, a
+    chave muda, e a entrada antiga sai pelo LRU.
+
+    Args:
+        max_entries (int): Quantidade máxima de fragmentos.
+    """
+
+    def __init__(self, max_entries: int = 10_000):
+        if max_entries < 1:
+            raise ValueError("O cache deve ter pelo menos uma entrada.")
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, Markup] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_render(
+        self, key: Hashable, render: Callable[[], Markup]
+    ) -> Markup:
+        """Retorna o fragmento em cache ou o renderiza e guarda."""
+        with self._lock:
+            fragment = self._entries.get(key)
+            if fragment is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return fragment
+            self.misses += 1
+        fragment = render()
+        with self._lock:
+            self._entries[key] = fragment
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return fragment
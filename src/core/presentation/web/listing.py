@@ -0,0 +1,84 @@
+"""Definição das páginas de listagem renderizadas no servidor."""
+
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from src.core.domain.entities.document import Document
+from src.core.domain.repositorys.document import IDocumentRepository
+from src.core.domain.value_objects.doc_status import DocumentStatus
+
+TEMPLATES = Path(__file__).parent / "templates"
+
+
+@dataclass(frozen=True)
+class Listing:
+    """
+    Página de listagem de um tipo de documento.
+
+    A página é servida em `/tenants/{tenant_id}/{name}`, com um painel de
+    resumo de todos os documentos do tenant e um card por documento da
+    página corrente.
+
+    Attributes:
+        name (str): Segmento da URL e prefixo das chaves de cache.
+        title (str): Título da página.
+        repository (IDocumentRepository): Origem dos documentos.
+        card_template (str): Nome do template do card.
+        summary_template (str): Nome do template do resumo.
+        card_values (Callable[[Document], dict]): Valores de um card.
+        summary_values (Callable[[list[Document]], dict]): Valores do
+            resumo, calculados sobre os documentos do tenant fora do
+            armazenamento frio; os arquivados frios são somados depois a
+            `total` e, se houver, a `archived`.
+        templates (Path, optional): Diretório com os templates próprios
+            da listagem, compilados quando ela é registrada.
+    """
+
+    name: str
+    title: str
+    repository: IDocumentRepository
+    card_template: str
+    summary_template: str
+    card_values: Callable[[Document], dict[str, Any]]
+    summary_values: Callable[[list[Document]], dict[str, Any]]
+    templates: Optional[Path] = None
+
+
+def document_card(document: Document) -> dict[str, Any]:
+    """Valores do card de um documento."""
+    return {
+        "id": document.entity_id,
+        "title": document.title,
+        "document_type": document.document_type.value,
+        "status": document.status.value,
+        "version": document.version,
+        "updated_at": document.updated_at.isoformat(),
+        "updated_label": document.updated_at.strftime("%d/%m/%Y %H:%M"),
+    }
+
+
+def document_summary(documents: list[Document]) -> dict[str, Any]:
+    """Contagem dos documentos por status."""
+    counts = Counter(document.status for document in documents)
+    return {
+        "total": len(documents),
+        "draft": counts[DocumentStatus.DRAFT],
+        "published": counts[DocumentStatus.PUBLISHED],
+        "archived": counts[DocumentStatus.ARCHIVED],
+        "deleted": counts[DocumentStatus.DELETED],
+    }
+
+
+def document_listing(repository: IDocumentRepository) -> Listing:
+    """Listagem de documentos."""
+    return Listing(
+        name="documents",
+        title="Documentos",
+        repository=repository,
+        card_template="document_card.html",
+        summary_template="document_summary.html",
+        card_values=document_card,
+        summary_values=document_summary,
+    )
@@ -0,0 +1,110 @@
+"""Templates HTML compilados uma única vez.
+
+Os templates usam a sintaxe de `string.Template` (`$campo` ou
+`${campo}`). Na carga, cada template é dividido em partes literais e
+campos; renderizar é só juntar as partes com os valores já escapados,
+sem reanalisar o texto.
+"""
+
+import html
+import string
+from pathlib import Path
+from typing import Any
+
+
+class Markup(str):
+    """Texto HTML já seguro, inserido sem escape."""
+
+
+def escape(value: Any) -> str:
+    """Escapa um valor para HTML, exceto se já for `Markup`."""
+    if isinstance(value, Markup):
+        return value
+    if value is None:
+        return ""
+    return html.escape(str(value))
+
+
+class CompiledTemplate:
+    """
+    Template pré-processado.
+
+    Args:
+        source (str): Texto do template.
+        name (str): Nome, usado nas mensagens de erro.
+
+    Raises:
+        ValueError: Se o template tiver um marcador inválido.
+    """
+
+    def __init__(self, source: str, name: str = "<template>"):
+        self.name = name
+        literals: list[str] = []
+        fields: list[str] = []
+        position = 0
+        pending = ""
+        for match in string.Template.pattern.finditer(source):
+            pending += source[position : match.start()]
+            position = match.end()
+            if match.group("escaped") is not None:
+                pending += "$"
+                continue
+            field = match.group("named") or match.group("braced")
+            if field is None:
+                raise ValueError(
+                    f"Marcador inválido em {name}, posição {match.start()}."
+                )
+            literals.append(pending)
+            fields.append(field)
+            pending = ""
+        literals.append(pending + source[position:])
+        self._literals = literals
+        self._fields = fields
+
+    @property
+    def fields(self) -> frozenset[str]:
+        """Campos usados pelo template."""
+        return frozenset(self._fields)
+
+    def render(self, values: dict[str, Any]) -> Markup:
+        """
+        Preenche o template; os valores são escapados para HTML.
+
+        Raises:
+            KeyError: Se faltar o valor de um campo.
+        """
+        parts = [self._literals[0]]
+        for field, literal in zip(self._fields, self._literals[1:]):
+            parts.append(escape(values[field]))
+            parts.append(literal)
+        return Markup("".join(parts))
+
+
+class TemplateRegistry:
+    """
+    Conjunto de templates carregados e compilados na inicialização.
+
+    Example:
+        templates = TemplateRegistry()
+        templates.load_directory(Path(__file__).parent / "templates")
+        templates["card.html"].render({...})
+    """
+
+    def __init__(self):
+        self._templates: dict[str, CompiledTemplate] = {}
+
+    def add(self, name: str, source: str) -> CompiledTemplate:
+        """Compila e registra um template."""
+        template = self._templates[name] = CompiledTemplate(source, name)
+        return template
+
+    def load_directory(self, directory: Path, prefix: str = "") -> None:
+        """Compila todos os arquivos `.html` de um diretório."""
+        for path in sorted(Path(directory).glob("*.html")):
+            self.add(prefix + path.name, path.read_text(encoding="utf-8"))
+
+    def __getitem__(self, name: str) -> CompiledTemplate:
+        return self._templates[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._templates
@@ -0,0 +1,289 @@
+"""Job de anonimização (LGPD) de contratos em lote."""
+
+import copy
+import json
+import os
+import re
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional
+from uuid import UUID, uuid5
+
+from src.core.application.events import EventBus
+from src.document_types.contract.domain.entities.contract import Contract
+from src.document_types.contract.domain.repositorys.contract import (
+    IContractRepository,
+)
+
+REDACTED = "[removido]"
+
+DEFAULT_PATTERNS = (
+    # CNPJ antes do CPF: o padrão do CPF casaria com parte de um CNPJ.
+    r"\b\d{2}\.?\d{3}\.?\d{3}/?\d{4}-?\d{2}\b",
+    r"\b\d{3}\.?\d{3}\.?\d{3}-?\d{2}\b",
+    r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+",
+    # Telefone com hífen ou com DDD entre parênteses; oito ou nove dígitos
+    # seguidos (pedidos, protocolos) não são telefone.
+    r"(?:\(\d{2}\)\s?|\b\d{2}\s)?\b9?\d{4}-\d{4}\b|\(\d{2}\)\s?9?\d{8}\b",
+)
+
+
+@dataclass(frozen=True)
+class PersonalData:
+    """Campos de um contrato que podem conter dados pessoais."""
+
+    description: str
+    notes: Optional[str]
+    parts_id: tuple[UUID, ...]
+
+    @classmethod
+    def of(cls, contract: Contract) -> "PersonalData":
+        """Extrai os dados pessoais de um contrato."""
+        return cls(
+            contract.description,
+            contract.notes,
+            tuple(contract.parts_id or ()),
+        )
+
+
+class RedactionPolicy(ABC):
+    """
+    Política de anonimização.
+
+    As políticas rodam em processos separados, portanto devem ser
+    serializáveis com `pickle` (classes no nível do módulo, sem lambdas).
+    """
+
+    @abstractmethod
+    def redact(self, data: PersonalData) -> PersonalData:
+        """Retorna a versão anonimizada dos dados."""
+
+
+class PatternRedactionPolicy(RedactionPolicy):
+    """
+    Substitui padrões de dados pessoais e pseudonimiza as partes.
+
+    Textos têm CPF, CNPJ, e-mails e telefones trocados por `[removido]`;
+    com `clear_notes`, as observações são apagadas por inteiro. Cada parte
+    vira um UUID derivado de forma determinística (`uuid5`) do original e
+    de um `namespace` secreto: contratos da mesma parte continuam ligados
+    entre si, mas a parte original não pode ser recuperada sem o segredo.
+
+    Args:
+        namespace (UUID): Segredo da pseudonimização das partes.
+        patterns (tuple[str, ...]): Expressões regulares a remover.
+        clear_notes (bool): Apaga as observações em vez de filtrá-las.
+    """
+
+    def __init__(
+        self,
+        namespace: UUID,
+        patterns: tuple[str, ...] = DEFAULT_PATTERNS,
+        clear_notes: bool = False,
+    ):
+        self.namespace = namespace
+        self.pattern = re.compile("|".join(f"(?:{item})" for item in patterns))
+        self.clear_notes = clear_notes
+
+    def scrub(self, text: Optional[str]) -> Optional[str]:
+        """Remove os padrões de um texto."""
+        if not text:
+            return text
+        return self.pattern.sub(REDACTED, text)
+
+    def redact(self, data: PersonalData) -> PersonalData:
+        """Retorna a versão anonimizada dos dados."""
+        return PersonalData(
+            description=self.scrub(data.description),
+            notes=None if self.clear_notes else self.scrub(data.notes),
+            parts_id=tuple(
+                uuid5(self.namespace, party.hex) for party in data.parts_id
+            ),
+        )
+
+
+class CheckpointStore(ABC):
+    """Armazena o cursor do job para retomá-lo após uma falha."""
+
+    @abstractmethod
+    def load(self) -> Optional[UUID]:
+        """Retorna o ID do último contrato processado."""
+
+    @abstractmethod
+    def save(self, last_id: UUID, processed: int) -> None:
+        """Registra o último contrato processado."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove o checkpoint ao fim de uma execução completa."""
+
+
+class InMemoryCheckpointStore(CheckpointStore):
+    """Checkpoint em memória (testes e execuções de um único processo)."""
+
+    def __init__(self):
+        self.last_id: Optional[UUID] = None
+        self.processed = 0
+
+    def load(self) -> Optional[UUID]:
+        """Retorna o ID do último contrato processado."""
+        return self.last_id
+
+    def save(self, last_id: UUID, processed: int) -> None:
+        """Registra o último contrato processado."""
+        self.last_id, self.processed = last_id, processed
+
+    def clear(self) -> None:
+        """Remove o checkpoint."""
+        self.last_id, self.processed = None, 0
+
+
+class FileCheckpointStore(CheckpointStore):
+    """
+    Checkpoint em um arquivo JSON, gravado de forma atômica.
+
+    Args:
+        path (str | Path): Caminho do arquivo.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+
+    def load(self) -> Optional[UUID]:
+        """Retorna o ID do último contrato processado."""
+        if not self.path.exists():
+            return None
+        data = json.loads(self.path.read_text(encoding="utf-8"))
+        return UUID(data["last_id"])
+
+    def save(self, last_id: UUID, processed: int) -> None:
+        """Grava o checkpoint em um arquivo temporário e o renomeia."""
+        temporary = self.path.with_suffix(self.path.suffix + ".tmp")
+        temporary.write_text(
+            json.dumps({"last_id": str(last_id), "processed": processed}),
+            encoding="utf-8",
+        )
+        os.replace(temporary, self.path)
+
+    def clear(self) -> None:
+        """Remove o arquivo de checkpoint."""
+        self.path.unlink(missing_ok=True)
+
+
+@dataclass(frozen=True)
+class AnonymizationReport:
+    """Resultado de uma execução do job."""
+
+    scanned: int
+    anonymized: int
+    chunks: int
+    completed: bool
+
+
+class LgpdAnonymizationJob:
+    """
+    Anonimiza em blocos os contratos marcados como `lgpd`.
+
+    A cada bloco, o job lê até `chunk_size` contratos pelo cursor, envia
+    os dados pessoais para o pool de workers, aplica o resultado com
+    `Contract.anonymize` em cópias de trabalho, grava o bloco com
+    `update_many`, publica os eventos `contract_anonymized` e registra o
+    checkpoint. Apenas um bloco fica em memória por vez. Após uma falha,
+    uma nova execução continua do último bloco gravado.
+
+    Args:
+        repository (IContractRepository): Repositório de contratos.
+        policy (RedactionPolicy): Política de anonimização.
+        checkpoint (CheckpointStore): Armazenamento do cursor.
+        user_id (UUID): Usuário registrado nos eventos de anonimização.
+        chunk_size (int): Contratos por bloco.
+        selector (Callable[[Contract], bool], optional): Filtro adicional,
+            por exemplo o prazo de retenção. Precisa rodar no processo
+            principal, não é enviado aos workers.
+        executor_factory (Callable[[], Executor], optional): Cria o pool
+            de workers; por padrão, um `ProcessPoolExecutor`.
+        bus (EventBus, optional): Recebe os eventos dos contratos gravados
+            (ex.: para a busca deixar de encontrar os dados removidos).
+    """
+
+    def __init__(
+        self,
+        repository: IContractRepository,
+        policy: RedactionPolicy,
+        checkpoint: CheckpointStore,
+        user_id: UUID,
+        chunk_size: int = 1_000,
+        selector: Optional[Callable[[Contract], bool]] = None,
+        executor_factory: Optional[Callable[[], Executor]] = None,
+        bus: Optional[EventBus] = None,
+    ):
+        if chunk_size < 1:
+            raise ValueError("O tamanho do bloco deve ser de pelo menos 1.")
+        self.repository = repository
+        self.policy = policy
+        self.checkpoint = checkpoint
+        self.user_id = user_id
+        self.chunk_size = chunk_size
+        self.selector = selector
+        self.executor_factory = executor_factory or ProcessPoolExecutor
+        self.bus = bus
+
+    def run(self, max_chunks: Optional[int] = None) -> AnonymizationReport:
+        """
+        Executa o job a partir do checkpoint.
+
+        Args:
+            max_chunks (int, optional): Interrompe após esta quantidade de
+                blocos, mantendo o checkpoint (execuções em janelas).
+
+        Returns:
+            AnonymizationReport: Totais da execução.
+        """
+        after = self.checkpoint.load()
+        scanned = anonymized = chunks = 0
+        with self.executor_factory() as executor:
+            while max_chunks is None or chunks < max_chunks:
+                page = self.repository.get_lgpd_page(self.chunk_size, after)
+                if not page:
+                    self.checkpoint.clear()
+                    return AnonymizationReport(
+                        scanned, anonymized, chunks, True
+                    )
+                selected = [
+                    contract
+                    for contract in page
+                    if self.selector is None or self.selector(contract)
+                ]
+                anonymized += self._anonymize(executor, selected)
+                scanned += len(page)
+                chunks += 1
+                after = page[-1].entity_id
+                self.checkpoint.save(after, scanned)
+        return AnonymizationReport(scanned, anonymized, chunks, False)
+
+    def _anonymize(self, executor: Executor, contracts: list[Contract]) -> int:
+        """Anonimiza um bloco e grava o resultado em uma única operação."""
+        if not contracts:
+            return 0
+        redacted = executor.map(
+            self.policy.redact,
+            [PersonalData.of(contract) for contract in contracts],
+            chunksize=max(1, len(contracts) // 32),
+        )
+        # Cópias de trabalho: se `update_many` falhar, os contratos
+        # guardados no repositório não ficam alterados pela metade.
+        working = [copy.copy(contract) for contract in contracts]
+        for contract, data in zip(working, redacted):
+            contract.anonymize(
+                description=data.description,
+                notes=data.notes,
+                parts_id=list(data.parts_id),
+                user_id_modifier=self.user_id,
+            )
+        updated = self.repository.update_many(working)
+        if self.bus is not None:
+            for contract in working:
+                self.bus.dispatch(contract)
+        return updated
@@ -0,0 +1,79 @@
+"""Notificações por e-mail de contratos com `email_send`."""
+
+from typing import Callable, Iterable
+from uuid import UUID
+
+from src.core.application.events import EventBus
+from src.core.application.services.notification import (
+    Notification,
+    NotificationQueue,
+)
+from src.core.domain.entities.base import DomainEvent
+from src.core.domain.exceptions import DocumentNotFoundException
+from src.document_types.contract.domain.entities.contract import Contract
+from src.document_types.contract.domain.repositorys.contract import (
+    IContractRepository,
+)
+
+EVENT_DESCRIPTIONS = {
+    "document_created": "O contrato foi registrado ou renovado.",
+    "document_updated": "O contrato foi atualizado.",
+}
+
+
+class ContractNotifier:
+    """
+    Enfileira notificações para eventos de contratos com `email_send`.
+
+    O handler apenas monta a mensagem e a coloca na fila; o envio fica
+    com o `NotificationDispatcher`, fora do fluxo da requisição.
+
+    Args:
+        repository (IContractRepository): Fonte dos contratos.
+        queue (NotificationQueue): Fila de notificações.
+        recipients (Callable[[Contract], Iterable[str]]): Destinatários de
+            cada contrato.
+        event_types (Iterable[str]): Eventos que geram notificação.
+    """
+
+    def __init__(
+        self,
+        repository: IContractRepository,
+        queue: NotificationQueue,
+        recipients: Callable[[Contract], Iterable[str]],
+        event_types: Iterable[str] = tuple(EVENT_DESCRIPTIONS),
+    ):
+        self.repository = repository
+        self.queue = queue
+        self.recipients = recipients
+        self.event_types = tuple(event_types)
+
+    def subscribe(self, bus: EventBus) -> None:
+        """Inscreve o notificador nos eventos configurados."""
+        for event_type in self.event_types:
+            bus.subscribe(event_type, self.handle)
+
+    def handle(self, event: DomainEvent) -> None:
+        """Enfileira a notificação de um evento, se aplicável."""
+        try:
+            contract = self.repository.get(UUID(event.data["document_id"]))
+        except DocumentNotFoundException:
+            return
+        if not isinstance(contract, Contract) or not contract.email_send:
+            return
+        recipients = tuple(self.recipients(contract))
+        if not recipients:
+            return
+        self.queue.put(
+            Notification(
+                tenant_id=contract.tenant_id,
+                recipients=recipients,
+                subject=f"Contrato nº {contract.number}: {contract.title}",
+                body=(
+                    f"{EVENT_DESCRIPTIONS.get(event.event_type, '')}\n\n"
+                    f"Contrato: {contract.title}\n"
+                    f"Número: {contract.number}\n"
+                    f"Vigência: {contract.start_date} a {contract.end_date}\n"
+                ),
+            )
+        )
@@ -0,0 +1,32 @@
+"""Numeração de contratos por tenant."""
+
+from uuid import UUID
+
+from src.core.application.services.sequence import BlockSequenceAllocator
+from src.core.domain.repositorys.sequence import ISequenceRepository
+
+
+class ContractNumberAllocator:
+    """
+    Gera `Contract.number` por tenant sem serializar a criação.
+
+    Cada tenant tem sua própria sequência, reservada em blocos (veja
+    `BlockSequenceAllocator`). Os números são únicos por tenant, mas a
+    sequência admite lacunas.
+
+    Args:
+        repository (ISequenceRepository): Armazenamento das sequências.
+        block_size (int): Números reservados por escrita.
+    """
+
+    def __init__(self, repository: ISequenceRepository, block_size: int = 50):
+        self._allocator = BlockSequenceAllocator(repository, block_size)
+
+    @staticmethod
+    def sequence_key(tenant_id: UUID) -> str:
+        """Chave da sequência de contratos de um tenant."""
+        return f"contract:{tenant_id}"
+
+    def next_number(self, tenant_id: UUID) -> int:
+        """Retorna o próximo número de contrato do tenant."""
+        return self._allocator.next(self.sequence_key(tenant_id))
@@ -0,0 +1,195 @@
+"""Agendador de renovações automáticas de contratos."""
+
+import copy
+import heapq
+import itertools
+import threading
+from datetime import date, datetime
+from typing import Iterable, Iterator, Optional
+from uuid import UUID
+
+from src.core.domain.exceptions import DocumentNotFoundException
+from src.core.domain.repositorys.document import IDocumentRepository
+from src.document_types.contract.domain.entities.contract import Contract
+from src.document_types.contract.domain.value_object import ContractStatus
+
+
+def _as_date(value: date | datetime) -> date:
+    """Normaliza `datetime` para `date`."""
+    return value.date() if isinstance(value, datetime) else value
+
+
+class ContractRenewalScheduler:
+    """
+    Mantém os contratos ativos com renovação automática ordenados por
+    `end_date`.
+
+    O índice é um min-heap com invalidação preguiçosa: reagendar ou
+    remover um contrato apenas registra a entrada vigente, e entradas
+    obsoletas são descartadas quando chegam ao topo. Assim, encontrar os
+    contratos vencidos custa O(k log n) no número de contratos vencidos,
+    em vez de percorrer todos os contratos.
+
+    O índice guarda só o ID e a data de cada contrato: a renovação relê
+    o contrato do repositório, para não gravar por cima de alterações
+    feitas depois do agendamento.
+    """
+
+    def __init__(self, contracts: Iterable[Contract] = ()):
+        self._heap: list[tuple[date, int, UUID]] = []
+        self._entries: dict[UUID, tuple[date, int]] = {}
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+        self.rebuild(contracts)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, contract_id: UUID) -> bool:
+        return contract_id in self._entries
+
+    @staticmethod
+    def is_schedulable(contract: Contract) -> bool:
+        """Verifica se o contrato deve estar no índice."""
+        return bool(
+            contract.status == ContractStatus.ACTIVE
+            and contract.automatic_renewal
+            and contract.end_date
+        )
+
+    def rebuild(self, contracts: Iterable[Contract]) -> None:
+        """Reconstrói o índice a partir de uma coleção, em O(n)."""
+        with self._lock:
+            self._heap = []
+            self._entries = {}
+            for contract in contracts:
+                if not self.is_schedulable(contract):
+                    continue
+                entry = (_as_date(contract.end_date), next(self._counter))
+                self._entries[contract.entity_id] = entry
+                self._heap.append((*entry, contract.entity_id))
+            heapq.heapify(self._heap)
+
+    def track(self, contract: Contract) -> None:
+        """
+        Adiciona, reagenda ou remove um contrato do índice.
+
+        Deve ser chamado sempre que `end_date`, `automatic_renewal` ou o
+        status mudarem.
+
+        Args:
+            contract (Contract): Contrato alterado.
+        """
+        with self._lock:
+            self._track(contract)
+
+    def _track(self, contract: Contract) -> None:
+        contract_id = contract.entity_id
+        if not self.is_schedulable(contract):
+            self._entries.pop(contract_id, None)
+            return
+        end_date = _as_date(contract.end_date)
+        current = self._entries.get(contract_id)
+        if current is not None and current[0] == end_date:
+            return
+        entry = (end_date, next(self._counter))
+        self._entries[contract_id] = entry
+        heapq.heappush(self._heap, (*entry, contract_id))
+
+    def untrack(self, contract_id: UUID) -> None:
+        """Remove um contrato do índice."""
+        with self._lock:
+            self._entries.pop(contract_id, None)
+
+    def _discard_stale(self) -> None:
+        """Remove do topo do heap as entradas obsoletas."""
+        heap = self._heap
+        while heap:
+            end_date, sequence, contract_id = heap[0]
+            if self._entries.get(contract_id) == (end_date, sequence):
+                return
+            heapq.heappop(heap)
+
+    def next_due(self) -> Optional[date]:
+        """Retorna a próxima data de vencimento agendada."""
+        with self._lock:
+            self._discard_stale()
+            return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, as_of: date, limit: Optional[int] = None) -> list[UUID]:
+        """
+        Retira do índice os contratos com `end_date` até `as_of`.
+
+        Args:
+            as_of (date): Data de referência.
+            limit (int, optional): Máximo de contratos retornados.
+
+        Returns:
+            list[UUID]: IDs dos contratos vencidos, do mais antigo ao mais
+            novo.
+        """
+        due = []
+        with self._lock:
+            while limit is None or len(due) < limit:
+                self._discard_stale()
+                if not self._heap or self._heap[0][0] > as_of:
+                    break
+                _, _, contract_id = heapq.heappop(self._heap)
+                del self._entries[contract_id]
+                due.append(contract_id)
+        return due
+
+    def renew_due(
+        self,
+        as_of: date,
+        user_id_modifier: UUID,
+        repository: IDocumentRepository,
+        batch_size: int = 500,
+    ) -> Iterator[list[Contract]]:
+        """
+        Renova em lotes os contratos vencidos até `as_of`.
+
+        Cada contrato é relido do repositório e renovado em uma cópia de
+        trabalho, uma única vez por execução; ao final, volta ao índice
+        com o novo `end_date`. Contratos excluídos, que não estão mais
+        ativos ou sem renovação automática saem do índice; os que tiveram
+        o `end_date` adiado são só reagendados.
+
+        Args:
+            as_of (date): Data de referência.
+            user_id_modifier (UUID): Usuário que executa a renovação.
+            repository (IDocumentRepository): Repositório de onde os
+                contratos são lidos e onde os renovados são atualizados.
+            batch_size (int): Tamanho de cada lote.
+
+        Yields:
+            list[Contract]: Contratos renovados em cada lote.
+        """
+        pending: list[Contract] = []
+        try:
+            while True:
+                due = self.pop_due(as_of, batch_size)
+                if not due:
+                    return
+                batch = []
+                for contract_id in due:
+                    try:
+                        contract = copy.copy(repository.get(contract_id))
+                    except DocumentNotFoundException:
+                        continue
+                    if not isinstance(
+                        contract, Contract
+                    ) or not self.is_schedulable(contract):
+                        continue
+                    if _as_date(contract.end_date) > as_of:
+                        pending.append(contract)
+                        continue
+                    contract.renew_contract(user_id_modifier)
+                    batch.append(repository.update(contract))
+                    pending.append(contract)
+                if batch:
+                    yield batch
+        finally:
+            with self._lock:
+                for contract in pending:
+                    self._track(contract)
@@ -1,13 +1,17 @@
-from datetime import date, datetime, timedelta
+from datetime import date, timedelta
 from decimal import Decimal
 from uuid import UUID
 
 from src.core.domain.entities.document import Document
 from src.core.domain.events.document import DocumentCreatedEvent
+from src.core.domain.exceptions import DomainValidationError
 from src.core.domain.value_objects.doc_types import DocumentType
 from src.document_types.contract.domain.entities.exceptions import (
     ContractRenewalException,
 )
+from src.document_types.contract.domain.events.contract import (
+    ContractAnonymizedEvent,
+)
 from src.document_types.contract.domain.value_object import (
     ContractStatus,
     ContractType,
@@ -17,11 +21,30 @@ from src.document_types.contract.domain.value_object import (
 class Contract(Document):
     """Classe que representa um contrato, herda de Document."""
 
+    updatable_attributes = Document.updatable_attributes | {
+        "subject",
+        "description",
+        "amount",
+        "number",
+        "department_id",
+        "folder_id",
+        "parts_id",
+        "start_date",
+        "end_date",
+        "notes",
+        "is_additional",
+        "email_send",
+        "lgpd",
+        "automatic_renewal",
+        "contract_type",
+    }
+
     def __init__(
         self,
         title: str,
         document_type: DocumentType,
         user_id: UUID,
+        tenant_id: UUID,
         subject: str,
         description: str,
         amount: Decimal,
@@ -41,8 +64,21 @@ class Contract(Document):
         automatic_renewal: bool = False,
         status: ContractStatus = ContractStatus.DRAFT,
         contract_type: ContractType = ContractType.OTHER,
+        version: int = 1,
+        entity_id: UUID | None = None,
     ):
-        super().__init__(title, DocumentType.CONTRACT, user_id)
+        super().__init__(
+            title=title,
+            user_id=user_id,
+            document_type=DocumentType.CONTRACT,
+            tenant_id=tenant_id,
+            version=version,
+            status=status,
+            entity_id=entity_id,
+            created_at=created_at,
+            updated_at=updated_at,
+            slug=slug,
+        )
         self.subject = subject
         self.description = description
         self.amount = amount
@@ -53,9 +89,6 @@ class Contract(Document):
         self.start_date = start_date
         self.end_date = end_date
         self.notes = notes
-        self.slug = slug
-        self.created_at = created_at or date.today()
-        self.updated_at = updated_at or date.today()
         self.is_additional = is_additional
         self.email_send = email_send
         self.lgpd = lgpd
@@ -66,11 +99,60 @@ class Contract(Document):
         if self.automatic_renewal and self.end_date is None:
             self._set_automatic_renewal()
 
+    @property
+    def start_date(self) -> date:
+        """Retorna o início da vigência."""
+        return self._start_date
+
+    @start_date.setter
+    def start_date(self, value: date):
+        """Define o início da vigência, que não pode passar do término."""
+        self._check_validity(value, getattr(self, "_end_date", None))
+        self._start_date = value
+
+    @property
+    def end_date(self) -> date | None:
+        """Retorna o término da vigência (None para indeterminado)."""
+        return self._end_date
+
+    @end_date.setter
+    def end_date(self, value: date | None):
+        """Define o término, que não pode anteceder o início."""
+        self._check_validity(getattr(self, "_start_date", None), value)
+        self._end_date = value
+
+    @staticmethod
+    def _check_validity(start: date | None, end: date | None) -> None:
+        if start is not None and end is not None and end < start:
+            raise DomainValidationError(
+                "O término do contrato não pode ser anterior ao início."
+            )
+
+    @property
+    def status(self) -> ContractStatus:
+        """Retorna o status do contrato."""
+        return self._status
+
+    @status.setter
+    def status(self, value: ContractStatus):
+        """Define o status do contrato,
+        garantindo que seja uma instância de ContractStatus.
+        """
+        if not isinstance(value, ContractStatus):
+            raise DomainValidationError(
+                "O status do contrato "
+                "deve ser uma instância de ContractStatus."
+            )
+        self._status = value
+
     def __str__(self):
-        return f"Contract(id={self.id}, document_type={self.document_type})"
+        return (
+            f"Contract(id={self.entity_id}, "
+            f"document_type={self.document_type})"
+        )
 
     def _set_automatic_renewal(self):
-        self.end_date = datetime.now() + timedelta(days=365)
+        self.end_date = date.today() + timedelta(days=365)
 
     def renew_contract(self, user_id_modifier: UUID):
         """Renova o contrato se a renovação automática estiver habilitada."""
@@ -81,9 +163,34 @@ class Contract(Document):
 
         if self.end_date:
             self.end_date = self.end_date + timedelta(days=365)
+        self._update_timestamp()
 
         self.add_domain_event(
-            DocumentCreatedEvent(self.id, user_id_modifier, self.document_type)
+            DocumentCreatedEvent(
+                self.entity_id, user_id_modifier, self.document_type
+            )
+        )
+
+    def anonymize(
+        self,
+        description: str,
+        notes: str | None,
+        parts_id: list[UUID],
+        user_id_modifier: UUID,
+    ):
+        """
+        Substitui os dados pessoais do contrato pelas versões anonimizadas.
+
+        O contrato deixa de ser marcado como `lgpd`. O evento registrado não
+        contém os valores antigos.
+        """
+        self.description = description
+        self.notes = notes
+        self.parts_id = parts_id
+        self.lgpd = False
+        self._update_timestamp()
+        self.add_domain_event(
+            ContractAnonymizedEvent(self.entity_id, user_id_modifier)
         )
 
     def activate(self, user_id_modifier: UUID):
@@ -93,13 +200,16 @@ class Contract(Document):
             self._update_timestamp()
             self.add_domain_event(
                 DocumentCreatedEvent(
-                    self.id, user_id_modifier, self.document_type
+                    self.entity_id, user_id_modifier, self.document_type
                 )
             )
 
     def _remove_automatic_renewal(self, user_id_modifier: UUID):
         """Remove a opção de renovação automática do contrato."""
         self.automatic_renewal = False
+        self._update_timestamp()
         self.add_domain_event(
-            DocumentCreatedEvent(self.id, user_id_modifier, self.document_type)
+            DocumentCreatedEvent(
+                self.entity_id, user_id_modifier, self.document_type
+            )
         )
@@ -0,0 +1,27 @@
+"""Eventos relacionados a contratos."""
+
+from uuid import UUID
+
+from src.core.domain.entities.base import DomainEvent
+
+
+class ContractAnonymizedEvent(DomainEvent):
+    """Evento disparado quando os dados pessoais de um contrato são
+    anonimizados.
+
+    Ao contrário de `DocumentUpdatedEvent`, não carrega os valores antigos,
+    que são justamente os dados pessoais removidos.
+
+    Args:
+        contract_id (UUID): ID do contrato anonimizado.
+        user_id (UUID): ID do usuário que solicitou a anonimização.
+    """
+
+    def __init__(self, contract_id: UUID, user_id: UUID):
+        super().__init__(
+            event_type="contract_anonymized",
+            data={
+                "document_id": str(contract_id),
+                "user_id": str(user_id),
+            },
+        )
@@ -0,0 +1,65 @@
+"""Repository para a entidade Contract."""
+
+from abc import abstractmethod
+from datetime import date
+from typing import Optional
+from uuid import UUID
+
+from src.core.domain.repositorys.document import IDocumentRepository
+from src.document_types.contract.domain.entities.contract import Contract
+
+
+class IContractRepository(IDocumentRepository):
+    """Interface para o repositório de contratos."""
+
+    @abstractmethod
+    def get_active_on(
+        self,
+        day: date,
+        department_id: Optional[UUID] = None,
+        folder_id: Optional[UUID] = None,
+    ) -> list[Contract]:
+        """Obtém contratos vigentes em uma data."""
+
+    @abstractmethod
+    def get_overlapping(
+        self,
+        start: date,
+        end: date,
+        department_id: Optional[UUID] = None,
+        folder_id: Optional[UUID] = None,
+    ) -> list[Contract]:
+        """Obtém contratos com vigência que intersecta um período."""
+
+    @abstractmethod
+    def get_ending_between(
+        self,
+        start: date,
+        end: date,
+        department_id: Optional[UUID] = None,
+        folder_id: Optional[UUID] = None,
+    ) -> list[Contract]:
+        """Obtém contratos com término dentro de um período."""
+
+    @abstractmethod
+    def get_by_party(
+        self,
+        party_id: UUID,
+        limit: Optional[int] = None,
+        after: Optional[UUID] = None,
+    ) -> list[Contract]:
+        """Obtém uma página dos contratos de uma parte."""
+
+    @abstractmethod
+    def count_by_party(self, party_id: UUID) -> int:
+        """Conta os contratos de uma parte."""
+
+    @abstractmethod
+    def get_by_folder_subtree(self, folder_id: UUID) -> list[Contract]:
+        """Obtém os contratos da pasta e de todas as suas subpastas."""
+
+    @abstractmethod
+    def get_lgpd_page(
+        self, limit: int, after: Optional[UUID] = None
+    ) -> list[Contract]:
+        """Obtém um bloco de contratos marcados como `lgpd`."""
@@ -0,0 +1,319 @@
+"""Repositório de contratos em memória."""
+
+import bisect
+from datetime import date, datetime
+from typing import Hashable, Iterable, Optional
+from uuid import UUID
+
+from src.core.domain.entities.folder import folder_path
+from src.core.infrastucture.persistence.archive import ArchiveStore
+from src.core.infrastucture.persistence.document import (
+    InMemoryDocumentRepository,
+)
+from src.core.infrastucture.persistence.folder import InMemoryFolderRepository
+from src.core.infrastucture.persistence.interval_tree import IntervalTree
+from src.core.infrastucture.persistence.path_index import PathIndex
+from src.document_types.contract.domain.entities.contract import Contract
+from src.document_types.contract.domain.repositorys.contract import (
+    IContractRepository,
+)
+
+PARTITION_FIELDS = ("department_id", "folder_id")
+
+
+def _as_date(value: Optional[date | datetime]) -> date:
+    """Normaliza datas; contratos sem término vão até `date.max`."""
+    if value is None:
+        return date.max
+    return value.date() if isinstance(value, datetime) else value
+
+
+class InMemoryContractRepository(
+    InMemoryDocumentRepository, IContractRepository
+):
+    """
+    Implementação em memória de `IContractRepository`.
+
+    Além dos índices de documento, mantém duas árvores de intervalos: a
+    vigência `[start_date, end_date]` e o término `end_date`. As árvores
+    podem ser particionadas por `department_id` ou `folder_id`; consultas
+    filtradas pelo campo de partição percorrem apenas a árvore dela.
+
+    Mantém também um índice reverso de cada parte (`parts_id`) para a
+    lista ordenada dos IDs de seus contratos. Na atualização, apenas as
+    partes adicionadas ou removidas são alteradas.
+
+    Os IDs dos contratos marcados como `lgpd` ficam em uma lista ordenada,
+    o que permite percorrê-los em blocos por cursor.
+
+    Por fim, indexa cada contrato pelo caminho materializado da sua pasta
+    (`PathIndex`), de modo que "tudo sob esta pasta" é uma única leitura
+    de faixa. Com um repositório de pastas, o índice acompanha as
+    movimentações de subárvores em bloco.
+
+    Args:
+        partition_by (str, optional): `department_id`, `folder_id` ou
+            None para uma única partição.
+        folder_repository (InMemoryFolderRepository, optional): Fonte dos
+            caminhos das pastas. Sem ele, cada pasta é tratada como raiz.
+        archive (ArchiveStore, optional): Armazenamento dos contratos
+            arquivados (ver `InMemoryDocumentRepository`).
+    """
+
+    def __init__(
+        self,
+        partition_by: Optional[str] = None,
+        folder_repository: Optional[InMemoryFolderRepository] = None,
+        archive: Optional[ArchiveStore] = None,
+    ):
+        if partition_by is not None and partition_by not in PARTITION_FIELDS:
+            raise ValueError(
+                f"Partição inválida: '{partition_by}'. "
+                f"Use uma de {PARTITION_FIELDS}."
+            )
+        super().__init__(archive)
+        self._partition_by = partition_by
+        self._validity: dict[Hashable, IntervalTree] = {}
+        self._endings: dict[Hashable, IntervalTree] = {}
+        self._interval_keys: dict[UUID, tuple[Hashable, date, date]] = {}
+        self._parties: dict[UUID, list[UUID]] = {}
+        self._indexed_parties: dict[UUID, frozenset[UUID]] = {}
+        self._lgpd_ids: list[UUID] = []
+        self._folders = folder_repository
+        self._folder_index = PathIndex()
+        self._folder_paths: dict[UUID, str] = {}
+        if folder_repository is not None:
+            folder_repository.subscribe(self._on_folder_moved)
+
+    def _interval_key(self, contract: Contract) -> tuple[Hashable, date, date]:
+        partition = (
+            getattr(contract, self._partition_by)
+            if self._partition_by
+            else None
+        )
+        return (
+            partition,
+            _as_date(contract.start_date),
+            _as_date(contract.end_date),
+        )
+
+    def _add_interval(self, contract_id: UUID, key: tuple) -> None:
+        partition, start, end = key
+        if partition not in self._validity:
+            self._validity[partition] = IntervalTree()
+            self._endings[partition] = IntervalTree()
+        self._validity[partition].insert(start, end, contract_id)
+        self._endings[partition].insert(end, end, contract_id)
+        self._interval_keys[contract_id] = key
+
+    def _remove_interval(self, contract_id: UUID) -> None:
+        key = self._interval_keys.pop(contract_id, None)
+        if key is None:
+            return
+        partition, start, end = key
+        self._validity[partition].remove(start, contract_id)
+        self._endings[partition].remove(end, contract_id)
+        if not self._validity[partition]:
+            del self._validity[partition]
+            del self._endings[partition]
+
+    def _sync_parties(
+        self, contract_id: UUID, parties: frozenset[UUID]
+    ) -> None:
+        """Aplica ao índice reverso apenas a diferença de partes."""
+        old = self._indexed_parties.pop(contract_id, frozenset())
+        for party_id in old - parties:
+            ids = self._parties[party_id]
+            del ids[bisect.bisect_left(ids, contract_id)]
+            if not ids:
+                del self._parties[party_id]
+        for party_id in parties - old:
+            bisect.insort(self._parties.setdefault(party_id, []), contract_id)
+        if parties:
+            self._indexed_parties[contract_id] = parties
+
+    def _folder_path(self, folder_id: Optional[UUID]) -> Optional[str]:
+        if folder_id is None:
+            return None
+        if self._folders is None:
+            return folder_path(folder_id)
+        return self._folders.path_of(folder_id)
+
+    def _sync_folder(self, contract_id: UUID, path: Optional[str]) -> None:
+        """Reposiciona o contrato no índice de pastas, se mudou."""
+        old = self._folder_paths.get(contract_id)
+        if old == path:
+            return
+        if old is not None:
+            self._folder_index.remove(old, contract_id)
+            del self._folder_paths[contract_id]
+        if path is not None:
+            self._folder_index.add(path, contract_id)
+            self._folder_paths[contract_id] = path
+
+    def _sync_lgpd(self, contract_id: UUID, flagged: bool) -> None:
+        """Mantém a lista ordenada de contratos marcados como `lgpd`."""
+        index = bisect.bisect_left(self._lgpd_ids, contract_id)
+        present = (
+            index < len(self._lgpd_ids)
+            and self._lgpd_ids[index] == contract_id
+        )
+        if flagged and not present:
+            self._lgpd_ids.insert(index, contract_id)
+        elif present and not flagged:
+            del self._lgpd_ids[index]
+
+    def _on_folder_moved(self, old_path: str, new_path: str) -> None:
+        """Troca em bloco o prefixo dos contratos da subárvore movida."""
+        with self._lock:
+            for path, contract_id in self._folder_index.rebase(
+                old_path, new_path
+            ):
+                self._folder_paths[contract_id] = path
+
+    def _index(self, entity: Contract) -> None:
+        super()._index(entity)
+        self._add_interval(entity.entity_id, self._interval_key(entity))
+        self._sync_parties(entity.entity_id, frozenset(entity.parts_id or ()))
+        self._sync_folder(
+            entity.entity_id, self._folder_path(entity.folder_id)
+        )
+        self._sync_lgpd(entity.entity_id, bool(entity.lgpd))
+
+    def _unindex(self, entity_id: UUID) -> None:
+        super()._unindex(entity_id)
+        self._remove_interval(entity_id)
+        self._sync_parties(entity_id, frozenset())
+        self._sync_folder(entity_id, None)
+        self._sync_lgpd(entity_id, False)
+
+    def _reindex(self, entity: Contract) -> None:
+        super()._reindex(entity)
+        key = self._interval_key(entity)
+        if self._interval_keys.get(entity.entity_id) != key:
+            self._remove_interval(entity.entity_id)
+            self._add_interval(entity.entity_id, key)
+        self._sync_parties(entity.entity_id, frozenset(entity.parts_id or ()))
+        self._sync_folder(
+            entity.entity_id, self._folder_path(entity.folder_id)
+        )
+        self._sync_lgpd(entity.entity_id, bool(entity.lgpd))
+
+    def _trees(
+        self,
+        trees: dict[Hashable, IntervalTree],
+        department_id: Optional[UUID],
+        folder_id: Optional[UUID],
+    ) -> Iterable[IntervalTree]:
+        """Seleciona as partições que podem conter resultados."""
+        filters = {"department_id": department_id, "folder_id": folder_id}
+        partition = filters.get(self._partition_by or "")
+        if partition is not None:
+            tree = trees.get(partition)
+            return [tree] if tree is not None else []
+        return list(trees.values())
+
+    def _query(
+        self,
+        trees: dict[Hashable, IntervalTree],
+        low: date,
+        high: date,
+        department_id: Optional[UUID],
+        folder_id: Optional[UUID],
+    ) -> list[Contract]:
+        with self._lock:
+            contracts = [
+                self._load(contract_id)
+                for tree in self._trees(trees, department_id, folder_id)
+                for contract_id in tree.overlapping(low, high)
+            ]
+        return [
+            contract
+            for contract in contracts
+            if department_id in (None, contract.department_id)
+            and folder_id in (None, contract.folder_id)
+        ]
+
+    def get_active_on(
+        self,
+        day: date,
+        department_id: Optional[UUID] = None,
+        folder_id: Optional[UUID] = None,
+    ) -> list[Contract]:
+        """Obtém contratos vigentes em uma data."""
+        return self._query(self._validity, day, day, department_id, folder_id)
+
+    def get_overlapping(
+        self,
+        start: date,
+        end: date,
+        department_id: Optional[UUID] = None,
+        folder_id: Optional[UUID] = None,
+    ) -> list[Contract]:
+        """Obtém contratos com vigência que intersecta um período."""
+        return self._query(
+            self._validity, start, end, department_id, folder_id
+        )
+
+    def get_ending_between(
+        self,
+        start: date,
+        end: date,
+        department_id: Optional[UUID] = None,
+        folder_id: Optional[UUID] = None,
+    ) -> list[Contract]:
+        """Obtém contratos com término dentro de um período."""
+        return self._query(self._endings, start, end, department_id, folder_id)
+
+    def get_by_party(
+        self,
+        party_id: UUID,
+        limit: Optional[int] = None,
+        after: Optional[UUID] = None,
+    ) -> list[Contract]:
+        """
+        Obtém os contratos de uma parte, ordenados pelo ID do contrato.
+
+        A paginação usa o ID do último contrato da página anterior como
+        cursor, de modo que cada página custa O(log m + k).
+
+        Args:
+            party_id (UUID): Parte (contraparte) do contrato.
+            limit (int, optional): Tamanho máximo da página.
+            after (UUID, optional): Cursor; retorna contratos com ID maior.
+        """
+        with self._lock:
+            ids = self._parties.get(party_id, [])
+            start = bisect.bisect_right(ids, after) if after else 0
+            end = len(ids) if limit is None else start + limit
+            return [self._load(item) for item in ids[start:end]]
+
+    def count_by_party(self, party_id: UUID) -> int:
+        """Conta os contratos de uma parte."""
+        return len(self._parties.get(party_id, ()))
+
+    def get_by_folder_subtree(self, folder_id: UUID) -> list[Contract]:
+        """Obtém os contratos da pasta e de todas as suas subpastas."""
+        path = self._folder_path(folder_id)
+        with self._lock:
+            return [
+                self._load(contract_id)
+                for contract_id in self._folder_index.subtree(path)
+            ]
+
+    def get_lgpd_page(
+        self, limit: int, after: Optional[UUID] = None
+    ) -> list[Contract]:
+        """
+        Obtém um bloco de contratos marcados como `lgpd`, ordenados pelo ID.
+
+        Args:
+            limit (int): Tamanho máximo do bloco.
+            after (UUID, optional): Cursor; retorna contratos com ID maior.
+        """
+        with self._lock:
+            start = bisect.bisect_right(self._lgpd_ids, after) if after else 0
+            return [
+                self._load(contract_id)
+                for contract_id in self._lgpd_ids[start : start + limit]
+            ]
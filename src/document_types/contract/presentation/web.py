@@ -0,0 +1,73 @@
+"""Listagem de contratos renderizada no servidor."""
+
+from collections import Counter
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Optional
+
+from src.core.presentation.web.listing import Listing
+from src.document_types.contract.domain.entities.contract import Contract
+from src.document_types.contract.domain.repositorys.contract import (
+    IContractRepository,
+)
+from src.document_types.contract.domain.value_object import ContractStatus
+
+TEMPLATES = Path(__file__).parent / "templates"
+
+
+def format_brl(amount: Optional[Decimal]) -> str:
+    """Formata um valor em reais, por exemplo `R$ 1.234,50`."""
+    if amount is None:
+        return "-"
+    text = f"{Decimal(amount):,.2f}"
+    return "R$ " + text.replace(",", "_").replace(".", ",").replace("_", ".")
+
+
+def contract_card(contract: Contract) -> dict[str, Any]:
+    """Valores do card de um contrato."""
+    end_date = contract.end_date
+    return {
+        "id": contract.entity_id,
+        "number": contract.number,
+        "title": contract.title,
+        "subject": contract.subject,
+        "contract_type": contract.contract_type.value,
+        "status": contract.status.value,
+        "amount": format_brl(contract.amount),
+        "start_date": contract.start_date.strftime("%d/%m/%Y"),
+        "end_date": end_date.strftime("%d/%m/%Y") if end_date else "-",
+        "version": contract.version,
+    }
+
+
+def contract_summary(contracts: list[Contract]) -> dict[str, Any]:
+    """Contagem por status e valor total dos contratos ativos."""
+    counts = Counter(contract.status for contract in contracts)
+    active_amount = sum(
+        (
+            contract.amount
+            for contract in contracts
+            if contract.status == ContractStatus.ACTIVE
+        ),
+        Decimal(0),
+    )
+    values: dict[str, Any] = {
+        status.name.lower(): counts[status] for status in ContractStatus
+    }
+    values["total"] = len(contracts)
+    values["active_amount"] = format_brl(active_amount)
+    return values
+
+
+def contract_listing(repository: IContractRepository) -> Listing:
+    """Listagem de contratos."""
+    return Listing(
+        name="contracts",
+        title="Contratos",
+        repository=repository,
+        card_template="contract_card.html",
+        summary_template="contract_summary.html",
+        card_values=contract_card,
+        summary_values=contract_summary,
+        templates=TEMPLATES,
+    )
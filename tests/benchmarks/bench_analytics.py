@@ -0,0 +1,37 @@
+"""Benchmarks da agregação de valores de contratos (extra `analytics`)."""
+
+from collections import defaultdict
+from decimal import Decimal
+
+from src.document_types.contract.application.services.analytics import (
+    ContractAmountFrame,
+)
+from tests.benchmarks.bench_contract import make_contracts
+from tests.benchmarks.harness import benchmark
+
+FIELDS = ("department_id", "contract_type")
+
+
+@benchmark("contract.amounts.decimal_loop", scaled=True)
+def bench_amounts_decimal_loop(scale: int):
+    contracts = make_contracts(scale)
+
+    def run():
+        totals: dict[tuple, list] = defaultdict(lambda: [0, Decimal(0)])
+        for contract in contracts:
+            item = totals[(contract.department_id, contract.contract_type)]
+            item[0] += 1
+            item[1] += contract.amount
+        return totals
+
+    return run, 1
+
+
+@benchmark("contract.amounts.vectorized", scaled=True)
+def bench_amounts_vectorized(scale: int):
+    frame = ContractAmountFrame.from_contracts(make_contracts(scale))
+
+    def run():
+        return frame.group_by(*FIELDS)
+
+    return run, 1
@@ -0,0 +1,160 @@
+"""Benchmarks do armazenamento de arquivos por blocos.
+
+Registra na suíte a vazão da divisão em blocos; como cada operação é um
+MiB, `ops_per_sec` é a vazão em MiB/s. Executado diretamente, mede também
+a taxa de deduplicação em cadeias de versões de um mesmo arquivo.
+
+Uso:
+    python -m tests.benchmarks.bench_blob --size-mib 16 --versions 10
+"""
+
+import argparse
+import io
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Iterator
+
+from src.core.infrastucture.persistence.blob_store import (
+    ChunkedBlobStore,
+    FileSystemBlobStore,
+)
+from src.core.infrastucture.persistence.chunking import Chunker, np
+from tests.benchmarks.bench_domain import SEED
+from tests.benchmarks.harness import benchmark
+
+MIB = 1 << 20
+CHUNKING_MIB = 16
+PURE_PYTHON_MIB = 2
+
+
+def make_file(rng: random.Random, size: int) -> bytes:
+    """
+    Conteúdo com a cara de um PDF: trechos de texto repetitivo
+    intercalados com trechos incompressíveis (imagens e fontes).
+    """
+    words = [b"contrato", b"clausula", b"parte", b"valor", b"prazo", b"obj"]
+    parts = []
+    total = 0
+    while total < size:
+        if rng.random() < 0.5:
+            part = b" ".join(rng.choices(words, k=rng.randint(500, 5_000)))
+        else:
+            part = rng.randbytes(rng.randint(8_000, 200_000))
+        parts.append(part)
+        total += len(part)
+    return b"".join(parts)[:size]
+
+
+def edit(rng: random.Random, content: bytes) -> bytes:
+    """
+    Uma nova versão do arquivo: atualização incremental no fim (como um
+    PDF salvo de novo) ou alterações pontuais no meio.
+    """
+    kind = rng.choice(("append", "insert", "replace", "delete"))
+    if kind == "append":
+        return content + rng.randbytes(rng.randint(1_000, 50_000))
+    position = rng.randrange(len(content))
+    length = rng.randint(10, 5_000)
+    if kind == "insert":
+        return content[:position] + rng.randbytes(length) + content[position:]
+    if kind == "replace":
+        return (
+            content[:position]
+            + rng.randbytes(length)
+            + content[position + length :]
+        )
+    return content[:position] + content[position + length :]
+
+
+def version_chain(seed: int, size: int, versions: int) -> Iterator[bytes]:
+    """Versões sucessivas de um arquivo, com poucas edições entre elas."""
+    rng = random.Random(seed)
+    content = make_file(rng, size)
+    yield content
+    for _ in range(versions - 1):
+        for _ in range(rng.randint(1, 3)):
+            content = edit(rng, content)
+        yield content
+
+
+def _chunking(chunker: Chunker, mib: int):
+    content = make_file(random.Random(SEED), mib * MIB)
+
+    def run():
+        for _ in chunker.chunks(io.BytesIO(content)):
+            pass
+
+    return run, mib
+
+
+@benchmark("blob.chunking")
+def bench_chunking(_: int):
+    return _chunking(Chunker(), CHUNKING_MIB)
+
+
+@benchmark("blob.chunking.pure_python")
+def bench_chunking_pure_python(_: int):
+    return _chunking(Chunker(vectorized=False), PURE_PYTHON_MIB)
+
+
+def stored_bytes(root: Path) -> int:
+    """Bytes ocupados pelos arquivos de um armazenamento."""
+    return sum(
+        path.stat().st_size for path in root.rglob("*") if path.is_file()
+    )
+
+
+def put_all(store, versions: list[bytes]) -> float:
+    """Grava as versões e retorna o tempo gasto, em segundos."""
+    start = time.perf_counter()
+    for content in versions:
+        store.put(io.BytesIO(content))
+    return time.perf_counter() - start
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Ponto de entrada da linha de comando."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seed", type=int, default=SEED)
+    parser.add_argument("--size-mib", type=int, default=16)
+    parser.add_argument("--versions", type=int, default=10)
+    parser.add_argument("--chains", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    print(f"NumPy: {'sim' if np is not None else 'não'}")
+    run, mib = _chunking(Chunker(), args.size_mib)
+    start = time.perf_counter()
+    run()
+    speed = mib / (time.perf_counter() - start)
+    print(f"{'divisão em blocos':<20} {speed:>8.1f} MiB/s")
+
+    chains = [
+        list(
+            version_chain(
+                args.seed + chain, args.size_mib * MIB, args.versions
+            )
+        )
+        for chain in range(args.chains)
+    ]
+    logical = sum(len(content) for chain in chains for content in chain)
+    stores = {
+        "arquivo inteiro": FileSystemBlobStore,
+        "blocos (FastCDC)": ChunkedBlobStore,
+    }
+    for name, factory in stores.items():
+        with tempfile.TemporaryDirectory() as root:
+            store = factory(Path(root), durable=False)
+            elapsed = sum(put_all(store, chain) for chain in chains)
+            ratio = logical / stored_bytes(store.root)
+            print(
+                f"{name:<20} {logical / MIB / elapsed:>8.1f} MiB/s "
+                f"deduplicação {ratio:>6.2f}x"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
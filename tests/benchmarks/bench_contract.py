@@ -0,0 +1,150 @@
+"""Benchmarks dos caminhos críticos de contratos."""
+
+import random
+from datetime import date, timedelta
+from decimal import Decimal
+
+from src.core.domain.value_objects.doc_types import DocumentType
+from src.document_types.contract.application.services.renewal import (
+    ContractRenewalScheduler,
+)
+from src.document_types.contract.domain.entities.contract import Contract
+from src.document_types.contract.domain.value_object import ContractStatus
+from src.document_types.contract.infrastructure.persistence.repository import (
+    InMemoryContractRepository,
+)
+from tests.benchmarks.bench_domain import SEED, uuid_factory
+from tests.benchmarks.harness import benchmark
+
+DEPARTMENTS = 20
+FOLDERS = 200
+PARTIES = 5_000
+# Fração dos contratos que vence no dia do job noturno.
+DUE_FRACTION = 0.001
+AS_OF = date(2025, 1, 1)
+# Janela da consulta "vencendo nos próximos N dias".
+ENDING_WINDOW = timedelta(days=30)
+
+
+def make_contracts(count: int) -> list[Contract]:
+    """Cria contratos determinísticos com vigências espalhadas."""
+    new_uuid = uuid_factory(SEED + 1)
+    rng = random.Random(SEED)
+    tenant_id, user_id = new_uuid(), new_uuid()
+    departments = [new_uuid() for _ in range(DEPARTMENTS)]
+    folders = [new_uuid() for _ in range(FOLDERS)]
+    parties = [new_uuid() for _ in range(PARTIES)]
+    contracts = []
+    for number in range(count):
+        start = date(2023, 1, 1) + timedelta(days=rng.randrange(730))
+        if rng.random() < DUE_FRACTION:
+            end = AS_OF
+        else:
+            end = AS_OF + timedelta(days=rng.randrange(1, 1_000))
+        contracts.append(
+            Contract(
+                title=f"Contrato {number}",
+                document_type=DocumentType.CONTRACT,
+                user_id=user_id,
+                tenant_id=tenant_id,
+                subject=f"Objeto {number}",
+                description=f"Descrição do contrato {number}",
+                amount=Decimal(rng.randrange(10_000, 10_000_000)) / 100,
+                number=number,
+                department_id=rng.choice(departments),
+                folder_id=rng.choice(folders),
+                parts_id=rng.sample(parties, rng.randint(1, 4)),
+                start_date=start,
+                end_date=end,
+                automatic_renewal=rng.random() < 0.5,
+                status=ContractStatus.ACTIVE,
+                entity_id=new_uuid(),
+            )
+        )
+    return contracts
+
+
+@benchmark("contract.renewal_due.scan", scaled=True)
+def bench_renewal_scan(scale: int):
+    contracts = make_contracts(scale)
+
+    def run():
+        return [
+            contract
+            for contract in contracts
+            if contract.status == ContractStatus.ACTIVE
+            and contract.automatic_renewal
+            and contract.end_date
+            and contract.end_date <= AS_OF
+        ]
+
+    return run, 1
+
+
+@benchmark("contract.renewal_due.scheduler", scaled=True)
+def bench_renewal_scheduler(scale: int):
+    scheduler = ContractRenewalScheduler(make_contracts(scale))
+
+    def run():
+        return scheduler.pop_due(AS_OF)
+
+    return run, 1
+
+
+@benchmark("contract.ending_soon.scan", scaled=True)
+def bench_ending_soon_scan(scale: int):
+    contracts = make_contracts(scale)
+    department_id = contracts[0].department_id
+    until = AS_OF + ENDING_WINDOW
+
+    def run():
+        return [
+            contract
+            for contract in contracts
+            if contract.department_id == department_id
+            and AS_OF <= contract.end_date <= until
+        ]
+
+    return run, 1
+
+
+@benchmark("contract.ending_soon.index", scaled=True)
+def bench_ending_soon_index(scale: int):
+    repository = InMemoryContractRepository(partition_by="department_id")
+    contracts = make_contracts(scale)
+    for contract in contracts:
+        repository.save(contract)
+    department_id = contracts[0].department_id
+    until = AS_OF + ENDING_WINDOW
+
+    def run():
+        return repository.get_ending_between(AS_OF, until, department_id)
+
+    return run, 1
+
+
+@benchmark("contract.by_party.scan", scaled=True)
+def bench_by_party_scan(scale: int):
+    contracts = make_contracts(scale)
+    party_id = contracts[0].parts_id[0]
+
+    def run():
+        return [
+            contract for contract in contracts if party_id in contract.parts_id
+        ]
+
+    return run, 1
+
+
+@benchmark("contract.by_party.index", scaled=True)
+def bench_by_party_index(scale: int):
+    repository = InMemoryContractRepository()
+    contracts = make_contracts(scale)
+    for contract in contracts:
+        repository.save(contract)
+    party_id = contracts[0].parts_id[0]
+
+    def run():
+        return repository.get_by_party(party_id, limit=50)
+
+    return run, 1
@@ -0,0 +1,196 @@
+"""Benchmarks dos caminhos críticos do domínio e dos repositórios."""
+
+import random
+from datetime import date
+from decimal import Decimal
+from uuid import UUID
+
+from src.core.domain.entities.base import DomainEvent
+from src.core.domain.entities.document import Document
+from src.core.domain.entities.tenant import Tenant
+from src.core.domain.value_objects.doc_types import DocumentType
+from src.core.infrastucture.persistence.document import (
+    InMemoryDocumentRepository,
+)
+from src.document_types.contract.domain.entities.contract import Contract
+from tests.benchmarks.harness import benchmark
+
+SEED = 2024
+DOCUMENTS_PER_TENANT = 100
+EVENTS_PER_ENTITY = 10
+
+
+def uuid_factory(seed: int = SEED):
+    """Gera UUIDs determinísticos."""
+    rng = random.Random(seed)
+    return lambda: UUID(int=rng.getrandbits(128), version=4)
+
+
+def make_documents(count: int) -> list[Document]:
+    """Cria documentos distribuídos uniformemente entre tenants."""
+    new_uuid = uuid_factory()
+    tenants = [
+        new_uuid() for _ in range(max(1, count // DOCUMENTS_PER_TENANT))
+    ]
+    user_id = new_uuid()
+    types = list(DocumentType)
+    return [
+        Document(
+            title=f"Documento {index}",
+            user_id=user_id,
+            document_type=types[index % len(types)],
+            tenant_id=tenants[index % len(tenants)],
+            entity_id=new_uuid(),
+        )
+        for index in range(count)
+    ]
+
+
+def make_repository(count: int):
+    """Cria um repositório populado e os seus documentos."""
+    documents = make_documents(count)
+    repository = InMemoryDocumentRepository()
+    for document in documents:
+        repository.save(document)
+    return repository, documents
+
+
+@benchmark("document.construct")
+def bench_document_construct(n: int):
+    new_uuid = uuid_factory()
+    user_id, tenant_id = new_uuid(), new_uuid()
+
+    def run():
+        for _ in range(n):
+            Document(
+                title="Documento",
+                user_id=user_id,
+                document_type=DocumentType.REPORT,
+                tenant_id=tenant_id,
+            )
+
+    return run, n
+
+
+@benchmark("tenant.construct")
+def bench_tenant_construct(n: int):
+    user_id = uuid_factory()()
+
+    def run():
+        for _ in range(n):
+            Tenant(
+                name="Empresa",
+                description="Descrição",
+                logo="logo.png",
+                user_id=user_id,
+            )
+
+    return run, n
+
+
+@benchmark("contract.construct")
+def bench_contract_construct(n: int):
+    new_uuid = uuid_factory()
+    user_id, tenant_id = new_uuid(), new_uuid()
+    department_id, folder_id = new_uuid(), new_uuid()
+    parts = [new_uuid(), new_uuid()]
+    start = date(2024, 1, 1)
+
+    def run():
+        for number in range(n):
+            Contract(
+                title="Contrato",
+                document_type=DocumentType.CONTRACT,
+                user_id=user_id,
+                tenant_id=tenant_id,
+                subject="Prestação de serviços",
+                description="Contrato de prestação de serviços",
+                amount=Decimal("1500.00"),
+                number=number,
+                department_id=department_id,
+                folder_id=folder_id,
+                parts_id=parts,
+                start_date=start,
+                end_date=None,
+                automatic_renewal=True,
+            )
+
+    return run, n
+
+
+@benchmark("document.update_attribute")
+def bench_update_attribute(n: int):
+    document = make_documents(1)[0]
+    user_id = document.user_id
+    titles = ("Título A", "Título B")
+
+    def run():
+        for index in range(n):
+            document.update_attribute("title", titles[index & 1], user_id)
+        document.clear_domain_events()
+
+    return run, n
+
+
+@benchmark("domain_event.create")
+def bench_domain_event_create(n: int):
+    data = {"document_id": "1", "user_id": "2"}
+
+    def run():
+        for _ in range(n):
+            DomainEvent("document_updated", data)
+
+    return run, n
+
+
+@benchmark("entity.get_domain_events")
+def bench_get_domain_events(n: int):
+    document = make_documents(1)[0]
+    for _ in range(EVENTS_PER_ENTITY):
+        document.add_domain_event(DomainEvent("evento", {}))
+
+    def run():
+        for _ in range(n):
+            document.get_domain_events()
+
+    return run, n
+
+
+@benchmark("repository.save", scaled=True)
+def bench_repository_save(scale: int):
+    documents = make_documents(scale)
+
+    def run():
+        repository = InMemoryDocumentRepository()
+        for document in documents:
+            repository.save(document)
+
+    return run, scale
+
+
+@benchmark("repository.get", scaled=True)
+def bench_repository_get(scale: int):
+    repository, documents = make_repository(scale)
+    rng = random.Random(SEED)
+    ids = [document.entity_id for document in documents]
+    lookups = [rng.choice(ids) for _ in range(min(scale, 100_000))]
+
+    def run():
+        for document_id in lookups:
+            repository.get(document_id)
+
+    return run, len(lookups)
+
+
+@benchmark("repository.query_by_tenant", scaled=True)
+def bench_repository_query(scale: int):
+    repository, documents = make_repository(scale)
+    tenants = sorted({document.tenant_id for document in documents})
+    rng = random.Random(SEED)
+    queries = [rng.choice(tenants) for _ in range(1_000)]
+
+    def run():
+        for tenant_id in queries:
+            repository.get_by_tenant_id(tenant_id)
+
+    return run, len(queries)
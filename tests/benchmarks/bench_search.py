@@ -0,0 +1,173 @@
+"""Benchmarks da busca textual.
+
+Registra na suíte a indexação e as consultas BM25 sobre um corpus
+sintético com vocabulário de distribuição Zipf (poucas palavras muito
+frequentes, muitas raras). Executado diretamente, mede a latência das
+consultas (mediana e p99) em um índice do tamanho pedido e o tempo das
+sugestões por prefixo sobre o mesmo número de títulos.
+
+Uso:
+    python -m tests.benchmarks.bench_search --documents 1000000
+"""
+
+import argparse
+import itertools
+import random
+import statistics
+import sys
+import time
+
+from src.core.infrastucture.search.inverted_index import InvertedIndex
+from src.core.infrastucture.search.postings import np
+from src.core.infrastucture.search.prefix_index import PrefixIndex
+from tests.benchmarks.bench_domain import SEED
+from tests.benchmarks.harness import benchmark
+
+QUERY_DOCUMENTS = 20_000
+INDEX_DOCUMENTS = 5_000
+TYPEAHEAD_TITLES = 100_000
+
+WORDS = (
+    "contrato locação imóvel serviço prestação aditivo cláusula prazo "
+    "valor reajuste multa rescisão garantia pagamento fornecimento "
+    "manutenção consultoria jurídica licença software obra reforma seguro "
+    "frota veículo limpeza vigilância energia água telefonia"
+).split()
+VOCABULARY = WORDS + [f"termo{number}" for number in range(50_000)]
+_CUMULATIVE = list(
+    itertools.accumulate(1 / rank for rank in range(1, len(VOCABULARY) + 1))
+)
+
+PREFIXES = ("c", "con", "contrato l", "loca", "term", "termo12", "xyz")
+
+QUERIES = (
+    "contrato",
+    "locação imóvel",
+    "reajuste multa rescisão",
+    "termo100",
+    "contrato serviço prestação",
+)
+
+
+def make_corpus(count: int, seed: int = SEED) -> list[list[tuple[str, int]]]:
+    """Campos (título e descrição, com pesos) de `count` documentos."""
+    rng = random.Random(seed)
+
+    def text(size: int) -> str:
+        return " ".join(
+            rng.choices(VOCABULARY, cum_weights=_CUMULATIVE, k=size)
+        )
+
+    return [[(text(6), 3), (text(25), 1)] for _ in range(count)]
+
+
+def make_index(corpus, vectorized: bool) -> InvertedIndex:
+    """Índice com o corpus, já aquecido (termos frequentes em cache)."""
+    index = InvertedIndex(vectorized)
+    for number, fields in enumerate(corpus):
+        index.add(number, fields)
+    for query in QUERIES:
+        index.search(query)
+    return index
+
+
+@benchmark("search.index")
+def bench_search_index(_: int):
+    corpus = make_corpus(INDEX_DOCUMENTS)
+
+    def run():
+        index = InvertedIndex()
+        for number, fields in enumerate(corpus):
+            index.add(number, fields)
+
+    return run, INDEX_DOCUMENTS
+
+
+def _query(vectorized: bool):
+    index = make_index(make_corpus(QUERY_DOCUMENTS), vectorized)
+
+    def run():
+        for query in QUERIES:
+            index.search(query)
+
+    return run, len(QUERIES)
+
+
+@benchmark("search.query")
+def bench_search_query(_: int):
+    return _query(np is not None)
+
+
+@benchmark("search.query.pure_python")
+def bench_search_query_pure_python(_: int):
+    return _query(False)
+
+
+def make_titles(count: int, seed: int = SEED) -> list[str]:
+    """Títulos curtos com o vocabulário do corpus."""
+    rng = random.Random(seed)
+    return [
+        " ".join(rng.choices(VOCABULARY, cum_weights=_CUMULATIVE, k=4))
+        for _ in range(count)
+    ]
+
+
+@benchmark("search.typeahead")
+def bench_search_typeahead(_: int):
+    index = PrefixIndex()
+    for number, title in enumerate(make_titles(TYPEAHEAD_TITLES)):
+        index.set(number, title)
+
+    def run():
+        for prefix in PREFIXES:
+            index.complete(prefix)
+
+    return run, len(PREFIXES)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Ponto de entrada da linha de comando."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seed", type=int, default=SEED)
+    parser.add_argument("--documents", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    print(f"NumPy: {'sim' if np is not None else 'não'}")
+    corpus = make_corpus(args.documents, args.seed)
+    start = time.perf_counter()
+    index = make_index(corpus, np is not None)
+    elapsed = time.perf_counter() - start
+    print(
+        f"indexação: {args.documents / elapsed:,.0f} documentos/s, "
+        f"{index.posting_bytes / index.postings:.2f} bytes por ocorrência"
+    )
+    for query in QUERIES:
+        times = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            index.search(query)
+            times.append((time.perf_counter() - start) * 1000)
+        times.sort()
+        print(
+            f"{query:<30} mediana {statistics.median(times):>7.2f} ms "
+            f"p99 {times[int(len(times) * 0.99) - 1]:>7.2f} ms"
+        )
+
+    index = PrefixIndex()
+    for number, title in enumerate(make_titles(args.documents, args.seed)):
+        index.set(number, title)
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        for prefix in PREFIXES:
+            index.complete(prefix)
+    elapsed = time.perf_counter() - start
+    print(
+        f"{'sugestões (10 por prefixo)':<30} "
+        f"{elapsed * 1e6 / args.repeat / len(PREFIXES):>7.1f} µs"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
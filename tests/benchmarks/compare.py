@@ -0,0 +1,117 @@
+"""Compara resultados de benchmarks com uma baseline.
+
+Uso:
+    python -m tests.benchmarks.compare \\
+        tests/benchmarks/baselines/domain.json bench_output.json \\
+        --threshold 0.15
+
+Retorna código 1 quando algum benchmark ficou mais lento que a baseline
+além do limite (fração do tempo por operação).
+"""
+
+import argparse
+import json
+import sys
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from tests.benchmarks.harness import load_results
+
+DEFAULT_THRESHOLD = 0.15
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """Comparação de um benchmark com a baseline."""
+
+    key: str
+    baseline_ns: float
+    current_ns: float
+    ratio: float
+    regression: bool
+    improvement: bool
+
+
+def compare(
+    baseline: dict, current: dict, threshold: float = DEFAULT_THRESHOLD
+) -> list[Comparison]:
+    """
+    Compara dois documentos de resultados.
+
+    Args:
+        baseline (dict): Resultados de referência.
+        current (dict): Resultados atuais.
+        threshold (float): Variação relativa tolerada.
+
+    Returns:
+        list[Comparison]: Comparações dos benchmarks presentes em ambos.
+    """
+    comparisons = []
+    for key, base in sorted(baseline["results"].items()):
+        now = current["results"].get(key)
+        if now is None:
+            continue
+        ratio = now["ns_per_op"] / base["ns_per_op"]
+        comparisons.append(
+            Comparison(
+                key=key,
+                baseline_ns=base["ns_per_op"],
+                current_ns=now["ns_per_op"],
+                ratio=ratio,
+                regression=ratio > 1 + threshold,
+                improvement=ratio < 1 - threshold,
+            )
+        )
+    return comparisons
+
+
+def render(comparisons: list[Comparison]) -> str:
+    """Monta o relatório textual da comparação."""
+    lines = [
+        f"{'benchmark':<42} {'baseline':>12} {'atual':>12} {'razão':>7}",
+    ]
+    for item in comparisons:
+        flag = ""
+        if item.regression:
+            flag = "  REGRESSÃO"
+        elif item.improvement:
+            flag = "  melhoria"
+        lines.append(
+            f"{item.key:<42} {item.baseline_ns:>12.1f} "
+            f"{item.current_ns:>12.1f} {item.ratio:>7.2f}{flag}"
+        )
+    regressions = sum(item.regression for item in comparisons)
+    lines.append(f"{regressions} regressão(ões) em {len(comparisons)}.")
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Ponto de entrada da linha de comando."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("current", type=Path)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument(
+        "--json",
+        type=Path,
+        default=None,
+        help="grava a comparação em JSON neste caminho",
+    )
+    args = parser.parse_args(argv)
+
+    comparisons = compare(
+        load_results(args.baseline),
+        load_results(args.current),
+        args.threshold,
+    )
+    print(render(comparisons))
+    if args.json:
+        args.json.write_text(
+            json.dumps([asdict(item) for item in comparisons], indent=2),
+            encoding="utf-8",
+        )
+    return 1 if any(item.regression for item in comparisons) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
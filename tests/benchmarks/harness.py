@@ -0,0 +1,173 @@
+"""Infraestrutura mínima para os benchmarks.
+
+Cada benchmark registra uma função de preparação que recebe o tamanho
+(escala) e devolve `(run, ops)`: `run()` executa `ops` operações e é
+cronometrada algumas vezes, guardando o melhor tempo. Os resultados são
+gravados em JSON para comparação com as baselines.
+"""
+
+import gc
+import json
+import platform
+import sys
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Iterable, Optional
+
+SCHEMA_VERSION = 1
+
+Setup = Callable[[int], tuple[Callable[[], object], int]]
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    """Benchmark registrado.
+
+    Attributes:
+        name (str): Nome do benchmark.
+        setup (Setup): Função de preparação.
+        scaled (bool): Se o benchmark é executado em cada escala.
+    """
+
+    name: str
+    setup: Setup
+    scaled: bool
+
+
+@dataclass(frozen=True)
+class Result:
+    """Resultado de um benchmark em uma escala."""
+
+    name: str
+    scale: int
+    ops: int
+    seconds: float
+    ns_per_op: float
+    ops_per_sec: float
+
+    @property
+    def key(self) -> str:
+        """Chave usada para comparar com a baseline."""
+        return f"{self.name}@{self.scale}"
+
+
+REGISTRY: dict[str, Benchmark] = {}
+
+
+def benchmark(name: str, scaled: bool = False) -> Callable[[Setup], Setup]:
+    """Registra uma função de preparação como benchmark."""
+
+    def decorator(setup: Setup) -> Setup:
+        REGISTRY[name] = Benchmark(name, setup, scaled)
+        return setup
+
+    return decorator
+
+
+def measure(bench: Benchmark, scale: int, repeat: int) -> Result:
+    """
+    Executa um benchmark e retorna o melhor tempo entre as repetições.
+
+    Args:
+        bench (Benchmark): Benchmark a ser executado.
+        scale (int): Escala (ou número de iterações).
+        repeat (int): Quantidade de repetições.
+    """
+    best = float("inf")
+    ops = 0
+    for _ in range(repeat):
+        run, ops = bench.setup(scale)
+        gc.collect()
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            run()
+            elapsed = time.perf_counter() - start
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        best = min(best, elapsed)
+        del run
+    return Result(
+        name=bench.name,
+        scale=scale,
+        ops=ops,
+        seconds=best,
+        ns_per_op=best * 1e9 / ops,
+        ops_per_sec=ops / best if best else float("inf"),
+    )
+
+
+def run_all(
+    scales: Iterable[int],
+    iterations: int,
+    repeat: int,
+    only: Optional[str] = None,
+    progress: Optional[Callable[[Result], None]] = None,
+) -> list[Result]:
+    """Executa todos os benchmarks registrados (filtrados por `only`)."""
+    results = []
+    for bench in REGISTRY.values():
+        if only and only not in bench.name:
+            continue
+        for scale in scales if bench.scaled else [iterations]:
+            # Escalas muito grandes são caras demais para várias
+            # repetições; uma execução já domina o ruído.
+            times = 1 if scale >= 1_000_000 else repeat
+            result = measure(bench, scale, times)
+            results.append(result)
+            if progress:
+                progress(result)
+    return results
+
+
+def to_document(results: list[Result]) -> dict:
+    """Monta o documento JSON dos resultados."""
+    return {
+        "schema": SCHEMA_VERSION,
+        "meta": {
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+        },
+        "results": {result.key: asdict(result) for result in results},
+    }
+
+
+def write_results(
+    results: list[Result], path: Path, merge: bool = False
+) -> None:
+    """
+    Grava os resultados em JSON.
+
+    Args:
+        results (list[Result]): Resultados a gravar.
+        path (Path): Arquivo de saída.
+        merge (bool): Preserva os resultados já gravados no arquivo que
+            não foram executados agora.
+    """
+    document = to_document(results)
+    if merge and path.exists():
+        previous = load_results(path)["results"]
+        document["results"] = {**previous, **document["results"]}
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps(document, indent=2, sort_keys=True) + "\n",
+        encoding="utf-8",
+    )
+
+
+def load_results(path: Path) -> dict:
+    """Lê um arquivo de resultados ou baseline."""
+    document = json.loads(Path(path).read_text(encoding="utf-8"))
+    if document.get("schema") != SCHEMA_VERSION:
+        raise ValueError(
+            f"Versão de esquema não suportada em '{path}': "
+            f"{document.get('schema')}"
+        )
+    return document
@@ -0,0 +1,263 @@
+"""Reproduz uma carga sintética através dos casos de uso.
+
+As operações são distribuídas entre os workers pelo ID do documento, o
+que preserva a ordem das operações de cada documento (uma atualização
+nunca passa na frente da criação do mesmo documento) e mantém a carga
+balanceada entre os workers.
+
+Uso:
+    python -m tests.benchmarks.replay --documents 100000 \\
+        --operations 50000 --concurrency 8 --json replay.json
+"""
+
+import argparse
+import json
+import sys
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Optional
+
+from src.core.application.services.document_service import DocumentService
+from src.core.application.use_cases.create_document import (
+    CreateDocumentUseCase,
+)
+from src.core.application.use_cases.document.change_status import (
+    ChangeDocumentStatusUseCase,
+)
+from src.core.application.use_cases.document.update import (
+    UpdateDocumentAttributeUseCase,
+)
+from src.core.infrastucture.persistence.document import (
+    InMemoryDocumentRepository,
+)
+from src.core.infrastucture.persistence.tenant import (
+    InMemoryTenantRepository,
+)
+from tests.benchmarks.workload import (
+    CREATE,
+    UPDATE,
+    Dataset,
+    Operation,
+    WorkloadConfig,
+    build_entity,
+    generate,
+)
+
+PERCENTILES = (50, 90, 95, 99)
+
+
+@dataclass(frozen=True)
+class LatencySummary:
+    """Resumo das latências de um tipo de operação (em microssegundos)."""
+
+    count: int
+    errors: int
+    p50: float
+    p90: float
+    p95: float
+    p99: float
+    max: float
+
+
+@dataclass(frozen=True)
+class ReplayReport:
+    """Resultado de uma reprodução."""
+
+    operations: int
+    errors: int
+    concurrency: int
+    seconds: float
+    throughput: float
+    latency: dict[str, LatencySummary]
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Percentil pelo método do posto mais próximo."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def summarize(latencies: list[float], errors: int) -> LatencySummary:
+    """Resume uma lista de latências em nanossegundos."""
+    values = sorted(value / 1_000 for value in latencies)
+    points = {f"p{pct}": percentile(values, pct) for pct in PERCENTILES}
+    return LatencySummary(
+        count=len(values),
+        errors=errors,
+        max=values[-1] if values else 0.0,
+        **points,
+    )
+
+
+class ReplayDriver:
+    """Executa operações através dos casos de uso de documentos."""
+
+    def __init__(
+        self,
+        document_repository: Optional[InMemoryDocumentRepository] = None,
+        tenant_repository: Optional[InMemoryTenantRepository] = None,
+    ):
+        self.document_repository = (
+            document_repository or InMemoryDocumentRepository()
+        )
+        self.tenant_repository = (
+            tenant_repository or InMemoryTenantRepository()
+        )
+        self._service = DocumentService()
+        self._create = CreateDocumentUseCase()
+        self._update = UpdateDocumentAttributeUseCase(self.document_repository)
+        self._change_status = ChangeDocumentStatusUseCase(
+            self.document_repository
+        )
+
+    def load(self, dataset: Dataset) -> None:
+        """Carrega o conjunto de dados inicial nos repositórios."""
+        for tenant in dataset.tenants:
+            self.tenant_repository.save(tenant)
+        for document in dataset.documents:
+            self.document_repository.save(document)
+
+    def apply(self, operation: Operation) -> None:
+        """Executa uma operação."""
+        payload = operation.payload
+        if operation.kind == CREATE:
+            document = build_entity(payload["entity"], payload["kwargs"])
+            self._create.execute(
+                repository=self.document_repository,
+                service=self._service,
+                document=document,
+            )
+        elif operation.kind == UPDATE:
+            self._update.execute(
+                operation.document_id,
+                payload["attr"],
+                payload["value"],
+                operation.user_id,
+            )
+        else:
+            self._change_status.execute(
+                operation.document_id, payload["status"], operation.user_id
+            )
+
+    def _run_shard(
+        self, operations: list[Operation]
+    ) -> tuple[dict[str, list[float]], dict[str, int]]:
+        latencies: dict[str, list[float]] = defaultdict(list)
+        errors: dict[str, int] = defaultdict(int)
+        clock = time.perf_counter_ns
+        for operation in operations:
+            start = clock()
+            try:
+                self.apply(operation)
+            except Exception:  # pylint: disable=broad-exception-caught
+                errors[operation.kind] += 1
+                continue
+            latencies[operation.kind].append(clock() - start)
+        return latencies, errors
+
+    def replay(
+        self, operations: list[Operation], concurrency: int = 1
+    ) -> ReplayReport:
+        """
+        Executa as operações com a concorrência informada.
+
+        Args:
+            operations (list[Operation]): Operações da carga.
+            concurrency (int): Quantidade de workers.
+
+        Returns:
+            ReplayReport: Vazão e percentis de latência.
+        """
+        shards: list[list[Operation]] = [[] for _ in range(concurrency)]
+        for operation in operations:
+            shards[operation.document_id.int % concurrency].append(operation)
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            partials = list(executor.map(self._run_shard, shards))
+        seconds = time.perf_counter() - start
+
+        latencies: dict[str, list[float]] = defaultdict(list)
+        errors: dict[str, int] = defaultdict(int)
+        for shard_latencies, shard_errors in partials:
+            for kind, values in shard_latencies.items():
+                latencies[kind].extend(values)
+            for kind, count in shard_errors.items():
+                errors[kind] += count
+
+        summary = {
+            kind: summarize(latencies[kind], errors[kind])
+            for kind in sorted(set(latencies) | set(errors))
+        }
+        summary["all"] = summarize(
+            [value for values in latencies.values() for value in values],
+            sum(errors.values()),
+        )
+        return ReplayReport(
+            operations=len(operations),
+            errors=sum(errors.values()),
+            concurrency=concurrency,
+            seconds=seconds,
+            throughput=len(operations) / seconds if seconds else 0.0,
+            latency=summary,
+        )
+
+
+def render(report: ReplayReport) -> str:
+    """Monta o relatório textual da reprodução."""
+    lines = [
+        f"{report.operations} operações em {report.seconds:.2f}s "
+        f"({report.throughput:.0f} ops/s, {report.errors} erros, "
+        f"concorrência {report.concurrency})",
+        f"{'operação':<10} {'qtd':>8} "
+        + " ".join(f"{f'p{pct}':>9}" for pct in PERCENTILES)
+        + f" {'máx':>10}  (µs)",
+    ]
+    for kind, item in report.latency.items():
+        lines.append(
+            f"{kind:<10} {item.count:>8} "
+            + " ".join(
+                f"{getattr(item, f'p{pct}'):>9.1f}" for pct in PERCENTILES
+            )
+            + f" {item.max:>10.1f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Ponto de entrada da linha de comando."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--tenants", type=int, default=50)
+    parser.add_argument("--documents", type=int, default=10_000)
+    parser.add_argument("--operations", type=int, default=20_000)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--json", type=Path, default=None)
+    args = parser.parse_args(argv)
+
+    dataset, operations = generate(
+        WorkloadConfig(
+            seed=args.seed,
+            tenants=args.tenants,
+            documents=args.documents,
+            operations=args.operations,
+        )
+    )
+    driver = ReplayDriver()
+    driver.load(dataset)
+    report = driver.replay(operations, args.concurrency)
+    print(render(report))
+    if args.json:
+        args.json.write_text(
+            json.dumps(asdict(report), indent=2), encoding="utf-8"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
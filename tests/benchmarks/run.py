@@ -0,0 +1,71 @@
+"""Executa a suíte de benchmarks e grava os resultados em JSON.
+
+Uso:
+    python -m tests.benchmarks.run --output bench_output.json
+    python -m tests.benchmarks.run --scales 10000 100000 --only repository
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Os módulos de benchmark registram os casos ao serem importados.
+from tests.benchmarks import (  # noqa: F401  pylint: disable=unused-import
+    bench_blob,
+    bench_contract,
+    bench_domain,
+    bench_search,
+)
+from tests.benchmarks.harness import Result, run_all, write_results
+
+try:
+    from tests.benchmarks import (  # noqa: F401  pylint: disable=C0412,W0611
+        bench_analytics,
+    )
+except ImportError:  # extra `analytics` (numpy) não instalado
+    pass
+
+DEFAULT_SCALES = (10_000, 100_000, 1_000_000)
+DEFAULT_ITERATIONS = 20_000
+
+
+def _print_result(result: Result) -> None:
+    print(
+        f"{result.key:<42} {result.ns_per_op:>12.1f} ns/op "
+        f"{result.ops_per_sec:>14.0f} ops/s",
+        file=sys.stderr,
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Ponto de entrada da linha de comando."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--scales", type=int, nargs="+", default=list(DEFAULT_SCALES)
+    )
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--only", default=None)
+    parser.add_argument(
+        "--output", type=Path, default=Path("bench_output.json")
+    )
+    parser.add_argument(
+        "--merge",
+        action="store_true",
+        help="mantém no arquivo de saída os resultados não executados",
+    )
+    args = parser.parse_args(argv)
+
+    results = run_all(
+        scales=args.scales,
+        iterations=args.iterations,
+        repeat=args.repeat,
+        only=args.only,
+        progress=_print_result,
+    )
+    write_results(results, args.output, merge=args.merge)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,32 @@
+"""Testes para o relatório de comparação dos benchmarks."""
+
+from tests.benchmarks.compare import compare, render
+
+
+def _document(values: dict[str, float]) -> dict:
+    return {
+        "schema": 1,
+        "results": {
+            key: {"ns_per_op": value} for key, value in values.items()
+        },
+    }
+
+
+def test_compare_flags_regressions_beyond_threshold():
+    """Testa a marcação de regressões e melhorias."""
+    baseline = _document({"a@1": 100.0, "b@1": 100.0, "c@1": 100.0})
+    current = _document({"a@1": 130.0, "b@1": 105.0, "c@1": 50.0})
+
+    comparisons = {item.key: item for item in compare(baseline, current, 0.2)}
+
+    assert comparisons["a@1"].regression is True
+    assert comparisons["b@1"].regression is False
+    assert comparisons["c@1"].improvement is True
+
+
+def test_compare_ignores_missing_benchmarks():
+    """Testa que benchmarks ausentes no resultado atual são ignorados."""
+    comparisons = compare(_document({"a@1": 1.0}), _document({}))
+
+    assert not comparisons
+    assert "0 regressão(ões) em 0." in render(comparisons)
@@ -0,0 +1,69 @@
+"""Testes para o gerador de carga e o driver de reprodução."""
+
+from collections import Counter
+
+from src.document_types.contract.domain.entities.contract import Contract
+from tests.benchmarks.replay import ReplayDriver, percentile
+from tests.benchmarks.workload import WorkloadConfig, generate
+
+CONFIG = WorkloadConfig(tenants=10, documents=500, operations=800)
+
+
+def test_generation_is_deterministic():
+    """Testa que a mesma semente gera as mesmas operações."""
+    first_dataset, first_ops = generate(CONFIG)
+    second_dataset, second_ops = generate(CONFIG)
+
+    assert [d.entity_id for d in first_dataset.documents] == [
+        d.entity_id for d in second_dataset.documents
+    ]
+    assert [(op.kind, op.document_id) for op in first_ops] == [
+        (op.kind, op.document_id) for op in second_ops
+    ]
+
+
+def test_dataset_shape():
+    """Testa o viés dos tenants e a presença de contratos com partes."""
+    dataset, operations = generate(CONFIG)
+
+    sizes = Counter(document.tenant_id for document in dataset.documents)
+    contracts = [d for d in dataset.documents if isinstance(d, Contract)]
+    assert max(sizes.values()) > 5 * min(sizes.values())
+    assert contracts and all(c.parts_id for c in contracts)
+    assert {op.kind for op in operations} == {"create", "update", "status"}
+    contract_ids = {contract.entity_id for contract in contracts} | {
+        op.document_id
+        for op in operations
+        if op.kind == "create" and op.payload["entity"] == "contract"
+    }
+    assert not any(
+        op.document_id in contract_ids
+        for op in operations
+        if op.kind == "status"
+    )
+
+
+def test_replay_runs_without_errors():
+    """Testa a reprodução concorrente através dos casos de uso."""
+    dataset, operations = generate(CONFIG)
+    driver = ReplayDriver()
+    driver.load(dataset)
+
+    report = driver.replay(operations, concurrency=4)
+
+    assert report.errors == 0
+    assert report.latency["all"].count == len(operations)
+    assert report.throughput > 0
+    created = sum(op.kind == "create" for op in operations)
+    assert driver.document_repository.count() == (
+        len(dataset.documents) + created
+    )
+
+
+def test_percentile_nearest_rank():
+    """Testa o cálculo de percentis."""
+    values = [float(value) for value in range(1, 101)]
+
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 99) == 99.0
+    assert percentile([], 50) == 0.0
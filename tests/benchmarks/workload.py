@@ -0,0 +1,312 @@
+"""Gerador determinístico de dados e de carga multi-tenant.
+
+Os dados imitam o formato de produção: tamanhos de tenant enviesados
+(Zipf), tipos de documento com distribuição Zipf, contratos com listas
+`parts_id` e uma mistura de operações de criação, atualização e mudança
+de status. Tudo é derivado de uma semente, de modo que a mesma
+configuração sempre gera as mesmas entidades e operações.
+"""
+
+import bisect
+import itertools
+import random
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Any, Optional
+from uuid import UUID
+
+from src.core.domain.entities.document import Document
+from src.core.domain.entities.tenant import Tenant
+from src.core.domain.value_objects.doc_status import DocumentStatus
+from src.core.domain.value_objects.doc_types import DocumentType
+from src.document_types.contract.domain.entities.contract import Contract
+from src.document_types.contract.domain.value_object import ContractType
+
+BASE_DATE = datetime(2024, 1, 1)
+
+CREATE = "create"
+UPDATE = "update"
+STATUS = "status"
+
+
+@dataclass(frozen=True)
+class WorkloadConfig:
+    """
+    Parâmetros do gerador.
+
+    Attributes:
+        seed (int): Semente do gerador pseudoaleatório.
+        tenants (int): Quantidade de tenants.
+        documents (int): Documentos pré-carregados (inclui contratos).
+        operations (int): Operações da carga.
+        tenant_skew (float): Expoente Zipf do tamanho dos tenants.
+        type_skew (float): Expoente Zipf dos tipos de documento.
+        contract_ratio (float): Fração de contratos entre os documentos.
+        max_parts (int): Máximo de partes por contrato.
+        parties_per_tenant (int): Contrapartes distintas por tenant.
+        mix (tuple[tuple[str, float], ...]): Pesos de cada operação.
+    """
+
+    seed: int = 42
+    tenants: int = 50
+    documents: int = 10_000
+    operations: int = 20_000
+    tenant_skew: float = 1.1
+    type_skew: float = 1.2
+    contract_ratio: float = 0.25
+    max_parts: int = 4
+    parties_per_tenant: int = 200
+    mix: tuple[tuple[str, float], ...] = (
+        (CREATE, 0.3),
+        (UPDATE, 0.5),
+        (STATUS, 0.2),
+    )
+
+
+@dataclass(frozen=True)
+class Operation:
+    """
+    Operação da carga.
+
+    Attributes:
+        kind (str): `create`, `update` ou `status`.
+        tenant_id (UUID): Tenant dono do documento.
+        document_id (UUID): Documento alvo.
+        user_id (UUID): Usuário que executa a operação.
+        payload (dict[str, Any]): Dados da operação. Em `create`, contém
+            `entity` ("document" ou "contract") e `kwargs` do construtor;
+            em `update`, `attr` e `value`; em `status`, `status`.
+    """
+
+    kind: str
+    tenant_id: UUID
+    document_id: UUID
+    user_id: UUID
+    payload: dict[str, Any] = field(hash=False)
+
+
+@dataclass
+class Dataset:
+    """Dados iniciais gerados."""
+
+    tenants: list[Tenant]
+    documents: list[Document]
+    users: dict[UUID, list[UUID]]
+    parties: dict[UUID, list[UUID]]
+
+
+class ZipfSampler:
+    """Amostra índices `0..n-1` com probabilidade proporcional a 1/k^s."""
+
+    def __init__(self, n: int, exponent: float, rng: random.Random):
+        weights = [1.0 / (rank**exponent) for rank in range(1, n + 1)]
+        self._cumulative = list(itertools.accumulate(weights))
+        self._total = self._cumulative[-1]
+        self._rng = rng
+
+    def sample(self) -> int:
+        """Retorna um índice amostrado."""
+        point = self._rng.random() * self._total
+        return bisect.bisect_right(self._cumulative, point)
+
+
+class WorkloadGenerator:
+    """Gera o conjunto de dados e a carga a partir de uma configuração."""
+
+    def __init__(self, config: Optional[WorkloadConfig] = None):
+        self.config = config or WorkloadConfig()
+        self._rng = random.Random(self.config.seed)
+        self._types = list(DocumentType)
+        self._tenant_sampler = ZipfSampler(
+            self.config.tenants, self.config.tenant_skew, self._rng
+        )
+        self._type_sampler = ZipfSampler(
+            len(self._types), self.config.type_skew, self._rng
+        )
+        self._sequence = itertools.count(1)
+        self._departments: dict[UUID, list[UUID]] = {}
+        self._folders: dict[UUID, list[UUID]] = {}
+
+    def _uuid(self) -> UUID:
+        return UUID(int=self._rng.getrandbits(128), version=4)
+
+    def _timestamp(self) -> datetime:
+        return BASE_DATE + timedelta(seconds=next(self._sequence))
+
+    def _document_kwargs(
+        self, tenant_id: UUID, user_id: UUID, parties: list[UUID]
+    ) -> tuple[str, dict[str, Any]]:
+        """Sorteia o tipo e monta os argumentos de um novo documento."""
+        number = next(self._sequence)
+        created_at = self._timestamp()
+        document_type = self._types[self._type_sampler.sample()]
+        is_contract = (
+            document_type == DocumentType.CONTRACT
+            or self._rng.random() < self.config.contract_ratio
+        )
+        if not is_contract:
+            return "document", {
+                "title": f"{document_type.value} {number}",
+                "user_id": user_id,
+                "document_type": document_type,
+                "tenant_id": tenant_id,
+                "entity_id": self._uuid(),
+                "created_at": created_at,
+                "updated_at": created_at,
+            }
+
+        start = date(2023, 1, 1) + timedelta(days=self._rng.randrange(730))
+        parts = self._rng.sample(
+            parties, self._rng.randint(1, self.config.max_parts)
+        )
+        return "contract", {
+            "title": f"Contrato {number}",
+            "document_type": DocumentType.CONTRACT,
+            "user_id": user_id,
+            "tenant_id": tenant_id,
+            "subject": f"Objeto do contrato {number}",
+            "description": f"Descrição do contrato {number}",
+            "amount": Decimal(self._rng.randrange(10_000, 10_000_000)) / 100,
+            "number": number,
+            "department_id": self._rng.choice(self._departments[tenant_id]),
+            "folder_id": self._rng.choice(self._folders[tenant_id]),
+            "parts_id": parts,
+            "start_date": start,
+            "end_date": start + timedelta(days=self._rng.choice([180, 365])),
+            "lgpd": self._rng.random() < 0.1,
+            "email_send": self._rng.random() < 0.3,
+            "automatic_renewal": self._rng.random() < 0.4,
+            "contract_type": self._rng.choice(list(ContractType)),
+            "entity_id": self._uuid(),
+            "created_at": created_at,
+            "updated_at": created_at,
+        }
+
+    def dataset(self) -> Dataset:
+        """Gera tenants, usuários, contrapartes e documentos iniciais."""
+        tenants = []
+        users: dict[UUID, list[UUID]] = {}
+        parties: dict[UUID, list[UUID]] = {}
+        for index in range(self.config.tenants):
+            owner = self._uuid()
+            tenant = Tenant(
+                name=f"Empresa {index + 1}",
+                description=f"Empresa sintética {index + 1}",
+                logo=f"logos/empresa-{index + 1}.png",
+                user_id=owner,
+                entity_id=self._uuid(),
+                created_at=BASE_DATE,
+                updated_at=BASE_DATE,
+            )
+            tenants.append(tenant)
+            users[tenant.entity_id] = [owner] + [
+                self._uuid() for _ in range(4)
+            ]
+            parties[tenant.entity_id] = [
+                self._uuid() for _ in range(self.config.parties_per_tenant)
+            ]
+            self._departments[tenant.entity_id] = [
+                self._uuid() for _ in range(7)
+            ]
+            self._folders[tenant.entity_id] = [self._uuid() for _ in range(31)]
+
+        documents = []
+        for _ in range(self.config.documents):
+            tenant = tenants[self._tenant_sampler.sample()]
+            entity, kwargs = self._document_kwargs(
+                tenant.entity_id,
+                self._rng.choice(users[tenant.entity_id]),
+                parties[tenant.entity_id],
+            )
+            documents.append(build_entity(entity, kwargs))
+        return Dataset(tenants, documents, users, parties)
+
+    def operations(self, dataset: Dataset) -> list[Operation]:
+        """Gera a sequência de operações sobre o conjunto de dados."""
+        kinds = [kind for kind, _ in self.config.mix]
+        weights = [weight for _, weight in self.config.mix]
+        by_tenant: dict[UUID, list[tuple[UUID, bool]]] = {}
+        # Contratos têm o próprio ciclo de status (`ContractStatus`): as
+        # mudanças de status sorteiam só entre os demais documentos.
+        plain_by_tenant: dict[UUID, list[UUID]] = {}
+        for document in dataset.documents:
+            is_contract = isinstance(document, Contract)
+            by_tenant.setdefault(document.tenant_id, []).append(
+                (document.entity_id, is_contract)
+            )
+            if not is_contract:
+                plain_by_tenant.setdefault(document.tenant_id, []).append(
+                    document.entity_id
+                )
+
+        operations = []
+        for _ in range(self.config.operations):
+            tenant = dataset.tenants[self._tenant_sampler.sample()]
+            tenant_id = tenant.entity_id
+            user_id = self._rng.choice(dataset.users[tenant_id])
+            existing = by_tenant.setdefault(tenant_id, [])
+            plain = plain_by_tenant.setdefault(tenant_id, [])
+            kind = self._rng.choices(kinds, weights)[0]
+            if (kind == UPDATE and not existing) or (
+                kind == STATUS and not plain
+            ):
+                kind = CREATE
+
+            if kind == CREATE:
+                entity, kwargs = self._document_kwargs(
+                    tenant_id, user_id, dataset.parties[tenant_id]
+                )
+                document_id = kwargs["entity_id"]
+                existing.append((document_id, entity == "contract"))
+                if entity != "contract":
+                    plain.append(document_id)
+                payload = {"entity": entity, "kwargs": kwargs}
+            elif kind == UPDATE:
+                document_id, is_contract = self._rng.choice(existing)
+                payload = self._update_payload(
+                    is_contract, dataset.parties[tenant_id]
+                )
+            else:
+                document_id = self._rng.choice(plain)
+                payload = {
+                    "status": self._rng.choice(
+                        [DocumentStatus.PUBLISHED, DocumentStatus.ARCHIVED]
+                    )
+                }
+            operations.append(
+                Operation(kind, tenant_id, document_id, user_id, payload)
+            )
+        return operations
+
+    def _update_payload(
+        self, is_contract: bool, parties: list[UUID]
+    ) -> dict[str, Any]:
+        """Sorteia o atributo e o novo valor de uma atualização."""
+        number = next(self._sequence)
+        if not is_contract:
+            return {"attr": "title", "value": f"Documento revisado {number}"}
+        attr = self._rng.choice(["title", "description", "parts_id"])
+        if attr == "parts_id":
+            value = self._rng.sample(
+                parties, self._rng.randint(1, self.config.max_parts)
+            )
+        else:
+            value = f"Contrato revisado {number}"
+        return {"attr": attr, "value": value}
+
+
+def build_entity(entity: str, kwargs: dict[str, Any]) -> Document:
+    """Constrói um `Document` ou `Contract` a partir do payload."""
+    if entity == "contract":
+        return Contract(**kwargs)
+    return Document(**kwargs)
+
+
+def generate(
+    config: Optional[WorkloadConfig] = None,
+) -> tuple[Dataset, list[Operation]]:
+    """Gera o conjunto de dados e a carga de uma configuração."""
+    generator = WorkloadGenerator(config)
+    dataset = generator.dataset()
+    return dataset, generator.operations(dataset)
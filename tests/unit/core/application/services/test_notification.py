@@ -0,0 +1,106 @@
+"""Testes para o despacho de notificações."""
+
+from uuid import uuid4
+
+from src.core.application.services.notification import (
+    IMailer,
+    Notification,
+    NotificationDispatcher,
+    NotificationQueue,
+    PermanentDeliveryError,
+    RetryPolicy,
+    TransientDeliveryError,
+)
+
+
+class FakeClock:
+    """Relógio controlado pelo teste."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeMailer(IMailer):
+    """Mailer que registra os lotes e devolve falhas programadas."""
+
+    def __init__(self, errors=()):
+        self.batches = []
+        self.errors = list(errors)
+
+    def send_batch(self, notifications):
+        self.batches.append(list(notifications))
+        return [
+            self.errors.pop(0) if self.errors else None for _ in notifications
+        ]
+
+    def close(self):
+        pass
+
+
+def make_notification(tenant_id) -> Notification:
+    """Cria uma notificação de um tenant."""
+    return Notification(tenant_id, ("a@example.com",), "Assunto", "Corpo")
+
+
+def test_batches_and_rate_limits_per_tenant():
+    """Testa o lote único e o adiamento por tenant."""
+    clock, mailer, queue = FakeClock(), FakeMailer(), NotificationQueue()
+    busy, quiet = uuid4(), uuid4()
+    for _ in range(5):
+        queue.put(make_notification(busy))
+    queue.put(make_notification(quiet))
+    dispatcher = NotificationDispatcher(
+        queue, mailer, rate=1.0, burst=2, clock=clock
+    )
+
+    report = dispatcher.dispatch_once()
+
+    assert (report.sent, report.deferred) == (3, 3)
+    assert len(mailer.batches) == 1
+    assert queue.next_ready_at() == 1.0
+
+    clock.now = 1.0
+    assert dispatcher.dispatch_once().sent == 1
+
+
+def test_retries_with_backoff_then_fails():
+    """Testa o reenvio com backoff e o descarte após as tentativas."""
+    clock, queue = FakeClock(), NotificationQueue()
+    mailer = FakeMailer(
+        [TransientDeliveryError("451"), TransientDeliveryError("451")]
+    )
+    queue.put(make_notification(uuid4()))
+    queue.put(make_notification(uuid4()))
+    dispatcher = NotificationDispatcher(
+        queue,
+        mailer,
+        retry=RetryPolicy(max_attempts=2, base_delay=10, jitter=0),
+        clock=clock,
+    )
+
+    assert dispatcher.dispatch_once().retried == 2
+    assert not dispatcher.dispatch_once().sent
+
+    clock.now = 10.0
+    mailer.errors = [TransientDeliveryError("451")]
+    report = dispatcher.dispatch_once()
+
+    assert (report.sent, report.failed) == (1, 1)
+    assert dispatcher.failed[0].attempts == 2
+
+
+def test_permanent_error_is_not_retried():
+    """Testa que falhas definitivas vão direto para `failed`."""
+    queue = NotificationQueue()
+    queue.put(make_notification(uuid4()))
+    dispatcher = NotificationDispatcher(
+        queue,
+        FakeMailer([PermanentDeliveryError("550")]),
+        clock=FakeClock(),
+    )
+
+    assert dispatcher.dispatch_once().failed == 1
+    assert not queue
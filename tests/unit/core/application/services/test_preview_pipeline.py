@@ -0,0 +1,174 @@
+"""Testes do pipeline de prévias em segundo plano."""
+
+import io
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from uuid import uuid4
+
+import pytest
+
+from src.core.application.events import EventBus
+from src.core.application.services.preview import (
+    PreviewPipeline,
+    preview_key,
+)
+from src.core.application.use_cases.document.attach import AttachFileUseCase
+from src.core.infrastucture.persistence.blob_store import FileSystemBlobStore
+from src.core.infrastucture.persistence.disk_cache import DiskLRUCache
+from src.core.infrastucture.persistence.document import (
+    InMemoryDocumentRepository,
+)
+
+
+def fake_render(segments, media_type, variants):
+    """Renderizador de teste: a "imagem" é o começo do conteúdo."""
+    with open(segments[0].path, "rb") as file:
+        head = file.read(16)
+    if head.startswith(b"corrompido"):
+        raise ValueError("arquivo corrompido")
+    return {
+        name: f"{name}:{size}:{os.getpid()}:".encode() + head
+        for name, size in variants.items()
+    }
+
+
+@pytest.fixture
+def setup(tmp_path, docs):
+    """Repositório com um documento, armazenamento e cache."""
+    repository = InMemoryDocumentRepository()
+    repository.save(docs)
+    store = FileSystemBlobStore(tmp_path / "blobs", durable=False)
+    cache = DiskLRUCache(tmp_path / "previews", max_bytes=1 << 20)
+    return docs, repository, store, cache
+
+
+def attach(repository, store, document, content, name="a.pdf"):
+    return AttachFileUseCase(repository, store).execute(
+        document.entity_id,
+        name,
+        io.BytesIO(content),
+        "application/pdf",
+        uuid4(),
+    )
+
+
+def test_events_enqueue_rendering_in_worker_processes(
+    setup,
+):  # pylint: disable=redefined-outer-name
+    document, repository, store, cache = setup
+    executor = ProcessPoolExecutor(
+        2, mp_context=multiprocessing.get_context("fork")
+    )
+    pipeline = PreviewPipeline(
+        repository, store, cache, fake_render, executor=executor
+    )
+    bus = EventBus()
+    pipeline.subscribe(bus)
+
+    attachment = attach(repository, store, document, b"%PDF-1.7 contrato")
+    bus.dispatch(repository.get(document.entity_id))
+    assert pipeline.drain(timeout=30)
+    pipeline.shutdown()
+
+    thumbnail = pipeline.preview(attachment.digest)
+    assert thumbnail.startswith(b"thumbnail:256:")
+    assert thumbnail.endswith(b"%PDF-1.7 contrat")
+    assert int(thumbnail.split(b":")[2]) != os.getpid()
+    assert pipeline.preview(attachment.digest, "preview") is not None
+    assert pipeline.rendered == 1
+
+
+def test_jobs_are_deduplicated_by_content(
+    setup,
+):  # pylint: disable=redefined-outer-name
+    document, repository, store, cache = setup
+    release = threading.Event()
+    calls = []
+
+    def blocking_render(segments, media_type, variants):
+        calls.append(segments)
+        release.wait(5)
+        return fake_render(segments, media_type, variants)
+
+    with ThreadPoolExecutor(2) as executor:
+        pipeline = PreviewPipeline(
+            repository, store, cache, blocking_render, executor=executor
+        )
+        first = attach(repository, store, document, b"mesmo conteudo")
+        second = attach(repository, store, document, b"mesmo conteudo", "b")
+        assert first.digest == second.digest
+
+        future = pipeline.submit(first.digest, "application/pdf")
+        assert pipeline.submit(second.digest, "application/pdf") is future
+        release.set()
+        assert pipeline.drain(timeout=5)
+
+        assert pipeline.submit(first.digest, "application/pdf") is None
+        assert len(calls) == 1
+        assert preview_key(first.digest, "thumbnail") in cache
+
+
+def test_failures_unsupported_types_and_missing_documents(
+    setup,
+):  # pylint: disable=redefined-outer-name
+    document, repository, store, cache = setup
+    with ThreadPoolExecutor(1) as executor:
+        pipeline = PreviewPipeline(
+            repository,
+            store,
+            cache,
+            fake_render,
+            executor=executor,
+            media_types={"application/pdf"},
+        )
+        broken = attach(repository, store, document, b"corrompido")
+        assert pipeline.submit(broken.digest, "application/pdf")
+        assert pipeline.drain(timeout=5)
+        assert pipeline.preview(broken.digest) is None
+        assert pipeline.submit(broken.digest, "application/pdf") is None
+
+        assert pipeline.submit(broken.digest, "text/plain") is None
+        assert pipeline.submit("0" * 64, "application/pdf") is None
+
+        bus = EventBus()
+        pipeline.subscribe(bus)
+        bus.dispatch(document)
+        repository.delete(document.entity_id)
+        document.update_attribute("title", "Outro", uuid4())
+        bus.dispatch(document)
+        assert pipeline.pending == 0
+
+
+def test_variant_too_big_for_cache_is_not_resubmitted(
+    setup, tmp_path
+):  # pylint: disable=redefined-outer-name
+    document, repository, store, _ = setup
+    cache = DiskLRUCache(tmp_path / "pequeno", max_bytes=8)
+    with ThreadPoolExecutor(1) as executor:
+        pipeline = PreviewPipeline(
+            repository, store, cache, fake_render, executor=executor
+        )
+        attachment = attach(repository, store, document, b"%PDF-1.7 grande")
+        assert pipeline.submit(attachment.digest, "application/pdf")
+        assert pipeline.drain(timeout=5)
+
+        assert pipeline.preview(attachment.digest) is None
+        assert pipeline.rendered == 0
+        assert pipeline.submit(attachment.digest, "application/pdf") is None
+
+
+def test_invalid_variant_names(
+    setup,
+):  # pylint: disable=redefined-outer-name
+    _, repository, store, cache = setup
+    with pytest.raises(ValueError):
+        PreviewPipeline(
+            repository,
+            store,
+            cache,
+            fake_render,
+            executor=ThreadPoolExecutor(1),
+            variants={"../x": 10},
+        )
@@ -0,0 +1,158 @@
+"""Testes para o token bucket."""
+
+from uuid import uuid4
+
+import pytest
+
+from src.core.application.services.rate_limit import (
+    CONCURRENCY,
+    RATE,
+    QuotaExceededError,
+    TenantQuota,
+    TenantRateLimiter,
+    TokenBucket,
+)
+
+
+class FakeClock:
+    """Relógio controlado manualmente."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_token_bucket_consumes_until_empty():
+    """Testa que o bucket nega aquisições após esgotar a capacidade."""
+    clock = FakeClock()
+    bucket = TokenBucket(rate=1.0, capacity=2, clock=clock)
+
+    assert bucket.try_acquire() is True
+    assert bucket.try_acquire() is True
+    assert bucket.try_acquire() is False
+
+
+def test_token_bucket_refills_over_time():
+    """Testa a reposição dos tokens com o passar do tempo."""
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2.0, capacity=1, clock=clock)
+    bucket.try_acquire()
+
+    assert bucket.retry_after() == pytest.approx(0.5)
+    clock.now = 0.5
+    assert bucket.try_acquire() is True
+
+
+def test_token_bucket_rejects_invalid_configuration():
+    """Testa a validação dos parâmetros do bucket."""
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0, capacity=1)
+    with pytest.raises(ValueError):
+        TokenBucket(rate=1, capacity=0)
+
+
+def test_tenant_limiter_applies_rate_per_tenant():
+    """Testa que a taxa de um tenant não consome a cota dos demais."""
+    clock = FakeClock()
+    limiter = TenantRateLimiter(
+        TenantQuota(rate=2.0, burst=2, max_concurrent=10), clock=clock
+    )
+    busy, quiet = uuid4(), uuid4()
+
+    for _ in range(2):
+        assert limiter.try_acquire(busy).admitted
+        limiter.release(busy)
+    refused = limiter.try_acquire(busy)
+
+    assert refused.reason == RATE
+    assert refused.retry_after == pytest.approx(0.5)
+    assert limiter.try_acquire(quiet).admitted
+    clock.now = 0.5
+    assert limiter.try_acquire(busy).admitted
+
+
+def test_tenant_limiter_applies_concurrency_and_overrides():
+    """Testa o limite de concorrência e a cota específica de um tenant."""
+    vip = uuid4()
+    limiter = TenantRateLimiter(
+        TenantQuota(max_concurrent=1),
+        quotas={vip: TenantQuota(max_concurrent=3)},
+        clock=FakeClock(),
+    )
+    other = uuid4()
+
+    assert limiter.try_acquire(other).admitted
+    assert limiter.try_acquire(other).reason == CONCURRENCY
+    assert all(limiter.try_acquire(vip).admitted for _ in range(3))
+    assert limiter.in_flight(vip) == 3
+
+    limiter.release(other)
+    assert limiter.try_acquire(other).admitted
+
+    limiter.configure(other, TenantQuota(max_concurrent=2))
+    assert limiter.try_acquire(other).admitted
+
+
+def test_tenant_limiter_admit_context():
+    """Testa a admissão sem espera com gerenciador de contexto."""
+    tenant_id = uuid4()
+    limiter = TenantRateLimiter(
+        TenantQuota(max_concurrent=1), clock=FakeClock()
+    )
+
+    with limiter.admit(tenant_id):
+        with pytest.raises(QuotaExceededError) as error:
+            with limiter.admit(tenant_id):
+                pass
+    assert error.value.reason == CONCURRENCY
+    assert limiter.in_flight(tenant_id) == 0
+
+
+def test_tenant_quota_validation():
+    """Testa a validação das cotas e dos fragmentos."""
+    with pytest.raises(ValueError):
+        TenantQuota(rate=0)
+    with pytest.raises(ValueError):
+        TenantQuota(max_concurrent=0)
+    with pytest.raises(ValueError):
+        TenantRateLimiter(shards=3)
+
+
+def test_idle_tenant_states_are_evicted():
+    """Testa que IDs usados uma vez não acumulam estado."""
+    clock = FakeClock()
+    limiter = TenantRateLimiter(
+        TenantQuota(rate=1.0, burst=1), shards=1, clock=clock
+    )
+    busy = uuid4()
+    assert limiter.try_acquire(busy).admitted  # segue em andamento
+
+    for _ in range(5000):
+        with limiter.admit(uuid4()):
+            clock.now += 0.01
+
+    assert limiter.tenants() < 2100
+    assert limiter.in_flight(busy) == 1
+
+
+def test_charge_consumes_tokens_without_concurrency_slot():
+    """Testa a cobrança do trabalho extra de uma requisição admitida."""
+    clock = FakeClock()
+    tenant_id = uuid4()
+    limiter = TenantRateLimiter(
+        TenantQuota(rate=1, burst=5, max_concurrent=1), clock=clock
+    )
+
+    with limiter.admit(tenant_id):
+        assert limiter.charge(tenant_id, 3).admitted
+        assert limiter.in_flight(tenant_id) == 1
+        denied = limiter.charge(tenant_id, 3)
+    assert (denied.admitted, denied.reason) == (False, RATE)
+    assert denied.retry_after == pytest.approx(2.0)
+
+    clock.now += 10  # bucket cheio de novo
+    assert limiter.charge(tenant_id, 12).admitted  # maior que a rajada
+    denied = limiter.try_acquire(tenant_id)
+    assert not denied.admitted and denied.retry_after == pytest.approx(8.0)
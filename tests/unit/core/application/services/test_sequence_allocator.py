@@ -0,0 +1,56 @@
+"""Testes para o alocador de sequências por blocos."""
+
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from src.core.application.services.sequence import BlockSequenceAllocator
+from src.core.infrastucture.persistence.sequence import (
+    InMemorySequenceRepository,
+)
+
+
+def test_reserves_one_block_per_block_size():
+    """Testa que cada bloco custa uma única escrita."""
+    repository = Mock(wraps=InMemorySequenceRepository())
+    allocator = BlockSequenceAllocator(repository, block_size=10)
+
+    numbers = [allocator.next("a") for _ in range(25)]
+
+    assert numbers == list(range(1, 26))
+    assert repository.reserve_block.call_count == 3
+
+
+def test_workers_get_disjoint_numbers():
+    """Testa workers com blocos próprios sobre o mesmo armazenamento."""
+    repository = InMemorySequenceRepository()
+    first = BlockSequenceAllocator(repository, block_size=5)
+    second = BlockSequenceAllocator(repository, block_size=5)
+
+    assert [first.next("a"), second.next("a"), first.next("a")] == [1, 6, 2]
+
+
+def test_thread_safety():
+    """Testa que threads concorrentes recebem números distintos."""
+    allocator = BlockSequenceAllocator(
+        InMemorySequenceRepository(), block_size=3
+    )
+    numbers: list[int] = []
+
+    def work():
+        numbers.extend(allocator.next("a") for _ in range(200))
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(numbers) == list(range(1, 1601))
+
+
+def test_invalid_block_size_raises():
+    """Testa que o bloco deve ter ao menos um número."""
+    with pytest.raises(ValueError):
+        BlockSequenceAllocator(InMemorySequenceRepository(), block_size=0)
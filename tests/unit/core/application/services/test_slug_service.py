@@ -0,0 +1,66 @@
+"""Testes para a geração de slugs."""
+
+from unittest.mock import Mock
+from uuid import uuid4
+
+import pytest
+
+from src.core.application.services.slug import SlugService
+from src.core.domain.entities.document import Document
+from src.core.domain.exceptions import (
+    DocumentNotFoundException,
+    SlugAlreadyExistsException,
+)
+from src.core.domain.value_objects.doc_types import DocumentType
+from src.core.infrastucture.persistence.document import (
+    InMemoryDocumentRepository,
+)
+
+
+def make_document(title: str, tenant_id, slug=None) -> Document:
+    """Cria um documento de um tenant."""
+    return Document(
+        title=title,
+        user_id=uuid4(),
+        document_type=DocumentType.MANUAL,
+        tenant_id=tenant_id,
+        slug=slug,
+    )
+
+
+def test_assign_resolves_collisions_in_one_query():
+    """Testa sufixos contra o repositório e dentro do lote."""
+    tenant_id = uuid4()
+    repository = InMemoryDocumentRepository()
+    repository.save(make_document("Manual", tenant_id, slug="manual-de-uso"))
+    repository.save(make_document("Manual", tenant_id, slug="manual-de-uso-2"))
+    spy = Mock(wraps=repository)
+    batch = [make_document("Manual de Uso", tenant_id) for _ in range(2)]
+    batch.append(make_document("Manual de Uso", uuid4()))
+
+    SlugService(spy).assign(batch)
+
+    assert [document.slug for document in batch] == [
+        "manual-de-uso-3",
+        "manual-de-uso-4",
+        "manual-de-uso",
+    ]
+    assert spy.get_taken_slugs.call_count == 1
+
+
+def test_slug_index_is_unique_per_tenant():
+    """Testa a resolução O(1) e a unicidade do slug no tenant."""
+    tenant_id = uuid4()
+    repository = InMemoryDocumentRepository()
+    document = repository.save(make_document("Doc", tenant_id, slug="doc"))
+
+    assert repository.get_by_slug(tenant_id, "doc") is document
+    with pytest.raises(SlugAlreadyExistsException):
+        repository.save(make_document("Doc", tenant_id, slug="doc"))
+    repository.save(make_document("Doc", uuid4(), slug="doc"))
+
+    document.slug = "doc-novo"
+    repository.update(document)
+    with pytest.raises(DocumentNotFoundException):
+        repository.get_by_slug(tenant_id, "doc")
+    assert repository.get_by_slug(tenant_id, "doc-novo") is document
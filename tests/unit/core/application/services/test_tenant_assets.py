@@ -0,0 +1,160 @@
+"""Testes das variantes do logo das empresas."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.core.application.events import EventBus
+from src.core.application.services.tenant_assets import (
+    TenantAssetService,
+    asset_name,
+)
+from src.core.domain.events.tenant import (
+    TenantCreatedEvent,
+    TenantDeletedEvent,
+    TenantUpdatedEvent,
+)
+from src.core.infrastucture.persistence.disk_cache import DiskLRUCache
+from src.core.infrastucture.persistence.tenant import (
+    InMemoryTenantRepository,
+)
+
+CALLS = []
+
+
+def fake_render(source, variants):
+    """Renderizador de teste: a "imagem" é a origem e o tamanho."""
+    CALLS.append(source)
+    if source.endswith(".txt"):
+        raise ValueError("não é uma imagem")
+    return {
+        name: f"{source}:{size}".encode() for name, size in variants.items()
+    }
+
+
+@pytest.fixture
+def setup(tmp_path, tenant):
+    """Serviço com uma empresa, um barramento e um cache em disco."""
+    CALLS.clear()
+    repository = InMemoryTenantRepository()
+    repository.save(tenant)
+    service = TenantAssetService(
+        repository,
+        DiskLRUCache(tmp_path, max_bytes=1 << 20),
+        fake_render,
+        executor=ThreadPoolExecutor(2),
+    )
+    bus = EventBus()
+    service.subscribe(bus)
+    yield tenant, service, bus
+    service.shutdown()
+
+
+def test_created_tenant_gets_content_hashed_variants(
+    setup,
+):  # pylint: disable=redefined-outer-name
+    tenant, service, bus = setup
+    bus.publish(TenantCreatedEvent(tenant.entity_id, tenant.user_id))
+    assert service.drain(timeout=10)
+
+    name = service.logo(tenant.entity_id)
+    data = f"{tenant.logo}:128".encode()
+    assert name == asset_name(data)
+    assert service.asset(name) == data
+    assert service.logo(tenant.entity_id, "small") != name
+    assert service.submit(tenant) is None
+    assert CALLS == [tenant.logo] and service.rendered == 1
+
+
+def test_update_regenerates_and_drops_stale_logo(
+    setup,
+):  # pylint: disable=redefined-outer-name
+    tenant, service, bus = setup
+    service.submit(tenant)
+    assert service.drain(timeout=10)
+    old = service.logo(tenant.entity_id)
+
+    bus.publish(
+        TenantUpdatedEvent(tenant.entity_id, tenant.user_id, None, None)
+    )
+    assert service.logo(tenant.entity_id) == old  # mesmo logo
+    assert service.drain(timeout=10)
+    assert CALLS == [tenant.logo, tenant.logo]
+
+    release = threading.Event()
+    service.renderer = lambda source, variants: (
+        release.wait(10) and fake_render(source, variants)
+    )
+    old_logo, tenant.logo = tenant.logo, "/logos/novo.png"
+    bus.publish(
+        TenantUpdatedEvent(tenant.entity_id, tenant.user_id, old_logo, "x")
+    )
+    assert service.logo(tenant.entity_id) is None
+    release.set()
+    assert service.drain(timeout=10)
+    assert service.asset(service.logo(tenant.entity_id)) == (
+        b"/logos/novo.png:128"
+    )
+    assert service.asset(old) is not None  # outros ainda podem usá-lo
+
+
+def test_failure_and_deleted_tenant(
+    setup, caplog
+):  # pylint: disable=redefined-outer-name
+    tenant, service, bus = setup
+    tenant.logo = "/logos/leia-me.txt"
+    service.submit(tenant)
+    assert service.drain(timeout=10)
+    assert service.logo(tenant.entity_id) is None
+    assert "Falha ao gerar o logo" in caplog.text
+
+    service.tenant_repository.delete(tenant.entity_id)
+    bus.publish(TenantDeletedEvent(tenant.entity_id, tenant.user_id))
+    assert service.pending == 0 and service.logo(tenant.entity_id) is None
+    assert service.asset("../segredo.png") is None
+    with pytest.raises(ValueError):
+        TenantAssetService(
+            service.tenant_repository,
+            service.cache,
+            fake_render,
+            variants={"Grande": 512},
+        )
+
+
+def test_evicted_variant_is_regenerated(
+    setup,
+):  # pylint: disable=redefined-outer-name
+    tenant, service, _ = setup
+    service.submit(tenant)
+    assert service.drain(timeout=10)
+    name = service.logo(tenant.entity_id)
+
+    service.cache.discard(name)
+
+    assert service.logo(tenant.entity_id) is None
+    assert service.drain(timeout=10)
+    assert service.logo(tenant.entity_id) == name
+    assert service.asset(name) == f"{tenant.logo}:128".encode()
+    assert CALLS == [tenant.logo, tenant.logo]
+
+
+def test_variant_too_big_for_cache_is_not_offered(
+    tenant, tmp_path, caplog
+):  # pylint: disable=redefined-outer-name
+    CALLS.clear()
+    repository = InMemoryTenantRepository()
+    repository.save(tenant)
+    service = TenantAssetService(
+        repository,
+        DiskLRUCache(tmp_path, max_bytes=4),
+        fake_render,
+        executor=ThreadPoolExecutor(1),
+    )
+    service.submit(tenant)
+    assert service.drain(timeout=10)
+
+    assert service.logo(tenant.entity_id) is None
+    assert service.pending == 0 and CALLS == [tenant.logo]
+    assert "Falha ao gerar o logo" in caplog.text
+    service.shutdown()
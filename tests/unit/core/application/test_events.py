@@ -0,0 +1,49 @@
+"""Testes para o barramento de eventos."""
+
+from uuid import uuid4
+
+from src.core.application.events import ALL_EVENTS, EventBus
+from src.core.domain.entities.base import DomainEvent
+
+
+def test_publish_delivers_to_type_and_wildcard_handlers():
+    """Testa a entrega por tipo e para `*`."""
+    bus = EventBus()
+    received = []
+    bus.subscribe("document_created", lambda event: received.append("a"))
+    bus.subscribe(ALL_EVENTS, lambda event: received.append("*"))
+
+    bus.publish(DomainEvent("document_created", {}))
+    bus.publish(DomainEvent("document_deleted", {}))
+
+    assert received == ["a", "*", "*"]
+
+
+def test_failing_handler_does_not_block_others():
+    """Testa que a falha de um handler não interrompe a entrega."""
+    bus = EventBus()
+    received = []
+
+    def failing(event):
+        raise RuntimeError("falha")
+
+    bus.subscribe("x", failing)
+    bus.subscribe("x", received.append)
+    event = DomainEvent("x", {})
+
+    bus.publish(event)
+
+    assert received == [event]
+
+
+def test_dispatch_publishes_and_clears_entity_events(docs):
+    """Testa a publicação dos eventos acumulados em uma entidade."""
+    bus = EventBus()
+    received = []
+    bus.subscribe(ALL_EVENTS, received.append)
+    docs.update_attribute("title", "Novo título", uuid4())
+
+    bus.dispatch(docs)
+
+    assert [event.event_type for event in received] == ["document_updated"]
+    assert not docs.get_domain_events()
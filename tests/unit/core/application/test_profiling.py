@@ -0,0 +1,213 @@
+"""Testes para os ganchos de profiling."""
+
+import cProfile
+import pstats
+import tracemalloc
+from uuid import uuid4
+
+import pytest
+
+from src.core.application.profiling import (
+    ProfiledRepository,
+    ProfiledUseCase,
+    Profiler,
+    ProfilingConfig,
+)
+
+
+class FakeClock:
+    """Relógio controlado manualmente."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeUseCase:
+    """Caso de uso mínimo para os testes."""
+
+    def execute(self, document):
+        """Devolve o documento recebido."""
+        return document
+
+
+@pytest.fixture
+def profiler(tmp_path):
+    """Profiler habilitado gravando em um diretório temporário."""
+    return Profiler(
+        ProfilingConfig(enabled=True, output_dir=tmp_path),
+        clock=FakeClock(),
+    )
+
+
+def test_config_from_env(tmp_path):
+    """Testa a leitura da configuração pelas variáveis de ambiente."""
+    tenant_id = uuid4()
+    config = ProfilingConfig.from_env(
+        {
+            "DOCUMENT_MANAGER_PROFILING": "true",
+            "DOCUMENT_MANAGER_PROFILING_USE_CASES": "A, B",
+            "DOCUMENT_MANAGER_PROFILING_TENANTS": str(tenant_id),
+            "DOCUMENT_MANAGER_PROFILING_DIR": str(tmp_path),
+            "DOCUMENT_MANAGER_PROFILING_MODES": "cprofile,tracemalloc",
+            "DOCUMENT_MANAGER_PROFILING_RATE": "12",
+        }
+    )
+
+    assert config.enabled is True
+    assert config.use_cases == {"A", "B"}
+    assert config.tenant_ids == {tenant_id}
+    assert config.output_dir == tmp_path
+    assert config.tracemalloc is True
+    assert config.max_per_minute == 12
+
+
+def test_disabled_profiler_does_not_sample(tmp_path):
+    """Testa que nada é gravado com os ganchos desligados."""
+    profiler = Profiler(ProfilingConfig(output_dir=tmp_path))
+
+    result = ProfiledUseCase(FakeUseCase(), profiler).execute("doc")
+
+    assert result == "doc"
+    assert not list(tmp_path.iterdir())
+
+
+def test_sampled_use_case_writes_pstats(
+    profiler, docs, tmp_path
+):  # pylint: disable=redefined-outer-name
+    """Testa a gravação do .pstats para um tenant amostrado."""
+    profiler.enable(tenant_ids=[docs.tenant_id])
+
+    ProfiledUseCase(FakeUseCase(), profiler).execute(docs)
+
+    files = list(tmp_path.glob("*.pstats"))
+    assert len(files) == 1
+    assert str(docs.tenant_id) in files[0].name
+    pstats.Stats(str(files[0]))
+
+
+def test_filters_by_use_case_name(
+    profiler, docs, tmp_path
+):  # pylint: disable=redefined-outer-name
+    """Testa que casos de uso fora do filtro não são amostrados."""
+    profiler.enable(use_cases=["OutroCaso"])
+
+    ProfiledUseCase(FakeUseCase(), profiler).execute(docs)
+
+    assert not list(tmp_path.iterdir())
+
+
+def test_sampling_is_rate_limited(
+    profiler, docs, tmp_path
+):  # pylint: disable=redefined-outer-name
+    """Testa que o limite de taxa descarta amostras excedentes."""
+    use_case = ProfiledUseCase(FakeUseCase(), profiler)
+
+    for _ in range(5):
+        use_case.execute(docs)
+
+    assert len(list(tmp_path.glob("*.pstats"))) == 1
+
+
+def test_tracemalloc_snapshot(
+    tmp_path, docs
+):  # pylint: disable=redefined-outer-name
+    """Testa a gravação do snapshot de alocações."""
+    profiler = Profiler(
+        ProfilingConfig(
+            enabled=True,
+            output_dir=tmp_path,
+            cprofile=False,
+            tracemalloc=True,
+        )
+    )
+
+    ProfiledUseCase(FakeUseCase(), profiler).execute(docs)
+
+    assert len(list(tmp_path.glob("*.tracemalloc"))) == 1
+    assert not list(tmp_path.glob("*.pstats"))
+
+
+def test_profiled_repository_names_methods(
+    profiler, docs, tmp_path
+):  # pylint: disable=redefined-outer-name
+    """Testa o proxy de repositório e o nome usado nos filtros."""
+
+    class FakeRepository:
+        """Repositório mínimo para os testes."""
+
+        def save(self, document):
+            """Devolve o documento recebido."""
+            return document
+
+    profiler.enable(use_cases=["FakeRepository.save"])
+    repository = ProfiledRepository(FakeRepository(), profiler)
+
+    assert repository.save(docs) is docs
+    assert len(list(tmp_path.glob("*FakeRepository.save*.pstats"))) == 1
+
+
+def test_concurrent_cprofile_sample_is_skipped(
+    tmp_path, docs
+):  # pylint: disable=redefined-outer-name
+    """Testa que só um cProfile fica ativo por processo."""
+    outer = Profiler(ProfilingConfig(enabled=True, output_dir=tmp_path))
+    clock = FakeClock()
+    inner = Profiler(
+        ProfilingConfig(enabled=True, output_dir=tmp_path / "inner"), clock
+    )
+
+    with outer.profile("Externo") as stem:
+        assert ProfiledUseCase(FakeUseCase(), inner).execute(docs) is docs
+
+    assert [path.name for path in tmp_path.glob("*.pstats")] == [
+        f"{stem.name}.pstats"
+    ]
+    assert not list((tmp_path / "inner").glob("*.pstats"))
+
+    clock.now += 60
+    ProfiledUseCase(FakeUseCase(), inner).execute(docs)
+
+    assert len(list((tmp_path / "inner").glob("*.pstats"))) == 1
+
+
+def test_unwritable_output_dir_does_not_fail_the_call(
+    tmp_path, docs, caplog
+):  # pylint: disable=redefined-outer-name
+    """Testa que um diretório inválido só é registrado em log."""
+    blocker = tmp_path / "arquivo"
+    blocker.write_text("")
+    profiler = Profiler(ProfilingConfig(enabled=True, output_dir=blocker))
+
+    assert ProfiledUseCase(FakeUseCase(), profiler).execute(docs) is docs
+    assert "Falha ao preparar o diretório de perfis" in caplog.text
+
+
+def test_failed_dump_keeps_result_and_cleans_up(
+    tmp_path, docs, caplog, monkeypatch
+):  # pylint: disable=redefined-outer-name
+    """Testa que uma falha ao gravar não vaza nem deixa estado ativo."""
+    clock = FakeClock()
+    profiler = Profiler(
+        ProfilingConfig(enabled=True, output_dir=tmp_path, tracemalloc=True),
+        clock=clock,
+    )
+
+    def fail(*_args, **_kwargs):
+        raise OSError("disco cheio")
+
+    monkeypatch.setattr(cProfile.Profile, "dump_stats", fail)
+    monkeypatch.setattr(tracemalloc.Snapshot, "dump", fail)
+
+    assert ProfiledUseCase(FakeUseCase(), profiler).execute(docs) is docs
+    assert "Falha ao gravar" in caplog.text
+    assert not tracemalloc.is_tracing()
+
+    monkeypatch.undo()
+    clock.now += 60
+    ProfiledUseCase(FakeUseCase(), profiler).execute(docs)
+
+    assert len(list(tmp_path.glob("*.pstats"))) == 1
+    assert len(list(tmp_path.glob("*.tracemalloc"))) == 1
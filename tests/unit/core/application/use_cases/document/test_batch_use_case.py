@@ -0,0 +1,185 @@
+"""Testes para o caso de uso de lote de operações de documentos."""
+
+from concurrent.futures import ThreadPoolExecutor
+from uuid import uuid4
+
+import pytest
+
+from src.core.application.services.document_service import DocumentService
+from src.core.application.services.unit_of_work import DocumentUnitOfWork
+from src.core.application.use_cases.document.batch import (
+    BatchOperation,
+    ExecuteDocumentBatchUseCase,
+)
+from src.core.domain.entities.document import Document
+from src.core.domain.exceptions import (
+    DocumentNotFoundException,
+    DocumentVersionConflictException,
+    SlugAlreadyExistsException,
+)
+from src.core.domain.value_objects.doc_status import DocumentStatus
+from src.core.domain.value_objects.doc_types import DocumentType
+from src.core.infrastucture.persistence.document import (
+    InMemoryDocumentRepository,
+)
+
+
+def make_document(tenant_id, title="Documento", slug=None):
+    return Document(
+        title=title,
+        user_id=uuid4(),
+        document_type=DocumentType.REPORT,
+        tenant_id=tenant_id,
+        slug=slug,
+    )
+
+
+@pytest.fixture
+def repository():
+    """Repositório com três documentos."""
+    repository = InMemoryDocumentRepository()
+    tenant_id = uuid4()
+    for index in range(3):
+        repository.save(make_document(tenant_id, f"Documento {index}"))
+    return repository
+
+
+@pytest.fixture(params=[False, True], ids=["sequential", "parallel"])
+def use_case(request, repository):  # pylint: disable=redefined-outer-name
+    """Caso de uso em modo sequencial e paralelo."""
+    with ThreadPoolExecutor(4) as executor:
+        yield ExecuteDocumentBatchUseCase(
+            repository, DocumentService(), executor
+        ), request.param
+
+
+def test_batch_commits_all_operations(
+    repository, use_case, user_id
+):  # pylint: disable=redefined-outer-name
+    """Testa um lote com inclusão, alteração e mudanças de status."""
+    batch, parallel = use_case
+    first, second, third = repository.all()
+    new = make_document(first.tenant_id, "Novo")
+    operations = [
+        BatchOperation("create", user_id, document=new),
+        BatchOperation(
+            "update_attribute",
+            user_id,
+            first.entity_id,
+            attr="title",
+            value="Renomeado",
+        ),
+        BatchOperation("publish", user_id, new.entity_id),
+        BatchOperation("archive", user_id, second.entity_id),
+        BatchOperation("delete", user_id, third.entity_id),
+        BatchOperation("publish", user_id, first.entity_id),
+    ]
+
+    result = batch.execute(operations, parallel)
+
+    assert result.committed
+    assert [item.error for item in result.results] == [None] * 6
+    # Cada resultado mostra o estado após a sua operação.
+    assert result.results[0].document.status == DocumentStatus.DRAFT
+    assert result.results[2].document.status == DocumentStatus.PUBLISHED
+    assert repository.get(new.entity_id).is_published()
+    assert repository.get(first.entity_id).title == "Renomeado"
+    assert repository.get(first.entity_id).is_published()
+    assert repository.get(second.entity_id).is_archived()
+    assert repository.get(third.entity_id).is_deleted()
+    assert len(result.entities) == 4
+    assert repository.get_by_status(DocumentStatus.DRAFT) == []
+
+
+def test_failed_operation_rolls_back_the_batch(
+    repository, use_case, user_id
+):  # pylint: disable=redefined-outer-name
+    """Testa que uma falha impede a gravação de todo o lote."""
+    batch, parallel = use_case
+    first = repository.all()[0]
+    new = make_document(first.tenant_id, "Novo")
+    operations = [
+        BatchOperation("create", user_id, document=new),
+        BatchOperation(
+            "update_attribute",
+            user_id,
+            first.entity_id,
+            attr="title",
+            value="Renomeado",
+        ),
+        BatchOperation("archive", user_id, uuid4()),
+    ]
+
+    result = batch.execute(operations, parallel)
+
+    assert not result.committed
+    assert isinstance(result.results[2].error, DocumentNotFoundException)
+    assert not repository.exists(new.entity_id)
+    # A cópia de trabalho foi alterada, o documento gravado não.
+    assert first.title == "Documento 0"
+    assert repository.get_metadata(first.entity_id).version == 1
+
+
+def test_operations_on_same_document_run_in_order(
+    repository, user_id
+):  # pylint: disable=redefined-outer-name
+    """Testa que as operações de um documento seguem a ordem do lote."""
+    first = repository.all()[0]
+    batch = ExecuteDocumentBatchUseCase(repository, DocumentService())
+
+    result = batch.execute(
+        [
+            BatchOperation("publish", user_id, first.entity_id),
+            BatchOperation("delete", user_id, first.entity_id),
+            BatchOperation("publish", user_id, first.entity_id),
+        ]
+    )
+
+    assert not result.committed
+    assert result.results[2].error is not None
+    assert first.is_draft()
+
+
+def test_commit_detects_concurrent_change(
+    repository, user_id
+):  # pylint: disable=redefined-outer-name
+    """Testa o controle de concorrência otimista no commit."""
+    first = repository.all()[0]
+    unit = DocumentUnitOfWork(repository)
+    working = unit.get(first.entity_id)
+    working.publish()
+    unit.update(working)
+
+    first.update_attribute("title", "Concorrente", user_id)
+    repository.update(first)
+
+    with pytest.raises(DocumentVersionConflictException):
+        unit.commit()
+    assert repository.get(first.entity_id).is_draft()
+
+
+def test_commit_checks_slugs_within_the_batch(
+    repository,
+):  # pylint: disable=redefined-outer-name
+    """Testa slugs repetidos no lote e a troca de slugs entre documentos."""
+    tenant_id = uuid4()
+    one = repository.save(make_document(tenant_id, "Um", slug="um"))
+
+    with pytest.raises(SlugAlreadyExistsException):
+        repository.commit(
+            [
+                make_document(tenant_id, slug="dois"),
+                make_document(tenant_id, slug="dois"),
+            ],
+            [],
+        )
+
+    unit = DocumentUnitOfWork(repository)
+    renamed = unit.get(one.entity_id)
+    renamed.slug = "antigo"
+    unit.update(renamed)
+    unit.save(make_document(tenant_id, "Novo", slug="um"))
+    unit.commit()
+
+    assert repository.get_by_slug(tenant_id, "antigo").title == "Um"
+    assert repository.get_by_slug(tenant_id, "um").title == "Novo"
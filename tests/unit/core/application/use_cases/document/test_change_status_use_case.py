@@ -0,0 +1,120 @@
+"""Testes para o caso de uso de mudança de status de documento."""
+
+from datetime import date
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from src.core.application.use_cases.document.change_status import (
+    ChangeDocumentStatusUseCase,
+)
+from src.core.domain.events.document import (
+    DocumentDeletedEvent,
+    DocumentUpdatedEvent,
+)
+from src.core.domain.exceptions import BusinessRuleViolationError
+from src.core.domain.value_objects.doc_status import DocumentStatus
+from src.core.domain.value_objects.doc_types import DocumentType
+from src.core.infrastucture.persistence.document import (
+    InMemoryDocumentRepository,
+)
+from src.document_types.contract.domain.entities.contract import Contract
+from src.document_types.contract.domain.value_object import ContractStatus
+
+
+@pytest.fixture
+def repository(docs):  # pylint: disable=redefined-outer-name
+    """Repositório com um documento."""
+    repository = InMemoryDocumentRepository()
+    repository.save(docs)
+    return repository
+
+
+def test_publish_updates_status_index(
+    repository, docs
+):  # pylint: disable=redefined-outer-name
+    """Testa a publicação e a atualização do índice de status."""
+    published = ChangeDocumentStatusUseCase(repository).execute(
+        docs.entity_id, DocumentStatus.PUBLISHED, uuid4()
+    )
+
+    assert repository.get_by_status(DocumentStatus.PUBLISHED) == [docs]
+    assert isinstance(published.get_domain_events()[0], DocumentUpdatedEvent)
+
+
+def test_delete_records_deleted_event(
+    repository, docs
+):  # pylint: disable=redefined-outer-name
+    """Testa a deleção lógica do documento."""
+    deleted = ChangeDocumentStatusUseCase(repository).execute(
+        docs.entity_id, DocumentStatus.DELETED, uuid4()
+    )
+
+    assert deleted.is_deleted() and repository.get(docs.entity_id).is_deleted()
+    assert isinstance(deleted.get_domain_events()[0], DocumentDeletedEvent)
+
+
+def test_change_back_to_draft_is_rejected(
+    repository, docs
+):  # pylint: disable=redefined-outer-name
+    """Testa que não é possível voltar o documento para rascunho."""
+    with pytest.raises(BusinessRuleViolationError):
+        ChangeDocumentStatusUseCase(repository).execute(
+            docs.entity_id, DocumentStatus.DRAFT, uuid4()
+        )
+
+
+def test_rejected_change_leaves_stored_document_intact(
+    repository, docs
+):  # pylint: disable=redefined-outer-name
+    """Testa que uma falha não altera o documento guardado."""
+    with pytest.raises(BusinessRuleViolationError):
+        ChangeDocumentStatusUseCase(repository).execute(
+            docs.entity_id, DocumentStatus.DRAFT, uuid4()
+        )
+    published = ChangeDocumentStatusUseCase(repository).execute(
+        docs.entity_id, DocumentStatus.PUBLISHED, uuid4()
+    )
+
+    assert published is not docs and docs.is_draft()
+    assert repository.get(docs.entity_id) is published
+
+
+@pytest.mark.parametrize(
+    "status",
+    [
+        DocumentStatus.PUBLISHED,
+        DocumentStatus.ARCHIVED,
+        DocumentStatus.DELETED,
+    ],
+)
+def test_contract_status_is_not_replaced(
+    repository, status
+):  # pylint: disable=redefined-outer-name
+    """Testa que contratos mantêm o `ContractStatus`."""
+    contract = Contract(
+        title="Contrato de Serviços",
+        document_type=DocumentType.CONTRACT,
+        user_id=uuid4(),
+        tenant_id=uuid4(),
+        subject="Prestação de serviços",
+        description="Contrato de prestação de serviços",
+        amount=Decimal("1500.00"),
+        number=1,
+        department_id=uuid4(),
+        folder_id=uuid4(),
+        parts_id=[uuid4()],
+        start_date=date(2024, 1, 1),
+        end_date=date(2024, 12, 31),
+    )
+    repository.save(contract)
+
+    with pytest.raises(BusinessRuleViolationError):
+        ChangeDocumentStatusUseCase(repository).execute(
+            contract.entity_id, status, uuid4()
+        )
+
+    stored = repository.get(contract.entity_id)
+    assert isinstance(stored.status, ContractStatus)
+    assert stored.status == contract.status
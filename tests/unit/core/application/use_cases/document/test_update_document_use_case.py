@@ -0,0 +1,37 @@
+"""Testes para o caso de uso de atualização de atributo de documento."""
+
+from uuid import uuid4
+
+import pytest
+
+from src.core.application.use_cases.document.update import (
+    UpdateDocumentAttributeUseCase,
+)
+from src.core.domain.events.document import DocumentUpdatedEvent
+from src.core.domain.exceptions import DocumentNotFoundException
+from src.core.infrastucture.persistence.document import (
+    InMemoryDocumentRepository,
+)
+
+
+def test_update_attribute_persists_and_records_event(
+    docs,
+):  # pylint: disable=redefined-outer-name
+    """Testa a atualização e o evento de domínio registrado."""
+    repository = InMemoryDocumentRepository()
+    repository.save(docs)
+
+    result = UpdateDocumentAttributeUseCase(repository).execute(
+        docs.entity_id, "title", "Novo Título", uuid4()
+    )
+
+    assert result.title == "Novo Título"
+    assert isinstance(result.get_domain_events()[0], DocumentUpdatedEvent)
+
+
+def test_update_attribute_of_missing_document():
+    """Testa a atualização de um documento inexistente."""
+    use_case = UpdateDocumentAttributeUseCase(InMemoryDocumentRepository())
+
+    with pytest.raises(DocumentNotFoundException):
+        use_case.execute(uuid4(), "title", "Novo Título", uuid4())
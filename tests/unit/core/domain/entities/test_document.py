@@ -7,7 +7,10 @@ from uuid import UUID, uuid4
 import pytest
 
 from src.core.domain.entities.document import Document
-from src.core.domain.events.document import DocumentUpdatedEvent
+from src.core.domain.events.document import (
+    DocumentAttachmentAddedEvent,
+    DocumentUpdatedEvent,
+)
 from src.core.domain.exceptions import (
     DocumentUpdateAttrException,
     DomainValidationError,
@@ -69,6 +72,20 @@ def test_document_update_timestamp(
     assert docs.updated_at > initial
 
 
+def test_status_changes_advance_timestamp(
+    docs,
+):  # pylint: disable=redefined-outer-name
+    """Testa que cada mudança de status avança `updated_at`."""
+    stamps = [docs.updated_at]
+    for change in (docs.publish, docs.archive, docs.increment_version):
+        change()
+        stamps.append(docs.updated_at)
+    docs.delete()
+    stamps.append(docs.updated_at)
+
+    assert stamps == sorted(set(stamps))
+
+
 def test_document_update_attribute(
     docs,
 ):  # pylint: disable=redefined-outer-name
@@ -190,6 +207,36 @@ def test_tenant_id_setter_validation(
         docs.tenant_id = None
 
 
+def test_slug_setter_normalizes_text(
+    docs,
+):  # pylint: disable=redefined-outer-name
+    """Testa a normalização e a validação do setter do slug."""
+    docs.slug = "Locação de Imóveis"
+    assert docs.slug == "locacao-de-imoveis"
+    docs.slug = "contrato-2"
+    assert docs.slug == "contrato-2"
+    docs.slug = None
+    assert docs.slug is None
+    with pytest.raises(DomainValidationError):
+        docs.slug = "---"
+    with pytest.raises(DomainValidationError):
+        docs.slug = 123
+
+
+def test_update_attribute_sets_missing_slug(
+    docs,
+):  # pylint: disable=redefined-outer-name
+    """Testa a definição de um slug em um documento criado sem slug."""
+    assert docs.slug is None
+    docs.update_attribute("slug", "Manual de Uso", uuid4())
+
+    assert docs.slug == "manual-de-uso"
+    event = docs.get_domain_events()[0]
+    assert event.data.get("new_value") == "manual-de-uso"
+    with pytest.raises(DocumentUpdateAttrException):
+        docs.update_attribute("slug", None, uuid4())
+
+
 def test_is_draft_validation(
     docs,
 ):  # pylint: disable=redefined-outer-name
@@ -306,6 +353,10 @@ def test_update_attribute_with_invalid_attr(
     """Testa a atualização de um atributo inválido."""
     with pytest.raises(DocumentUpdateAttrException):
         docs.update_attribute("invalid_attr", "New Value", uuid4())
+    for attr, value in (("_version", -5), ("status", DocumentStatus.DRAFT)):
+        with pytest.raises(DocumentUpdateAttrException):
+            docs.update_attribute(attr, value, uuid4())
+    assert docs.version == 1
 
 
 def test_update_attribute_with_invalid_type(
@@ -355,3 +406,40 @@ def test_update_attribute_with_setter_validation(
         docs.update_attribute("title", "   ", uuid4())
     with pytest.raises(DocumentUpdateAttrException):
         docs.update_attribute("title", "A", uuid4())
+
+
+def test_attach_versions_files(docs):  # pylint: disable=W0621
+    """Testa que cada anexo cria uma versão e preserva as anteriores."""
+    user = uuid4()
+    pdf = "application/pdf"
+    first = docs.attach("contrato.pdf", "a" * 64, 10, pdf, user)
+    scan = docs.attach("scan.png", "b" * 64, 5, "image/png", user)
+    second = docs.attach("contrato.pdf", "c" * 64, 12, pdf, user)
+
+    assert docs.version == 4
+    assert (first.version, scan.version, second.version) == (2, 3, 4)
+    assert docs.attachment("contrato.pdf") == second
+    assert docs.attachment("contrato.pdf", version=3) == first
+    assert docs.attachment("scan.png", version=2) is None
+    assert set(docs.attachments_at()) == {"contrato.pdf", "scan.png"}
+
+    event = docs.get_domain_events()[-1]
+    assert isinstance(event, DocumentAttachmentAddedEvent)
+    assert event.event_type == "document_updated"
+    assert event.data["old_value"] == "a" * 64
+    assert event.data["digest"] == "c" * 64
+    assert event.data["version"] == 4
+
+
+def test_attach_rejects_invalid_files(docs):  # pylint: disable=W0621
+    """Testa que anexos inválidos não alteram o documento."""
+    with pytest.raises(DomainValidationError):
+        docs.attach("a.pdf", "xyz", 1, "application/pdf", uuid4())
+    with pytest.raises(DomainValidationError):
+        docs.attach(" ", "a" * 64, 1, "application/pdf", uuid4())
+    assert docs.version == 1
+    assert docs.attachments == ()
+
+    docs.delete()
+    with pytest.raises(DomainValidationError):
+        docs.attach("a.pdf", "a" * 64, 1, "application/pdf", uuid4())
@@ -0,0 +1,25 @@
+"""Testes para a normalização de textos."""
+
+from src.core.domain.text import fold_accents, slug_family, slugify
+
+
+def test_fold_accents():
+    """Testa a remoção de acentos do português."""
+    assert fold_accents("Ação, Pão e Órgão à vista") == (
+        "Acao, Pao e Orgao a vista"
+    )
+
+
+def test_slugify():
+    """Testa a geração de slugs."""
+    assert slugify("  Locação de Imóveis — 2024!  ") == (
+        "locacao-de-imoveis-2024"
+    )
+    assert slugify("???") == ""
+    assert slugify("a" * 100, max_length=10) == "a" * 10
+
+
+def test_slug_family():
+    """Testa a remoção do sufixo numérico."""
+    assert slug_family("contrato-2024-3") == "contrato-2024"
+    assert slug_family("contrato") == "contrato"
@@ -0,0 +1,112 @@
+"""Testes para o envio SMTP contra o servidor local."""
+
+from uuid import uuid4
+
+import pytest
+
+from src.core.application.services.notification import (
+    Notification,
+    NotificationDispatcher,
+    NotificationQueue,
+    PermanentDeliveryError,
+    RetryPolicy,
+    TransientDeliveryError,
+)
+from src.core.infrastucture.notifications.local_smtp import LocalSmtpServer
+from src.core.infrastucture.notifications.smtp import SmtpMailer
+
+
+@pytest.fixture
+def server():
+    """Servidor SMTP local."""
+    with LocalSmtpServer() as smtp_server:
+        yield smtp_server
+
+
+def make_notification(index: int) -> Notification:
+    """Cria uma notificação numerada."""
+    return Notification(
+        uuid4(), (f"user{index}@example.com",), f"Aviso {index}", "Olá"
+    )
+
+
+def test_batch_reuses_one_connection(
+    server,
+):  # pylint: disable=redefined-outer-name
+    """Testa que lotes seguidos usam a mesma conexão."""
+    mailer = SmtpMailer(server.host, server.port, sender="app@example.com")
+
+    first = mailer.send_batch([make_notification(i) for i in range(10)])
+    second = mailer.send_batch([make_notification(i) for i in range(5)])
+    mailer.close()
+
+    assert first + second == [None] * 15
+    assert mailer.connections_opened == 1
+    assert server.connections == 1
+    assert len(server.messages) == 15
+    assert server.messages[0].message["Subject"] == "Aviso 0"
+    assert server.messages[0].recipients == ("user0@example.com",)
+
+
+def test_classifies_failures(server):  # pylint: disable=redefined-outer-name
+    """Testa a classificação de respostas 4xx e 5xx."""
+    mailer = SmtpMailer(server.host, server.port)
+    server.fail_next("451 Tente mais tarde")
+    server.fail_next("550 Caixa inexistente")
+
+    results = mailer.send_batch([make_notification(i) for i in range(3)])
+    mailer.close()
+
+    assert isinstance(results[0], TransientDeliveryError)
+    assert isinstance(results[1], PermanentDeliveryError)
+    assert results[2] is None
+
+
+def test_dispatcher_retries_until_delivered(
+    server,
+):  # pylint: disable=redefined-outer-name
+    """Testa o reenvio de ponta a ponta contra o servidor local."""
+    queue = NotificationQueue()
+    queue.put(make_notification(1))
+    server.fail_next(count=2)
+    dispatcher = NotificationDispatcher(
+        queue,
+        SmtpMailer(server.host, server.port),
+        retry=RetryPolicy(base_delay=0, jitter=0),
+    )
+
+    reports = [dispatcher.dispatch_once() for _ in range(3)]
+    dispatcher.mailer.close()
+
+    assert [report.sent for report in reports] == [0, 0, 1]
+    assert len(server.messages) == 1
+
+
+def test_partially_refused_recipients_fail(
+    server,
+):  # pylint: disable=redefined-outer-name
+    """Testa a recusa de parte dos destinatários de uma mensagem."""
+    mailer = SmtpMailer(server.host, server.port)
+    server.refuse("sumiu@example.com")
+    server.refuse("cheio@example.com", "452 Caixa cheia")
+    permanent = Notification(
+        uuid4(), ("ok@example.com", "sumiu@example.com"), "Aviso", "Olá"
+    )
+    transient = Notification(
+        uuid4(),
+        ("ok@example.com", "sumiu@example.com", "cheio@example.com"),
+        "Aviso",
+        "Olá",
+    )
+
+    results = mailer.send_batch([permanent, transient])
+    mailer.close()
+
+    assert isinstance(results[0], PermanentDeliveryError)
+    assert isinstance(results[1], TransientDeliveryError)
+    assert permanent.recipients == ("sumiu@example.com",)
+    assert transient.recipients == ("sumiu@example.com", "cheio@example.com")
+    assert [message.recipients for message in server.messages] == [
+        ("ok@example.com",),
+        ("ok@example.com",),
+    ]
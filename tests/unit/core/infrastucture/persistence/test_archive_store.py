@@ -0,0 +1,74 @@
+"""Testes dos segmentos compactados do armazenamento frio."""
+
+import os
+
+import pytest
+
+from src.core.infrastucture.persistence.archive import ArchiveStore
+
+
+@pytest.mark.parametrize("codec", ["zlib", "lzma"])
+def test_append_and_read_compressed(tmp_path, codec):
+    store = ArchiveStore(tmp_path, codec=codec)
+    data = b"contrato de locacao " * 500
+
+    location = store.append(data)
+    other = store.append(b"curto")
+
+    assert store.read(location) == data
+    assert store.read(other) == b"curto"
+    assert other.offset == location.length
+    assert store.size < len(data) // 10
+
+
+def test_rotation_and_discard_remove_dead_segments(tmp_path):
+    store = ArchiveStore(tmp_path, segment_bytes=200)
+    blobs = [os.urandom(80) for _ in range(3)]  # incompressíveis
+    first, second, third = [store.append(blob) for blob in blobs]
+    assert [first.segment, second.segment, third.segment] == [1, 1, 2]
+
+    store.discard(first)
+    assert store.garbage == first.length
+    assert store.read(second) == blobs[1]
+    reader = store._readers[1]  # pylint: disable=protected-access
+
+    store.discard(second)
+    assert store.segments == 1 and store.garbage == 0
+    assert not (tmp_path / "segment-00000001.arc").exists()
+    with pytest.raises(OSError):
+        os.fstat(reader)  # o descritor do segmento apagado foi fechado
+
+    store.discard(third)  # o segmento ativo não é apagado
+    assert store.segments == 1 and store.garbage == third.length
+
+
+def test_reopen_appends_to_last_segment(tmp_path):
+    store = ArchiveStore(tmp_path)
+    first = store.append(b"primeiro")
+    store.close()
+
+    reopened = ArchiveStore(tmp_path, codec="lzma")
+    second = reopened.append(b"segundo")
+
+    assert reopened.read(first) == b"primeiro"
+    assert reopened.read(second) == b"segundo"
+    assert second.offset == first.length
+
+
+def test_corrupted_record_raises(tmp_path):
+    store = ArchiveStore(tmp_path)
+    location = store.append(b"x" * 100)
+    path = tmp_path / "segment-00000001.arc"
+    data = bytearray(path.read_bytes())
+    data[-1] ^= 0xFF
+    path.write_bytes(bytes(data))
+
+    with pytest.raises(ValueError):
+        ArchiveStore(tmp_path).read(location)
+
+
+def test_invalid_arguments(tmp_path):
+    with pytest.raises(ValueError):
+        ArchiveStore(tmp_path, codec="zstd")
+    with pytest.raises(ValueError):
+        ArchiveStore(tmp_path, segment_bytes=0)
@@ -0,0 +1,143 @@
+"""Testes do armazenamento de conteúdo no sistema de arquivos."""
+
+import hashlib
+import io
+import os
+import random
+from uuid import uuid4
+
+import pytest
+
+from src.core.application.use_cases.document.attach import AttachFileUseCase
+from src.core.domain.exceptions import BlobNotFoundException
+from src.core.infrastucture.persistence.blob_store import (
+    ChunkedBlobStore,
+    FileSystemBlobStore,
+)
+from src.core.infrastucture.persistence.chunking import Chunker
+from src.core.infrastucture.persistence.document import (
+    InMemoryDocumentRepository,
+)
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Armazenamento com blocos pequenos, para exercitar o streaming."""
+    return FileSystemBlobStore(tmp_path / "blobs", chunk_size=7)
+
+
+def objects(store):  # pylint: disable=redefined-outer-name
+    return [path for path in store.root.rglob("*") if path.is_file()]
+
+
+def test_put_streams_and_hashes_in_one_pass(store):  # pylint: disable=W0621
+    content = os.urandom(1000)
+
+    from_file = store.put(io.BytesIO(content))
+    from_chunks = store.put(
+        content[start : start + 100] for start in range(0, 1000, 100)
+    )
+
+    assert from_file.digest == hashlib.sha256(content).hexdigest()
+    assert from_file == from_chunks
+    assert from_file.size == 1000
+    assert store.size(from_file.digest) == 1000
+    assert b"".join(store.read_chunks(from_file.digest)) == content
+    with store.open(from_file.digest) as file:
+        assert file.read() == content
+
+
+def test_identical_content_is_stored_once(store):  # pylint: disable=W0621
+    first = store.put([b"modelo de contrato"])
+    second = store.put(io.BytesIO(b"modelo de contrato"))
+    store.put([b"outro conteudo"])
+
+    assert first == second
+    assert len(objects(store)) == 2
+    assert not list((store.root / "tmp").iterdir())
+
+
+def test_failed_write_leaves_no_object(store):  # pylint: disable=W0621
+    def broken():
+        yield b"parte"
+        raise OSError("conexão interrompida")
+
+    with pytest.raises(OSError):
+        store.put(broken())
+
+    assert objects(store) == []
+
+
+def test_missing_and_invalid_digests(store):  # pylint: disable=W0621
+    missing = "0" * 64
+
+    assert not store.exists(missing)
+    with pytest.raises(BlobNotFoundException):
+        store.open(missing)
+    with pytest.raises(ValueError):
+        store.exists("../../etc/passwd")
+
+
+def test_attach_file_use_case(store, docs):  # pylint: disable=W0621
+    repository = InMemoryDocumentRepository()
+    repository.save(docs)
+    use_case = AttachFileUseCase(repository, store)
+
+    attachment = use_case.execute(
+        docs.entity_id,
+        "contrato.pdf",
+        io.BytesIO(b"%PDF-1.7"),
+        "application/pdf",
+        uuid4(),
+    )
+
+    stored = repository.get(docs.entity_id)
+    assert stored.version == 2
+    assert stored.attachment("contrato.pdf") == attachment
+    assert store.exists(attachment.digest)
+    assert repository.get_metadata(docs.entity_id).version == 2
+
+
+@pytest.fixture
+def chunked(tmp_path):
+    """Armazenamento por blocos pequenos."""
+    return ChunkedBlobStore(
+        tmp_path / "chunked",
+        Chunker(min_size=256, avg_size=1024, max_size=4096),
+    )
+
+
+def test_chunked_versions_share_unchanged_chunks(
+    chunked,
+):  # pylint: disable=redefined-outer-name
+    content = random.Random(3).randbytes(100_000)
+    edited = content[:40_000] + b"nova clausula" + content[40_000:]
+
+    first = chunked.put(io.BytesIO(content))
+    second = chunked.put([edited])
+    stored = sum(path.stat().st_size for path in objects(chunked.chunks))
+
+    assert first.digest == hashlib.sha256(content).hexdigest()
+    assert second.size == len(edited)
+    assert stored < len(content) + 3 * 4096
+    assert sum(size for _, size in chunked.manifest(first.digest)) == len(
+        content
+    )
+    assert chunked.put([content]) == first
+
+
+def test_chunked_reads_reassemble_stream(
+    chunked,
+):  # pylint: disable=redefined-outer-name
+    content = random.Random(4).randbytes(50_000)
+    digest = chunked.put([content]).digest
+
+    assert b"".join(chunked.read_chunks(digest)) == content
+    assert chunked.size(digest) == len(content)
+    with chunked.open(digest) as file:
+        file.seek(12_345)
+        assert file.read(10_000) == content[12_345:22_345]
+        file.seek(-10, io.SEEK_END)
+        assert file.read() == content[-10:]
+    with pytest.raises(BlobNotFoundException):
+        chunked.open("1" * 64)
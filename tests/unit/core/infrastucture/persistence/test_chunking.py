@@ -0,0 +1,64 @@
+"""Testes da divisão em blocos definidos pelo conteúdo."""
+
+import io
+import random
+
+import pytest
+
+from src.core.infrastucture.persistence import chunking
+from src.core.infrastucture.persistence.chunking import Chunker
+
+
+@pytest.fixture
+def data():
+    """Conteúdo pseudoaleatório determinístico."""
+    return random.Random(7).randbytes(200_000)
+
+
+def small_chunker(**kwargs):
+    return Chunker(min_size=256, avg_size=1024, max_size=4096, **kwargs)
+
+
+def test_chunks_respect_size_limits(data):  # pylint: disable=W0621
+    chunks = small_chunker().split(data)
+
+    assert b"".join(chunks) == data
+    assert all(256 < len(chunk) <= 4096 for chunk in chunks[:-1])
+    assert 1024 / 2 < len(data) / len(chunks) < 1024 * 2
+
+
+def test_streaming_matches_in_memory(data):  # pylint: disable=W0621
+    chunker = small_chunker()
+    expected = chunker.split(data)
+    pieces = (data[start : start + 999] for start in range(0, len(data), 999))
+
+    assert list(chunker.chunks(io.BytesIO(data))) == expected
+    assert list(chunker.chunks(pieces)) == expected
+
+
+@pytest.mark.skipif(chunking.np is None, reason="requer o extra analytics")
+def test_vectorized_and_pure_python_cut_identically(
+    data,
+):  # pylint: disable=redefined-outer-name
+    vectorized = small_chunker(vectorized=True).split(data)
+
+    assert small_chunker(vectorized=False).split(data) == vectorized
+
+
+def test_edit_only_changes_nearby_chunks(data):  # pylint: disable=W0621
+    chunker = small_chunker()
+    original = set(chunker.split(data))
+    edited = data[:100_000] + b"inserido" + data[100_000:]
+
+    new = [chunk for chunk in chunker.split(edited) if chunk not in original]
+
+    assert sum(len(chunk) for chunk in new) <= 3 * 4096
+
+
+def test_invalid_parameters():
+    with pytest.raises(ValueError):
+        Chunker(min_size=32, avg_size=1024, max_size=4096)
+    with pytest.raises(ValueError):
+        Chunker(min_size=256, avg_size=1000, max_size=4096)
+    with pytest.raises(ValueError):
+        Chunker(min_size=4096, avg_size=1024, max_size=8192)
@@ -0,0 +1,56 @@
+"""Testes do cache em disco com remoção LRU."""
+
+import os
+
+import pytest
+
+from src.core.infrastucture.persistence.disk_cache import DiskLRUCache
+
+
+def test_put_get_and_lru_eviction(tmp_path):
+    cache = DiskLRUCache(tmp_path, max_bytes=30)
+    cache.put("aa1", b"x" * 10)
+    cache.put("bb2", b"y" * 10)
+    cache.put("cc3", b"z" * 10)
+    assert cache.get("aa1") == b"x" * 10  # aa1 passa a ser o mais recente
+
+    cache.put("dd4", b"w" * 10)
+
+    assert "bb2" not in cache
+    assert cache.get("bb2") is None
+    assert not (tmp_path / "bb" / "bb2").exists()
+    assert [key in cache for key in ("aa1", "cc3", "dd4")] == [True] * 3
+    assert cache.size == 30
+
+
+def test_replace_oversized_and_discard(tmp_path):
+    cache = DiskLRUCache(tmp_path, max_bytes=10)
+    assert cache.put("aa", b"1234")
+    assert cache.put("aa", b"123456")
+    assert cache.size == 6
+    assert not cache.put("bb", b"x" * 11)
+    assert "bb" not in cache and cache.get("aa") == b"123456"
+
+    cache.discard("aa")
+    cache.discard("aa")
+    assert len(cache) == 0 and cache.size == 0
+
+
+def test_reopen_restores_usage_order(tmp_path):
+    cache = DiskLRUCache(tmp_path, max_bytes=100)
+    for index, key in enumerate(("aa", "bb", "cc")):
+        cache.put(key, b"x" * 10)
+        os.utime(tmp_path / key[:2] / key, ns=(index, index))
+    cache.get("aa")
+
+    reopened = DiskLRUCache(tmp_path, max_bytes=20)
+
+    assert len(reopened) == 2
+    assert "bb" not in reopened
+    assert reopened.get("aa") == b"x" * 10
+
+
+@pytest.mark.parametrize("key", ["", "../x", "a/b", ".hidden", "a..b"])
+def test_invalid_keys(tmp_path, key):
+    with pytest.raises(ValueError):
+        DiskLRUCache(tmp_path, max_bytes=10).put(key, b"x")
@@ -0,0 +1,259 @@
+"""Testes para o repositório de documentos em memória."""
+
+import threading
+from uuid import uuid4
+
+import pytest
+
+from src.core.domain.entities.document import Document
+from src.core.domain.exceptions import (
+    DocumentAlreadyExistsException,
+    DocumentNotFoundException,
+)
+from src.core.domain.value_objects.doc_status import DocumentStatus
+from src.core.domain.value_objects.doc_types import DocumentType
+from src.core.infrastucture.persistence.archive import ArchiveStore
+from src.core.infrastucture.persistence.document import (
+    InMemoryDocumentRepository,
+)
+
+
+@pytest.fixture
+def repository():
+    """Repositório vazio."""
+    return InMemoryDocumentRepository()
+
+
+def test_save_and_get(
+    repository, docs
+):  # pylint: disable=redefined-outer-name
+    """Testa o armazenamento e a leitura de um documento."""
+    repository.save(docs)
+
+    assert repository.get(docs.entity_id) is docs
+    assert repository.get_by_id(docs.entity_id) is docs
+    assert repository.exists(docs.entity_id)
+    assert repository.count() == 1
+    assert repository.all() == [docs]
+
+
+def test_save_duplicate_raises(
+    repository, docs
+):  # pylint: disable=redefined-outer-name
+    """Testa que salvar o mesmo documento duas vezes falha."""
+    repository.save(docs)
+
+    with pytest.raises(DocumentAlreadyExistsException):
+        repository.save(docs)
+
+
+def test_get_missing_raises(
+    repository,
+):  # pylint: disable=redefined-outer-name
+    """Testa a leitura de um documento inexistente."""
+    with pytest.raises(DocumentNotFoundException):
+        repository.get(uuid4())
+
+
+def test_queries_use_indexes(
+    repository, docs, user_id
+):  # pylint: disable=redefined-outer-name
+    """Testa as consultas por tenant, tipo, usuário e status."""
+    other = Document(
+        title="Outro documento",
+        user_id=uuid4(),
+        document_type=DocumentType.MANUAL,
+        tenant_id=uuid4(),
+    )
+    repository.save(docs)
+    repository.save(other)
+
+    assert repository.get_by_tenant_id(docs.tenant_id) == [docs]
+    assert repository.get_by_document_type(DocumentType.MANUAL) == [other]
+    assert repository.get_by_user_id(user_id) == [docs]
+    assert repository.get_by_status(DocumentStatus.DRAFT) == [docs, other]
+    assert repository.get_by_status("Rascunho") == [docs, other]
+
+
+def test_update_moves_index_entries(
+    repository, docs
+):  # pylint: disable=redefined-outer-name
+    """Testa que a atualização move o documento entre os índices."""
+    repository.save(docs)
+
+    docs.publish()
+    repository.update(docs)
+
+    assert repository.get_by_status(DocumentStatus.DRAFT) == []
+    assert repository.get_by_status(DocumentStatus.PUBLISHED) == [docs]
+
+
+def test_delete_removes_from_indexes(
+    repository, docs
+):  # pylint: disable=redefined-outer-name
+    """Testa a remoção de um documento."""
+    repository.save(docs)
+
+    repository.delete(docs.entity_id)
+
+    assert not repository.exists(docs.entity_id)
+    assert repository.get_by_tenant_id(docs.tenant_id) == []
+    with pytest.raises(DocumentNotFoundException):
+        repository.delete(docs.entity_id)
+
+
+def test_page_by_tenant_follows_cursor(
+    repository, user_id
+):  # pylint: disable=redefined-outer-name
+    """Testa a paginação por cursor dos documentos de um tenant."""
+    tenant_id = uuid4()
+    documents = [
+        repository.save(
+            Document(
+                title=f"Documento {index}",
+                user_id=user_id,
+                document_type=DocumentType.REPORT,
+                tenant_id=tenant_id,
+            )
+        )
+        for index in range(5)
+    ]
+    repository.save(
+        Document(
+            title="Outro tenant",
+            user_id=user_id,
+            document_type=DocumentType.REPORT,
+            tenant_id=uuid4(),
+        )
+    )
+    expected = sorted(documents, key=lambda document: document.entity_id)
+    repository.delete(expected[2].entity_id)
+    del expected[2]
+
+    first = repository.get_page_by_tenant(tenant_id, 2)
+    rest = repository.get_page_by_tenant(tenant_id, 10, first[-1].entity_id)
+
+    assert first + rest == expected
+    assert repository.get_page_by_tenant(uuid4(), 10) == []
+
+
+def test_metadata_tracks_persisted_state(
+    repository, docs
+):  # pylint: disable=redefined-outer-name
+    """Testa que os metadados refletem a última gravação."""
+    repository.save(docs)
+    saved = repository.get_metadata(docs.entity_id)
+
+    docs.increment_version()
+    assert repository.get_metadata(docs.entity_id) == saved
+
+    repository.update(docs)
+    metadata = repository.get_metadata(docs.entity_id)
+    assert metadata == (docs.entity_id, 2, docs.updated_at)
+
+    repository.delete(docs.entity_id)
+    with pytest.raises(DocumentNotFoundException):
+        repository.get_metadata(docs.entity_id)
+
+
+def test_archived_documents_move_to_cold_storage(
+    tmp_path, docs
+):  # pylint: disable=redefined-outer-name
+    """Testa que arquivados ficam compactados e são lidos sob demanda."""
+    archive = ArchiveStore(tmp_path)
+    repository = InMemoryDocumentRepository(archive)
+    repository.save(docs)
+
+    docs.archive()
+    repository.update(docs)
+
+    assert repository.archived == 1 and archive.size > 0
+    loaded = repository.get(docs.entity_id)
+    assert loaded is not docs
+    assert (loaded.title, loaded.status, loaded.version) == (
+        docs.title,
+        DocumentStatus.ARCHIVED,
+        docs.version,
+    )
+    assert loaded.get_domain_events() == []
+    assert repository.get_by_status(DocumentStatus.ARCHIVED) == [docs]
+    assert repository.get_archived_by_tenant(docs.tenant_id) == [docs]
+    assert repository.get_metadata(docs.entity_id).version == docs.version
+
+    loaded.publish()
+    repository.update(loaded)
+
+    assert repository.archived == 0 and archive.garbage == archive.size
+    assert repository.get(docs.entity_id) is loaded
+    assert repository.get_by_tenant_id(docs.tenant_id) == [loaded]
+
+
+def test_tenant_listings_skip_cold_records(
+    tmp_path, docs, monkeypatch
+):  # pylint: disable=redefined-outer-name
+    """Testa que as listagens do tenant não descompactam arquivados."""
+    archive = ArchiveStore(tmp_path)
+    repository = InMemoryDocumentRepository(archive)
+    hot = repository.save(
+        Document(
+            title="Ativo",
+            user_id=docs.user_id,
+            document_type=docs.document_type,
+            tenant_id=docs.tenant_id,
+        )
+    )
+    docs.archive()
+    repository.save(docs)
+    monkeypatch.setattr(archive, "read", None)  # qualquer leitura falha
+
+    assert repository.get_by_tenant_id(docs.tenant_id) == [hot]
+    assert repository.get_page_by_tenant(docs.tenant_id, 10) == [hot]
+    assert repository.count_archived_by_tenant(docs.tenant_id) == 1
+    assert repository.get_tenant_version(docs.tenant_id) == 2
+
+
+def test_delete_discards_cold_record(
+    tmp_path, docs
+):  # pylint: disable=redefined-outer-name
+    """Testa que excluir um arquivado descarta o registro frio."""
+    archive = ArchiveStore(tmp_path)
+    repository = InMemoryDocumentRepository(archive)
+    docs.archive()
+    repository.save(docs)
+
+    repository.delete(docs.entity_id)
+
+    assert not repository.exists(docs.entity_id)
+    assert repository.archived == 0 and archive.garbage == archive.size
+
+
+def test_cold_reads_survive_concurrent_updates(
+    tmp_path, docs
+):  # pylint: disable=redefined-outer-name
+    """Testa leituras de arquivados enquanto os segmentos são apagados."""
+    archive = ArchiveStore(tmp_path, segment_bytes=1)
+    repository = InMemoryDocumentRepository(archive)
+    docs.archive()
+    repository.save(docs)
+    stop = threading.Event()
+    errors = []
+
+    def read():
+        while not stop.is_set():
+            try:
+                repository.get(docs.entity_id)
+            except Exception as error:  # pylint: disable=broad-except
+                errors.append(error)
+                return
+
+    readers = [threading.Thread(target=read) for _ in range(4)]
+    for reader in readers:
+        reader.start()
+    for _ in range(300):
+        repository.update(docs)  # cada gravação abre e apaga um segmento
+    stop.set()
+    for reader in readers:
+        reader.join()
+
+    assert errors == []
+    assert archive.segments == 1
@@ -0,0 +1,76 @@
+"""Testes para o repositório de pastas em memória."""
+
+from uuid import uuid4
+
+import pytest
+
+from src.core.domain.entities.folder import Folder
+from src.core.domain.exceptions import BusinessRuleViolationError
+from src.core.infrastucture.persistence.folder import InMemoryFolderRepository
+from src.core.infrastucture.persistence.path_index import PathIndex
+
+
+@pytest.fixture
+def tree():
+    """Árvore `raiz > a > a1` e `raiz > b` de um tenant."""
+    repository = InMemoryFolderRepository()
+    tenant_id = uuid4()
+    root = repository.save(Folder("Raiz", tenant_id))
+    a = repository.save(Folder("A", tenant_id, root.entity_id))
+    a1 = repository.save(Folder("A1", tenant_id, a.entity_id))
+    b = repository.save(Folder("B", tenant_id, root.entity_id))
+    return repository, root, a, a1, b
+
+
+def test_subtree_and_membership(tree):  # pylint: disable=redefined-outer-name
+    """Testa a leitura da subárvore e a pertinência por prefixo."""
+    repository, root, a, a1, b = tree
+
+    assert set(repository.get_subtree(a.entity_id)) == {a, a1}
+    assert len(repository.get_subtree(root.entity_id)) == 4
+    assert repository.is_in_subtree(a1.entity_id, root.entity_id)
+    assert not repository.is_in_subtree(a1.entity_id, b.entity_id)
+    assert repository.get_children(root.entity_id) == [a, b]
+    assert a1.depth == 2
+
+
+def test_move_rewrites_whole_subtree(
+    tree,
+):  # pylint: disable=redefined-outer-name
+    """Testa a movimentação de uma subárvore em bloco."""
+    repository, root, a, a1, b = tree
+
+    repository.move(a.entity_id, b.entity_id)
+
+    assert a.parent_id == b.entity_id
+    assert a1.path.startswith(b.path)
+    assert set(repository.get_subtree(b.entity_id)) == {b, a, a1}
+    assert repository.get_children(root.entity_id) == [b]
+
+
+def test_invalid_moves_raise(tree):  # pylint: disable=redefined-outer-name
+    """Testa ciclos, outras empresas e remoção de pastas com filhas."""
+    repository, _, a, a1, _ = tree
+
+    with pytest.raises(BusinessRuleViolationError):
+        repository.move(a.entity_id, a1.entity_id)
+    other = repository.save(Folder("Outra", uuid4()))
+    with pytest.raises(BusinessRuleViolationError):
+        repository.move(a.entity_id, other.entity_id)
+    with pytest.raises(BusinessRuleViolationError):
+        repository.delete(a.entity_id)
+    repository.delete(a1.entity_id)
+    assert repository.get_subtree(a.entity_id) == [a]
+
+
+def test_path_index_rebase():
+    """Testa a troca de prefixo de uma faixa do índice."""
+    index = PathIndex()
+    for path, item in [("/a/", 1), ("/a/b/", 2), ("/c/", 3), ("/d/", 4)]:
+        index.add(path, item)
+
+    moved = index.rebase("/a/", "/c/a/")
+
+    assert moved == [("/c/a/", 1), ("/c/a/b/", 2)]
+    assert list(index.subtree("/c/")) == [3, 1, 2]
+    assert index.count("/a/") == 0
@@ -0,0 +1,62 @@
+"""Testes para a árvore de intervalos."""
+
+import random
+
+import pytest
+
+from src.core.infrastucture.persistence.interval_tree import IntervalTree
+
+
+def test_overlapping_and_stabbing():
+    """Testa consultas por faixa e por ponto."""
+    tree = IntervalTree(seed=1)
+    tree.insert(1, 5, "a")
+    tree.insert(3, 8, "b")
+    tree.insert(10, 12, "c")
+
+    assert list(tree.overlapping(6, 9)) == ["b"]
+    assert list(tree.overlapping(0, 20)) == ["a", "b", "c"]
+    assert list(tree.stabbing(5)) == ["a", "b"]
+    assert not list(tree.stabbing(9))
+    assert len(tree) == 3
+
+
+def test_remove():
+    """Testa a remoção pelo início e pelo identificador."""
+    tree = IntervalTree(seed=1)
+    tree.insert(1, 5, "a")
+    tree.insert(1, 3, "b")
+
+    assert tree.remove(1, "a")
+    assert not tree.remove(1, "a")
+    assert list(tree) == ["b"]
+    assert len(tree) == 1
+
+
+def test_invalid_interval_raises():
+    """Testa que intervalos invertidos são rejeitados."""
+    with pytest.raises(ValueError):
+        IntervalTree().insert(5, 1, "a")
+
+
+def test_matches_linear_scan():
+    """Compara as consultas com uma varredura linear."""
+    rng = random.Random(7)
+    tree = IntervalTree(seed=7)
+    intervals = {}
+    for item_id in range(500):
+        start = rng.randrange(1000)
+        intervals[item_id] = (start, start + rng.randrange(50))
+        tree.insert(*intervals[item_id], item_id)
+    for item_id in range(0, 500, 3):
+        tree.remove(intervals.pop(item_id)[0], item_id)
+
+    for _ in range(100):
+        low = rng.randrange(1000)
+        high = low + rng.randrange(30)
+        expected = {
+            item_id
+            for item_id, (start, end) in intervals.items()
+            if start <= high and end >= low
+        }
+        assert set(tree.overlapping(low, high)) == expected
@@ -0,0 +1,63 @@
+"""Testes para os armazenamentos de sequências."""
+
+import multiprocessing
+
+import pytest
+
+from src.core.application.services.sequence import BlockSequenceAllocator
+from src.core.infrastucture.persistence.sequence import (
+    InMemorySequenceRepository,
+    SqliteSequenceRepository,
+)
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def repository(request, tmp_path):
+    """Armazenamentos de sequências."""
+    if request.param == "memory":
+        return InMemorySequenceRepository()
+    return SqliteSequenceRepository(tmp_path / "sequences.db")
+
+
+def test_reserve_block(repository):  # pylint: disable=redefined-outer-name
+    """Testa blocos consecutivos e sequências independentes."""
+    assert repository.reserve_block("a", 10) == 1
+    assert repository.reserve_block("a", 5) == 11
+    assert repository.reserve_block("b", 5) == 1
+    with pytest.raises(ValueError):
+        repository.reserve_block("a", 0)
+
+
+def test_sqlite_persists_between_instances(tmp_path):
+    """Testa que a sequência continua após reabrir o arquivo."""
+    SqliteSequenceRepository(tmp_path / "seq.db").reserve_block("a", 10)
+
+    assert (
+        SqliteSequenceRepository(tmp_path / "seq.db").reserve_block("a", 1)
+        == 11
+    )
+
+
+def _allocate(path: str, count: int, queue) -> None:
+    allocator = BlockSequenceAllocator(
+        SqliteSequenceRepository(path), block_size=7
+    )
+    queue.put([allocator.next("contract") for _ in range(count)])
+
+
+def test_sqlite_is_safe_across_processes(tmp_path):
+    """Testa que processos concorrentes nunca recebem o mesmo número."""
+    path = str(tmp_path / "sequences.db")
+    SqliteSequenceRepository(path)
+    queue = multiprocessing.Queue()
+    workers = [
+        multiprocessing.Process(target=_allocate, args=(path, 100, queue))
+        for _ in range(4)
+    ]
+    for worker in workers:
+        worker.start()
+    numbers = [number for _ in workers for number in queue.get(timeout=60)]
+    for worker in workers:
+        worker.join()
+
+    assert len(numbers) == len(set(numbers)) == 400
@@ -0,0 +1,54 @@
+"""Testes para o repositório de empresas em memória."""
+
+import pytest
+
+from src.core.domain.exceptions import TenantNotFoundException
+from src.core.infrastucture.persistence.tenant import (
+    InMemoryTenantRepository,
+)
+
+
+@pytest.fixture
+def repository(tenant):  # pylint: disable=redefined-outer-name
+    """Repositório com uma empresa."""
+    repository = InMemoryTenantRepository()
+    repository.save(tenant)
+    return repository
+
+
+def test_exists_by_name_ignores_case(
+    repository, tenant
+):  # pylint: disable=redefined-outer-name
+    """Testa a busca por nome sem diferenciar maiúsculas."""
+    assert repository.exists_by_name(tenant.name.upper())
+    assert not repository.exists_by_name("Outra Empresa")
+
+
+def test_actives_and_inactives(
+    repository, tenant
+):  # pylint: disable=redefined-outer-name
+    """Testa a separação entre empresas ativas e inativas."""
+    assert repository.get_actives() == [tenant]
+
+    tenant.deactivate()
+    repository.update(tenant)
+
+    assert repository.get_actives() == []
+    assert repository.get_inactives() == [tenant]
+
+
+def test_get_by_user_id(
+    repository, tenant, user_id
+):  # pylint: disable=redefined-outer-name
+    """Testa a busca por usuário."""
+    assert repository.get_by_user_id(user_id) == [tenant]
+
+
+def test_get_missing_raises(
+    repository, tenant
+):  # pylint: disable=redefined-outer-name
+    """Testa a leitura de uma empresa removida."""
+    repository.delete(tenant.entity_id)
+
+    with pytest.raises(TenantNotFoundException):
+        repository.get(tenant.entity_id)
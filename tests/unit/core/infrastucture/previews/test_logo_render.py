@@ -0,0 +1,50 @@
+"""Testes do redimensionamento do logo (requer o extra `preview`)."""
+
+import io
+
+import pytest
+
+logo = pytest.importorskip("src.core.infrastucture.previews.logo")
+Image = logo.Image
+
+
+def test_render_logo_variants_keep_transparency(tmp_path):
+    path = tmp_path / "logo.png"
+    Image.new("RGBA", (800, 400), (255, 0, 0, 0)).save(path, "PNG")
+
+    results = logo.render_logo(
+        str(path), {"small": 64, "large": 256}, root=str(tmp_path)
+    )
+
+    small = Image.open(io.BytesIO(results["small"]))
+    assert small.size == (64, 32) and small.mode == "RGBA"
+    assert Image.open(io.BytesIO(results["large"])).size == (256, 128)
+
+
+def test_read_logo_rejects_unsafe_sources(tmp_path):
+    path = tmp_path / "logo.png"
+    path.write_bytes(b"x" * 10)
+
+    assert logo.read_logo(str(path), root=str(tmp_path)) == b"x" * 10
+    with pytest.raises(ValueError):
+        logo.read_logo(str(path), root=str(tmp_path / "outro"))
+    with pytest.raises(ValueError):
+        logo.read_logo("file:///etc/passwd", root=str(tmp_path))
+    with pytest.raises(ValueError):
+        logo.read_logo(str(path), root=str(tmp_path), max_bytes=5)
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "http://127.0.0.1/logo.png",
+        "http://localhost:8000/logo.png",
+        "https://10.0.0.5/logo.png",
+        "http://169.254.169.254/latest/meta-data/",
+        "http://[::1]/logo.png",
+        "http://[::ffff:192.168.0.1]/logo.png",
+    ],
+)
+def test_read_logo_rejects_private_hosts(tmp_path, url):
+    with pytest.raises(ValueError, match="não permitido"):
+        logo.read_logo(url, root=str(tmp_path))
@@ -0,0 +1,33 @@
+"""Testes da renderização de prévias (requer o extra `preview`)."""
+
+import io
+
+import pytest
+
+from src.core.domain.repositorys.blob import FileSegment
+
+render = pytest.importorskip("src.core.infrastucture.previews.render")
+render_previews = render.render_previews
+Image = render.Image
+
+
+def test_render_image_variants(tmp_path):
+    output = io.BytesIO()
+    Image.new("RGB", (2000, 1000), "red").save(output, "PNG")
+    path = tmp_path / "imagem.png"
+    path.write_bytes(b"lixo" + output.getvalue())
+    segments = [FileSegment(path, 4, len(output.getvalue()))]
+
+    results = render_previews(
+        segments, "image/png", {"thumbnail": 100, "preview": 400}
+    )
+
+    assert Image.open(io.BytesIO(results["thumbnail"])).size == (100, 50)
+    assert Image.open(io.BytesIO(results["preview"])).size == (400, 200)
+
+
+def test_unsupported_media_type(tmp_path):
+    path = tmp_path / "a.txt"
+    path.write_bytes(b"texto")
+    with pytest.raises(ValueError):
+        render_previews([FileSegment(path, 0, 5)], "text/plain", {"t": 10})
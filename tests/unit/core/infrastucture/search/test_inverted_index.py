@@ -0,0 +1,139 @@
+"""Testes do tokenizador, das listas comprimidas e do índice BM25."""
+
+import random
+
+import pytest
+
+from src.core.infrastucture.search.inverted_index import InvertedIndex
+from src.core.infrastucture.search.postings import (
+    PostingList,
+    np,
+    read_varints,
+    read_varints_array,
+    write_varint,
+)
+from src.core.infrastucture.search.tokenizer import singular, tokenize
+
+MODES = [False] + ([True] if np is not None else [])
+
+
+def test_tokenize_folds_accents_plurals_and_stopwords():
+    assert list(tokenize("Locação de Imóveis para Ações")) == [
+        "locacao",
+        "imovel",
+        "acao",
+    ]
+    assert list(tokenize("LOCACAO imovel")) == ["locacao", "imovel"]
+    assert singular("valores") == "valor"
+    assert singular("itens") == "item"
+    assert singular("status") == "status"
+    assert singular("gas") == "gas"
+    assert singular("lapis") == "lapis"
+    assert singular("pires") == "pir"  # o erro citado na docstring
+
+
+def test_varints_round_trip():
+    values = [0, 1, 127, 128, 300, 16_383, 16_384, 2**40]
+    data = bytearray()
+    for value in values:
+        write_varint(data, value)
+    assert read_varints(data) == values
+    if np is not None:
+        assert read_varints_array(bytes(data)).tolist() == values
+
+
+def test_posting_list_is_delta_encoded():
+    postings = PostingList.build([0, 1, 2, 1000], [1, 2, 1, 3])
+    assert postings.decode() == ([0, 1, 2, 1000], [1, 2, 1, 3])
+    assert len(postings.data) == 9  # só a diferença 997 usa dois bytes
+    with pytest.raises(ValueError):
+        postings.append(1000, 1)
+    if np is not None:
+        documents, frequencies = postings.decode_array()
+        assert documents.tolist() == [0, 1, 2, 1000]
+        assert frequencies.tolist() == [1, 2, 1, 3]
+
+
+@pytest.mark.parametrize("vectorized", MODES)
+def test_bm25_ranking(vectorized):
+    index = InvertedIndex(vectorized)
+    index.add("locacao", [("Contrato de locação de imóvel", 3)])
+    index.add("servico", [("Contrato de prestação de serviços", 3)])
+    index.add("aditivo", [("Aditivo", 3), ("locação de imóveis", 1)])
+    for number in range(20):
+        index.add(number, [(f"Relatório mensal {number}", 3)])
+
+    assert index.search("imóveis locação")[0][0] == "locacao"
+    assert [key for key, _ in index.search("locacao")] == [
+        "locacao",
+        "aditivo",
+    ]
+    assert index.search("contratos", limit=1)[0][0] in ("locacao", "servico")
+    assert index.search("inexistente") == []
+    assert index.search("de para") == []
+
+
+@pytest.mark.parametrize("vectorized", MODES)
+def test_reindex_remove_and_compact(vectorized):
+    index = InvertedIndex(vectorized)
+    index.add("a", [("alfa beta", 1)])
+    assert not index.add("a", [("alfa beta", 1)])
+    assert index.add("a", [("gama", 1)])
+    assert index.removed == 1
+    assert index.search("alfa") == []
+    assert index.search("gama")[0][0] == "a"
+
+    assert index.remove("a")
+    assert not index.remove("a")
+    assert index.search("gama") == []
+
+    index.add("b", [("gama delta", 1)])
+    index.compact()
+    assert index.removed == 0
+    assert len(index) == 1
+    assert index.search("gama")[0][0] == "b"
+
+
+def test_vectorized_and_python_paths_agree():
+    if np is None:
+        pytest.skip("NumPy não instalado")
+    rng = random.Random(3)
+    words = [f"termo{number}" for number in range(50)]
+    indexes = [InvertedIndex(False), InvertedIndex(True)]
+    for number in range(3000):
+        text = " ".join(rng.choices(words, k=rng.randint(1, 30)))
+        for index in indexes:
+            index.add(number, [(text, 1)])
+        if number % 7 == 0:
+            for index in indexes:
+                index.remove(number // 2)
+    for compact in (False, True):
+        if compact:
+            for index in indexes:
+                index.compact()
+        for query in ("termo1", "termo2 termo30", "termo49 termo0 termo7"):
+            python, vectorized = (index.search(query, 20) for index in indexes)
+            # Empates podem trocar de ordem por arredondamento.
+            assert [score for _, score in python] == pytest.approx(
+                [score for _, score in vectorized]
+            )
+            scores = dict(python)
+            for key, score in vectorized:
+                assert scores.get(key, score) == pytest.approx(score)
+
+
+def test_decoded_cache_follows_appends_and_removals():
+    if np is None:
+        pytest.skip("NumPy não instalado")
+    index = InvertedIndex(True, cache_postings=5000)
+    for number in range(2000):
+        index.add(number, [("contrato comum", 1 + number % 3)])
+    first = index.search("contrato", 3)
+
+    index.add("novo", [("contrato contrato contrato", 1)])
+    index.remove(first[0][0])
+    again = [key for key, _ in index.search("contrato", 3)]
+
+    assert first[0][0] not in again
+    assert "novo" in again
+    assert index.search("contrato inexistente", 1)[0][0] == "novo"
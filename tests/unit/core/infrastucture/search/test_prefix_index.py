@@ -0,0 +1,101 @@
+"""Testes do índice de prefixos e do indexador de sugestões."""
+
+from uuid import uuid4
+
+from src.core.application.events import EventBus
+from src.core.application.use_cases.document.update import (
+    UpdateDocumentAttributeUseCase,
+)
+from src.core.domain.entities.document import Document
+from src.core.domain.events.document import DocumentCreatedEvent
+from src.core.domain.events.tenant import TenantCreatedEvent
+from src.core.domain.value_objects.doc_types import DocumentType
+from src.core.infrastucture.persistence.document import (
+    InMemoryDocumentRepository,
+)
+from src.core.infrastucture.persistence.tenant import (
+    InMemoryTenantRepository,
+)
+from src.core.infrastucture.search.prefix_index import PrefixIndex
+from src.core.infrastucture.search.typeahead import TypeaheadIndexer
+
+
+def test_complete_ranks_title_starts_before_inner_words():
+    index = PrefixIndex()
+    index.set(1, "Contrato de Locação de Imóvel")
+    index.set(2, "Locação de veículos")
+    index.set(3, "Aditivo: locação da sala 2")
+    index.set(4, "Relatório anual")
+
+    assert index.complete("Loca") == [
+        (2, "Locação de veículos"),
+        (1, "Contrato de Locação de Imóvel"),
+        (3, "Aditivo: locação da sala 2"),
+    ]
+    assert index.complete("contrato loc") == [
+        (1, "Contrato de Locação de Imóvel")
+    ]
+    assert index.complete("IMÓ") == [(1, "Contrato de Locação de Imóvel")]
+    assert index.complete("loc", limit=1) == [(2, "Locação de veículos")]
+    assert index.complete("contrato de loc") == index.complete("contrato l")
+    assert index.complete("de") == []  # palavras vazias não são indexadas
+    assert index.complete("  ") == []
+
+
+def test_set_replaces_and_remove_clears_entries():
+    index = PrefixIndex()
+    assert index.set("a", "Balanço 2023")
+    assert not index.set("a", "Balanço 2023")
+    assert index.set("a", "Orçamento 2024")
+    assert index.complete("bal") == []
+    assert index.complete("2024") == [("a", "Orçamento 2024")]
+
+    assert index.remove("a")
+    assert not index.remove("a")
+    assert index.complete("orc") == [] and len(index) == 0
+
+
+def test_indexer_follows_title_changes_and_tenants(tenant):
+    documents = InMemoryDocumentRepository()
+    tenants = InMemoryTenantRepository()
+    typeahead = TypeaheadIndexer(documents, tenants)
+    bus = EventBus()
+    typeahead.subscribe(bus)
+
+    tenants.save(tenant)
+    bus.publish(TenantCreatedEvent(tenant.entity_id, tenant.user_id))
+    document = Document(
+        title="Ata de reunião",
+        document_type=DocumentType.REPORT,
+        user_id=uuid4(),
+        tenant_id=tenant.entity_id,
+    )
+    documents.save(document)
+    bus.publish(
+        DocumentCreatedEvent(
+            document.entity_id, document.user_id, document.document_type
+        )
+    )
+
+    bus.dispatch(
+        UpdateDocumentAttributeUseCase(documents).execute(
+            document.entity_id, "title", "Ata da assembleia", uuid4()
+        )
+    )
+
+    assert typeahead.suggest_documents(tenant.entity_id, "ata") == [
+        (document.entity_id, "Ata da assembleia")
+    ]
+    assert typeahead.suggest_documents(tenant.entity_id, "reun") == []
+    assert typeahead.suggest_documents(uuid4(), "ata") == []
+    assert typeahead.suggest_tenants("empresa de t") == [
+        (tenant.entity_id, tenant.name)
+    ]
+
+    documents.delete(document.entity_id)
+    bus.publish(
+        DocumentCreatedEvent(
+            document.entity_id, document.user_id, document.document_type
+        )
+    )
+    assert typeahead.suggest_documents(tenant.entity_id, "ata") == []
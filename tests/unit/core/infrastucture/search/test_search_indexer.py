@@ -0,0 +1,82 @@
+"""Testes da indexação de documentos por eventos."""
+
+from uuid import uuid4
+
+from src.core.application.events import EventBus
+from src.core.application.use_cases.document.change_status import (
+    ChangeDocumentStatusUseCase,
+)
+from src.core.domain.entities.document import Document
+from src.core.domain.events.document import DocumentCreatedEvent
+from src.core.domain.value_objects.doc_status import DocumentStatus
+from src.core.domain.value_objects.doc_types import DocumentType
+from src.core.infrastucture.persistence.document import (
+    InMemoryDocumentRepository,
+)
+from src.core.infrastucture.search.indexer import SearchIndexer
+
+
+def make_document(tenant_id, title):
+    document = Document(
+        title=title,
+        document_type=DocumentType.REPORT,
+        user_id=uuid4(),
+        tenant_id=tenant_id,
+    )
+    document.add_domain_event(
+        DocumentCreatedEvent(
+            document.entity_id, document.user_id, document.document_type
+        )
+    )
+    return document
+
+
+def test_events_keep_each_tenant_index_current(tenant):
+    repository = InMemoryDocumentRepository()
+    indexer = SearchIndexer(repository)
+    bus = EventBus()
+    indexer.subscribe(bus)
+    other_tenant = uuid4()
+    report = make_document(tenant.entity_id, "Relatório de Auditoria")
+    other = make_document(other_tenant, "Relatório de Auditoria")
+    for document in (report, other):
+        repository.save(document)
+        bus.dispatch(document)
+
+    assert indexer.search(tenant.entity_id, "auditoria")[0][0] == (
+        report.entity_id
+    )
+    assert [hit for hit, _ in indexer.search(other_tenant, "relatorio")] == [
+        other.entity_id
+    ]
+    assert indexer.search(uuid4(), "auditoria") == []
+
+    report.update_attribute("title", "Balanço Patrimonial", uuid4())
+    repository.update(report)
+    bus.dispatch(report)
+    assert indexer.search(tenant.entity_id, "auditoria") == []
+    assert indexer.search(tenant.entity_id, "balanco")[0][0] == (
+        report.entity_id
+    )
+
+    # Mudar só o status não reindexa; excluir remove do índice.
+    report.archive()
+    assert not indexer.index(report)
+    deleted = ChangeDocumentStatusUseCase(repository).execute(
+        report.entity_id, DocumentStatus.DELETED, uuid4()
+    )
+    bus.dispatch(deleted)
+    assert indexer.search(tenant.entity_id, "balanco") == []
+
+
+def test_missing_documents_leave_the_index(tenant):
+    repository = InMemoryDocumentRepository()
+    indexer = SearchIndexer(repository)
+    document = make_document(tenant.entity_id, "Ata de reunião")
+    assert indexer.index_many([document]) == 1
+    event = document.get_domain_events()[0]
+
+    indexer.handle(event)
+
+    assert indexer.search(tenant.entity_id, "ata") == []
+    assert not indexer.remove(document.entity_id)
@@ -0,0 +1,548 @@
+"""Testes da aplicação ASGI."""
+
+import asyncio
+import threading
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.core.application.events import EventBus
+from src.core.application.services.rate_limit import (
+    TenantQuota,
+    TenantRateLimiter,
+)
+from src.core.domain.entities.document import Document
+from src.core.domain.value_objects.doc_types import DocumentType
+from src.core.infrastucture.persistence.async_repository import (
+    AsyncRepository,
+)
+from src.core.infrastucture.persistence.document import (
+    InMemoryDocumentRepository,
+)
+from src.core.infrastucture.persistence.tenant import (
+    InMemoryTenantRepository,
+)
+from src.core.presentation.api.app import DocumentApi, create_app
+from src.core.presentation.api.testing import ASGITestClient
+
+
+@pytest.fixture
+def repositories():
+    """Repositórios em memória da aplicação."""
+    return InMemoryDocumentRepository(), InMemoryTenantRepository()
+
+
+@pytest.fixture
+def bus():
+    """Barramento que registra os tipos de evento publicados."""
+    bus = EventBus()
+    bus.published = []
+    bus.subscribe("*", lambda event: bus.published.append(event.event_type))
+    return bus
+
+
+@pytest.fixture
+def client(repositories, bus):  # pylint: disable=redefined-outer-name
+    """Cliente da aplicação, com páginas pequenas."""
+    documents, tenants = repositories
+    return ASGITestClient(DocumentApi(documents, tenants, bus, page_size=3))
+
+
+def create_tenant(client, name="Empresa"):  # pylint: disable=W0621
+    response = client.post(
+        "/tenants",
+        json={
+            "name": name,
+            "description": "Descrição",
+            "logo": "logo.png",
+            "user_id": str(uuid4()),
+        },
+    )
+    assert response.status == 201
+    return response.json()
+
+
+def test_health(client):  # pylint: disable=redefined-outer-name
+    response = client.get("/health")
+    assert response.status == 200
+    assert response.json() == {"status": "ok"}
+
+
+def test_create_and_get_tenant(client, bus):  # pylint: disable=W0621
+    tenant = create_tenant(client)
+
+    response = client.get(f"/tenants/{tenant['id']}")
+
+    assert response.json() == tenant
+    assert bus.published == ["tenant_created"]
+
+
+def test_duplicate_tenant_name_is_conflict(client):  # pylint: disable=W0621
+    create_tenant(client)
+    response = client.post(
+        "/tenants",
+        json={
+            "name": "Empresa",
+            "description": "Outra",
+            "logo": "logo.png",
+            "user_id": str(uuid4()),
+        },
+    )
+    assert response.status == 409
+
+
+def test_document_lifecycle(client, bus):  # pylint: disable=W0621
+    tenant = create_tenant(client)
+    user_id = str(uuid4())
+    response = client.post(
+        "/documents",
+        json={
+            "title": "Relatório anual",
+            "user_id": user_id,
+            "document_type": "REPORT",
+            "tenant_id": tenant["id"],
+        },
+    )
+    assert response.status == 201
+    document = response.json()
+    assert response.headers["location"] == f"/documents/{document['id']}"
+    assert document["status"] == "DRAFT"
+
+    response = client.patch(
+        f"/documents/{document['id']}",
+        json={"attr": "title", "value": "Relatório 2025", "user_id": user_id},
+    )
+    assert response.json()["title"] == "Relatório 2025"
+
+    response = client.post(
+        f"/documents/{document['id']}/status",
+        json={"status": "PUBLISHED", "user_id": user_id},
+    )
+    assert response.json()["status"] == "PUBLISHED"
+    assert bus.published == [
+        "tenant_created",
+        "document_created",
+        "document_updated",
+        "document_updated",
+    ]
+
+
+@pytest.mark.parametrize(
+    "url, body, status",
+    [
+        ("/documents/{missing}", None, 404),
+        ("/documents/not-a-uuid", None, 422),
+        ("/nowhere", None, 404),
+        ("/documents/{document}", {"attr": "status"}, 422),
+        ("/documents/{document}", {"attr": "nope", "value": "x"}, 422),
+        ("/documents/{document}", {"attr": "_version", "value": -5}, 422),
+        ("/documents/{document}", {"attr": "_title", "value": ""}, 422),
+        ("/documents/{document}", {"attr": "version", "value": 9}, 422),
+        ("/documents/{document}/status", {"status": "DRAFT"}, 409),
+        ("/documents/{document}/status", {"status": "NOPE"}, 422),
+    ],
+)
+def test_errors(
+    client, repositories, url, body, status
+):  # pylint: disable=W0621,R0913,R0917
+    documents, _ = repositories
+    document = documents.save(
+        Document(
+            title="Documento",
+            user_id=uuid4(),
+            document_type=DocumentType.REPORT,
+            tenant_id=uuid4(),
+        )
+    )
+    url = url.format(missing=uuid4(), document=document.entity_id)
+    if body is None:
+        response = client.get(url)
+    else:
+        method = "PATCH" if url.count("/") == 2 else "POST"
+        response = client.request(
+            method, url, json={"user_id": str(uuid4()), **body}
+        )
+    assert response.status == status
+    assert "detail" in response.json()
+
+
+def test_failed_update_leaves_document_intact(
+    client, repositories
+):  # pylint: disable=redefined-outer-name
+    documents, _ = repositories
+    tenant_id = uuid4()
+    first, second = [
+        documents.save(
+            Document(
+                title=f"Documento {number}",
+                user_id=uuid4(),
+                document_type=DocumentType.REPORT,
+                tenant_id=tenant_id,
+                slug=f"documento-{number}",
+            )
+        )
+        for number in (1, 2)
+    ]
+    url = f"/documents/{second.entity_id}"
+    etag = client.get(url).headers["etag"]
+    body = {"user_id": str(uuid4()), "attr": "slug"}
+
+    conflict = client.patch(url, json={**body, "value": first.slug})
+
+    assert conflict.status == 409
+    assert client.get(url).json()["slug"] == "documento-2"
+    assert client.get(url, headers={"if-none-match": etag}).status == 304
+    updated = client.patch(url, json={**body, "value": "documento-3"})
+    assert updated.status == 200 and updated.json()["slug"] == "documento-3"
+
+
+def test_patch_sets_slug_of_document_created_without_one(
+    client, repositories
+):  # pylint: disable=redefined-outer-name
+    documents, _ = repositories
+    url = f"/documents/{save_documents(documents, uuid4(), 1)[0]}"
+
+    response = client.patch(
+        url,
+        json={"user_id": str(uuid4()), "attr": "slug", "value": "Meu Slug"},
+    )
+
+    assert response.status == 200
+    assert response.json()["slug"] == "meu-slug"
+
+
+def test_invalid_json_and_wrong_method(client):  # pylint: disable=W0621
+    assert client.post("/tenants", body=b"{").status == 400
+    response = client.request("DELETE", "/tenants")
+    assert response.status == 405
+    assert response.headers["allow"] == "GET, POST"
+
+
+def test_document_of_unknown_tenant_is_rejected(
+    client,
+):  # pylint: disable=W0621
+    response = client.post(
+        "/documents",
+        json={
+            "title": "Documento",
+            "user_id": str(uuid4()),
+            "document_type": "REPORT",
+            "tenant_id": str(uuid4()),
+        },
+    )
+    assert response.status == 422
+
+
+def save_documents(repository, tenant_id, count):
+    return sorted(
+        str(
+            repository.save(
+                Document(
+                    title=f"Documento {index}",
+                    user_id=uuid4(),
+                    document_type=DocumentType.REPORT,
+                    tenant_id=tenant_id,
+                )
+            ).entity_id
+        )
+        for index in range(count)
+    )
+
+
+def test_list_documents_streams_pages(
+    client, repositories
+):  # pylint: disable=W0621
+    documents, _ = repositories
+    tenant = create_tenant(client)
+    save_documents(documents, uuid4(), 5)
+    ids = save_documents(documents, UUID(tenant["id"]), 7)
+
+    response = client.get(f"/tenants/{tenant['id']}/documents")
+
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert [line["id"] for line in response.lines()] == ids
+    # Páginas de 3: cada página é enviada assim que é lida.
+    assert len(response.chunks) == 3
+
+
+def test_list_documents_cursor_and_limit(
+    client, repositories
+):  # pylint: disable=W0621
+    documents, _ = repositories
+    tenant = create_tenant(client)
+    ids = save_documents(documents, UUID(tenant["id"]), 10)
+    url = f"/tenants/{tenant['id']}/documents"
+
+    first = client.get(f"{url}?limit=4").lines()
+    rest = client.get(f"{url}?after={first[-1]['id']}").lines()
+
+    assert len(first) == 4
+    assert [line["id"] for line in first + rest] == ids
+    assert client.get(f"{url}?limit=0").status == 422
+    assert client.get(f"/tenants/{uuid4()}/documents").status == 404
+
+
+def test_list_tenants_by_activity(client):  # pylint: disable=W0621
+    created = [create_tenant(client, f"Empresa {index}") for index in range(5)]
+    client.post(
+        "/tenants",
+        json={
+            "name": "Inativa",
+            "description": "Descrição",
+            "logo": "logo.png",
+            "user_id": str(uuid4()),
+            "is_active": False,
+        },
+    )
+
+    active = client.get("/tenants").lines()
+    inactive = client.get("/tenants?active=false").lines()
+
+    assert [line["id"] for line in active] == sorted(
+        tenant["id"] for tenant in created
+    )
+    assert [line["name"] for line in inactive] == ["Inativa"]
+
+
+def test_offloaded_repository_runs_in_worker_thread():
+    loop_thread = threading.get_ident()
+
+    class Probe:
+        def current_thread(self):
+            return threading.get_ident()
+
+    async def thread_of(offload):
+        return await AsyncRepository(Probe(), offload).current_thread()
+
+    assert asyncio.run(thread_of(False)) == loop_thread
+    assert asyncio.run(thread_of(True)) != loop_thread
+
+
+def test_lifespan_is_acknowledged(repositories):  # pylint: disable=W0621
+    app = DocumentApi(*repositories)
+    incoming = [{"type": "lifespan.shutdown"}, {"type": "lifespan.startup"}]
+    sent = []
+
+    async def receive():
+        return incoming.pop()
+
+    async def send(message):
+        sent.append(message["type"])
+
+    asyncio.run(app({"type": "lifespan"}, receive, send))
+
+    assert sent == ["lifespan.startup.complete", "lifespan.shutdown.complete"]
+
+
+class MetadataProbe(InMemoryDocumentRepository):
+    """Repositório que conta as leituras completas de documentos."""
+
+    def __init__(self):
+        super().__init__()
+        self.loads = 0
+
+    def get(self, entity_id):
+        self.loads += 1
+        return super().get(entity_id)
+
+
+def test_conditional_get_skips_loading_the_document():
+    documents = MetadataProbe()
+    client = ASGITestClient(DocumentApi(documents, InMemoryTenantRepository()))
+    document = documents.save(
+        Document(
+            title="Documento",
+            user_id=uuid4(),
+            document_type=DocumentType.REPORT,
+            tenant_id=uuid4(),
+        )
+    )
+    url = f"/documents/{document.entity_id}"
+    etag = client.get(url).headers["etag"]
+
+    response = client.get(url, headers={"If-None-Match": etag})
+
+    assert response.status == 304
+    assert response.body == b""
+    assert response.headers["etag"] == etag
+    assert "content-length" not in response.headers
+    assert documents.loads == 1
+    assert client.get(url, headers={"If-None-Match": "*"}).status == 304
+    assert (
+        client.get(url, headers={"If-None-Match": f'"x", W/{etag}'}).status
+        == 304
+    )
+
+
+def test_etag_changes_with_every_write(client):  # pylint: disable=W0621
+    tenant = create_tenant(client)
+    user_id = str(uuid4())
+    created = client.post(
+        "/documents",
+        json={
+            "title": "Documento",
+            "user_id": user_id,
+            "document_type": "REPORT",
+            "tenant_id": tenant["id"],
+        },
+    )
+    url = created.headers["location"]
+    etags = [created.headers["etag"]]
+    etags.append(
+        client.patch(
+            url, json={"attr": "title", "value": "Outro", "user_id": user_id}
+        ).headers["etag"]
+    )
+    etags.append(
+        client.post(
+            f"{url}/status", json={"status": "PUBLISHED", "user_id": user_id}
+        ).headers["etag"]
+    )
+
+    assert len(set(etags)) == 3
+    response = client.get(url, headers={"If-None-Match": etags[0]})
+    assert response.status == 200
+    assert response.headers["etag"] == etags[-1]
+    missing = client.get(
+        f"/documents/{uuid4()}", headers={"If-None-Match": etags[0]}
+    )
+    assert missing.status == 404
+
+
+def test_batch_runs_operations_in_one_request(
+    client, repositories, bus
+):  # pylint: disable=W0621
+    documents, _ = repositories
+    tenant = create_tenant(client)
+    user_id = str(uuid4())
+    existing = save_documents(documents, UUID(tenant["id"]), 2)
+    new_id = str(uuid4())
+
+    response = client.post(
+        "/documents/batch",
+        json={
+            "parallel": True,
+            "operations": [
+                {
+                    "op": "create",
+                    "id": new_id,
+                    "title": "Novo",
+                    "document_type": "MANUAL",
+                    "tenant_id": tenant["id"],
+                    "user_id": user_id,
+                },
+                {"op": "publish", "id": new_id, "user_id": user_id},
+                {
+                    "op": "update_attribute",
+                    "id": existing[0],
+                    "attr": "title",
+                    "value": "Renomeado",
+                    "user_id": user_id,
+                },
+                {"op": "archive", "id": existing[1], "user_id": user_id},
+            ],
+        },
+    )
+
+    body = response.json()
+    assert response.status == 200
+    assert body["committed"] is True
+    assert [item["status"] for item in body["results"]] == [201, 200, 200, 200]
+    assert body["results"][1]["document"]["status"] == "PUBLISHED"
+    assert documents.get(UUID(existing[1])).is_archived()
+    assert bus.published.count("document_created") == 1
+    assert bus.published.count("document_updated") == 3
+
+
+def test_batch_failure_reports_per_operation(
+    client, repositories
+):  # pylint: disable=W0621
+    documents, _ = repositories
+    tenant = create_tenant(client)
+    user_id = str(uuid4())
+    existing = save_documents(documents, UUID(tenant["id"]), 1)
+    missing = str(uuid4())
+
+    response = client.post(
+        "/documents/batch",
+        json={
+            "operations": [
+                {"op": "publish", "id": existing[0], "user_id": user_id},
+                {"op": "archive", "id": missing, "user_id": user_id},
+            ]
+        },
+    )
+
+    body = response.json()
+    assert response.status == 404
+    assert body["committed"] is False
+    assert [item["status"] for item in body["results"]] == [424, 404]
+    assert documents.get(UUID(existing[0])).is_draft()
+
+
+@pytest.mark.parametrize(
+    "operations",
+    [
+        [],
+        [{"op": "move", "id": str(uuid4()), "user_id": str(uuid4())}],
+        [{"op": "publish", "user_id": str(uuid4())}],
+        [
+            {
+                "op": "create",
+                "title": "x",
+                "document_type": "REPORT",
+                "tenant_id": str(uuid4()),
+                "user_id": str(uuid4()),
+            }
+        ],
+    ],
+)
+def test_batch_rejects_invalid_operations(
+    client, operations
+):  # pylint: disable=W0621
+    response = client.post("/documents/batch", json={"operations": operations})
+    assert response.status == 422
+
+
+def test_batch_is_charged_per_operation(
+    repositories, bus
+):  # pylint: disable=W0621
+    documents, tenants = repositories
+    limiter = TenantRateLimiter(TenantQuota(rate=0.01, burst=10))
+    client = ASGITestClient(
+        DocumentApi(documents, tenants, bus, limiter=limiter)
+    )
+    tenant = create_tenant(client)
+    user_id = str(uuid4())
+
+    def batch(count):
+        return client.post(
+            "/documents/batch",
+            json={
+                "operations": [
+                    {
+                        "op": "create",
+                        "title": f"Documento {index}",
+                        "document_type": "MANUAL",
+                        "tenant_id": tenant["id"],
+                        "user_id": user_id,
+                    }
+                    for index in range(count)
+                ]
+            },
+        )
+
+    assert batch(8).status == 200
+    rejected = batch(8)
+    assert rejected.status == 429
+    assert rejected.json()["reason"] == "rate"
+    assert int(rejected.headers["retry-after"]) >= 1
+    assert documents.count() == 8
+
+
+def test_create_app_limits_tenants():
+    client = ASGITestClient(create_app())
+
+    assert client.get("/health").status == 200
+    response = client.get("/documents/x", headers={"X-Tenant-Id": "x"})
+    assert response.status == 400
@@ -0,0 +1,167 @@
+"""Testes do download de anexos com faixas de bytes."""
+
+import asyncio
+import io
+import random
+from uuid import uuid4
+
+import pytest
+
+from src.core.application.use_cases.document.attach import AttachFileUseCase
+from src.core.domain.repositorys.blob import FileSegment
+from src.core.infrastucture.persistence.blob_store import (
+    ChunkedBlobStore,
+    FileSystemBlobStore,
+)
+from src.core.infrastucture.persistence.chunking import Chunker
+from src.core.infrastucture.persistence.document import (
+    InMemoryDocumentRepository,
+)
+from src.core.infrastucture.persistence.tenant import (
+    InMemoryTenantRepository,
+)
+from src.core.presentation.api.app import DocumentApi
+from src.core.presentation.api.conditional import parse_range
+from src.core.presentation.api.http import (
+    ZEROCOPY_SEND,
+    FileResponse,
+    HTTPError,
+)
+from src.core.presentation.api.testing import ASGITestClient
+
+CONTENT = random.Random(5).randbytes(300_000)
+
+
+@pytest.fixture(params=["file", "chunked"])
+def store(request, tmp_path):
+    """Os dois armazenamentos, com blocos pequenos no particionado."""
+    if request.param == "file":
+        return FileSystemBlobStore(tmp_path, durable=False)
+    return ChunkedBlobStore(
+        tmp_path, Chunker(min_size=4096, avg_size=16384, max_size=65536)
+    )
+
+
+@pytest.fixture
+def manual(docs, store):  # pylint: disable=redefined-outer-name
+    """Documento com um manual anexado e o repositório dele."""
+    repository = InMemoryDocumentRepository()
+    repository.save(docs)
+    AttachFileUseCase(repository, store).execute(
+        docs.entity_id,
+        "manual técnico.pdf",
+        io.BytesIO(CONTENT),
+        "application/pdf",
+        uuid4(),
+    )
+    return docs, repository
+
+
+def make_client(repository, store, **kwargs):  # pylint: disable=W0621
+    app = DocumentApi(repository, InMemoryTenantRepository(), blob_store=store)
+    return ASGITestClient(app, **kwargs)
+
+
+def test_parse_range():
+    assert parse_range(None, 100) is None
+    assert parse_range("bytes=0-9", 100) == range(0, 10)
+    assert parse_range("bytes=90-", 100) == range(90, 100)
+    assert parse_range("bytes=-10", 100) == range(90, 100)
+    assert parse_range("bytes=50-1000", 100) == range(50, 100)
+    assert parse_range("bytes=0-1,5-6", 100) is None
+    assert parse_range("items=0-1", 100) is None
+    assert parse_range("bytes=9-1", 100) is None
+    with pytest.raises(HTTPError) as error:
+        parse_range("bytes=100-", 100)
+    assert error.value.status == 416
+    assert error.value.headers["content-range"] == "bytes */100"
+
+
+@pytest.mark.parametrize("zero_copy", [False, True])
+def test_full_and_ranged_downloads(
+    manual, store, zero_copy
+):  # pylint: disable=redefined-outer-name
+    document, repository = manual
+    extensions = {ZEROCOPY_SEND: {}} if zero_copy else {}
+    client = make_client(repository, store, extensions=extensions)
+    url = f"/documents/{document.entity_id}/files/manual técnico.pdf"
+
+    full = client.get(url)
+    assert full.status == 200
+    assert full.body == CONTENT
+    assert full.headers["content-length"] == str(len(CONTENT))
+    assert full.headers["accept-ranges"] == "bytes"
+    assert full.headers["content-type"] == "application/pdf"
+
+    partial = client.get(url, headers={"range": "bytes=70000-170000"})
+    assert partial.status == 206
+    assert partial.body == CONTENT[70_000:170_001]
+    assert partial.headers["content-range"] == (
+        f"bytes 70000-170000/{len(CONTENT)}"
+    )
+
+    tail = client.get(url, headers={"range": "bytes=-100"})
+    assert tail.body == CONTENT[-100:]
+
+
+def test_conditional_and_head_requests(
+    manual, store
+):  # pylint: disable=redefined-outer-name
+    document, repository = manual
+    client = make_client(repository, store)
+    url = f"/documents/{document.entity_id}/files/manual técnico.pdf"
+    etag = client.head(url).headers["etag"]
+
+    head = client.head(url, headers={"range": "bytes=0-99"})
+    assert head.status == 206
+    assert head.headers["content-length"] == "100"
+    assert head.body == b""
+
+    stale = client.get(url, headers={"range": "bytes=0-9", "if-range": '"x"'})
+    assert stale.status == 200
+    assert stale.body == CONTENT
+
+    fresh = client.get(url, headers={"range": "bytes=0-9", "if-range": etag})
+    assert fresh.status == 206
+
+    assert client.get(url, headers={"if-none-match": etag}).status == 304
+    assert client.get(url, headers={"range": "bytes=999999-"}).status == 416
+
+
+def test_download_by_version_and_missing_files(
+    manual, store
+):  # pylint: disable=redefined-outer-name
+    document, repository = manual
+    AttachFileUseCase(repository, store).execute(
+        document.entity_id,
+        "manual técnico.pdf",
+        io.BytesIO(b"segunda versao"),
+        "application/pdf",
+        uuid4(),
+    )
+    client = make_client(repository, store)
+    base = f"/documents/{document.entity_id}/files"
+
+    assert client.get(f"{base}/manual técnico.pdf").body == b"segunda versao"
+    assert client.get(f"{base}/manual técnico.pdf?version=2").body == CONTENT
+    assert client.get(f"{base}/manual técnico.pdf?version=1").status == 404
+    assert client.get(f"{base}/outro.pdf").status == 404
+    assert client.get(f"{base}/manual técnico.pdf?version=x").status == 422
+
+
+def test_mapped_body_is_sent_as_bytes(tmp_path):
+    path = tmp_path / "arquivo"
+    path.write_bytes(CONTENT)
+    kept = []  # como um transporte que guarda o corpo ainda não enviado
+
+    async def send(message):
+        kept.append(message)
+
+    response = FileResponse(
+        [FileSegment(path, 70_000, 100_000)], chunk_size=32_768
+    )
+    asyncio.run(response(send))
+
+    bodies = [message["body"] for message in kept[1:]]
+    assert all(type(body) is bytes for body in bodies)
+    assert b"".join(bodies) == CONTENT[70_000:170_000]
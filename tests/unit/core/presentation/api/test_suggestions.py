@@ -0,0 +1,73 @@
+"""Testes das rotas de sugestões (autocompletar)."""
+
+from uuid import uuid4
+
+from src.core.application.events import EventBus
+from src.core.infrastucture.persistence.document import (
+    InMemoryDocumentRepository,
+)
+from src.core.infrastucture.persistence.tenant import (
+    InMemoryTenantRepository,
+)
+from src.core.infrastucture.search.typeahead import TypeaheadIndexer
+from src.core.presentation.api.app import DocumentApi
+from src.core.presentation.api.testing import ASGITestClient
+
+
+def make_client() -> ASGITestClient:
+    documents = InMemoryDocumentRepository()
+    tenants = InMemoryTenantRepository()
+    bus = EventBus()
+    typeahead = TypeaheadIndexer(documents, tenants)
+    typeahead.subscribe(bus)
+    return ASGITestClient(
+        DocumentApi(documents, tenants, bus, typeahead=typeahead)
+    )
+
+
+def post(client, path, **data):
+    response = client.post(path, json={"user_id": str(uuid4()), **data})
+    assert response.status == 201
+    return response.json()
+
+
+def test_document_and_tenant_suggestions():
+    client = make_client()
+    tenant = post(
+        client, "/tenants", name="Águas Claras", description="d", logo="l"
+    )
+    post(client, "/tenants", name="Agropecuária", description="d", logo="l")
+    document = post(
+        client,
+        "/documents",
+        title="Contrato de fornecimento",
+        document_type="CONTRACT",
+        tenant_id=tenant["id"],
+    )
+    base = f"/tenants/{tenant['id']}/documents/suggestions"
+
+    assert client.get(f"{base}?q=forn").json() == [
+        {"id": document["id"], "title": "Contrato de fornecimento"}
+    ]
+    client.patch(
+        f"/documents/{document['id']}",
+        json={"attr": "title", "value": "Aditivo", "user_id": str(uuid4())},
+    )
+    assert client.get(f"{base}?q=forn").json() == []
+    assert client.get(f"{base}?q=adi").json()[0]["title"] == "Aditivo"
+
+    names = client.get("/tenants/suggestions?q=ag").json()
+    assert [item["name"] for item in names] == [
+        "Agropecuária",
+        "Águas Claras",
+    ]
+    assert client.get("/tenants/suggestions?q=ag&limit=1").json() == [names[0]]
+    assert client.get("/tenants/suggestions?q=ag&limit=0").status == 422
+    assert client.get(f"/tenants/{tenant['id']}").status == 200
+
+
+def test_routes_need_the_indexer():
+    client = ASGITestClient(
+        DocumentApi(InMemoryDocumentRepository(), InMemoryTenantRepository())
+    )
+    assert client.get("/tenants/suggestions?q=a").status == 422  # é um id
@@ -0,0 +1,131 @@
+"""Testes do middleware de cotas por tenant."""
+
+import asyncio
+from uuid import uuid4
+
+from src.core.application.services.rate_limit import (
+    TenantQuota,
+    TenantRateLimiter,
+)
+from src.core.presentation.api.http import Response
+from src.core.presentation.api.limits import TenantLimitMiddleware
+from src.core.presentation.api.testing import ASGITestClient
+
+
+class SlowApp:
+    """Aplicação que segura cada requisição até ser liberada."""
+
+    def __init__(self):
+        self.running = 0
+        self.peak = 0
+        self.gate = None
+
+    async def __call__(self, scope, receive, send):
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        if self.gate is not None:
+            await self.gate.wait()
+        self.running -= 1
+        await Response.json({"ok": True})(send)
+
+
+def make_client(quota, app=None):
+    app = app or SlowApp()
+    limiter = TenantRateLimiter(quota)
+    return ASGITestClient(TenantLimitMiddleware(app, limiter)), app
+
+
+def test_requests_without_tenant_are_not_limited():
+    client, _ = make_client(TenantQuota(rate=1, burst=1))
+    assert [client.get("/health").status for _ in range(3)] == [200] * 3
+
+
+def test_document_requests_without_tenant_share_a_quota():
+    client, _ = make_client(TenantQuota(rate=0.01, burst=2))
+
+    statuses = [client.get(f"/documents/{uuid4()}").status for _ in range(3)]
+
+    assert statuses == [200, 200, 429]
+    assert client.get(f"/tenants/{uuid4()}/documents").status == 200
+
+
+def test_rate_limit_rejects_with_retry_after():
+    client, _ = make_client(TenantQuota(rate=0.5, burst=1))
+    tenant = str(uuid4())
+
+    first = client.get(f"/tenants/{tenant}")
+    second = client.get("/documents", headers={"X-Tenant-Id": tenant})
+    other = client.get(f"/tenants/{uuid4()}/documents")
+
+    assert first.status == 200
+    assert second.status == 429
+    assert second.headers["retry-after"] == "2"
+    assert second.json()["reason"] == "rate"
+    assert other.status == 200
+
+
+def test_header_cannot_escape_path_quota():
+    client, _ = make_client(TenantQuota(rate=0.01, burst=1))
+    tenant = uuid4()
+    url = f"/tenants/{tenant}/documents"
+
+    assert client.get(url).status == 200
+    assert client.get(url).status == 429
+    for header in ("x", str(uuid4())):
+        response = client.get(url, headers={"X-Tenant-Id": header})
+        assert response.status == 400
+    same = client.get(url, headers={"X-Tenant-Id": str(tenant)})
+    assert same.status == 429
+    assert client.get("/documents", headers={"X-Tenant-Id": "x"}).status == (
+        400
+    )
+
+
+def test_rate_limit_waits_for_token_within_deadline():
+    client, _ = make_client(TenantQuota(rate=50, burst=1, max_wait=1.0))
+    headers = {"X-Tenant-Id": str(uuid4())}
+
+    async def burst():
+        return await asyncio.gather(
+            *(client.arequest("GET", "/", headers=headers) for _ in range(3))
+        )
+
+    assert [item.status for item in asyncio.run(burst())] == [200] * 3
+
+
+def test_concurrency_queue_and_rejection():
+    quota = TenantQuota(rate=1000, burst=1000, max_concurrent=2, max_wait=5)
+    client, app = make_client(quota)
+    headers = {"X-Tenant-Id": str(uuid4())}
+
+    async def scenario():
+        app.gate = asyncio.Event()
+        requests = [
+            asyncio.create_task(client.arequest("GET", "/", headers=headers))
+            for _ in range(5)
+        ]
+        await asyncio.sleep(0.05)
+        assert app.running == 2
+        app.gate.set()
+        return await asyncio.gather(*requests)
+
+    assert [item.status for item in asyncio.run(scenario())] == [200] * 5
+    assert app.peak == 2
+
+    impatient, app = make_client(TenantQuota(max_concurrent=1))
+
+    async def saturated():
+        app.gate = asyncio.Event()
+        held = asyncio.create_task(
+            impatient.arequest("GET", "/", headers=headers)
+        )
+        await asyncio.sleep(0.01)
+        rejected = await impatient.arequest("GET", "/", headers=headers)
+        app.gate.set()
+        await held
+        return rejected
+
+    rejected = asyncio.run(saturated())
+    assert rejected.status == 429
+    assert rejected.json()["reason"] == "concurrency"
+    assert rejected.headers["retry-after"] == "1"
@@ -0,0 +1,251 @@
+"""Testes das listagens HTML e do cache de fragmentos."""
+
+from concurrent.futures import ThreadPoolExecutor
+from uuid import uuid4
+
+import pytest
+
+from src.core.application.services.tenant_assets import TenantAssetService
+from src.core.domain.entities.document import Document
+from src.core.domain.value_objects.doc_types import DocumentType
+from src.core.infrastucture.persistence.archive import ArchiveStore
+from src.core.infrastucture.persistence.disk_cache import DiskLRUCache
+from src.core.infrastucture.persistence.document import (
+    InMemoryDocumentRepository,
+)
+from src.core.infrastucture.persistence.tenant import (
+    InMemoryTenantRepository,
+)
+from src.core.presentation.api.testing import ASGITestClient
+from src.core.presentation.web.app import WebApp
+from src.core.presentation.web.cache import FragmentCache
+from src.core.presentation.web.listing import document_listing
+from src.core.presentation.web.templates import (
+    CompiledTemplate,
+    Markup,
+    TemplateRegistry,
+)
+
+
+@pytest.fixture
+def documents():
+    """Repositório de documentos em memória."""
+    return InMemoryDocumentRepository()
+
+
+@pytest.fixture
+def web(tenant, documents):  # pylint: disable=redefined-outer-name
+    """Aplicação web com a listagem de documentos."""
+    tenants = InMemoryTenantRepository()
+    tenants.save(tenant)
+    app = WebApp(tenants, page_size=200)
+    app.add_listing(document_listing(documents))
+    return app
+
+
+def save_documents(documents, tenant, user_id, count):  # pylint: disable=W0621
+    saved = []
+    for number in range(count):
+        document = Document(
+            title=f"Documento {number}",
+            document_type=DocumentType.REPORT,
+            user_id=user_id,
+            tenant_id=tenant.entity_id,
+        )
+        saved.append(documents.save(document))
+    return saved
+
+
+def test_compiled_template_escapes_values():
+    template = CompiledTemplate("<p>$text</p><div>${html}</div> $$5")
+
+    rendered = template.render(
+        {"text": "<b>&</b>", "html": Markup("<i>ok</i>")}
+    )
+
+    assert rendered == (
+        "<p>&lt;b&gt;&amp;&lt;/b&gt;</p><div><i>ok</i></div> $5"
+    )
+    assert template.fields == {"text", "html"}
+
+
+def test_compiled_template_rejects_invalid_placeholder():
+    with pytest.raises(ValueError):
+        CompiledTemplate("valor: $ 10")
+
+
+def test_templates_are_compiled_once(
+    web, monkeypatch
+):  # pylint: disable=redefined-outer-name
+    compiled = []
+    original = TemplateRegistry.add
+
+    def add(self, name, source):
+        compiled.append(name)
+        return original(self, name, source)
+
+    monkeypatch.setattr(TemplateRegistry, "add", add)
+    client = ASGITestClient(web)
+    tenant_id = next(iter(web.tenant_repository.all())).entity_id
+
+    for _ in range(3):
+        assert client.get(f"/tenants/{tenant_id}/documents").status == 200
+
+    assert not compiled
+
+
+def test_rerender_only_recomputes_changed_rows(
+    web, documents, tenant, user_id
+):  # pylint: disable=redefined-outer-name
+    cache = web.cache
+    listing = web._listings["documents"]  # pylint: disable=W0212
+    saved = save_documents(documents, tenant, user_id, 200)
+
+    first = web.render_listing(listing, tenant)
+    assert cache.misses == 201
+    assert cache.hits == 0
+
+    again = web.render_listing(listing, tenant)
+    assert again == first
+    assert cache.misses == 201
+    assert cache.hits == 201
+
+    saved[7].update_attribute("title", "Alterado", user_id)
+    documents.update(saved[7])
+    changed = web.render_listing(listing, tenant)
+
+    assert cache.misses == 203
+    assert cache.hits == 201 + 199
+    assert "Alterado" in changed
+    assert "Documento 7<" not in changed
+
+
+def test_summary_follows_tenant_version(
+    web, documents, tenant, user_id
+):  # pylint: disable=redefined-outer-name
+    listing = web._listings["documents"]  # pylint: disable=W0212
+    saved = save_documents(documents, tenant, user_id, 3)
+
+    assert "Publicados: 0" in web.render_listing(listing, tenant)
+
+    saved[0].publish()
+    documents.update(saved[0])
+
+    assert "Publicados: 1" in web.render_listing(listing, tenant)
+
+
+def test_summary_counts_cold_documents_without_reading_them(
+    tenant, user_id, tmp_path, monkeypatch
+):  # pylint: disable=redefined-outer-name
+    archive = ArchiveStore(tmp_path)
+    documents = InMemoryDocumentRepository(archive)
+    tenants = InMemoryTenantRepository()
+    tenants.save(tenant)
+    web = WebApp(tenants)
+    listing = document_listing(documents)
+    web.add_listing(listing)
+    saved = save_documents(documents, tenant, user_id, 3)
+    for document in saved[:2]:
+        document.archive()
+        documents.update(document)
+    monkeypatch.setattr(archive, "read", None)  # qualquer leitura falha
+
+    page = web.render_listing(listing, tenant)
+
+    assert "<strong>3</strong>" in page and "Arquivados: 2" in page
+    assert "Documento 2<" in page and "Documento 0<" not in page
+
+
+def test_page_escapes_and_paginates(
+    tenant, documents, user_id
+):  # pylint: disable=redefined-outer-name
+    tenants = InMemoryTenantRepository()
+    tenants.save(tenant)
+    app = WebApp(tenants, page_size=2)
+    app.add_listing(document_listing(documents))
+    client = ASGITestClient(app)
+    saved = save_documents(documents, tenant, user_id, 3)
+    saved[0].update_attribute("title", "<script>x</script>", user_id)
+    documents.update(saved[0])
+
+    response = client.get(f"/tenants/{tenant.entity_id}/documents")
+    first = response.body.decode()
+
+    assert response.status == 200
+    assert response.headers["content-type"].startswith("text/html")
+    assert first.count('class="card document"') == 2
+    assert 'rel="next"' in first
+
+    last = sorted(document.entity_id for document in saved)[1]
+    second = client.get(
+        f"/tenants/{tenant.entity_id}/documents?after={last}"
+    ).body.decode()
+
+    assert second.count('class="card document"') == 1
+    assert 'rel="next"' not in second
+    assert "<script>" not in first + second
+    assert "&lt;script&gt;x&lt;/script&gt;" in first + second
+
+
+def fake_logo(source, variants):
+    return {
+        name: f"{source}:{size}".encode() for name, size in variants.items()
+    }
+
+
+def test_page_links_pregenerated_logo(
+    tenant, documents, tmp_path
+):  # pylint: disable=redefined-outer-name
+    tenants = InMemoryTenantRepository()
+    tenants.save(tenant)
+    assets = TenantAssetService(
+        tenants,
+        DiskLRUCache(tmp_path, max_bytes=1 << 20),
+        fake_logo,
+        executor=ThreadPoolExecutor(1),
+    )
+    app = WebApp(tenants, assets=assets)
+    app.add_listing(document_listing(documents))
+    client = ASGITestClient(app)
+    page = f"/tenants/{tenant.entity_id}/documents"
+    assert 'class="logo"' not in client.get(page).body.decode()
+
+    assets.submit(tenant)
+    assert assets.drain(timeout=10)
+    name = assets.logo(tenant.entity_id)
+    assert f'<img class="logo" src="/assets/{name}"' in (
+        client.get(page).body.decode()
+    )
+
+    response = client.get(f"/assets/{name}")
+    assert response.status == 200
+    assert response.body == f"{tenant.logo}:128".encode()
+    assert response.headers["content-type"] == "image/png"
+    assert "immutable" in response.headers["cache-control"]
+    assert client.get("/assets/" + "0" * 64 + ".png").status == 404
+    assets.shutdown()
+
+
+def test_unknown_tenant_renders_error_page(web):  # pylint: disable=W0621
+    client = ASGITestClient(web)
+
+    response = client.get(f"/tenants/{uuid4()}/documents")
+
+    assert response.status == 404
+    assert "Empresa não encontrada." in response.body.decode()
+    assert client.get("/tenants/abc/documents").status == 404
+
+
+def test_fragment_cache_evicts_least_recently_used():
+    cache = FragmentCache(max_entries=2)
+    cache.get_or_render("a", lambda: Markup("A"))
+    cache.get_or_render("b", lambda: Markup("B"))
+    cache.get_or_render("a", lambda: Markup("?"))
+    cache.get_or_render("c", lambda: Markup("C"))
+
+    assert len(cache) == 2
+    assert cache.get_or_render("a", lambda: Markup("?")) == "A"
+    assert cache.get_or_render("b", lambda: Markup("B2")) == "B2"
+
+    with pytest.raises(ValueError):
+        FragmentCache(max_entries=0)
@@ -0,0 +1,36 @@
+"Configuração de fixtures para testes unitários dos tipos de documento"
+
+from datetime import date
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from src.core.domain.value_objects.doc_types import DocumentType
+from src.document_types.contract.domain.entities.contract import Contract
+
+
+@pytest.fixture
+def make_contract():
+    """Fixture que cria contratos válidos, aceitando substituições."""
+
+    def factory(**overrides) -> Contract:
+        values = {
+            "title": "Contrato de Serviços",
+            "document_type": DocumentType.CONTRACT,
+            "user_id": uuid4(),
+            "tenant_id": uuid4(),
+            "subject": "Prestação de serviços",
+            "description": "Contrato de prestação de serviços",
+            "amount": Decimal("1500.00"),
+            "number": 1,
+            "department_id": uuid4(),
+            "folder_id": uuid4(),
+            "parts_id": [uuid4()],
+            "start_date": date(2024, 1, 1),
+            "end_date": date(2024, 12, 31),
+        }
+        values.update(overrides)
+        return Contract(**values)
+
+    return factory
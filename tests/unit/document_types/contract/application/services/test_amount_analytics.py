@@ -0,0 +1,93 @@
+"""Testes para a agregação vetorizada de valores de contratos."""
+
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from src.core.domain.exceptions import DomainValidationError
+from src.document_types.contract.domain.value_object import (
+    ContractStatus,
+    ContractType,
+)
+
+analytics = pytest.importorskip(
+    "src.document_types.contract.application.services.analytics"
+)
+ContractAmountFrame = analytics.ContractAmountFrame
+
+
+@pytest.fixture
+def contracts(make_contract):
+    """Contratos de dois tenants com tipos e status variados."""
+    first, second = uuid4(), uuid4()
+    values = [
+        (first, ContractType.SERVICE, ContractStatus.ACTIVE, "0.10"),
+        (first, ContractType.SERVICE, ContractStatus.ACTIVE, "0.20"),
+        (first, ContractType.SALES, ContractStatus.DRAFT, "1000.01"),
+        (second, ContractType.SERVICE, ContractStatus.ACTIVE, "99.99"),
+    ]
+    return [
+        make_contract(
+            tenant_id=tenant_id,
+            contract_type=contract_type,
+            status=status,
+            amount=Decimal(amount),
+        )
+        for tenant_id, contract_type, status, amount in values
+    ]
+
+
+def test_cents_round_trip():
+    """Testa a conversão exata entre `Decimal` e centavos."""
+    assert analytics.to_cents(Decimal("1234.56")) == 123456
+    assert analytics.from_cents(123456) == Decimal("1234.56")
+    assert str(analytics.from_cents(10)) == "0.10"
+    with pytest.raises(DomainValidationError):
+        analytics.to_cents(Decimal("0.001"))
+
+
+def test_group_by_sums_counts_and_percentiles(
+    contracts,
+):  # pylint: disable=redefined-outer-name
+    """Testa somas, contagens e percentis por grupo."""
+    frame = ContractAmountFrame.from_contracts(contracts)
+
+    groups = frame.group_by(
+        "tenant_id", "contract_type", percentiles=(50, 100)
+    )
+
+    first = contracts[0].tenant_id
+    result = {group.key: group for group in groups}
+    service = result[(first, ContractType.SERVICE)]
+    assert service.count == 2
+    assert service.total == Decimal("0.30")
+    assert service.percentiles == {50: Decimal("0.10"), 100: Decimal("0.20")}
+    assert result[(first, ContractType.SALES)].total == Decimal("1000.01")
+    assert len(groups) == 3
+    assert frame.total() == sum(c.amount for c in contracts)
+
+
+def test_where_filters_by_category(
+    contracts,
+):  # pylint: disable=redefined-outer-name
+    """Testa o filtro por igualdade."""
+    frame = ContractAmountFrame.from_contracts(contracts)
+
+    active = frame.where(status=ContractStatus.ACTIVE)
+
+    assert len(active) == 3
+    assert active.group_by()[0].total == Decimal("100.29")
+    assert not frame.where(status=ContractStatus.CANCELLED).group_by()
+
+
+def test_invalid_arguments_raise(
+    contracts,
+):  # pylint: disable=redefined-outer-name
+    """Testa campos e percentis inválidos."""
+    frame = ContractAmountFrame.from_contracts(contracts)
+
+    with pytest.raises(ValueError):
+        frame.group_by("title")
+    with pytest.raises(ValueError):
+        frame.group_by(percentiles=(101,))
@@ -0,0 +1,195 @@
+"""Testes para o job de anonimização LGPD."""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.core.application.events import EventBus
+from src.document_types.contract.application.services.anonymization import (
+    FileCheckpointStore,
+    InMemoryCheckpointStore,
+    LgpdAnonymizationJob,
+    PatternRedactionPolicy,
+    PersonalData,
+)
+from src.document_types.contract.domain.events.contract import (
+    ContractAnonymizedEvent,
+)
+from src.document_types.contract.infrastructure.persistence.repository import (
+    InMemoryContractRepository,
+)
+
+NAMESPACE = uuid4()
+
+
+@pytest.fixture
+def repository(make_contract):
+    """Repositório com 10 contratos LGPD e 2 sem dados pessoais."""
+    repository = InMemoryContractRepository()
+    for index in range(12):
+        repository.save(
+            make_contract(
+                description="Contato: joao@example.com, CPF 123.456.789-09",
+                notes="Tel. (11) 91234-5678",
+                lgpd=index < 10,
+            )
+        )
+    return repository
+
+
+def test_policy_scrubs_text_and_pseudonymizes_parties():
+    """Testa a remoção de padrões e a pseudonimização determinística."""
+    policy = PatternRedactionPolicy(NAMESPACE)
+    party = uuid4()
+    data = PersonalData(
+        "CNPJ 12.345.678/0001-90 e maria@empresa.com.br", None, (party,)
+    )
+
+    redacted = policy.redact(data)
+
+    assert redacted.description == "CNPJ [removido] e [removido]"
+    assert redacted.notes is None
+    assert redacted.parts_id == policy.redact(data).parts_id
+    assert redacted.parts_id != (party,)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Tel. (11) 91234-5678",
+        "Tel. (11)912345678",
+        "Tel. 11 91234-5678",
+        "Tel. 3456-7890",
+    ],
+)
+def test_policy_scrubs_phone_numbers(text):
+    """Testa os formatos de telefone removidos."""
+    redacted = PatternRedactionPolicy(NAMESPACE).redact(
+        PersonalData(text, None, ())
+    )
+
+    assert redacted.description == "Tel. [removido]"
+
+
+def test_policy_keeps_plain_numbers():
+    """Testa que números sem formato de telefone são mantidos."""
+    text = "Pedido 12345678, protocolo 912345678, processo 20240001"
+
+    redacted = PatternRedactionPolicy(NAMESPACE).redact(
+        PersonalData(text, None, ())
+    )
+
+    assert redacted.description == text
+
+
+def test_job_anonymizes_in_chunks(
+    repository,
+):  # pylint: disable=redefined-outer-name
+    """Testa a execução completa com um pool de workers."""
+    checkpoint = InMemoryCheckpointStore()
+    job = LgpdAnonymizationJob(
+        repository,
+        PatternRedactionPolicy(NAMESPACE, clear_notes=True),
+        checkpoint,
+        user_id=uuid4(),
+        chunk_size=3,
+    )
+
+    report = job.run()
+
+    assert (report.scanned, report.anonymized, report.chunks) == (10, 10, 4)
+    assert report.completed
+    assert not repository.get_lgpd_page(100)
+    assert checkpoint.load() is None
+    anonymized = [c for c in repository.all() if c.notes is None]
+    assert len(anonymized) == 10
+    assert all("@" not in contract.description for contract in anonymized)
+    events = anonymized[0].get_domain_events()
+    assert isinstance(events[-1], ContractAnonymizedEvent)
+
+
+def test_job_resumes_from_checkpoint(
+    repository, tmp_path
+):  # pylint: disable=redefined-outer-name
+    """Testa a retomada após uma execução interrompida."""
+    checkpoint = FileCheckpointStore(tmp_path / "lgpd.json")
+    selected = []
+
+    def selector(contract):
+        selected.append(contract.entity_id)
+        return contract.end_date < date(2025, 1, 1)
+
+    def make_job():
+        return LgpdAnonymizationJob(
+            repository,
+            PatternRedactionPolicy(NAMESPACE),
+            checkpoint,
+            user_id=uuid4(),
+            chunk_size=4,
+            selector=selector,
+            executor_factory=ThreadPoolExecutor,
+        )
+
+    first = make_job().run(max_chunks=1)
+    assert not first.completed
+    assert checkpoint.load() == selected[-1]
+
+    second = make_job().run()
+    assert second.completed
+    assert first.scanned + second.scanned == 10
+    assert len(set(selected)) == 10
+
+
+def test_job_publishes_events_of_saved_contracts(
+    repository,
+):  # pylint: disable=redefined-outer-name
+    """Testa a publicação dos eventos após a gravação de cada bloco."""
+    bus = EventBus()
+    received = []
+    bus.subscribe(
+        "contract_anonymized",
+        lambda event: received.append(
+            repository.get(UUID(event.data["document_id"])).lgpd
+        ),
+    )
+    job = LgpdAnonymizationJob(
+        repository,
+        PatternRedactionPolicy(NAMESPACE),
+        InMemoryCheckpointStore(),
+        user_id=uuid4(),
+        chunk_size=4,
+        executor_factory=ThreadPoolExecutor,
+        bus=bus,
+    )
+
+    job.run()
+
+    assert received == [False] * 10
+    assert all(not c.get_domain_events() for c in repository.all())
+
+
+def test_failed_chunk_leaves_contracts_intact(
+    repository,
+):  # pylint: disable=redefined-outer-name
+    """Testa que uma falha na gravação não altera os contratos guardados."""
+
+    def update_many(_contracts):
+        raise RuntimeError("falha na gravação")
+
+    repository.update_many = update_many
+    job = LgpdAnonymizationJob(
+        repository,
+        PatternRedactionPolicy(NAMESPACE),
+        InMemoryCheckpointStore(),
+        user_id=uuid4(),
+        executor_factory=ThreadPoolExecutor,
+    )
+
+    with pytest.raises(RuntimeError):
+        job.run()
+
+    assert len(repository.get_lgpd_page(100)) == 10
+    assert all("@" in c.description for c in repository.all())
+    assert not any(c.get_domain_events() for c in repository.all())
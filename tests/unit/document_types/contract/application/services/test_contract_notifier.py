@@ -0,0 +1,33 @@
+"""Testes para as notificações de contratos."""
+
+from uuid import uuid4
+
+from src.core.application.events import EventBus
+from src.core.application.services.notification import NotificationQueue
+from src.document_types.contract.application.services.notifications import (
+    ContractNotifier,
+)
+from src.document_types.contract.infrastructure.persistence.repository import (
+    InMemoryContractRepository,
+)
+
+
+def test_only_contracts_with_email_send_are_queued(make_contract):
+    """Testa que apenas contratos com `email_send` geram notificação."""
+    repository = InMemoryContractRepository()
+    queue = NotificationQueue()
+    bus = EventBus()
+    ContractNotifier(
+        repository, queue, lambda contract: ["juridico@example.com"]
+    ).subscribe(bus)
+    notify = repository.save(make_contract(email_send=True, number=7))
+    silent = repository.save(make_contract())
+
+    for contract in (notify, silent):
+        contract.update_attribute("title", "Contrato revisado", uuid4())
+        bus.dispatch(contract)
+
+    (notification,) = queue.pop_ready(now=0.0, limit=10)
+    assert notification.tenant_id == notify.tenant_id
+    assert notification.recipients == ("juridico@example.com",)
+    assert notification.subject == "Contrato nº 7: Contrato revisado"
@@ -0,0 +1,19 @@
+"""Testes para a numeração de contratos por tenant."""
+
+from uuid import uuid4
+
+from src.core.infrastucture.persistence.sequence import (
+    InMemorySequenceRepository,
+)
+from src.document_types.contract.application.services.numbering import (
+    ContractNumberAllocator,
+)
+
+
+def test_numbers_are_independent_per_tenant():
+    """Testa sequências separadas por tenant."""
+    allocator = ContractNumberAllocator(InMemorySequenceRepository())
+    first, second = uuid4(), uuid4()
+
+    assert [allocator.next_number(first) for _ in range(3)] == [1, 2, 3]
+    assert allocator.next_number(second) == 1
@@ -0,0 +1,170 @@
+"""Testes para o agendador de renovações automáticas."""
+
+import copy
+from datetime import date, timedelta
+from uuid import uuid4
+
+import pytest
+
+from src.core.application.use_cases.document.update import (
+    UpdateDocumentAttributeUseCase,
+)
+from src.core.infrastucture.persistence.document import (
+    InMemoryDocumentRepository,
+)
+from src.document_types.contract.application.services.renewal import (
+    ContractRenewalScheduler,
+)
+from src.document_types.contract.domain.value_object import ContractStatus
+
+END_DATE = date(2024, 1, 1)
+
+
+@pytest.fixture
+def make_active(make_contract):
+    """Cria contratos ativos com renovação automática."""
+
+    def factory(**overrides):
+        values = {"automatic_renewal": True, "status": ContractStatus.ACTIVE}
+        values.update(overrides)
+        return make_contract(**values)
+
+    return factory
+
+
+def test_only_active_automatic_renewals_are_scheduled(
+    make_active,
+):  # pylint: disable=redefined-outer-name
+    """Testa que apenas contratos ativos com renovação automática entram."""
+    automatic = make_active()
+    manual = make_active(automatic_renewal=False)
+    draft = make_active(status=ContractStatus.DRAFT)
+
+    scheduler = ContractRenewalScheduler([automatic, manual, draft])
+
+    assert len(scheduler) == 1
+    assert automatic.entity_id in scheduler
+    assert manual.entity_id not in scheduler
+    assert draft.entity_id not in scheduler
+
+
+def test_pop_due_returns_contracts_in_end_date_order(
+    make_active,
+):  # pylint: disable=redefined-outer-name
+    """Testa a ordem e o limite dos contratos vencidos."""
+    contracts = [
+        make_active(end_date=date(2024, 1, day)) for day in (20, 5, 10, 30)
+    ]
+    scheduler = ContractRenewalScheduler(contracts)
+
+    due = scheduler.pop_due(date(2024, 1, 15))
+
+    assert due == [contracts[1].entity_id, contracts[2].entity_id]
+    assert scheduler.next_due() == date(2024, 1, 20)
+
+
+def test_track_reschedules_changed_end_date(
+    make_active,
+):  # pylint: disable=redefined-outer-name
+    """Testa o reagendamento incremental quando a data muda."""
+    contract = make_active(end_date=END_DATE)
+    scheduler = ContractRenewalScheduler([contract])
+
+    contract.end_date = date(2024, 6, 1)
+    scheduler.track(contract)
+
+    assert scheduler.pop_due(date(2024, 3, 1)) == []
+    assert scheduler.pop_due(date(2024, 6, 1)) == [contract.entity_id]
+
+
+def test_track_removes_when_renewal_disabled(
+    make_active,
+):  # pylint: disable=redefined-outer-name
+    """Testa a remoção do índice ao desligar a renovação automática."""
+    contract = make_active()
+    scheduler = ContractRenewalScheduler([contract])
+
+    contract.automatic_renewal = False
+    scheduler.track(contract)
+
+    assert len(scheduler) == 0
+    assert scheduler.next_due() is None
+
+
+def stored(contracts):
+    """Repositório com os contratos."""
+    repository = InMemoryDocumentRepository()
+    for contract in contracts:
+        repository.save(contract)
+    return repository
+
+
+def test_renew_due_in_batches(
+    make_active,
+):  # pylint: disable=redefined-outer-name
+    """Testa a renovação em lotes e o reagendamento ao final."""
+    contracts = [make_active(end_date=END_DATE) for _ in range(5)]
+    repository = stored(contracts)
+    scheduler = ContractRenewalScheduler(contracts)
+
+    batches = list(
+        scheduler.renew_due(
+            date(2024, 1, 1), uuid4(), repository=repository, batch_size=2
+        )
+    )
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    renewed_until = END_DATE + timedelta(days=365)
+    assert all(
+        repository.get(c.entity_id).end_date == renewed_until
+        for c in contracts
+    )
+    assert all(c.end_date == END_DATE for c in contracts)  # cópias
+    assert len(scheduler) == 5
+    assert scheduler.next_due() == renewed_until
+
+
+def test_renew_due_keeps_later_changes(
+    make_active,
+):  # pylint: disable=redefined-outer-name
+    """Testa que a renovação não desfaz alterações feitas depois."""
+    contract = make_active(end_date=END_DATE)
+    repository = stored([contract])
+    scheduler = ContractRenewalScheduler([contract])
+    UpdateDocumentAttributeUseCase(repository).execute(
+        contract.entity_id, "title", "Contrato renomeado", uuid4()
+    )
+
+    list(scheduler.renew_due(END_DATE, uuid4(), repository=repository))
+
+    renewed = repository.get(contract.entity_id)
+    assert renewed.title == "Contrato renomeado"
+    assert renewed.end_date == END_DATE + timedelta(days=365)
+
+
+def test_renew_due_skips_contracts_no_longer_active(
+    make_active,
+):  # pylint: disable=redefined-outer-name
+    """Testa que contratos cancelados ou excluídos não são renovados."""
+    cancelled, deleted, postponed = [
+        make_active(end_date=END_DATE) for _ in range(3)
+    ]
+    repository = stored([cancelled, deleted, postponed])
+    scheduler = ContractRenewalScheduler([cancelled, deleted, postponed])
+    change = copy.copy(cancelled)
+    change.status = ContractStatus.CANCELLED
+    repository.update(change)
+    repository.delete(deleted.entity_id)
+    change = copy.copy(postponed)
+    change.end_date = date(2024, 3, 1)
+    repository.update(change)
+
+    batches = list(
+        scheduler.renew_due(END_DATE, uuid4(), repository=repository)
+    )
+
+    assert batches == []
+    assert repository.get(cancelled.entity_id).end_date == END_DATE
+    assert repository.get(postponed.entity_id).end_date == date(2024, 3, 1)
+    assert len(scheduler) == 1
+    assert scheduler.next_due() == date(2024, 3, 1)
@@ -0,0 +1,80 @@
+"""Testes unitários para a entidade Contract."""
+
+from datetime import date, timedelta
+from uuid import uuid4
+
+import pytest
+
+from src.core.domain.exceptions import DomainValidationError
+from src.core.domain.value_objects.doc_types import DocumentType
+from src.document_types.contract.domain.entities.exceptions import (
+    ContractRenewalException,
+)
+from src.document_types.contract.domain.value_object import ContractStatus
+
+
+def test_contract_creation(make_contract):
+    """Testa a criação de um contrato como documento do tipo contrato."""
+    tenant_id = uuid4()
+    contract = make_contract(tenant_id=tenant_id)
+
+    assert contract.document_type == DocumentType.CONTRACT
+    assert contract.tenant_id == tenant_id
+    assert contract.status == ContractStatus.DRAFT
+    assert contract.version == 1
+
+
+def test_contract_status_validation(make_contract):
+    """Testa que o status do contrato exige ContractStatus."""
+    contract = make_contract()
+
+    with pytest.raises(DomainValidationError):
+        contract.status = "Ativo"
+
+
+def test_automatic_renewal_sets_end_date(make_contract):
+    """Testa a vigência padrão da renovação automática."""
+    contract = make_contract(end_date=None, automatic_renewal=True)
+
+    assert contract.end_date == date.today() + timedelta(days=365)
+
+
+def test_renew_contract_extends_end_date(make_contract):
+    """Testa a renovação do contrato."""
+    contract = make_contract(automatic_renewal=True)
+
+    contract.renew_contract(uuid4())
+
+    assert contract.end_date == date(2024, 12, 31) + timedelta(days=365)
+    assert len(contract.get_domain_events()) == 1
+
+
+def test_renew_contract_without_automatic_renewal(make_contract):
+    """Testa a renovação sem renovação automática habilitada."""
+    with pytest.raises(ContractRenewalException):
+        make_contract().renew_contract(uuid4())
+
+
+def test_activate_contract(make_contract):
+    """Testa a ativação do contrato."""
+    contract = make_contract()
+
+    contract.activate(uuid4())
+
+    assert contract.status == ContractStatus.ACTIVE
+
+
+def test_end_date_before_start_date_is_rejected(make_contract):
+    """Testa a validação da vigência na criação e na alteração."""
+    with pytest.raises(DomainValidationError):
+        make_contract(start_date=date(2024, 6, 1), end_date=date(2024, 1, 1))
+
+    contract = make_contract()
+    with pytest.raises(DomainValidationError):
+        contract.end_date = date(2023, 12, 31)
+    with pytest.raises(DomainValidationError):
+        contract.start_date = date(2025, 1, 1)
+    assert (contract.start_date, contract.end_date) == (
+        date(2024, 1, 1),
+        date(2024, 12, 31),
+    )
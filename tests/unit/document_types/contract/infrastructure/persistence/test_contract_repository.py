@@ -0,0 +1,186 @@
+"""Testes para o repositório de contratos em memória."""
+
+from datetime import date
+from uuid import uuid4
+
+import pytest
+
+from src.core.application.services.slug import SlugService
+from src.core.application.use_cases.document.update import (
+    UpdateDocumentAttributeUseCase,
+)
+from src.core.domain.entities.folder import Folder
+from src.core.domain.exceptions import DocumentUpdateAttrException
+from src.core.infrastucture.persistence.archive import ArchiveStore
+from src.core.infrastucture.persistence.folder import InMemoryFolderRepository
+from src.document_types.contract.infrastructure.persistence.repository import (
+    InMemoryContractRepository,
+)
+
+
+@pytest.mark.parametrize("partition_by", [None, "department_id", "folder_id"])
+def test_active_on_and_ending_between(make_contract, partition_by):
+    """Testa as consultas de vigência e de término."""
+    repository = InMemoryContractRepository(partition_by=partition_by)
+    department_id = uuid4()
+    first = make_contract(department_id=department_id)
+    second = make_contract(
+        department_id=department_id,
+        start_date=date(2024, 6, 1),
+        end_date=date(2025, 5, 31),
+    )
+    other = make_contract(end_date=None)
+    for contract in (first, second, other):
+        repository.save(contract)
+
+    assert set(repository.get_active_on(date(2024, 7, 1))) == {
+        first,
+        second,
+        other,
+    }
+    assert repository.get_active_on(
+        date(2025, 1, 15), department_id=department_id
+    ) == [second]
+    assert repository.get_ending_between(
+        date(2024, 12, 1), date(2024, 12, 31)
+    ) == [first]
+    assert (
+        repository.get_overlapping(date(2023, 1, 1), date(2023, 12, 31)) == []
+    )
+
+
+def test_update_and_delete_keep_index_in_sync(make_contract):
+    """Testa a reindexação após atualização e remoção."""
+    repository = InMemoryContractRepository(partition_by="department_id")
+    contract = make_contract()
+    repository.save(contract)
+
+    contract.end_date = date(2025, 3, 31)
+    contract.department_id = uuid4()
+    repository.update(contract)
+
+    assert repository.get_ending_between(
+        date(2025, 3, 1), date(2025, 3, 31), contract.department_id
+    ) == [contract]
+    assert not repository.get_ending_between(
+        date(2024, 12, 1), date(2024, 12, 31)
+    )
+
+    repository.delete(contract.entity_id)
+    assert not repository.get_active_on(date(2025, 1, 1))
+
+
+def test_invalid_partition_raises():
+    """Testa que apenas campos conhecidos podem particionar o índice."""
+    with pytest.raises(ValueError):
+        InMemoryContractRepository(partition_by="tenant_id")
+
+
+def test_get_by_party_paginates(make_contract):
+    """Testa a paginação por cursor do índice reverso de partes."""
+    repository = InMemoryContractRepository()
+    party_id = uuid4()
+    contracts = [make_contract(parts_id=[party_id, uuid4()]) for _ in range(5)]
+    for contract in contracts:
+        repository.save(contract)
+    expected = sorted(contracts, key=lambda contract: contract.entity_id)
+
+    first = repository.get_by_party(party_id, limit=2)
+    second = repository.get_by_party(
+        party_id, limit=2, after=first[-1].entity_id
+    )
+    rest = repository.get_by_party(party_id, after=second[-1].entity_id)
+
+    assert first + second + rest == expected
+    assert repository.count_by_party(party_id) == 5
+    assert not repository.get_by_party(uuid4())
+
+
+def test_party_index_follows_update_attribute(make_contract):
+    """Testa a atualização incremental via `update_attribute`."""
+    repository = InMemoryContractRepository()
+    old_party, kept_party, new_party = uuid4(), uuid4(), uuid4()
+    contract = make_contract(parts_id=[old_party, kept_party])
+    repository.save(contract)
+    use_case = UpdateDocumentAttributeUseCase(repository)
+
+    use_case.execute(
+        contract.entity_id, "parts_id", [kept_party, new_party], uuid4()
+    )
+
+    assert not repository.get_by_party(old_party)
+    assert repository.get_by_party(kept_party) == [contract]
+    assert repository.get_by_party(new_party) == [contract]
+
+    repository.delete(contract.entity_id)
+    assert repository.count_by_party(kept_party) == 0
+
+
+def test_slug_from_subject(make_contract):
+    """Testa o slug gerado pelo objeto e a resolução pelo slug."""
+    repository = InMemoryContractRepository()
+    contract = make_contract(subject="Locação de Sala Comercial")
+
+    SlugService(repository).assign([contract], source="subject")
+    repository.save(contract)
+
+    assert contract.slug == "locacao-de-sala-comercial"
+    assert repository.get_by_slug(contract.tenant_id, contract.slug) is (
+        contract
+    )
+
+
+def test_folder_subtree_follows_moves(make_contract):
+    """Testa a consulta por subárvore antes e depois de mover pastas."""
+    folders = InMemoryFolderRepository()
+    repository = InMemoryContractRepository(folder_repository=folders)
+    tenant_id = uuid4()
+    root = folders.save(Folder("Jurídico", tenant_id))
+    child = folders.save(Folder("Locações", tenant_id, root.entity_id))
+    other = folders.save(Folder("Compras", tenant_id))
+    in_root = make_contract(folder_id=root.entity_id)
+    in_child = make_contract(folder_id=child.entity_id)
+    repository.save(in_root)
+    repository.save(in_child)
+
+    assert set(repository.get_by_folder_subtree(root.entity_id)) == {
+        in_root,
+        in_child,
+    }
+
+    folders.move(child.entity_id, other.entity_id)
+
+    assert repository.get_by_folder_subtree(root.entity_id) == [in_root]
+    assert repository.get_by_folder_subtree(other.entity_id) == [in_child]
+
+
+def test_archived_contracts_stay_queryable(make_contract, tmp_path):
+    """Testa as consultas sobre contratos no armazenamento frio."""
+    repository = InMemoryContractRepository(
+        partition_by="department_id", archive=ArchiveStore(tmp_path)
+    )
+    contract = make_contract()
+    contract.archive()
+    repository.save(contract)
+
+    assert repository.archived == 1
+    (loaded,) = repository.get_active_on(
+        date(2024, 7, 1), department_id=contract.department_id
+    )
+    assert loaded == contract and loaded.amount == contract.amount
+    assert repository.get_by_party(contract.parts_id[0]) == [contract]
+
+
+def test_invalid_validity_leaves_repository_unchanged(make_contract):
+    """Testa que uma vigência inválida não chega aos índices."""
+    repository = InMemoryContractRepository()
+    contract = repository.save(make_contract())
+    use_case = UpdateDocumentAttributeUseCase(repository)
+
+    with pytest.raises(DocumentUpdateAttrException):
+        use_case.execute(
+            contract.entity_id, "end_date", date(2023, 1, 1), uuid4()
+        )
+
+    assert repository.get_active_on(date(2024, 7, 1)) == [contract]
+    assert repository.get_by_tenant_id(contract.tenant_id) == [contract]
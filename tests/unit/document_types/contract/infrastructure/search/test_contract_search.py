@@ -0,0 +1,83 @@
+"""Testes da busca textual sobre os campos de contratos."""
+
+from concurrent.futures import ThreadPoolExecutor
+from uuid import uuid4
+
+from src.core.application.events import EventBus
+from src.core.infrastucture.persistence.document import (
+    InMemoryDocumentRepository,
+)
+from src.core.infrastucture.search.indexer import SearchIndexer
+from src.document_types.contract.application.services.anonymization import (
+    InMemoryCheckpointStore,
+    LgpdAnonymizationJob,
+    PatternRedactionPolicy,
+)
+from src.document_types.contract.infrastructure.persistence.repository import (
+    InMemoryContractRepository,
+)
+
+
+def test_contract_fields_are_indexed_with_weights(make_contract):
+    contract = make_contract(
+        title="Contrato 12/2024",
+        subject="Locação de imóvel comercial",
+        description="Aluguel da sede",
+        notes="Reajuste anual pelo IGP-M",
+    )
+    tenant_id = contract.tenant_id
+    other = make_contract(
+        tenant_id=tenant_id,
+        title="Locação de veículos",
+        subject="Frota",
+        description="Veículos para a diretoria",
+    )
+    noted = make_contract(
+        tenant_id=tenant_id,
+        subject="Consultoria",
+        description="Consultoria jurídica",
+        notes="Cláusula de locação de sala, se necessário",
+    )
+    indexer = SearchIndexer(InMemoryDocumentRepository())
+    indexer.index_many([contract, other, noted])
+
+    hits = [hit for hit, _ in indexer.search(tenant_id, "locacoes")]
+    assert hits[-1] == noted.entity_id
+    assert set(hits) == {
+        contract.entity_id,
+        other.entity_id,
+        noted.entity_id,
+    }
+    assert indexer.search(tenant_id, "igp")[0][0] == contract.entity_id
+    assert indexer.search(tenant_id, "juridica")[0][0] == noted.entity_id
+
+
+def test_anonymized_data_is_no_longer_found(make_contract):
+    contract = make_contract(
+        notes="contato fulano@empresa.com.br cpf 123.456.789-09", lgpd=True
+    )
+    tenant_id = contract.tenant_id
+    repository = InMemoryContractRepository()
+    repository.save(contract)
+    bus = EventBus()
+    indexer = SearchIndexer(repository)
+    indexer.subscribe(bus)
+    indexer.index(contract)
+    assert indexer.search(tenant_id, "fulano")
+    assert indexer.search(tenant_id, "789")
+
+    LgpdAnonymizationJob(
+        repository,
+        PatternRedactionPolicy(uuid4()),
+        InMemoryCheckpointStore(),
+        user_id=uuid4(),
+        executor_factory=ThreadPoolExecutor,
+        bus=bus,
+    ).run()
+
+    assert repository.get(contract.entity_id).notes == (
+        "contato [removido] cpf [removido]"
+    )
+    assert indexer.search(tenant_id, "fulano") == []
+    assert indexer.search(tenant_id, "789") == []
+    assert indexer.search(tenant_id, "contato")[0][0] == contract.entity_id
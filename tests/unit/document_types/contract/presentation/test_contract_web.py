@@ -0,0 +1,62 @@
+"""Testes da listagem HTML de contratos."""
+
+from decimal import Decimal
+from uuid import uuid4
+
+from src.core.domain.entities.tenant import Tenant
+from src.core.infrastucture.persistence.tenant import (
+    InMemoryTenantRepository,
+)
+from src.core.presentation.api.testing import ASGITestClient
+from src.core.presentation.web.app import WebApp
+from src.document_types.contract.domain.value_object import ContractStatus
+from src.document_types.contract.infrastructure.persistence.repository import (
+    InMemoryContractRepository,
+)
+from src.document_types.contract.presentation.web import (
+    contract_listing,
+    format_brl,
+)
+
+
+def test_format_brl():
+    assert format_brl(Decimal("1234567.5")) == "R$ 1.234.567,50"
+    assert format_brl(Decimal("0")) == "R$ 0,00"
+    assert format_brl(None) == "-"
+
+
+def test_contract_listing_page(make_contract):
+    tenant = Tenant(
+        name="Empresa",
+        description="Descrição",
+        logo="logo.png",
+        user_id=uuid4(),
+    )
+    tenants = InMemoryTenantRepository()
+    tenants.save(tenant)
+    contracts = InMemoryContractRepository()
+    for number, status in enumerate(
+        (ContractStatus.ACTIVE, ContractStatus.ACTIVE, ContractStatus.DRAFT),
+        start=1,
+    ):
+        contracts.save(
+            make_contract(
+                tenant_id=tenant.entity_id,
+                number=number,
+                status=status,
+                amount=Decimal("1000.50"),
+            )
+        )
+    app = WebApp(tenants)
+    app.add_listing(contract_listing(contracts))
+    client = ASGITestClient(app)
+
+    response = client.get(f"/tenants/{tenant.entity_id}/contracts")
+    page = response.body.decode()
+
+    assert response.status == 200
+    assert page.count('class="card contract"') == 3
+    assert "R$ 2.001,00 em contratos ativos" in page
+    assert "Ativos: 2" in page
+    assert "Rascunhos: 1" in page
+    assert "01/01/2024 a 31/12/2024" in page